@@ -19,6 +19,7 @@ from graphrag.index.run.utils import create_callback_chain
 from graphrag.index.typing.pipeline_run_result import PipelineRunResult
 from graphrag.index.typing.workflow import WorkflowFunction
 from graphrag.index.workflows.factory import PipelineFactory
+from graphrag.language_model.scheduler import RequestPriority, llm_priority
 from graphrag.logger.base import ProgressLogger
 from graphrag.logger.null_progress import NullProgressLogger
 
@@ -42,7 +43,8 @@ async def build_index(
     method : IndexingMethod default=IndexingMethod.Standard
         Styling of indexing to perform (full LLM, NLP + LLM, etc.).
     memory_profile : bool
-        Whether to enable memory profiling.
+        Whether to enable memory profiling. Adds tracemalloc peaks, top allocators
+        and deep DataFrame sizes to the per-workflow entries in stats.json.
     callbacks : list[WorkflowCallbacks] | None default=None
         A list of callbacks to register.
     progress_logger : ProgressLogger | None default=None
@@ -61,28 +63,28 @@ async def build_index(
 
     outputs: list[PipelineRunResult] = []
 
-    if memory_profile:
-        log.warning("New pipeline does not yet support memory profiling.")
-
     # 入口：这里创建 执行索引的 pipeline
     pipeline = PipelineFactory.create_pipeline(config, method)
 
     workflow_callbacks.pipeline_start(pipeline.names())
 
     # 核心的索引入口文件是 run_pipeline.py
-    async for output in run_pipeline(
-        pipeline,
-        config,
-        callbacks=workflow_callbacks,
-        logger=logger,
-        is_update_run=is_update_run,
-    ):
-        outputs.append(output)
-        if output.errors and len(output.errors) > 0:
-            logger.error(output.workflow)
-        else:
-            logger.success(output.workflow)
-        logger.info(str(output.result))
+    # indexing LLM calls yield to interactive queries sharing the same quota
+    with llm_priority(RequestPriority.background):
+        async for output in run_pipeline(
+            pipeline,
+            config,
+            callbacks=workflow_callbacks,
+            logger=logger,
+            is_update_run=is_update_run,
+            memory_profile=memory_profile,
+        ):
+            outputs.append(output)
+            if output.errors and len(output.errors) > 0:
+                logger.error(output.workflow)
+            else:
+                logger.success(output.workflow)
+            logger.info(str(output.result))
 
     workflow_callbacks.pipeline_end(outputs)
     return outputs
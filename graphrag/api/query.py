@@ -17,6 +17,7 @@ WARNING: This API is under development and may undergo changes in future release
 Backwards compatibility is not guaranteed at this time.
 """
 
+import time
 from collections.abc import AsyncGenerator
 from typing import Any
 
@@ -49,6 +50,7 @@ from graphrag.query.indexer_adapters import (
 )
 from graphrag.utils.api import (
     get_embedding_store,
+    get_keyword_index,
     load_search_prompt,
     update_context_data,
 )
@@ -57,6 +59,14 @@ from graphrag.utils.cli import redact
 logger = PrintProgressLogger("")
 
 
+def _emit_engine_construction(
+    callbacks: list[QueryCallbacks] | None, elapsed: float
+) -> None:
+    """Report the time spent adapting indexer tables and building the search engine."""
+    for callback in callbacks or []:
+        callback.on_stage("engine_construction", elapsed)
+
+
 @validate_call(config={"arbitrary_types_allowed": True})
 async def global_search(
     config: GraphRagConfig,
@@ -155,6 +165,7 @@ def global_search_streaming(
     ------
     TODO: Document any exceptions to expect.
     """
+    engine_start = time.perf_counter()
     communities_ = read_indexer_communities(communities, community_reports)
     reports = read_indexer_reports(
         community_reports,
@@ -185,6 +196,7 @@ def global_search_streaming(
         general_knowledge_inclusion_prompt=knowledge_prompt,
         callbacks=callbacks,
     )
+    _emit_engine_construction(callbacks, time.perf_counter() - engine_start)
     return search_engine.stream_search(query=query)
 
 
@@ -432,6 +444,7 @@ def local_search_streaming(
     ------
     TODO: Document any exceptions to expect.
     """
+    engine_start = time.perf_counter()
     vector_store_args = {}
     for index, store in config.vector_store.items():
         vector_store_args[index] = store.model_dump()
@@ -458,7 +471,13 @@ def local_search_streaming(
         response_type=response_type,
         system_prompt=prompt,
         callbacks=callbacks,
+        keyword_index=get_keyword_index(
+            config.output,
+            entity_description_embedding,
+            config.local_search.retrieval_mode,
+        ),
     )
+    _emit_engine_construction(callbacks, time.perf_counter() - engine_start)
     return search_engine.stream_search(query=query)
 
 
@@ -787,6 +806,7 @@ def drift_search_streaming(
     ------
     TODO: Document any exceptions to expect.
     """
+    engine_start = time.perf_counter()
     vector_store_args = {}
     for index, store in config.vector_store.items():
         vector_store_args[index] = store.model_dump()
@@ -823,6 +843,7 @@ def drift_search_streaming(
         response_type=response_type,
         callbacks=callbacks,
     )
+    _emit_engine_construction(callbacks, time.perf_counter() - engine_start)
     return search_engine.stream_search(query=query)
 
 
@@ -1103,6 +1124,7 @@ def basic_search_streaming(
     ------
     TODO: Document any exceptions to expect.
     """
+    engine_start = time.perf_counter()
     vector_store_args = {}
     for index, store in config.vector_store.items():
         vector_store_args[index] = store.model_dump()
@@ -1122,7 +1144,13 @@ def basic_search_streaming(
         text_unit_embeddings=description_embedding_store,
         system_prompt=prompt,
         callbacks=callbacks,
+        keyword_index=get_keyword_index(
+            config.output,
+            text_unit_text_embedding,
+            config.basic_search.retrieval_mode,
+        ),
     )
+    _emit_engine_construction(callbacks, time.perf_counter() - engine_start)
     return search_engine.stream_search(query=query)
 
 
@@ -29,5 +29,15 @@ class QueryCallbacks(BaseLLMCallback):
     def on_reduce_response_end(self, reduce_response_output: str) -> None:
         """Handle the end of reduce operation."""
 
+    def on_stage(
+        self,
+        stage: str,
+        elapsed: float,
+        llm_calls: int = 0,
+        prompt_tokens: int = 0,
+        output_tokens: int = 0,
+    ) -> None:
+        """Handle the end of a timed query stage (elapsed is in seconds)."""
+
     def on_llm_new_token(self, token) -> None:
         """Handle when a new token is generated."""
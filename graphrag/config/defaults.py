@@ -17,9 +17,14 @@ from graphrag.config.enums import (
     NounPhraseExtractorType,
     OutputType,
     ReportingType,
+    RetrievalMode,
     TextEmbeddingTarget,
 )
 from graphrag.vector_stores.factory import VectorStoreType
+from graphrag.vector_stores.quantization import (
+    DEFAULT_RESCORE_MULTIPLIER,
+    VectorQuantization,
+)
 
 DEFAULT_OUTPUT_BASE_DIR = "output"
 DEFAULT_CHAT_MODEL_ID = "default_chat_model"
@@ -50,6 +55,7 @@ class BasicSearchDefaults:
     llm_max_tokens: int = 2000
     chat_model_id: str = DEFAULT_CHAT_MODEL_ID
     embedding_model_id: str = DEFAULT_EMBEDDING_MODEL_ID
+    retrieval_mode = RetrievalMode.Vector
 
 
 @dataclass
@@ -75,6 +81,7 @@ class ChunksDefaults:
     encoding_model: str = "cl100k_base"
     prepend_metadata: bool = False
     chunk_size_includes_metadata: bool = False
+    num_workers: int = 0
 
 
 @dataclass
@@ -84,6 +91,7 @@ class ClusterGraphDefaults:
     max_cluster_size: int = 10
     use_lcc: bool = True
     seed: int = 0xDEADBEEF
+    incremental_update: bool = False
 
 
 @dataclass
@@ -94,6 +102,7 @@ class CommunityReportDefaults:
     text_prompt: None = None
     max_length: int = 2000
     max_input_length: int = 8000
+    context_workers: int = 0
     strategy: None = None
     model_id: str = DEFAULT_CHAT_MODEL_ID
 
@@ -155,6 +164,8 @@ class EmbedTextDefaults:
     names: list[str] = field(default_factory=list)
     strategy: None = None
     vector_store_id: str = DEFAULT_VECTOR_STORE_ID
+    keyword_index: bool = False
+    keyword_tokenizer: str = "cjk"
 
 
 @dataclass
@@ -181,6 +192,8 @@ class ExtractGraphDefaults:
         default_factory=lambda: ["organization", "person", "geo", "event"]
     )
     max_gleanings: int = 1
+    gleaning_min_records: int = 0
+    batch_max_tokens: int = 0
     strategy: None = None
     encoding_model: None = None
     model_id: str = DEFAULT_CHAT_MODEL_ID
@@ -322,6 +335,7 @@ class LocalSearchDefaults:
     llm_max_tokens: int = 2000
     chat_model_id: str = DEFAULT_CHAT_MODEL_ID
     embedding_model_id: str = DEFAULT_EMBEDDING_MODEL_ID
+    retrieval_mode = RetrievalMode.Vector
 
 
 @dataclass
@@ -358,6 +372,7 @@ class ReportingDefaults:
     connection_string: None = None
     container_name: None = None
     storage_account_blob_url: None = None
+    otel_spans: bool = False
 
 
 @dataclass
@@ -408,6 +423,8 @@ class VectorStoreDefaults:
     api_key: None = None
     audience: None = None
     database_name: None = None
+    quantization = VectorQuantization.none.value
+    rescore_multiplier: int = DEFAULT_RESCORE_MULTIPLIER
 
 
 @dataclass
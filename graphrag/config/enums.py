@@ -180,3 +180,14 @@ class NounPhraseExtractorType(str, Enum):
     """Noun phrase extractor based on dependency parsing and NER using SpaCy."""
     CFG = "cfg"
     """Noun phrase extractor combining CFG-based noun-chunk extraction and NER."""
+
+
+class RetrievalMode(str, Enum):
+    """Enum for how local and basic search retrieve candidates."""
+
+    Vector = "vector"
+    """Embed the query and search the vector store."""
+    Hybrid = "hybrid"
+    """Fuse vector and BM25 keyword results with reciprocal rank fusion."""
+    Keyword = "keyword"
+    """Search the BM25 keyword index only; no embedding call is made."""
@@ -6,6 +6,7 @@
 from pydantic import BaseModel, Field
 
 from graphrag.config.defaults import graphrag_config_defaults
+from graphrag.config.enums import RetrievalMode
 
 
 class BasicSearchConfig(BaseModel):
@@ -51,3 +52,7 @@ class BasicSearchConfig(BaseModel):
         description="The LLM maximum tokens.",
         default=graphrag_config_defaults.basic_search.llm_max_tokens,
     )
+    retrieval_mode: RetrievalMode = Field(
+        description="How candidates are retrieved: 'vector', 'hybrid' (vector + BM25 fused with reciprocal rank fusion) or 'keyword' (BM25 only, no embedding call). Hybrid and keyword modes need embed_text.keyword_index.",
+        default=graphrag_config_defaults.basic_search.retrieval_mode,
+    )
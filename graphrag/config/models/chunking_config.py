@@ -40,3 +40,7 @@ class ChunkingConfig(BaseModel):
         description="Count metadata in max tokens.",
         default=graphrag_config_defaults.chunks.chunk_size_includes_metadata,
     )
+    num_workers: int = Field(
+        description="The processes used by the markdown and csv strategies (0 uses one per CPU).",
+        default=graphrag_config_defaults.chunks.num_workers,
+    )
@@ -23,3 +23,7 @@ class ClusterGraphConfig(BaseModel):
         description="The seed to use for the clustering.",
         default=graphrag_config_defaults.cluster_graph.seed,
     )
+    incremental_update: bool = Field(
+        description="Whether incremental index updates re-cluster only the region around changed entities and regenerate reports for changed communities only.",
+        default=graphrag_config_defaults.cluster_graph.incremental_update,
+    )
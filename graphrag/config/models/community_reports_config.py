@@ -30,6 +30,10 @@ class CommunityReportsConfig(BaseModel):
         description="The maximum input length in tokens to use when generating reports.",
         default=graphrag_config_defaults.community_reports.max_input_length,
     )
+    context_workers: int = Field(
+        description="The number of worker processes used to pack community contexts (0 packs in-process).",
+        default=graphrag_config_defaults.community_reports.context_workers,
+    )
     strategy: dict | None = Field(
         description="The override strategy to use.",
         default=graphrag_config_defaults.community_reports.strategy,
@@ -26,6 +26,14 @@ class ExtractGraphConfig(BaseModel):
         description="The maximum number of entity gleanings to use.",
         default=graphrag_config_defaults.extract_graph.max_gleanings,
     )
+    gleaning_min_records: int = Field(
+        description="Skip gleaning when the first extraction pass yields fewer records than this per text unit. 0 always gleans.",
+        default=graphrag_config_defaults.extract_graph.gleaning_min_records,
+    )
+    batch_max_tokens: int = Field(
+        description="The maximum number of text unit tokens packed into one extraction request. 0 extracts each text unit on its own.",
+        default=graphrag_config_defaults.extract_graph.batch_max_tokens,
+    )
     strategy: dict | None = Field(
         description="Override the default entity extraction strategy",
         default=graphrag_config_defaults.extract_graph.strategy,
@@ -57,5 +65,7 @@ class ExtractGraphConfig(BaseModel):
             if self.prompt
             else None,
             "max_gleanings": self.max_gleanings,
+            "gleaning_min_records": self.gleaning_min_records,
+            "batch_max_tokens": self.batch_max_tokens,
             "encoding_name": model_config.encoding_model,
         }
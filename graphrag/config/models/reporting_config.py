@@ -32,3 +32,7 @@ class ReportingConfig(BaseModel):
         description="The storage account blob url to use.",
         default=graphrag_config_defaults.reporting.storage_account_blob_url,
     )
+    otel_spans: bool = Field(
+        description="Export per-workflow telemetry as OpenTelemetry spans (requires opentelemetry-api).",
+        default=graphrag_config_defaults.reporting.otel_spans,
+    )
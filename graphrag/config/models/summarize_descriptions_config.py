@@ -49,4 +49,5 @@ class SummarizeDescriptionsConfig(BaseModel):
             if self.prompt
             else None,
             "max_summary_length": self.max_length,
+            "encoding_name": model_config.encoding_model,
         }
@@ -41,6 +41,14 @@ class TextEmbeddingConfig(BaseModel):
         description="The vector store ID to use for text embeddings.",
         default=graphrag_config_defaults.embed_text.vector_store_id,
     )
+    keyword_index: bool = Field(
+        description="Whether to build BM25 keyword indexes over text units and entity descriptions for hybrid and keyword search.",
+        default=graphrag_config_defaults.embed_text.keyword_index,
+    )
+    keyword_tokenizer: str = Field(
+        description="The tokenizer to use for keyword indexes. 'simple', 'cjk' or a registered custom tokenizer.",
+        default=graphrag_config_defaults.embed_text.keyword_tokenizer,
+    )
 
     def resolved_strategy(self, model_config: LanguageModelConfig) -> dict:
         """Get the resolved text embedding strategy."""
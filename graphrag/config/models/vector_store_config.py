@@ -7,6 +7,7 @@ from pydantic import BaseModel, Field, model_validator
 
 from graphrag.config.defaults import vector_store_defaults
 from graphrag.vector_stores.factory import VectorStoreType
+from graphrag.vector_stores.quantization import VectorQuantization
 
 
 class VectorStoreConfig(BaseModel):
@@ -85,9 +86,37 @@ class VectorStoreConfig(BaseModel):
         default=vector_store_defaults.overwrite,
     )
 
+    quantization: str = Field(
+        description="The quantization of the stored vectors when type == lancedb: 'none', 'int8' or 'binary'. Quantized searches rank candidates on the codes and rescore them on full-precision vectors.",
+        default=vector_store_defaults.quantization,
+    )
+
+    rescore_multiplier: int = Field(
+        description="The number of quantized candidates rescored per requested result.",
+        default=vector_store_defaults.rescore_multiplier,
+    )
+
+    def _validate_quantization(self) -> None:
+        """Validate the quantization settings."""
+        if self.quantization not in [method.value for method in VectorQuantization]:
+            msg = f"vector_store.quantization must be one of {[method.value for method in VectorQuantization]}, got {self.quantization}."
+            raise ValueError(msg)
+
+        if (
+            self.type != VectorStoreType.LanceDB.value
+            and self.quantization != VectorQuantization.none.value
+        ):
+            msg = "vector_store.quantization is only supported when vector_store.type == lancedb."
+            raise ValueError(msg)
+
+        if self.rescore_multiplier < 1:
+            msg = "vector_store.rescore_multiplier must be at least 1."
+            raise ValueError(msg)
+
     @model_validator(mode="after")
     def _validate_model(self):
         """Validate the model."""
         self._validate_db_uri()
         self._validate_url()
+        self._validate_quantization()
         return self
@@ -9,7 +9,7 @@ from typing import Any
 from graphrag.data_model.named import Named
 
 
-@dataclass
+@dataclass(slots=True)
 class Community(Named):
     """A protocol for a community in the system."""
 
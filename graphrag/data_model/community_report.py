@@ -9,7 +9,7 @@ from typing import Any
 from graphrag.data_model.named import Named
 
 
-@dataclass
+@dataclass(slots=True)
 class CommunityReport(Named):
     """Defines an LLM-generated summary report of a community."""
 
@@ -9,7 +9,7 @@ from typing import Any
 from graphrag.data_model.identified import Identified
 
 
-@dataclass
+@dataclass(slots=True)
 class Covariate(Identified):
     """
     A protocol for a covariate in the system.
@@ -9,7 +9,7 @@ from typing import Any
 from graphrag.data_model.named import Named
 
 
-@dataclass
+@dataclass(slots=True)
 class Document(Named):
     """A protocol for a document in the system."""
 
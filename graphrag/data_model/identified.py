@@ -6,7 +6,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Identified:
     """A protocol for an item with an ID."""
 
@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from graphrag.data_model.identified import Identified
 
 
-@dataclass
+@dataclass(slots=True)
 class Named(Identified):
     """A protocol for an item with a name/title."""
 
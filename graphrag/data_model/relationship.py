@@ -9,7 +9,7 @@ from typing import Any
 from graphrag.data_model.identified import Identified
 
 
-@dataclass
+@dataclass(slots=True)
 class Relationship(Identified):
     """A relationship between two entities. This is a generic relationship, and can be used to represent any type of relationship between any two entities."""
 
@@ -19,6 +19,7 @@ from io import BytesIO
 from graphrag.config.models.input_config import InputConfig
 from graphrag.index.utils.hashing import gen_sha512_hash
 from graphrag.index.input.util import load_files, generate_image_descriptions, generate_image_descriptions_sync
+from graphrag.language_model.scheduler import LLMScheduler, estimate_tokens, quota_key
 from graphrag.logger.base import ProgressLogger
 from graphrag.storage.pipeline_storage import PipelineStorage
 
@@ -802,6 +803,8 @@ def generate_descriptions_for_tables(doc_local_dir, structured_info, config):
                 api_key=api_key,
                 base_url=base_url,
             )
+            # 与同一端点/密钥的其他 LLM 调用共享限流配额
+            quota = LLMScheduler.quota(quota_key(base_url, api_key, model))
             
             # 为每个表格生成描述
             descriptions = {}
@@ -826,14 +829,23 @@ def generate_descriptions_for_tables(doc_local_dir, structured_info, config):
                 
                 # 发送请求并获取响应
                 success = False
+                tokens = estimate_tokens([prompt_text, user_message]) + max_tokens
                 for attempt in range(max_retries):
                     try:
-                        response = client.chat.completions.create(
-                            model=model,
-                            messages=messages,
-                            max_tokens=max_tokens,
-                            temperature=temperature
-                        )
+                        with quota.request_sync(tokens) as permit:
+                            try:
+                                response = client.chat.completions.create(
+                                    model=model,
+                                    messages=messages,
+                                    max_tokens=max_tokens,
+                                    temperature=temperature
+                                )
+                            except Exception as e:
+                                # 429 会暂停该配额的派发并降低并发上限
+                                permit.record_error(e)
+                                raise
+                            if response.usage is not None:
+                                permit.record_usage(response.usage.prompt_tokens, response.usage.completion_tokens)
                         
                         # 提取描述
                         description = response.choices[0].message.content
@@ -852,9 +864,6 @@ def generate_descriptions_for_tables(doc_local_dir, structured_info, config):
                 # 每处理完一个表格后保存一次
                 with open(output_file, 'w', encoding='utf-8') as f:
                     json.dump(descriptions, f, ensure_ascii=False, indent=2)
-                
-                # 添加延迟，避免API限制
-                time.sleep(1)
             
             # 将描述添加到表格数据中
             for table_data in structured_info["tables"]:
@@ -21,6 +21,7 @@ import pandas as pd
 
 from graphrag.config.models.input_config import InputConfig
 from graphrag.index.utils.hashing import gen_sha512_hash
+from graphrag.language_model.scheduler import LLMScheduler, estimate_tokens, quota_key
 from graphrag.logger.base import ProgressLogger
 from graphrag.storage.pipeline_storage import PipelineStorage
 
@@ -321,6 +322,8 @@ def generate_image_descriptions_sync(
             api_key=api_key,
             base_url=base_url,
         )
+        # 与同一端点/密钥的其他 LLM 调用共享限流配额
+        quota = LLMScheduler.quota(quota_key(base_url, api_key, model))
         
         # 创建图片路径到上下文的映射
         context_map = {}
@@ -394,14 +397,24 @@ def generate_image_descriptions_sync(
                 
                 # 发送请求并获取响应
                 success = False
+                # 图片本身的 token 无法预先计算，只按文本部分加输出上限预估
+                tokens = estimate_tokens([system_prompt, context_text]) + max_tokens
                 for attempt in range(max_retries):
                     try:
-                        response = client.chat.completions.create(
-                            model=model,
-                            messages=messages,
-                            max_tokens=max_tokens,
-                            temperature=temperature
-                        )
+                        with quota.request_sync(tokens) as permit:
+                            try:
+                                response = client.chat.completions.create(
+                                    model=model,
+                                    messages=messages,
+                                    max_tokens=max_tokens,
+                                    temperature=temperature
+                                )
+                            except Exception as e:
+                                # 429 会暂停该配额的派发并降低并发上限
+                                permit.record_error(e)
+                                raise
+                            if response.usage is not None:
+                                permit.record_usage(response.usage.prompt_tokens, response.usage.completion_tokens)
                         
                         # 提取描述
                         description = response.choices[0].message.content
@@ -427,9 +440,6 @@ def generate_image_descriptions_sync(
                 with open(output_file, 'w', encoding='utf-8') as f:
                     json.dump(descriptions, f, ensure_ascii=False, indent=2)
             
-            # 添加延迟，避免API限制
-            if i < len(image_files) - 1:
-                time.sleep(1)
     
     except ImportError:
         log.error("导入OpenAI模块失败，无法生成图片描述")
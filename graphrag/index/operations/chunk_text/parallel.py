@@ -0,0 +1,60 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing chunk_documents, which runs a per-document chunker over a process pool."""
+
+import os
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Any
+
+from graphrag.config.models.chunking_config import ChunkingConfig
+from graphrag.index.operations.chunk_text.typing import TextChunk
+from graphrag.logger.progress import ProgressTicker
+
+PARALLEL_MIN_CHARS = 1_000_000
+"""Input size below which documents are chunked in-process, as starting a pool would cost more than it saves."""
+
+DocumentChunker = Callable[[int, Any, ChunkingConfig], list[TextChunk]]
+"""Chunks one document given its index, text and the chunking config."""
+
+
+def chunk_documents(
+    chunker: DocumentChunker,
+    texts: list[Any],
+    config: ChunkingConfig,
+    tick: ProgressTicker,
+) -> Iterator[TextChunk]:
+    """Chunk every document with the chunker, yielding the chunks in document order.
+
+    Large inputs are spread over config.num_workers processes (one per CPU when 0),
+    so the chunker must be a module-level function. Chunks are yielded as soon as
+    their document is done.
+    """
+    workers = min(config.num_workers or os.cpu_count() or 1, len(texts))
+    size = sum(len(text) for text in texts if isinstance(text, str))
+    if workers <= 1 or size < PARALLEL_MIN_CHARS:
+        yield from _ticked(map(chunker, range(len(texts)), texts, repeat(config)), tick)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # ship documents in chunks to amortize pickling and IPC per task
+        yield from _ticked(
+            executor.map(
+                chunker,
+                range(len(texts)),
+                texts,
+                repeat(config),
+                chunksize=max(1, len(texts) // (workers * 4)),
+            ),
+            tick,
+        )
+
+
+def _ticked(
+    results: Iterable[list[TextChunk]], tick: ProgressTicker
+) -> Iterator[TextChunk]:
+    for chunks in results:
+        yield from chunks
+        tick(1)
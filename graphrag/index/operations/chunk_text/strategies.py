@@ -6,7 +6,6 @@
 from collections.abc import Iterable
 
 import nltk
-import tiktoken
 
 from graphrag.config.models.chunking_config import ChunkingConfig
 from graphrag.index.operations.chunk_text.typing import TextChunk
@@ -15,11 +14,12 @@ from graphrag.index.text_splitting.text_splitting import (
     split_multiple_texts_on_tokens,
 )
 from graphrag.logger.progress import ProgressTicker
+from graphrag.utils.tokenizer import get_encoding
 
 
 def get_encoding_fn(encoding_name):
     """Get the encoding model."""
-    enc = tiktoken.get_encoding(encoding_name)
+    enc = get_encoding(encoding_name)
 
     def encode(text: str) -> list[int]:
         if not isinstance(text, str):
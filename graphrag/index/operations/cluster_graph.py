@@ -20,8 +20,14 @@ def cluster_graph(
     max_cluster_size: int,
     use_lcc: bool,
     seed: int | None = None,
+    starting_communities: dict[str, int] | None = None,
 ) -> Communities:
-    """Apply a hierarchical clustering algorithm to a graph."""
+    """Apply a hierarchical clustering algorithm to a graph.
+
+    starting_communities optionally seeds the top level partition with a
+    previous {node: community} assignment, which keeps re-clustering of an
+    updated graph close to the earlier result.
+    """
     if len(graph.nodes) == 0:
         log.warning("Graph has no nodes")
         return []
@@ -31,6 +37,7 @@ def cluster_graph(
         max_cluster_size=max_cluster_size,
         use_lcc=use_lcc,
         seed=seed,
+        starting_communities=starting_communities,
     )
 
     levels = sorted(node_id_to_community_map.keys())
@@ -58,6 +65,7 @@ def _compute_leiden_communities(
     max_cluster_size: int,
     use_lcc: bool,
     seed: int | None = None,
+    starting_communities: dict[str, int] | None = None,
 ) -> tuple[dict[int, dict[str, int]], dict[int, int]]:
     """Return Leiden root communities and their hierarchy mapping."""
     # NOTE: This import is done here to reduce the initial import time of the graphrag package
@@ -67,7 +75,10 @@ def _compute_leiden_communities(
         graph = stable_largest_connected_component(graph)
 
     community_mapping = hierarchical_leiden(
-        graph, max_cluster_size=max_cluster_size, random_seed=seed
+        graph,
+        max_cluster_size=max_cluster_size,
+        starting_communities=starting_communities,
+        random_seed=seed,
     )
     results: dict[int, dict[str, int]] = {}
     hierarchy: dict[int, int] = {}
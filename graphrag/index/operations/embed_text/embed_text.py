@@ -3,7 +3,9 @@
 
 """A module containing embed_text, load_strategy and create_row_from_embedding_data methods definition."""
 
+import asyncio
 import logging
+from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
@@ -14,7 +16,7 @@ from graphrag.cache.pipeline_cache import PipelineCache
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.embeddings import create_collection_name
 from graphrag.index.operations.embed_text.strategies.typing import TextEmbeddingStrategy
-from graphrag.vector_stores.base import BaseVectorStore, VectorStoreDocument
+from graphrag.vector_stores.base import BaseVectorStore
 from graphrag.vector_stores.factory import VectorStoreFactory
 
 log = logging.getLogger(__name__)
@@ -22,6 +24,8 @@ log = logging.getLogger(__name__)
 # Per Azure OpenAI Limits
 # https://learn.microsoft.com/en-us/azure/ai-services/openai/reference
 DEFAULT_EMBEDDING_BATCH_SIZE = 500
+DEFAULT_PENDING_WRITES = 2
+"""Embedded batches that may wait on the vector store writer before embedding pauses."""
 
 
 class TextEmbedStrategyType(str, Enum):
@@ -170,45 +174,86 @@ async def _text_embed_with_vector_store(
         else:
             total_rows += 1
 
-    i = 0
-    starting_index = 0
-
+    # embedding batches run ahead while a writer task loads finished ones in order
+    queue: asyncio.Queue[_VectorBatch | None] = asyncio.Queue(
+        maxsize=DEFAULT_PENDING_WRITES
+    )
+    writer = asyncio.create_task(_write_batches(vector_store, queue, overwrite))
     all_results = []
-
-    while insert_batch_size * i < input.shape[0]:
-        batch = input.iloc[insert_batch_size * i : insert_batch_size * (i + 1)]
-        texts: list[str] = batch[embed_column].to_numpy().tolist()
-        titles: list[str] = batch[title].to_numpy().tolist()
-        ids: list[str] = batch[id_column].to_numpy().tolist()
-        result = await strategy_exec(texts, callbacks, cache, strategy_config)
-        if result.embeddings:
-            embeddings = [
-                embedding for embedding in result.embeddings if embedding is not None
+    try:
+        for start in range(0, input.shape[0], insert_batch_size):
+            batch = input.iloc[start : start + insert_batch_size]
+            texts: list[str] = batch[embed_column].to_numpy().tolist()
+            titles: list[str] = batch[title].to_numpy().tolist()
+            ids: list[str] = batch[id_column].to_numpy().tolist()
+            result = await strategy_exec(texts, callbacks, cache, strategy_config)
+            vectors = result.embeddings or []
+            # rows without an embedding are neither returned nor stored
+            kept = [
+                position
+                for position, vector in enumerate(vectors)
+                if vector is not None
             ]
-            all_results.extend(embeddings)
-
-        vectors = result.embeddings or []
-        documents: list[VectorStoreDocument] = []
-        for doc_id, doc_text, doc_title, doc_vector in zip(
-            ids, texts, titles, vectors, strict=True
-        ):
-            if type(doc_vector) is np.ndarray:
-                doc_vector = doc_vector.tolist()
-            document = VectorStoreDocument(
-                id=doc_id,
-                text=doc_text,
-                vector=doc_vector,
-                attributes={"title": doc_title},
+            all_results.extend(vectors[position] for position in kept)
+            await _enqueue(
+                queue,
+                _VectorBatch(
+                    ids=[ids[position] for position in kept],
+                    texts=[texts[position] for position in kept],
+                    vectors=np.asarray(
+                        [vectors[position] for position in kept], dtype=np.float32
+                    ),
+                    attributes=[{"title": titles[position]} for position in kept],
+                ),
+                writer,
             )
-            documents.append(document)
-
-        vector_store.load_documents(documents, overwrite and i == 0)
-        starting_index += len(documents)
-        i += 1
+        await _enqueue(queue, None, writer)
+        await writer
+    finally:
+        writer.cancel()
 
     return all_results
 
 
+@dataclass
+class _VectorBatch:
+    ids: list[str]
+    texts: list[str]
+    vectors: np.ndarray
+    attributes: list[dict[str, Any]]
+
+
+async def _enqueue(
+    queue: asyncio.Queue, item: _VectorBatch | None, writer: asyncio.Task
+) -> None:
+    """Put an item on the write queue, failing fast if the writer has stopped."""
+    put = asyncio.ensure_future(queue.put(item))
+    await asyncio.wait({put, writer}, return_when=asyncio.FIRST_COMPLETED)
+    if not put.done():
+        put.cancel()
+        # the writer only returns after the final None, so it raised
+        writer.result()
+
+
+async def _write_batches(
+    vector_store: BaseVectorStore,
+    queue: asyncio.Queue,
+    overwrite: bool,
+) -> None:
+    """Load queued batches into the vector store in order, off the event loop."""
+    first = True
+    while (batch := await queue.get()) is not None:
+        await asyncio.to_thread(
+            vector_store.load_vectors,
+            batch.ids,
+            batch.texts,
+            batch.vectors,
+            batch.attributes,
+            overwrite and first,
+        )
+        first = False
+
+
 def _create_vector_store(
     vector_store_config: dict, collection_name: str
 ) -> BaseVectorStore:
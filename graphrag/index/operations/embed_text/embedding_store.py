@@ -0,0 +1,99 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing the EmbeddingStore, which reuses text embeddings across runs."""
+
+import asyncio
+import base64
+import hashlib
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from typing import Any, TypeVar
+
+import numpy as np
+
+from graphrag.cache.pipeline_cache import PipelineCache
+
+EMBEDDING_STORE_CACHE_NAME = "text_embedding_store"
+DEFAULT_STORE_CONCURRENCY = 64
+"""Cache reads or writes in flight at once, to stay under open file limits."""
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class EmbeddingStore:
+    """Embeddings persisted in the pipeline cache, keyed by model and text hash.
+
+    Unlike the LLM cache, which is keyed per request batch, every text is stored
+    on its own, so a text embedded once is reused whatever batch it lands in.
+    Vectors are stored as base64-encoded little-endian float64, which round-trips
+    the API values exactly.
+    """
+
+    def __init__(
+        self,
+        cache: PipelineCache,
+        model: str,
+        concurrency: int = DEFAULT_STORE_CONCURRENCY,
+    ):
+        self._cache = cache.child(EMBEDDING_STORE_CACHE_NAME)
+        self._model = model
+        self._concurrency = concurrency
+
+    def key(self, text: str) -> str:
+        """Get the cache key of a text for this store's model."""
+        text_hash = hashlib.sha256(
+            text.encode("utf-8"), usedforsecurity=False
+        ).hexdigest()
+        return hashlib.sha256(
+            f"{self._model}\n{text_hash}".encode(), usedforsecurity=False
+        ).hexdigest()
+
+    async def get_many(self, texts: Sequence[str]) -> list[np.ndarray | None]:
+        """Get the stored embedding of each text, or None where there is none."""
+
+        async def get(text: str) -> np.ndarray | None:
+            value = await self._cache.get(self.key(text))
+            return _decode(value) if isinstance(value, str) else None
+
+        return await _bounded(get, texts, self._concurrency)
+
+    async def set_many(self, texts: Sequence[str], embeddings: Sequence[Any]) -> None:
+        """Store the embedding of each text."""
+
+        async def set_one(item: tuple[str, Any]) -> None:
+            text, embedding = item
+            await self._cache.set(
+                self.key(text), _encode(embedding), {"model": self._model}
+            )
+
+        await _bounded(
+            set_one, list(zip(texts, embeddings, strict=True)), self._concurrency
+        )
+
+
+async def _bounded(
+    fn: Callable[[T], Awaitable[R]], items: Iterable[T], concurrency: int
+) -> list[R]:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(item: T) -> R:
+        async with semaphore:
+            return await fn(item)
+
+    return await asyncio.gather(*[run(item) for item in items])
+
+
+def _encode(embedding: Any) -> str:
+    vector = np.asarray(embedding, dtype="<f8")
+    return base64.b64encode(vector.tobytes()).decode("ascii")
+
+
+def _decode(value: str) -> np.ndarray | None:
+    try:
+        data = base64.b64decode(value, validate=True)
+    except ValueError:
+        return None
+    if not data or len(data) % 8:
+        return None
+    return np.frombuffer(data, dtype="<f8").astype(np.float64)
@@ -5,6 +5,7 @@
 
 import asyncio
 import logging
+import time
 from typing import Any
 
 import numpy as np
@@ -12,7 +13,9 @@ import numpy as np
 from graphrag.cache.pipeline_cache import PipelineCache
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.models.language_model_config import LanguageModelConfig
+from graphrag.index.operations.embed_text.embedding_store import EmbeddingStore
 from graphrag.index.operations.embed_text.strategies.typing import TextEmbeddingResult
+from graphrag.index.run.profiling import record_llm_wait
 from graphrag.index.text_splitting.text_splitting import TokenTextSplitter
 from graphrag.index.utils.is_null import is_null
 from graphrag.language_model.manager import ModelManager
@@ -48,16 +51,28 @@ async def run(
 
     # Break up the input texts. The sizes here indicate how many snippets are in each input text
     texts, input_sizes = _prepare_embed_texts(input, splitter)
+
+    # Reuse snippets embedded by earlier runs and send each remaining one to the model once
+    store = EmbeddingStore(cache, llm_config.model)
+    snippet_embeddings = await store.get_many(texts)
+    missing = list(
+        dict.fromkeys(
+            text
+            for text, embedding in zip(texts, snippet_embeddings, strict=True)
+            if embedding is None
+        )
+    )
     text_batches = _create_text_batches(
-        texts,
+        missing,
         batch_size,
         batch_max_tokens,
         splitter,
     )
     log.info(
-        "embedding %d inputs via %d snippets using %d batches. max_batch_size=%d, max_tokens=%d",
+        "embedding %d inputs via %d snippets (%d reused) using %d batches. max_batch_size=%d, max_tokens=%d",
         len(input),
         len(texts),
+        len(texts) - sum(embedding is None for embedding in snippet_embeddings),
         len(text_batches),
         batch_size,
         batch_max_tokens,
@@ -65,8 +80,16 @@ async def run(
     ticker = progress_ticker(callbacks.progress, len(text_batches))
 
     # Embed each chunk of snippets
-    embeddings = await _execute(model, text_batches, ticker, semaphore)
-    embeddings = _reconstitute_embeddings(embeddings, input_sizes)
+    embedded = await _execute(model, text_batches, ticker, semaphore)
+    await store.set_many(missing, embedded)
+    embedded_by_text = dict(zip(missing, embedded, strict=True))
+    embeddings = _reconstitute_embeddings(
+        [
+            embedded_by_text[text] if embedding is None else embedding
+            for text, embedding in zip(texts, snippet_embeddings, strict=True)
+        ],
+        input_sizes,
+    )
 
     return TextEmbeddingResult(embeddings=embeddings)
 
@@ -87,7 +110,9 @@ async def _execute(
     semaphore: asyncio.Semaphore,
 ) -> list[list[float]]:
     async def embed(chunk: list[str]):
+        wait_start = time.perf_counter()
         async with semaphore:
+            record_llm_wait(time.perf_counter() - wait_start)
             chunk_embeddings = await model.aembed_batch(chunk)
             result = np.array(chunk_embeddings)
             tick(1)
@@ -8,8 +8,6 @@ import traceback
 from dataclasses import dataclass
 from typing import Any
 
-import tiktoken
-
 from graphrag.config.defaults import ENCODING_MODEL, graphrag_config_defaults
 from graphrag.index.typing.error_handler import ErrorHandlerFn
 from graphrag.language_model.protocol.base import ChatModel
@@ -18,6 +16,7 @@ from graphrag.prompts.index.extract_claims import (
     EXTRACT_CLAIMS_PROMPT,
     LOOP_PROMPT,
 )
+from graphrag.utils.tokenizer import get_encoding
 
 DEFAULT_TUPLE_DELIMITER = "<|>"
 DEFAULT_RECORD_DELIMITER = "##"
@@ -89,7 +88,7 @@ class ClaimExtractor:
         self._on_error = on_error or (lambda _e, _s, _d: None)
 
         # Construct the looping arguments
-        encoding = tiktoken.get_encoding(encoding_model or ENCODING_MODEL)
+        encoding = get_encoding(encoding_model or ENCODING_MODEL)
         yes = f"{encoding.encode('Y')[0]}"
         no = f"{encoding.encode('N')[0]}"
         self._loop_args = {"logit_bias": {yes: 100, no: 100}, "max_tokens": 1}
@@ -11,12 +11,16 @@ import pandas as pd
 from graphrag.cache.pipeline_cache import PipelineCache
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.enums import AsyncType
+from graphrag.index.operations.extract_graph.graph_extractor import pack_by_tokens
 from graphrag.index.operations.extract_graph.typing import (
+    ENTITY_RECORD_COLUMNS,
+    RELATIONSHIP_RECORD_COLUMNS,
     Document,
     EntityExtractStrategy,
     ExtractEntityStrategyType,
 )
 from graphrag.index.utils.derive_from_rows import derive_from_rows
+from graphrag.utils.tokenizer import get_tokenizer
 
 log = logging.getLogger(__name__)
 
@@ -68,6 +72,8 @@ async def extract_graph(
         completion_delimiter: "<|COMPLETE|>" # Optional, the delimiter to use for the LLM to mark completion
         tuple_delimiter: "<|>" # Optional, the delimiter to use for the LLM to mark a tuple
         record_delimiter: "##" # Optional, the delimiter to use for the LLM to mark a record
+        batch_max_tokens: 0 # Optional, pack several text units into one request up to this many text tokens, 0 disables batching
+        gleaning_min_records: 0 # Optional, skip gleaning when the first pass yields fewer records per text unit
 
         encoding_name: cl100k_base # Optional, The encoding to use for the LLM with gleanings
 
@@ -98,43 +104,83 @@ async def extract_graph(
     if strategy_config.get("llm") and strategy_config["llm"]["max_retries"] == -1:
         strategy_config["llm"]["max_retries"] = len(text_units)
 
+    batches = _batch_documents(
+        text_units,
+        text_column,
+        id_column,
+        strategy_config.get("batch_max_tokens", 0),
+        strategy_config.get("encoding_name"),
+    )
+
     num_started = 0
 
     async def run_strategy(row):
         nonlocal num_started
-        text = row[text_column]
-        id = row[id_column]
         result = await strategy_exec(
-            [Document(text=text, id=id)],
+            row["documents"],
             entity_types,
             callbacks,
             cache,
             strategy_config,
         )
         num_started += 1
-        return [result.entities, result.relationships, result.graph]
+        return result
 
     results = await derive_from_rows(
-        text_units,
+        batches,
         run_strategy,
         callbacks,
         async_type=async_mode,
         num_threads=num_threads,
     )
 
-    entity_dfs = []
-    relationship_dfs = []
+    # append every call's records to columnar buffers in row order, then merge once
+    entity_records: dict[str, list] = {column: [] for column in ENTITY_RECORD_COLUMNS}
+    relationship_records: dict[str, list] = {
+        column: [] for column in RELATIONSHIP_RECORD_COLUMNS
+    }
     for result in results:
         if result:
-            entity_dfs.append(pd.DataFrame(result[0]))
-            relationship_dfs.append(pd.DataFrame(result[1]))
+            for column, values in entity_records.items():
+                values.extend(result.entities[column])
+            for column, values in relationship_records.items():
+                values.extend(result.relationships[column])
 
-    entities = _merge_entities(entity_dfs)
-    relationships = _merge_relationships(relationship_dfs)
+    entities = _merge_entities(pd.DataFrame(entity_records))
+    relationships = _merge_relationships(pd.DataFrame(relationship_records))
 
     return (entities, relationships)
 
 
+def _batch_documents(
+    text_units: pd.DataFrame,
+    text_column: str,
+    id_column: str,
+    batch_max_tokens: int,
+    encoding_name: str | None,
+) -> pd.DataFrame:
+    """Group the text units into the documents of each extraction call."""
+    documents = [
+        Document(text=text, id=id)
+        for text, id in zip(text_units[text_column], text_units[id_column], strict=True)
+    ]
+    if batch_max_tokens <= 0:
+        return pd.DataFrame({"documents": [[document] for document in documents]})
+
+    if "n_tokens" in text_units.columns:
+        token_counts = text_units["n_tokens"].fillna(0).astype(int).tolist()
+    else:
+        token_counts = get_tokenizer(encoding_name).count_batch([
+            document.text for document in documents
+        ])
+    return pd.DataFrame({
+        "documents": [
+            [documents[position] for position in batch]
+            for batch in pack_by_tokens(token_counts, batch_max_tokens)
+        ]
+    })
+
+
 def _load_strategy(strategy_type: ExtractEntityStrategyType) -> EntityExtractStrategy:
     """Load strategy method definition."""
     match strategy_type:
@@ -150,8 +196,7 @@ def _load_strategy(strategy_type: ExtractEntityStrategyType) -> EntityExtractStr
             raise ValueError(msg)
 
 
-def _merge_entities(entity_dfs) -> pd.DataFrame:
-    all_entities = pd.concat(entity_dfs, ignore_index=True)
+def _merge_entities(all_entities: pd.DataFrame) -> pd.DataFrame:
     return (
         all_entities.groupby(["title", "type"], sort=False)
         .agg(
@@ -163,8 +208,7 @@ def _merge_entities(entity_dfs) -> pd.DataFrame:
     )
 
 
-def _merge_relationships(relationship_dfs) -> pd.DataFrame:
-    all_relationships = pd.concat(relationship_dfs, ignore_index=False)
+def _merge_relationships(all_relationships: pd.DataFrame) -> pd.DataFrame:
     return (
         all_relationships.groupby(["source", "target"], sort=False)
         .agg(
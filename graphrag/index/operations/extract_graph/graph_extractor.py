@@ -6,26 +6,31 @@
 import logging
 import re
 import traceback
-from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import Any
 
-import networkx as nx
-import tiktoken
-
 from graphrag.config.defaults import ENCODING_MODEL, graphrag_config_defaults
+from graphrag.index.operations.extract_graph.typing import (
+    ENTITY_RECORD_COLUMNS,
+    RELATIONSHIP_RECORD_COLUMNS,
+    ExtractedRecords,
+)
 from graphrag.index.typing.error_handler import ErrorHandlerFn
 from graphrag.index.utils.string import clean_str
 from graphrag.language_model.protocol.base import ChatModel
 from graphrag.prompts.index.extract_graph import (
+    BATCH_CONTINUE_PROMPT,
+    BATCH_INPUT_PROMPT,
     CONTINUE_PROMPT,
     GRAPH_EXTRACTION_PROMPT,
     LOOP_PROMPT,
 )
+from graphrag.utils.tokenizer import get_tokenizer
 
 DEFAULT_TUPLE_DELIMITER = "<|>"
 DEFAULT_RECORD_DELIMITER = "##"
 DEFAULT_COMPLETION_DELIMITER = "<|COMPLETE|>"
+DEFAULT_CHUNK_DELIMITER = "<|CHUNK|>"
 DEFAULT_ENTITY_TYPES = ["organization", "person", "geo", "event"]
 
 log = logging.getLogger(__name__)
@@ -33,9 +38,14 @@ log = logging.getLogger(__name__)
 
 @dataclass
 class GraphExtractionResult:
-    """Unipartite graph extraction result class definition."""
+    """Unipartite graph extraction result class definition.
 
-    output: nx.Graph
+    Entity and relationship records are merged per document only; their
+    source_id is the index of the document they were extracted from.
+    """
+
+    entities: ExtractedRecords
+    relationships: ExtractedRecords
     source_docs: dict[Any, Any]
 
 
@@ -55,6 +65,8 @@ class GraphExtractor:
     _summarization_prompt: str
     _loop_args: dict[str, Any]
     _max_gleanings: int
+    _gleaning_min_records: int
+    _batch_max_tokens: int
     _on_error: ErrorHandlerFn
 
     def __init__(
@@ -69,6 +81,8 @@ class GraphExtractor:
         join_descriptions=True,
         encoding_model: str | None = None,
         max_gleanings: int | None = None,
+        gleaning_min_records: int | None = None,
+        batch_max_tokens: int | None = None,
         on_error: ErrorHandlerFn | None = None,
     ):
         """Init method definition."""
@@ -88,12 +102,22 @@ class GraphExtractor:
             if max_gleanings is not None
             else graphrag_config_defaults.extract_graph.max_gleanings
         )
+        self._gleaning_min_records = (
+            gleaning_min_records
+            if gleaning_min_records is not None
+            else graphrag_config_defaults.extract_graph.gleaning_min_records
+        )
+        self._batch_max_tokens = (
+            batch_max_tokens
+            if batch_max_tokens is not None
+            else graphrag_config_defaults.extract_graph.batch_max_tokens
+        )
         self._on_error = on_error or (lambda _e, _s, _d: None)
 
         # Construct the looping arguments
-        encoding = tiktoken.get_encoding(encoding_model or ENCODING_MODEL)
-        yes = f"{encoding.encode('Y')[0]}"
-        no = f"{encoding.encode('N')[0]}"
+        self._tokenizer = get_tokenizer(encoding_model or ENCODING_MODEL)
+        yes = f"{self._tokenizer.encode('Y')[0]}"
+        no = f"{self._tokenizer.encode('N')[0]}"
         self._loop_args = {"logit_bias": {yes: 100, no: 100}, "max_tokens": 1}
 
     async def __call__(
@@ -121,31 +145,74 @@ class GraphExtractor:
             ),
         }
 
-        for doc_index, text in enumerate(texts):
-            try:
-                # Invoke the entity extraction
-                result = await self._process_document(text, prompt_variables)
-                source_doc_map[doc_index] = text
-                all_records[doc_index] = result
-            except Exception as e:
-                log.exception("error extracting graph")
-                self._on_error(
-                    e,
-                    traceback.format_exc(),
-                    {
-                        "doc_index": doc_index,
-                        "text": text,
-                    },
-                )
-
-        output = await self._process_results(
+        if self._batch_max_tokens > 0 and len(texts) > 1:
+            batches = pack_by_tokens(
+                self._tokenizer.count_batch(texts), self._batch_max_tokens
+            )
+        else:
+            batches = [[doc_index] for doc_index in range(len(texts))]
+
+        for batch in batches:
+            missed = batch
+            if len(batch) > 1:
+                try:
+                    batch_records = await self._process_batch(
+                        [texts[doc_index] for doc_index in batch], prompt_variables
+                    )
+                except Exception as e:
+                    log.exception("error extracting graph")
+                    self._on_error(
+                        e,
+                        traceback.format_exc(),
+                        {
+                            "doc_indexes": batch,
+                            "texts": [texts[doc_index] for doc_index in batch],
+                        },
+                    )
+                    continue
+                for position, result in batch_records.items():
+                    source_doc_map[batch[position]] = texts[batch[position]]
+                    all_records[batch[position]] = result
+                missed = [
+                    doc_index
+                    for position, doc_index in enumerate(batch)
+                    if position not in batch_records
+                ]
+                if missed:
+                    # the model dropped some chunk markers, extract those chunks alone
+                    log.warning(
+                        "batched extraction returned no records for %d of %d chunks, retrying them one by one",
+                        len(missed),
+                        len(batch),
+                    )
+
+            for doc_index in missed:
+                text = texts[doc_index]
+                try:
+                    # Invoke the entity extraction
+                    result = await self._process_document(text, prompt_variables)
+                    source_doc_map[doc_index] = text
+                    all_records[doc_index] = result
+                except Exception as e:
+                    log.exception("error extracting graph")
+                    self._on_error(
+                        e,
+                        traceback.format_exc(),
+                        {
+                            "doc_index": doc_index,
+                            "text": text,
+                        },
+                    )
+
+        entities, relationships = self._process_results(
             all_records,
             prompt_variables.get(self._tuple_delimiter_key, DEFAULT_TUPLE_DELIMITER),
             prompt_variables.get(self._record_delimiter_key, DEFAULT_RECORD_DELIMITER),
         )
 
         return GraphExtractionResult(
-            output=output,
+            entities=entities,
+            relationships=relationships,
             source_docs=source_doc_map,
         )
 
@@ -159,11 +226,49 @@ class GraphExtractor:
             }),
         )
         results = response.output.content or ""
+        if self._count_records(results, prompt_variables) < self._gleaning_min_records:
+            # a sparse first pass rarely hides more records, skip the gleaning calls
+            return results
+        return results + await self._glean(response, CONTINUE_PROMPT)
+
+    async def _process_batch(
+        self, texts: list[str], prompt_variables: dict[str, str]
+    ) -> dict[int, str]:
+        """Extract several documents with one request, returning the records of each document position found in the output."""
+        chunks = "\n\n".join(
+            f"{DEFAULT_CHUNK_DELIMITER} {position + 1}\n{text}"
+            for position, text in enumerate(texts)
+        )
+        response = await self._model.achat(
+            self._extraction_prompt.format(**{
+                **prompt_variables,
+                self._input_text_key: BATCH_INPUT_PROMPT.format(
+                    chunk_count=len(texts),
+                    chunk_delimiter=DEFAULT_CHUNK_DELIMITER,
+                    chunks=chunks,
+                ),
+            }),
+        )
+        results = response.output.content or ""
+        chunks = _split_chunks(results, len(texts))
+        if self._count_records(
+            results, prompt_variables
+        ) >= self._gleaning_min_records * len(texts):
+            # gleaned records are only kept under a chunk marker of their own
+            gleanings = await self._glean(
+                response,
+                BATCH_CONTINUE_PROMPT.format(chunk_delimiter=DEFAULT_CHUNK_DELIMITER),
+            )
+            for position, records in _split_chunks(gleanings, len(texts)).items():
+                chunks[position] = chunks.get(position, "") + records
+        return chunks
 
+    async def _glean(self, response: Any, continue_prompt: str) -> str:
+        results = ""
         # Repeat to ensure we maximize entity count
         for i in range(self._max_gleanings):
             response = await self._model.achat(
-                CONTINUE_PROMPT,
+                continue_prompt,
                 name=f"extract-continuation-{i}",
                 history=response.history,
             )
@@ -182,128 +287,140 @@ class GraphExtractor:
 
             if response.output.content != "Y":
                 break
-        
+
         return results
 
-    async def _process_results(
+    def _count_records(self, results: str, prompt_variables: dict[str, str]) -> int:
+        tuple_delimiter = prompt_variables[self._tuple_delimiter_key]
+        return sum(
+            tuple_delimiter in record
+            for record in results.split(prompt_variables[self._record_delimiter_key])
+        )
+
+    def _process_results(
         self,
         results: dict[int, str],
         tuple_delimiter: str,
         record_delimiter: str,
-    ) -> nx.Graph:
-        """Parse the result string to create an undirected unipartite graph.
+    ) -> tuple[ExtractedRecords, ExtractedRecords]:
+        """Parse the result strings into columnar entity and relationship records.
 
         Args:
             - results - dict of results from the extraction chain
             - tuple_delimiter - delimiter between tuples in an output record, default is '<|>'
             - record_delimiter - delimiter between records, default is '##'
         Returns:
-            - output - unipartite graph in graphML format
+            - entities - one row per entity of each document, relationship endpoints without an entity record get an empty type
+            - relationships - one row per undirected entity pair of each document, oriented from the entity seen first
         """
-        graph = nx.Graph()
+        entities: ExtractedRecords = {column: [] for column in ENTITY_RECORD_COLUMNS}
+        relationships: ExtractedRecords = {
+            column: [] for column in RELATIONSHIP_RECORD_COLUMNS
+        }
         for source_doc_id, extracted_data in results.items():
-            records = [r.strip() for r in extracted_data.split(record_delimiter)]
-
-            for record in records:
+            # per-document merge state, in insertion order: node name -> [type, descriptions]
+            # and (source, target) of a pair's first record -> [weight, descriptions]
+            nodes: dict[str, list] = {}
+            edges: dict[tuple[str, str], list] = {}
+            for record in extracted_data.split(record_delimiter):
                 record = re.sub(r"^\(|\)$", "", record.strip())
                 record_attributes = record.split(tuple_delimiter)
 
                 if record_attributes[0] == '"entity"' and len(record_attributes) >= 4:
-                    # add this record as a node in the G
                     entity_name = clean_str(record_attributes[1].upper())
                     entity_type = clean_str(record_attributes[2].upper())
                     entity_description = clean_str(record_attributes[3])
 
-                    if entity_name in graph.nodes():
-                        node = graph.nodes[entity_name]
-                        if self._join_descriptions:
-                            node["description"] = "\n".join(
-                                list({
-                                    *_unpack_descriptions(node),
-                                    entity_description,
-                                })
-                            )
-                        else:
-                            if len(entity_description) > len(node["description"]):
-                                node["description"] = entity_description
-                        node["source_id"] = ", ".join(
-                            list({
-                                *_unpack_source_ids(node),
-                                str(source_doc_id),
-                            })
-                        )
-                        node["type"] = (
-                            entity_type if entity_type != "" else node["type"]
-                        )
-                    else:
-                        graph.add_node(
-                            entity_name,
-                            type=entity_type,
-                            description=entity_description,
-                            source_id=str(source_doc_id),
-                        )
+                    node = nodes.get(entity_name)
+                    if node is None:
+                        nodes[entity_name] = node = [entity_type, []]
+                    elif entity_type != "":
+                        node[0] = entity_type
+                    self._merge_description(
+                        node[1], entity_description, keep_longest=True
+                    )
 
                 if (
                     record_attributes[0] == '"relationship"'
                     and len(record_attributes) >= 5
                 ):
-                    # add this record as edge
                     source = clean_str(record_attributes[1].upper())
                     target = clean_str(record_attributes[2].upper())
                     edge_description = clean_str(record_attributes[3])
-                    edge_source_id = clean_str(str(source_doc_id))
                     try:
                         weight = float(record_attributes[-1])
                     except ValueError:
                         weight = 1.0
 
-                    if source not in graph.nodes():
-                        graph.add_node(
-                            source,
-                            type="",
-                            description="",
-                            source_id=edge_source_id,
-                        )
-                    if target not in graph.nodes():
-                        graph.add_node(
-                            target,
-                            type="",
-                            description="",
-                            source_id=edge_source_id,
-                        )
-                    if graph.has_edge(source, target):
-                        edge_data = graph.get_edge_data(source, target)
-                        if edge_data is not None:
-                            weight += edge_data["weight"]
-                            if self._join_descriptions:
-                                edge_description = "\n".join(
-                                    list({
-                                        *_unpack_descriptions(edge_data),
-                                        edge_description,
-                                    })
-                                )
-                            edge_source_id = ", ".join(
-                                list({
-                                    *_unpack_source_ids(edge_data),
-                                    str(source_doc_id),
-                                })
-                            )
-                    graph.add_edge(
-                        source,
-                        target,
-                        weight=weight,
-                        description=edge_description,
-                        source_id=edge_source_id,
+                    nodes.setdefault(source, ["", []])
+                    nodes.setdefault(target, ["", []])
+                    key = (
+                        (target, source)
+                        if (target, source) in edges
+                        else (source, target)
+                    )
+                    edge = edges.setdefault(key, [0.0, []])
+                    edge[0] += weight
+                    self._merge_description(
+                        edge[1], edge_description, keep_longest=False
                     )
 
-        return graph
-
-
-def _unpack_descriptions(data: Mapping) -> list[str]:
-    value = data.get("description", None)
-    return [] if value is None else value.split("\n")
-
-
-def _unpack_source_ids(data: Mapping) -> list[str]:
-    value = data.get("source_id", None)
-    return [] if value is None else value.split(", ")
+            for name, (entity_type, descriptions) in nodes.items():
+                entities["title"].append(name)
+                entities["type"].append(entity_type)
+                entities["description"].append("\n".join(descriptions))
+                entities["source_id"].append(source_doc_id)
+
+            # orient and order relationships like an undirected graph's edge list:
+            # from the endpoint seen first, grouped by that endpoint in creation order
+            rank = {name: position for position, name in enumerate(nodes)}
+            edge_rows = [
+                (source, target, *edge)
+                if rank[source] <= rank[target]
+                else (target, source, *edge)
+                for (source, target), edge in edges.items()
+            ]
+            edge_rows.sort(key=lambda row: rank[row[0]])
+            for source, target, weight, descriptions in edge_rows:
+                relationships["source"].append(source)
+                relationships["target"].append(target)
+                relationships["weight"].append(weight)
+                relationships["description"].append("\n".join(descriptions))
+                relationships["source_id"].append(source_doc_id)
+
+        return entities, relationships
+
+    def _merge_description(
+        self, descriptions: list[str], description: str, keep_longest: bool
+    ) -> None:
+        if self._join_descriptions:
+            if description and description not in descriptions:
+                descriptions.append(description)
+        elif not keep_longest or len(description) > len("".join(descriptions)):
+            descriptions[:] = [description]
+
+
+def pack_by_tokens(token_counts: list[int], max_tokens: int) -> list[list[int]]:
+    """Group consecutive positions so each group holds at most max_tokens (a larger item gets a group of its own)."""
+    batches: list[list[int]] = []
+    batch_tokens = 0
+    for position, tokens in enumerate(token_counts):
+        if batches and batch_tokens + tokens <= max_tokens:
+            batches[-1].append(position)
+            batch_tokens += tokens
+        else:
+            batches.append([position])
+            batch_tokens = tokens
+    return batches
+
+
+def _split_chunks(results: str, chunk_count: int) -> dict[int, str]:
+    """Split a batched extraction output on its chunk markers, by 0-based chunk position."""
+    parts = re.split(rf"{re.escape(DEFAULT_CHUNK_DELIMITER)}\s*(\d+)", results)
+    chunks: dict[int, str] = {}
+    # parts alternate between a chunk number and the records that follow it
+    for number, records in zip(parts[1::2], parts[2::2], strict=True):
+        position = int(number) - 1
+        if 0 <= position < chunk_count:
+            chunks[position] = chunks.get(position, "") + records
+    return chunks
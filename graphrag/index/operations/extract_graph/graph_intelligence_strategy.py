@@ -3,8 +3,6 @@
 
 """A module containing run_graph_intelligence,  run_extract_graph and _create_text_splitter methods to run graph intelligence."""
 
-import networkx as nx
-
 from graphrag.cache.pipeline_cache import PipelineCache
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.defaults import graphrag_config_defaults
@@ -57,12 +55,21 @@ async def run_extract_graph(
     max_gleanings = args.get(
         "max_gleanings", graphrag_config_defaults.extract_graph.max_gleanings
     )
+    gleaning_min_records = args.get(
+        "gleaning_min_records",
+        graphrag_config_defaults.extract_graph.gleaning_min_records,
+    )
+    batch_max_tokens = args.get(
+        "batch_max_tokens", graphrag_config_defaults.extract_graph.batch_max_tokens
+    )
 
     extractor = GraphExtractor(
         model_invoker=model,
         prompt=extraction_prompt,
         encoding_model=encoding_model,
         max_gleanings=max_gleanings,
+        gleaning_min_records=gleaning_min_records,
+        batch_max_tokens=batch_max_tokens,
         on_error=lambda e, s, d: (
             callbacks.error("Entity Extraction Error", e, s, d) if callbacks else None
         ),
@@ -79,26 +86,12 @@ async def run_extract_graph(
         },
     )
 
-    graph = results.output
     # Map the "source_id" back to the "id" field
-    for _, node in graph.nodes(data=True):  # type: ignore
-        if node is not None:
-            node["source_id"] = ",".join(
-                docs[int(id)].id for id in node["source_id"].split(",")
-            )
-
-    for _, _, edge in graph.edges(data=True):  # type: ignore
-        if edge is not None:
-            edge["source_id"] = ",".join(
-                docs[int(id)].id for id in edge["source_id"].split(",")
-            )
-
-    entities = [
-        ({"title": item[0], **(item[1] or {})})
-        for item in graph.nodes(data=True)
-        if item is not None
+    results.entities["source_id"] = [
+        docs[doc_index].id for doc_index in results.entities["source_id"]
+    ]
+    results.relationships["source_id"] = [
+        docs[doc_index].id for doc_index in results.relationships["source_id"]
     ]
 
-    relationships = nx.to_pandas_edgelist(graph)
-
-    return EntityExtractionResult(entities, relationships, graph)
+    return EntityExtractionResult(results.entities, results.relationships)
@@ -8,13 +8,13 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
-import networkx as nx
-
 from graphrag.cache.pipeline_cache import PipelineCache
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 
-ExtractedEntity = dict[str, Any]
-ExtractedRelationship = dict[str, Any]
+ExtractedRecords = dict[str, list[Any]]
+"""Columnar records: one list of values per column, all of the same length."""
+ENTITY_RECORD_COLUMNS = ("title", "type", "description", "source_id")
+RELATIONSHIP_RECORD_COLUMNS = ("source", "target", "weight", "description", "source_id")
 StrategyConfig = dict[str, Any]
 EntityTypes = list[str]
 
@@ -29,11 +29,14 @@ class Document:
 
 @dataclass
 class EntityExtractionResult:
-    """Entity extraction result class definition."""
+    """Entity extraction result class definition.
+
+    Holds one entity row per (text unit, entity) and one relationship row per
+    (text unit, entity pair), so results of many calls can be appended and merged once.
+    """
 
-    entities: list[ExtractedEntity]
-    relationships: list[ExtractedRelationship]
-    graph: nx.Graph | None
+    entities: ExtractedRecords
+    relationships: ExtractedRecords
 
 
 EntityExtractStrategy = Callable[
@@ -41,6 +41,7 @@ def build_local_context(
     claims,
     callbacks: WorkflowCallbacks,
     max_tokens: int = 16_000,
+    context_workers: int = 0,
 ):
     """Prep communities for report generation."""
     levels = get_levels(nodes, schemas.COMMUNITY_LEVEL)
@@ -49,7 +50,7 @@ def build_local_context(
 
     for level in progress_iterable(levels, callbacks.progress, len(levels)):
         communities_at_level_df = _prepare_reports_at_level(
-            nodes, edges, claims, level, max_tokens
+            nodes, edges, claims, level, max_tokens, context_workers
         )
 
         communities_at_level_df.loc[:, schemas.COMMUNITY_LEVEL] = level
@@ -65,6 +66,7 @@ def _prepare_reports_at_level(
     claim_df: pd.DataFrame | None,
     level: int,
     max_tokens: int = 16_000,
+    context_workers: int = 0,
 ) -> pd.DataFrame:
     """Prepare reports at a given level."""
     # Filter and prepare node details
@@ -182,6 +184,9 @@ def _prepare_reports_at_level(
     return parallel_sort_context_batch(
         community_df,
         max_tokens=max_tokens,
+        parallel=context_workers > 0,
+        use_processes=True,
+        max_workers=context_workers or None,
     )
 
 
@@ -2,6 +2,15 @@
 # Licensed under the MIT License
 """Sort context by degree in descending order."""
 
+import csv
+import functools
+import io
+import math
+import os
+from collections.abc import Iterable
+from typing import Any
+
+import numpy as np
 import pandas as pd
 
 import graphrag.data_model.schemas as schemas
@@ -22,36 +31,6 @@ def sort_context(
     claim_details_column: str = schemas.CLAIM_DETAILS,
 ) -> str:
     """Sort context by degree in descending order, optimizing for performance."""
-
-    def _get_context_string(
-        entities: list[dict],
-        edges: list[dict],
-        claims: list[dict],
-        sub_community_reports: list[dict] | None = None,
-    ) -> str:
-        """Concatenate structured data into a context string."""
-        contexts = []
-        if sub_community_reports:
-            report_df = pd.DataFrame(sub_community_reports)
-            if not report_df.empty:
-                contexts.append(
-                    f"----Reports-----\n{report_df.to_csv(index=False, sep=',')}"
-                )
-
-        for label, data in [
-            ("Entities", entities),
-            ("Claims", claims),
-            ("Relationships", edges),
-        ]:
-            if data:
-                data_df = pd.DataFrame(data)
-                if not data_df.empty:
-                    contexts.append(
-                        f"-----{label}-----\n{data_df.to_csv(index=False, sep=',')}"
-                    )
-
-        return "\n\n".join(contexts)
-
     # Preprocess local context
     edges = [
         {**e, schemas.SHORT_ID: int(e[schemas.SHORT_ID])}
@@ -81,6 +60,68 @@ def sort_context(
     # Sort edges by degree (desc) and ID (asc)
     edges.sort(key=lambda x: (-x.get(edge_degree_column, 0), x.get(edge_id_column, "")))
 
+    claim_rows = [claim for claims in claim_details.values() for claim in claims]
+    if _csv_safe(edges) and _csv_safe(node_details.values()) and _csv_safe(claim_rows):
+        return _pack_context(
+            edges,
+            node_details,
+            claim_details,
+            sub_community_reports,
+            max_tokens,
+            edge_source_column,
+            edge_target_column,
+        )
+    return _rebuild_context(
+        edges,
+        node_details,
+        claim_details,
+        sub_community_reports,
+        max_tokens,
+        edge_source_column,
+        edge_target_column,
+    )
+
+
+def _get_context_string(
+    entities: list[dict],
+    edges: list[dict],
+    claims: list[dict],
+    sub_community_reports: list[dict] | None = None,
+) -> str:
+    """Concatenate structured data into a context string."""
+    contexts = []
+    if sub_community_reports:
+        report_df = pd.DataFrame(sub_community_reports)
+        if not report_df.empty:
+            contexts.append(
+                f"----Reports-----\n{report_df.to_csv(index=False, sep=',')}"
+            )
+
+    for label, data in [
+        ("Entities", entities),
+        ("Claims", claims),
+        ("Relationships", edges),
+    ]:
+        if data:
+            data_df = pd.DataFrame(data)
+            if not data_df.empty:
+                contexts.append(
+                    f"-----{label}-----\n{data_df.to_csv(index=False, sep=',')}"
+                )
+
+    return "\n\n".join(contexts)
+
+
+def _rebuild_context(
+    edges: list[dict],
+    node_details: dict,
+    claim_details: dict,
+    sub_community_reports: list[dict] | None,
+    max_tokens: int | None,
+    edge_source_column: str,
+    edge_target_column: str,
+) -> str:
+    """Add edges one at a time, re-rendering and re-counting the whole context after each."""
     # Deduplicate and build context incrementally
     edge_ids, nodes_ids, claims_ids = set(), set(), set()
     sorted_edges, sorted_nodes, sorted_claims = [], [], []
@@ -122,19 +163,212 @@ def sort_context(
     )
 
 
-def parallel_sort_context_batch(community_df, max_tokens, parallel=False):
-    """Calculate context using parallelization if enabled."""
+def _csv_kind(value: Any) -> str | None:
+    """Classify a value by how DataFrame.to_csv renders it, or None if unsupported."""
+    if isinstance(value, str):
+        return "str"
+    if isinstance(value, bool | np.bool_):
+        return "bool"
+    if isinstance(value, int | np.integer):
+        return "int"
+    if isinstance(value, float):
+        # float64 only: narrower floats are formatted at their own precision
+        return "float"
+    return None
+
+
+def _csv_safe(records: Iterable[dict]) -> bool:
+    """Whether rows can be rendered one at a time exactly as DataFrame(records).to_csv would.
+
+    That holds when every record has the same keys in the same order and every
+    column holds a single scalar kind, so no prefix of the rows can change a
+    column's dtype (e.g. ints turning into floats once a NaN appears).
+    """
+    columns = None
+    kinds: list[str | None] = []
+    for record in records:
+        if columns is None:
+            columns = list(record)
+            kinds = [_csv_kind(value) for value in record.values()]
+            if None in kinds:
+                return False
+        elif (
+            list(record) != columns
+            or [_csv_kind(value) for value in record.values()] != kinds
+        ):
+            return False
+    return True
+
+
+def _csv_value(value: Any) -> str:
+    if isinstance(value, float):
+        # NaN is written as an empty field; other floats use their shortest repr
+        return "" if math.isnan(value) else repr(float(value))
+    if isinstance(value, bool | np.bool_):
+        return str(bool(value))
+    if isinstance(value, np.integer):
+        return str(int(value))
+    return str(value)
+
+
+def _csv_line(values: Iterable[Any]) -> str:
+    """Render one row with the same dialect DataFrame.to_csv uses."""
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator=os.linesep).writerow([
+        _csv_value(value) for value in values
+    ])
+    return buffer.getvalue()
+
+
+class _Section:
+    """One labelled CSV table of the context, rendered and counted row by row.
+
+    Every row ends with a newline, which is always a tiktoken pre-tokenization
+    boundary for the next row, so the token count of the table is the sum of its
+    parts. Only the last row of a table that is followed by another one merges
+    with the blank-line separator and is counted together with it.
+    """
+
+    def __init__(self, label: str):
+        self.label = label
+        self.header = ""
+        self.header_tokens = 0
+        self.rows: list[str] = []
+        self.row_tokens: list[int] = []
+        # running token totals, so any prefix of the table is counted in O(1)
+        self.cumulative_tokens: list[int] = []
+        self._joined_tokens: dict[int, int] = {}
+
+    def add(self, record: dict) -> None:
+        if not self.rows:
+            self.header = f"-----{self.label}-----\n{_csv_line(record)}"
+            self.header_tokens = num_tokens(self.header)
+        row = _csv_line(record.values())
+        tokens = num_tokens(row)
+        self.rows.append(row)
+        self.row_tokens.append(tokens)
+        self.cumulative_tokens.append(
+            tokens + (self.cumulative_tokens[-1] if self.cumulative_tokens else 0)
+        )
+
+    def count(self, rows: int, followed: bool) -> int:
+        """Token count of the first rows, including the separator if another table follows."""
+        last = rows - 1
+        total = self.header_tokens + self.cumulative_tokens[last]
+        if followed:
+            if last not in self._joined_tokens:
+                self._joined_tokens[last] = num_tokens(f"{self.rows[last]}\n\n")
+            total += self._joined_tokens[last] - self.row_tokens[last]
+        return total
+
+    def render(self, rows: int) -> str:
+        return self.header + "".join(self.rows[:rows])
+
+
+def _pack_context(
+    edges: list[dict],
+    node_details: dict,
+    claim_details: dict,
+    sub_community_reports: list[dict] | None,
+    max_tokens: int | None,
+    edge_source_column: str,
+    edge_target_column: str,
+) -> str:
+    """Add edges one at a time like _rebuild_context, rendering each row once and keeping running token counts."""
+    reports = _get_context_string([], [], [], sub_community_reports)
+    reports_tokens = num_tokens(reports) if reports else 0
+    reports_joined_tokens = num_tokens(f"{reports}\n\n") if reports else 0
+    entities, claims, relationships = (
+        _Section("Entities"),
+        _Section("Claims"),
+        _Section("Relationships"),
+    )
+    sections = (entities, claims, relationships)
+
+    def total_tokens(rows: tuple[int, ...]) -> int:
+        present = [
+            (section, count)
+            for section, count in zip(sections, rows, strict=True)
+            if count
+        ]
+        total = 0
+        if reports:
+            total += reports_joined_tokens if present else reports_tokens
+        for index, (section, count) in enumerate(present):
+            total += section.count(count, followed=index < len(present) - 1)
+        return total
+
+    def render(rows: tuple[int, ...]) -> str:
+        contexts = [reports] if reports else []
+        contexts.extend(
+            section.render(count)
+            for section, count in zip(sections, rows, strict=True)
+            if count
+        )
+        return "\n\n".join(contexts)
+
+    edge_ids, nodes_ids, claims_ids = set(), set(), set()
+    previous: tuple[int, ...] | None = None
+
+    for edge in edges:
+        source, target = edge[edge_source_column], edge[edge_target_column]
+
+        for node in [node_details.get(source), node_details.get(target)]:
+            if node and node[schemas.SHORT_ID] not in nodes_ids:
+                nodes_ids.add(node[schemas.SHORT_ID])
+                entities.add(node)
+
+        for node_claims in [claim_details.get(source), claim_details.get(target)]:
+            if node_claims:
+                for claim in node_claims:
+                    if claim[schemas.SHORT_ID] not in claims_ids:
+                        claims_ids.add(claim[schemas.SHORT_ID])
+                        claims.add(claim)
+
+        if edge[schemas.SHORT_ID] not in edge_ids:
+            edge_ids.add(edge[schemas.SHORT_ID])
+            relationships.add(edge)
+
+        current = tuple(len(section.rows) for section in sections)
+        if max_tokens and total_tokens(current) > max_tokens:
+            # keep the last fitting context; if even the first edge overflows, keep it anyway
+            return render(previous if previous is not None else current)
+        previous = current
+
+    return render(tuple(len(section.rows) for section in sections))
+
+
+def parallel_sort_context_batch(
+    community_df,
+    max_tokens,
+    parallel=False,
+    use_processes=False,
+    max_workers=None,
+):
+    """Calculate context using parallelization if enabled.
+
+    Threads share the GIL, so for large graphs set use_processes to pack
+    communities on a process pool (max_workers defaults to the CPU count).
+    """
     if parallel:
-        # Use ThreadPoolExecutor for parallel execution
-        from concurrent.futures import ThreadPoolExecutor
-
-        with ThreadPoolExecutor(max_workers=None) as executor:
-            context_strings = list(
-                executor.map(
-                    lambda x: sort_context(x, max_tokens=max_tokens),
-                    community_df[schemas.ALL_CONTEXT],
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+        contexts = community_df[schemas.ALL_CONTEXT].tolist()
+        pack = functools.partial(sort_context, max_tokens=max_tokens)
+        if use_processes:
+            workers = max_workers or os.cpu_count() or 1
+            # ship communities in chunks to amortize pickling and IPC per task
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                context_strings = list(
+                    executor.map(
+                        pack,
+                        contexts,
+                        chunksize=max(1, len(contexts) // (workers * 4)),
+                    )
                 )
-            )
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                context_strings = list(executor.map(pack, contexts))
         community_df[schemas.CONTEXT_STRING] = context_strings
 
     else:
@@ -3,14 +3,16 @@
 
 """A module containing create_community_reports and load_strategy methods definition."""
 
+import asyncio
 import logging
+import time
+import traceback
 from collections.abc import Callable
 
 import pandas as pd
 
 import graphrag.data_model.schemas as schemas
 from graphrag.cache.pipeline_cache import PipelineCache
-from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.enums import AsyncType
 from graphrag.index.operations.summarize_communities.typing import (
@@ -21,7 +23,8 @@ from graphrag.index.operations.summarize_communities.typing import (
 from graphrag.index.operations.summarize_communities.utils import (
     get_levels,
 )
-from graphrag.index.utils.derive_from_rows import derive_from_rows
+from graphrag.index.run.profiling import record_llm_wait
+from graphrag.index.utils.derive_from_rows import ParallelizationError
 from graphrag.logger.progress import progress_ticker
 
 log = logging.getLogger(__name__)
@@ -36,11 +39,18 @@ async def summarize_communities(
     cache: PipelineCache,
     strategy: dict,
     max_input_length: int,
-    async_mode: AsyncType = AsyncType.AsyncIO,
+    async_mode: AsyncType = AsyncType.AsyncIO,  # noqa: ARG001
     num_threads: int = 4,
 ):
-    """Generate community summaries."""
-    reports: list[CommunityReport | None] = []
+    """Generate community summaries.
+
+    Reports are scheduled over the community hierarchy instead of level by level.
+    A community whose local context fits (or that has no sub-communities) starts
+    right away; one whose context must be built from sub-community reports starts
+    as soon as its own sub-communities are done. At most num_threads reports are
+    generated at a time across all levels. Both async modes run the strategy
+    coroutines on the event loop.
+    """
     tick = progress_ticker(callbacks.progress, len(local_contexts))
     strategy_exec = load_strategy(strategy["type"])
     strategy_config = {**strategy}
@@ -57,42 +67,128 @@ async def summarize_communities(
 
     levels = get_levels(nodes)
 
-    level_contexts = []
-    for level in levels:
-        level_context = level_context_builder(
-            pd.DataFrame(reports),
+    # contexts that need no sub-community report: fitting ones as-is, the rest trimmed
+    level_contexts = [
+        level_context_builder(
+            None,
             community_hierarchy_df=community_hierarchy,
             local_context_df=local_contexts,
             level=level,
             max_tokens=max_input_length,
         )
-        level_contexts.append(level_context)
-
-    for level_context in level_contexts:
-
-        async def run_generate(record):
-            result = await _generate_report(
-                strategy_exec,
-                community_id=record[schemas.COMMUNITY_ID],
-                community_level=record[schemas.COMMUNITY_LEVEL],
-                community_context=record[schemas.CONTEXT_STRING],
-                callbacks=callbacks,
-                cache=cache,
-                strategy=strategy_config,
-            )
-            tick()
-            return result
-
-        local_reports = await derive_from_rows(
-            level_context,
-            run_generate,
-            callbacks=NoopWorkflowCallbacks(),
-            num_threads=num_threads,
-            async_type=async_mode,
+        for level in levels
+    ]
+    records = [
+        record
+        for level_context in level_contexts
+        for _, record in level_context.iterrows()
+    ]
+
+    loop = asyncio.get_running_loop()
+    finished = {
+        int(record[schemas.COMMUNITY_ID]): loop.create_future() for record in records
+    }
+    sub_communities: dict[int, list[int]] = {}
+    for community, sub_community in zip(
+        community_hierarchy["community"],
+        community_hierarchy["sub_community"],
+        strict=True,
+    ):
+        if int(sub_community) in finished:
+            sub_communities.setdefault(int(community), []).append(int(sub_community))
+    exceeded = {
+        int(community)
+        for community, flag in zip(
+            local_contexts[schemas.COMMUNITY_ID],
+            local_contexts[schemas.CONTEXT_EXCEED_FLAG],
+            strict=True,
         )
-        reports.extend([lr for lr in local_reports if lr is not None])
+        if flag
+    }
+
+    semaphore = asyncio.Semaphore(num_threads or 4)
+    errors: list[tuple[BaseException, str]] = []
+
+    async def run_generate(record: pd.Series) -> CommunityReport | None:
+        community_id = int(record[schemas.COMMUNITY_ID])
+        community_level = int(record[schemas.COMMUNITY_LEVEL])
+        report = None
+        try:
+            community_context = record[schemas.CONTEXT_STRING]
+            children = sub_communities.get(community_id)
+            if community_id in exceeded and children:
+                # wait outside the semaphore, so waiting parents never hold a slot
+                sub_reports = [
+                    sub_report
+                    for sub_report in await asyncio.gather(*[
+                        finished[child] for child in children
+                    ])
+                    if sub_report is not None
+                ]
+                if sub_reports:
+                    community_context = await asyncio.to_thread(
+                        _build_community_context,
+                        level_context_builder,
+                        community_id,
+                        community_level,
+                        sub_reports,
+                        community_hierarchy,
+                        local_contexts,
+                        max_input_length,
+                        community_context,
+                    )
+
+            wait_start = time.perf_counter()
+            async with semaphore:
+                record_llm_wait(time.perf_counter() - wait_start)
+                report = await _generate_report(
+                    strategy_exec,
+                    community_id=record[schemas.COMMUNITY_ID],
+                    community_level=record[schemas.COMMUNITY_LEVEL],
+                    community_context=community_context,
+                    callbacks=callbacks,
+                    cache=cache,
+                    strategy=strategy_config,
+                )
+        except Exception as e:  # noqa: BLE001
+            errors.append((e, traceback.format_exc()))
+        finally:
+            finished[community_id].set_result(report)
+            tick()
+        return report
+
+    results = await asyncio.gather(*[run_generate(record) for record in records])
+
+    if errors:
+        raise ParallelizationError(len(errors), errors[0][1])
+
+    return pd.DataFrame([report for report in results if report is not None])
 
-    return pd.DataFrame(reports)
+
+def _build_community_context(
+    level_context_builder: Callable,
+    community_id: int,
+    community_level: int,
+    sub_reports: list[CommunityReport],
+    community_hierarchy: pd.DataFrame,
+    local_contexts: pd.DataFrame,
+    max_input_length: int,
+    fallback: str,
+) -> str:
+    """Build the context of one community from its sub-community reports."""
+    hierarchy = community_hierarchy[community_hierarchy["community"] == community_id]
+    members = {community_id, *(int(sub) for sub in hierarchy["sub_community"])}
+    context = level_context_builder(
+        pd.DataFrame(sub_reports),
+        community_hierarchy_df=hierarchy,
+        local_context_df=local_contexts[
+            local_contexts[schemas.COMMUNITY_ID].astype(int).isin(members)
+        ],
+        level=community_level,
+        max_tokens=max_input_length,
+    )
+    row = context[context[schemas.COMMUNITY_ID].astype(int) == community_id]
+    return fallback if row.empty else row[schemas.CONTEXT_STRING].iloc[0]
 
 
 async def _generate_report(
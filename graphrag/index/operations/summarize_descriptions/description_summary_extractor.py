@@ -4,12 +4,13 @@
 """A module containing 'GraphExtractionResult' and 'GraphExtractor' models."""
 
 import json
+from collections.abc import Mapping
 from dataclasses import dataclass
 
 from graphrag.index.typing.error_handler import ErrorHandlerFn
-from graphrag.index.utils.tokens import num_tokens_from_string
 from graphrag.language_model.protocol.base import ChatModel
 from graphrag.prompts.index.summarize_descriptions import SUMMARIZE_PROMPT
+from graphrag.utils.tokenizer import CachedTokenizer, get_tokenizer
 
 # Max token size for input prompts
 DEFAULT_MAX_INPUT_TOKENS = 4_000
@@ -35,6 +36,9 @@ class SummarizeExtractor:
     _on_error: ErrorHandlerFn
     _max_summary_length: int
     _max_input_tokens: int
+    _prompt_tokens: int
+    _tokenizer: CachedTokenizer
+    _token_counts: Mapping[str, int]
 
     def __init__(
         self,
@@ -45,6 +49,8 @@ class SummarizeExtractor:
         on_error: ErrorHandlerFn | None = None,
         max_summary_length: int | None = None,
         max_input_tokens: int | None = None,
+        encoding_model: str | None = None,
+        token_counts: Mapping[str, int] | None = None,
     ):
         """Init method definition."""
         # TODO: streamline construction
@@ -56,6 +62,10 @@ class SummarizeExtractor:
         self._on_error = on_error or (lambda _e, _s, _d: None)
         self._max_summary_length = max_summary_length or DEFAULT_MAX_SUMMARY_LENGTH
         self._max_input_tokens = max_input_tokens or DEFAULT_MAX_INPUT_TOKENS
+        self._tokenizer = get_tokenizer(encoding_model)
+        # descriptions already counted by the caller are not encoded again
+        self._token_counts = token_counts or {}
+        self._prompt_tokens = self._tokenizer.count(self._summarization_prompt)
 
     async def __call__(
         self,
@@ -91,14 +101,18 @@ class SummarizeExtractor:
             descriptions = sorted(descriptions)
 
         # Iterate over descriptions, adding all until the max input tokens is reached
-        usable_tokens = self._max_input_tokens - num_tokens_from_string(
-            self._summarization_prompt
-        )
+        description_tokens = [
+            self._token_counts[d]
+            if d in self._token_counts
+            else self._tokenizer.count(d)
+            for d in descriptions
+        ]
+        usable_tokens = self._max_input_tokens - self._prompt_tokens
         descriptions_collected = []
         result = ""
 
         for i, description in enumerate(descriptions):
-            usable_tokens -= num_tokens_from_string(description)
+            usable_tokens -= description_tokens[i]
             descriptions_collected.append(description)
 
             # If buffer is full, or all descriptions have been added, summarize
@@ -115,8 +129,8 @@ class SummarizeExtractor:
                     descriptions_collected = [result]
                     usable_tokens = (
                         self._max_input_tokens
-                        - num_tokens_from_string(self._summarization_prompt)
-                        - num_tokens_from_string(result)
+                        - self._prompt_tokens
+                        - self._tokenizer.count(result)
                     )
 
         return result
@@ -63,6 +63,8 @@ async def run_summarize_descriptions(
         ),
         max_summary_length=args.get("max_summary_length", None),
         max_input_tokens=max_tokens,
+        encoding_model=args.get("encoding_name", None),
+        token_counts=args.get("token_counts", None),
     )
 
     result = await extractor(id=id, descriptions=descriptions)
@@ -5,17 +5,23 @@
 
 import asyncio
 import logging
+import time
 from typing import Any
 
 import pandas as pd
 
 from graphrag.cache.pipeline_cache import PipelineCache
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
+from graphrag.index.operations.summarize_descriptions.description_summary_extractor import (
+    DEFAULT_MAX_SUMMARY_LENGTH,
+)
 from graphrag.index.operations.summarize_descriptions.typing import (
     SummarizationStrategy,
     SummarizeStrategyType,
 )
+from graphrag.index.run.profiling import record_llm_wait
 from graphrag.logger.progress import ProgressTicker, progress_ticker
+from graphrag.utils.tokenizer import get_tokenizer
 
 log = logging.getLogger(__name__)
 
@@ -80,6 +86,10 @@ async def summarize_descriptions(
     if strategy_config.get("llm") and strategy_config["llm"]["max_retries"] == -1:
         strategy_config["llm"]["max_retries"] = len(entities_df) + len(relationships_df)
 
+    max_summary_length = (
+        strategy_config.get("max_summary_length") or DEFAULT_MAX_SUMMARY_LENGTH
+    )
+
     async def get_summarized(
         nodes: pd.DataFrame, edges: pd.DataFrame, semaphore: asyncio.Semaphore
     ):
@@ -87,45 +97,62 @@ async def summarize_descriptions(
 
         ticker = progress_ticker(callbacks.progress, ticker_length)
 
-        node_futures = [
-            do_summarize_descriptions(
-                str(row.title),  # type: ignore
-                sorted(set(row.description)),  # type: ignore
-                ticker,
-                semaphore,
-            )
+        node_jobs = [
+            (str(row.title), sorted(set(row.description)))  # type: ignore
             for row in nodes.itertuples(index=False)
         ]
-
-        node_results = await asyncio.gather(*node_futures)
+        edge_jobs = [
+            ((str(row.source), str(row.target)), sorted(set(row.description)))  # type: ignore
+            for row in edges.itertuples(index=False)
+        ]
+        token_counts = _count_description_tokens(
+            node_jobs + edge_jobs, strategy_config.get("encoding_name")
+        )
+        # the extractor budgets its prompts with these counts instead of recounting
+        strategy_config["token_counts"] = token_counts
+
+        # Resolve items that need no summarization up front, and queue the rest
+        # (nodes and edges interleaved) so the largest prompts start first
+        descriptions: dict[str | tuple[str, str], str] = {}
+        pending = []
+        for id, unique_descriptions in node_jobs + edge_jobs:
+            trivial = _trivial_summary(
+                unique_descriptions, token_counts, max_summary_length
+            )
+            if trivial is not None:
+                descriptions[id] = trivial
+                ticker(1)
+            else:
+                estimate = sum(token_counts[d] for d in unique_descriptions)
+                pending.append((estimate, id, unique_descriptions))
+        log.info(
+            "summarize_descriptions: %d of %d descriptions resolved without the LLM",
+            ticker_length - len(pending),
+            ticker_length,
+        )
+        pending.sort(key=lambda job: job[0], reverse=True)
+
+        results = await asyncio.gather(*[
+            do_summarize_descriptions(id, unique_descriptions, ticker, semaphore)
+            for _, id, unique_descriptions in pending
+        ])
+        for result in results:
+            descriptions[result.id] = result.description
 
         node_descriptions = [
             {
-                "title": result.id,
-                "description": result.description,
+                "title": id,
+                "description": descriptions[id],
             }
-            for result in node_results
-        ]
-
-        edge_futures = [
-            do_summarize_descriptions(
-                (str(row.source), str(row.target)),  # type: ignore
-                sorted(set(row.description)),  # type: ignore
-                ticker,
-                semaphore,
-            )
-            for row in edges.itertuples(index=False)
+            for id, _ in node_jobs
         ]
-
-        edge_results = await asyncio.gather(*edge_futures)
-
         edge_descriptions = [
             {
-                "source": result.id[0],
-                "target": result.id[1],
-                "description": result.description,
+                "source": id[0],
+                "target": id[1],
+                "description": descriptions[id],
             }
-            for result in edge_results
+            for id, _ in edge_jobs
         ]
 
         entity_descriptions = pd.DataFrame(node_descriptions)
@@ -138,7 +165,9 @@ async def summarize_descriptions(
         ticker: ProgressTicker,
         semaphore: asyncio.Semaphore,
     ):
+        wait_start = time.perf_counter()
         async with semaphore:
+            record_llm_wait(time.perf_counter() - wait_start)
             results = await strategy_exec(
                 id, descriptions, callbacks, cache, strategy_config
             )
@@ -162,3 +191,30 @@ def load_strategy(strategy_type: SummarizeStrategyType) -> SummarizationStrategy
         case _:
             msg = f"Unknown strategy: {strategy_type}"
             raise ValueError(msg)
+
+
+def _count_description_tokens(
+    jobs: list[tuple[str | tuple[str, str], list[str]]],
+    encoding_name: str | None = None,
+) -> dict[str, int]:
+    """Count the tokens of every distinct description in a single batch."""
+    unique = list({d for _, descriptions in jobs for d in descriptions})
+    counts = get_tokenizer(encoding_name).count_batch(unique)
+    return dict(zip(unique, counts, strict=True))
+
+
+def _trivial_summary(
+    descriptions: list[str], token_counts: dict[str, int], max_summary_length: int
+) -> str | None:
+    """Return the summary of a description list that needs no LLM call, if any.
+
+    A single unique description is used verbatim, and descriptions that
+    together already fit within the summary length are joined.
+    """
+    if len(descriptions) == 0:
+        return ""
+    if len(descriptions) == 1:
+        return descriptions[0]
+    if sum(token_counts[d] for d in descriptions) <= max_summary_length:
+        return " ".join(descriptions)
+    return None
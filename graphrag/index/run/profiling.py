@@ -0,0 +1,211 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Per-workflow resource telemetry for the indexing pipeline."""
+
+from __future__ import annotations
+
+import logging
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    import pandas as pd
+
+log = logging.getLogger(__name__)
+
+TOP_ALLOCATORS = 10
+"""Number of tracemalloc allocation sites reported per workflow."""
+
+
+@dataclass
+class WorkflowProfile:
+    """Resource usage collected while a single workflow runs."""
+
+    name: str
+    """The workflow name."""
+
+    memory_profile: bool = False
+    """Whether tracemalloc and deep DataFrame sizing are enabled."""
+
+    llm_calls: int = 0
+    """Number of LLM requests actually sent to the provider."""
+
+    llm_retries: int = 0
+    """Number of retryable LLM errors that triggered a new attempt."""
+
+    llm_cache_hits: int = 0
+    """Number of LLM requests answered from the cache."""
+
+    llm_cache_misses: int = 0
+    """Number of LLM requests that missed the cache."""
+
+    prompt_tokens: int = 0
+    """Prompt tokens reported by the provider."""
+
+    completion_tokens: int = 0
+    """Completion tokens reported by the provider."""
+
+    llm_wait_time: float = 0
+    """Seconds spent waiting on the pipeline's LLM concurrency semaphores."""
+
+    tables_in: dict[str, dict[str, int]] = field(default_factory=dict)
+    """Row count and byte size of each table loaded from storage."""
+
+    tables_out: dict[str, dict[str, int]] = field(default_factory=dict)
+    """Row count and byte size of each table written to storage."""
+
+    def record_table(self, name: str, table: pd.DataFrame, output: bool) -> None:
+        """Record the shape and in-memory size of a table read or written by the workflow."""
+        target = self.tables_out if output else self.tables_in
+        target[name] = {
+            "rows": len(table),
+            "columns": len(table.columns),
+            "bytes": int(
+                table.memory_usage(index=True, deep=self.memory_profile).sum()
+            ),
+        }
+
+    def to_stats(self) -> dict[str, Any]:
+        """Return the JSON-serializable stats for this workflow."""
+        lookups = self.llm_cache_hits + self.llm_cache_misses
+        return {
+            "llm_calls": self.llm_calls,
+            "llm_retries": self.llm_retries,
+            "llm_cache_hits": self.llm_cache_hits,
+            "llm_cache_misses": self.llm_cache_misses,
+            "llm_cache_hit_rate": self.llm_cache_hits / lookups if lookups else 0.0,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "llm_wait_time": self.llm_wait_time,
+            "tables_in": self.tables_in,
+            "tables_out": self.tables_out,
+        }
+
+
+_current_profile: ContextVar[WorkflowProfile | None] = ContextVar(
+    "graphrag_workflow_profile", default=None
+)
+
+
+def current_profile() -> WorkflowProfile | None:
+    """Return the profile of the workflow running in the current context, if any."""
+    return _current_profile.get()
+
+
+def record_llm_wait(seconds: float) -> None:
+    """Add time spent waiting for an LLM concurrency slot to the current workflow."""
+    profile = _current_profile.get()
+    if profile is not None:
+        profile.llm_wait_time += seconds
+
+
+def record_table(name: str, table: pd.DataFrame, output: bool) -> None:
+    """Record a table read (output=False) or written (output=True) by the current workflow."""
+    profile = _current_profile.get()
+    if profile is not None:
+        profile.record_table(name, table, output)
+
+
+@contextmanager
+def profile_workflow(
+    name: str, stats: dict[str, Any], memory_profile: bool = False
+) -> Iterator[WorkflowProfile]:
+    """Collect telemetry for a workflow and write it into the given stats dict on exit.
+
+    Tasks and threads started by the workflow inherit the profile through the
+    current context, so LLM events and storage reads are attributed to it.
+    """
+    profile = WorkflowProfile(name=name, memory_profile=memory_profile)
+    token = _current_profile.set(profile)
+    if memory_profile:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+    peak_rss_start = _peak_rss()
+    start_wall = time.time()
+    start = time.perf_counter()
+    try:
+        yield profile
+    finally:
+        _current_profile.reset(token)
+        peak_rss = _peak_rss()
+        stats.update({
+            "overall": time.perf_counter() - start,
+            "start_time": start_wall,
+            "peak_rss": peak_rss,
+            "peak_rss_growth": max(peak_rss - peak_rss_start, 0),
+            **profile.to_stats(),
+        })
+        if memory_profile and tracemalloc.is_tracing():
+            _, traced_peak = tracemalloc.get_traced_memory()
+            stats["tracemalloc_peak"] = traced_peak
+            stats["top_allocators"] = _top_allocators()
+
+
+def stop_memory_profiling() -> None:
+    """Stop tracemalloc if it was started for the pipeline run."""
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+def export_workflow_span(name: str, stats: dict[str, Any]) -> None:
+    """Export a finished workflow's stats as an OpenTelemetry span.
+
+    Uses the globally configured tracer provider; this is a no-op when
+    opentelemetry is not installed.
+    """
+    try:
+        from opentelemetry import trace
+    except ImportError:
+        log.warning("opentelemetry is not installed, skipping workflow span export")
+        return
+
+    start_ns = int(stats["start_time"] * 1e9)
+    end_ns = start_ns + int(stats["overall"] * 1e9)
+    tracer = trace.get_tracer("graphrag.index")
+    span = tracer.start_span(f"workflow.{name}", start_time=start_ns)
+    for key, value in _flatten(stats, "graphrag"):
+        span.set_attribute(key, value)
+    span.end(end_time=end_ns)
+
+
+def _flatten(values: dict[str, Any], prefix: str) -> Iterator[tuple[str, Any]]:
+    for key, value in values.items():
+        name = f"{prefix}.{key}"
+        if isinstance(value, dict):
+            yield from _flatten(value, name)
+        elif isinstance(value, bool | int | float | str):
+            yield name, value
+
+
+def _top_allocators() -> list[dict[str, Any]]:
+    snapshot = tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(inclusive=False, filename_pattern=tracemalloc.__file__),
+    ))
+    return [
+        {
+            "location": str(stat.traceback),
+            "size": stat.size,
+            "count": stat.count,
+        }
+        for stat in snapshot.statistics("lineno")[:TOP_ALLOCATORS]
+    ]
+
+
+def _peak_rss() -> int:
+    """Return the process high-water resident set size in bytes, or 0 if unavailable."""
+    try:
+        import resource
+    except ImportError:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and kilobytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
@@ -18,6 +18,11 @@ from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.models.graph_rag_config import GraphRagConfig
 from graphrag.index.input.factory import create_input
+from graphrag.index.run.profiling import (
+    export_workflow_span,
+    profile_workflow,
+    stop_memory_profiling,
+)
 from graphrag.index.run.utils import create_run_context
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.pipeline import Pipeline
@@ -41,6 +46,7 @@ async def run_pipeline(
     callbacks: WorkflowCallbacks,
     logger: ProgressLogger,
     is_update_run: bool = False,
+    memory_profile: bool = False,
 ) -> AsyncIterable[PipelineRunResult]:
     """Run all workflows using a simplified pipeline."""
     root_dir = config.root_dir
@@ -83,6 +89,7 @@ async def run_pipeline(
                 storage=delta_storage,
                 callbacks=callbacks,
                 logger=logger,
+                memory_profile=memory_profile,
             ):
                 yield table
 
@@ -110,6 +117,7 @@ async def run_pipeline(
             storage=storage,
             callbacks=callbacks,
             logger=logger,
+            memory_profile=memory_profile,
         ):
             yield table
 
@@ -122,6 +130,7 @@ async def _run_pipeline(
     storage: PipelineStorage,
     callbacks: WorkflowCallbacks,
     logger: ProgressLogger,
+    memory_profile: bool = False,
 ) -> AsyncIterable[PipelineRunResult]:
     start_time = time.time()
 
@@ -145,15 +154,19 @@ async def _run_pipeline(
             last_workflow = name
             progress = logger.child(name, transient=False)
             callbacks.workflow_start(name, None)
-            work_time = time.time()
-            result = await workflow_function(config, context)
+            workflow_stats = context.stats.workflows.setdefault(name, {})
+            with profile_workflow(name, workflow_stats, memory_profile):
+                result = await workflow_function(config, context)
+            if config.reporting.otel_spans:
+                export_workflow_span(name, workflow_stats)
             progress(Progress(percent=1))
             callbacks.workflow_end(name, result)
             yield PipelineRunResult(
                 workflow=name, result=result.result, state=context.state, errors=None
             )
 
-            context.stats.workflows[name] = {"overall": time.time() - work_time}
+            # persist stats after each workflow so partial runs remain inspectable
+            await _dump_json(context)
 
         context.stats.total_runtime = time.time() - start_time
         await _dump_json(context)
@@ -164,6 +177,9 @@ async def _run_pipeline(
         yield PipelineRunResult(
             workflow=last_workflow, result=None, state=context.state, errors=[e]
         )
+    finally:
+        if memory_profile:
+            stop_memory_profiling()
 
 
 async def _dump_json(context: PipelineRunContext) -> None:
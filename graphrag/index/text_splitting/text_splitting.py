@@ -5,16 +5,22 @@
 
 import logging
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Collection, Iterable
+from collections.abc import Callable, Collection, Iterable, Sequence
 from dataclasses import dataclass
+from itertools import chain
 from typing import Any, Literal, cast
 
+import numpy as np
 import pandas as pd
-import tiktoken
 
 import graphrag.config.defaults as defs
 from graphrag.index.operations.chunk_text.typing import TextChunk
 from graphrag.logger.progress import ProgressTicker
+from graphrag.utils.tokenizer import (
+    DEFAULT_ENCODE_THREADS,
+    get_encoding,
+    tokenizer_for,
+)
 
 EncodedText = list[int]
 DecodeFn = Callable[[EncodedText], str]
@@ -23,6 +29,9 @@ LengthFn = Callable[[str], int]
 
 log = logging.getLogger(__name__)
 
+_ENCODE_BATCH_SIZE = 1000
+"""Texts (or chunks) encoded (or decoded) per batch, bounding the temporary Python token lists."""
+
 
 @dataclass(frozen=True)
 class Tokenizer:
@@ -96,15 +105,7 @@ class TokenTextSplitter(TextSplitter):
     ):
         """Init method definition."""
         super().__init__(**kwargs)
-        if model_name is not None:
-            try:
-                enc = tiktoken.encoding_for_model(model_name)
-            except KeyError:
-                log.exception("Model %s not found, using %s", model_name, encoding_name)
-                enc = tiktoken.get_encoding(encoding_name)
-        else:
-            enc = tiktoken.get_encoding(encoding_name)
-        self._tokenizer = enc
+        self._tokenizer = get_encoding(encoding_name, model_name)
         self._allowed_special = allowed_special or set()
         self._disallowed_special = disallowed_special
 
@@ -118,7 +119,9 @@ class TokenTextSplitter(TextSplitter):
 
     def num_tokens(self, text: str) -> int:
         """Return the number of tokens in a string."""
-        return len(self.encode(text))
+        if self._allowed_special:
+            return len(self.encode(text))
+        return tokenizer_for(self._tokenizer).count(text)
 
     def split_text(self, text: str | list[str]) -> list[str]:
         """Split text method."""
@@ -165,29 +168,175 @@ def split_multiple_texts_on_tokens(
     texts: list[str], tokenizer: Tokenizer, tick: ProgressTicker
 ) -> list[TextChunk]:
     """Split multiple texts and return chunks with metadata using the tokenizer."""
-    result = []
-    mapped_ids = []
-
-    for source_doc_idx, text in enumerate(texts):
-        encoded = tokenizer.encode(text)
+    encoded = []
+    for text in texts:
+        encoded.append(np.asarray(tokenizer.encode(text), dtype=np.int64))
         if tick:
             tick(1)  # Track progress if tick callback is provided
-        mapped_ids.append((source_doc_idx, encoded))
 
-    input_ids = [
-        (source_doc_idx, id) for source_doc_idx, ids in mapped_ids for id in ids
+    offsets = _offsets([len(ids) for ids in encoded])
+    tokens = np.concatenate(encoded) if encoded else np.zeros(0, dtype=np.int64)
+    _, starts, ends = chunk_windows(
+        np.asarray([len(tokens)]), tokenizer.tokens_per_chunk, tokenizer.chunk_overlap
+    )
+    doc_indices = _window_doc_indices(
+        offsets, starts, ends, np.zeros(len(starts), dtype=np.int64)
+    )
+    return [
+        TextChunk(tokenizer.decode(tokens[start:end].tolist()), indices, end - start)
+        for start, end, indices in zip(
+            starts.tolist(), ends.tolist(), doc_indices, strict=True
+        )
     ]
 
-    start_idx = 0
-    cur_idx = min(start_idx + tokenizer.tokens_per_chunk, len(input_ids))
-    chunk_ids = input_ids[start_idx:cur_idx]
 
-    while start_idx < len(input_ids):
-        chunk_text = tokenizer.decode([id for _, id in chunk_ids])
-        doc_indices = list({doc_idx for doc_idx, _ in chunk_ids})
-        result.append(TextChunk(chunk_text, doc_indices, len(chunk_ids)))
-        start_idx += tokenizer.tokens_per_chunk - tokenizer.chunk_overlap
-        cur_idx = min(start_idx + tokenizer.tokens_per_chunk, len(input_ids))
-        chunk_ids = input_ids[start_idx:cur_idx]
+@dataclass
+class TokenChunks:
+    """Columnar token chunks of grouped texts, one position per chunk."""
+
+    group_indices: np.ndarray
+    """The group each chunk belongs to."""
+    doc_indices: list[list[int]]
+    """The positions, within their group, of the texts each chunk draws from."""
+    texts: list[str]
+    """The decoded text of each chunk."""
+    n_tokens: np.ndarray
+    """The number of tokens in each chunk."""
+
+
+def split_grouped_texts_on_tokens(
+    groups: Sequence[Sequence[Any]],
+    tokens_per_chunk: int | Sequence[int],
+    chunk_overlap: int,
+    encoding_name: str,
+    tick: ProgressTicker | None = None,
+    num_threads: int = DEFAULT_ENCODE_THREADS,
+) -> TokenChunks:
+    """Split every group of texts into overlapping token chunks in one pass.
+
+    The texts of a group are chunked as one token stream, like
+    split_multiple_texts_on_tokens, with one window size per group (or the same
+    for all). Texts are encoded with tiktoken's threaded encode_batch into a
+    single token array and chunks are sliced from it by offset, so no Python
+    object is kept per token.
+    """
+    encoding = get_encoding(encoding_name)
+    texts = [
+        text if isinstance(text, str) else f"{text}"
+        for text in chain.from_iterable(groups)
+    ]
 
-    return result
+    token_batches = []
+    text_lengths = np.zeros(len(texts), dtype=np.int64)
+    for batch_start in range(0, len(texts), _ENCODE_BATCH_SIZE):
+        batch = texts[batch_start : batch_start + _ENCODE_BATCH_SIZE]
+        encoded = encoding.encode_batch(batch, num_threads=num_threads)
+        lengths = [len(ids) for ids in encoded]
+        text_lengths[batch_start : batch_start + len(batch)] = lengths
+        token_batches.append(
+            np.fromiter(
+                chain.from_iterable(encoded), dtype=np.uint32, count=sum(lengths)
+            )
+        )
+        if tick:
+            tick(len(batch))
+    tokens = np.concatenate(token_batches) if token_batches else np.zeros(0, np.uint32)
+
+    text_offsets = _offsets(text_lengths)
+    group_first_text = _offsets([len(group) for group in groups])
+    group_indices, starts, ends = chunk_windows(
+        np.diff(text_offsets[group_first_text]), tokens_per_chunk, chunk_overlap
+    )
+    doc_indices = _window_doc_indices(
+        text_offsets, starts, ends, group_first_text[group_indices]
+    )
+
+    chunk_texts: list[str] = []
+    bounds = list(zip(starts.tolist(), ends.tolist(), strict=True))
+    for batch_start in range(0, len(bounds), _ENCODE_BATCH_SIZE):
+        chunk_texts.extend(
+            encoding.decode_batch(
+                [
+                    tokens[start:end].tolist()
+                    for start, end in bounds[
+                        batch_start : batch_start + _ENCODE_BATCH_SIZE
+                    ]
+                ],
+                num_threads=num_threads,
+            )
+        )
+
+    return TokenChunks(
+        group_indices=group_indices,
+        doc_indices=doc_indices,
+        texts=chunk_texts,
+        n_tokens=ends - starts,
+    )
+
+
+def chunk_windows(
+    group_lengths: np.ndarray,
+    tokens_per_chunk: int | Sequence[int] | np.ndarray,
+    chunk_overlap: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return the group, start and end token offset of every chunk window.
+
+    Groups are consecutive runs of group_lengths tokens; each is covered by
+    windows of tokens_per_chunk tokens advancing by tokens_per_chunk - chunk_overlap,
+    the windows split_single_text_on_tokens steps through.
+    """
+    group_lengths = np.asarray(group_lengths, dtype=np.int64)
+    sizes = np.broadcast_to(
+        np.asarray(tokens_per_chunk, dtype=np.int64), group_lengths.shape
+    )
+    strides = sizes - chunk_overlap
+    if (strides[group_lengths > 0] <= 0).any():
+        msg = "Chunk overlap must be smaller than the tokens per chunk."
+        raise ValueError(msg)
+
+    counts = np.where(group_lengths > 0, -(-group_lengths // np.maximum(strides, 1)), 0)
+    group_indices = np.repeat(np.arange(len(group_lengths)), counts)
+    window_indices = np.arange(counts.sum()) - np.repeat(
+        np.cumsum(counts) - counts, counts
+    )
+    group_starts = np.cumsum(group_lengths) - group_lengths
+    starts = group_starts[group_indices] + window_indices * strides[group_indices]
+    ends = np.minimum(
+        starts + sizes[group_indices],
+        group_starts[group_indices] + group_lengths[group_indices],
+    )
+    return group_indices, starts, ends
+
+
+def _offsets(lengths: Sequence[int] | np.ndarray) -> np.ndarray:
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    return offsets
+
+
+def _window_doc_indices(
+    text_offsets: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    first_texts: np.ndarray,
+) -> list[list[int]]:
+    """Get the texts (relative to first_texts) with tokens in each window."""
+    first = np.searchsorted(text_offsets, starts, "right") - 1
+    last = np.searchsorted(text_offsets, ends - 1, "right") - 1
+    text_lengths = np.diff(text_offsets)
+    doc_indices = []
+    for first_text, last_text, base in zip(
+        first.tolist(), last.tolist(), first_texts.tolist(), strict=True
+    ):
+        if first_text == last_text:
+            doc_indices.append([first_text - base])
+        else:
+            # set order, as the per-token splitter produced: it is part of the chunk id hash
+            doc_indices.append(
+                list({
+                    text - base
+                    for text in range(first_text, last_text + 1)
+                    if text_lengths[text] > 0
+                })
+            )
+    return doc_indices
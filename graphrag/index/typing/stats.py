@@ -4,6 +4,7 @@
 """Pipeline stats types."""
 
 from dataclasses import dataclass, field
+from typing import Any
 
 
 @dataclass
@@ -19,5 +20,5 @@ class PipelineRunStats:
     input_load_time: float = field(default=0)
     """Float representing the input load time."""
 
-    workflows: dict[str, dict[str, float]] = field(default_factory=dict)
-    """A dictionary of workflows."""
+    workflows: dict[str, dict[str, Any]] = field(default_factory=dict)
+    """Per-workflow telemetry: runtime, peak memory, table sizes and LLM usage."""
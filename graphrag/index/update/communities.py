@@ -9,6 +9,12 @@ from graphrag.data_model.schemas import (
     COMMUNITIES_FINAL_COLUMNS,
     COMMUNITY_REPORTS_FINAL_COLUMNS,
 )
+from graphrag.index.operations.cluster_graph import cluster_graph
+from graphrag.index.operations.create_graph import create_graph
+from graphrag.index.utils.stable_lcc import stable_largest_connected_component
+from graphrag.index.workflows.create_communities import (
+    create_communities_from_clusters,
+)
 
 
 def _update_and_merge_communities(
@@ -150,3 +156,199 @@ def _update_and_merge_community_reports(
     ]
 
     return merged_community_reports.loc[:, COMMUNITY_REPORTS_FINAL_COLUMNS]
+
+
+def _recluster_changed_region(
+    old_communities: pd.DataFrame,
+    entities: pd.DataFrame,
+    relationships: pd.DataFrame,
+    changed_titles: set[str],
+    max_cluster_size: int,
+    use_lcc: bool,
+    seed: int | None = None,
+) -> tuple[pd.DataFrame, set[int]]:
+    """Re-cluster only the part of the graph touched by an incremental update.
+
+    The region is made of the changed entities, their neighbours, and every
+    member of the previous top level communities that contain any of them.
+    It is re-partitioned with hierarchical Leiden seeded with the previous top
+    level assignment; communities outside the region are kept as they are.
+    Re-clustered communities whose level and membership match a previous
+    community keep its id.
+
+    Parameters
+    ----------
+    old_communities : pd.DataFrame
+        The communities of the previous index.
+    entities : pd.DataFrame
+        The merged entities.
+    relationships : pd.DataFrame
+        The merged relationships.
+    changed_titles : set[str]
+        Titles of the entities added or modified by the delta.
+
+    Returns
+    -------
+    pd.DataFrame
+        The updated communities.
+    set[int]
+        The ids of the communities whose membership or content changed, and
+        therefore need a new report.
+    """
+    old_communities = old_communities.copy()
+    if "size" not in old_communities.columns:
+        old_communities["size"] = None
+    if "period" not in old_communities.columns:
+        old_communities["period"] = None
+    old_communities["community"] = old_communities["community"].astype(int)
+    old_communities["parent"] = old_communities["parent"].astype(int)
+
+    graph = create_graph(relationships)
+    if use_lcc:
+        graph = stable_largest_connected_component(graph)
+
+    id_to_title = dict(zip(entities["id"], entities["title"], strict=True))
+    members = old_communities["entity_ids"].apply(
+        lambda ids: frozenset(id_to_title[i] for i in ids if i in id_to_title)
+    )
+    roots = old_communities["level"].astype(int) == 0
+    root_of = {
+        title: community
+        for community, titles in zip(
+            old_communities.loc[roots, "community"], members[roots], strict=True
+        )
+        for title in titles
+    }
+
+    seeds = {title for title in changed_titles if title in graph}
+    for title in list(seeds):
+        seeds.update(graph.neighbors(title))
+    affected_roots = {root_of[title] for title in seeds if title in root_of}
+    region = set(seeds)
+    for community, titles in zip(
+        old_communities.loc[roots, "community"], members[roots], strict=True
+    ):
+        if community in affected_roots:
+            region.update(titles)
+    region &= set(graph.nodes)
+
+    in_region = members.apply(lambda titles: not titles.isdisjoint(region))
+    kept = old_communities.loc[~in_region]
+    if len(region) == 0:
+        return kept.loc[:, COMMUNITIES_FINAL_COLUMNS], set()
+
+    clusters = cluster_graph(
+        graph.subgraph(sorted(region)),
+        max_cluster_size,
+        use_lcc=False,
+        seed=seed,
+        starting_communities={
+            title: root_of[title] for title in region if title in root_of
+        },
+    )
+
+    # map the new cluster ids onto previous ids where membership is unchanged
+    previous = {
+        (int(level), titles): community
+        for level, titles, community in zip(
+            old_communities.loc[in_region, "level"],
+            members[in_region],
+            old_communities.loc[in_region, "community"],
+            strict=True,
+        )
+    }
+    next_id = int(old_communities["community"].max()) + 1
+    id_mapping = {-1: -1}
+    cluster_members: dict[int, frozenset[str]] = {}
+    for level, cluster, _, titles in clusters:
+        key = (int(level), frozenset(titles))
+        if key in previous:
+            id_mapping[cluster] = previous[key]
+        else:
+            id_mapping[cluster] = next_id
+            next_id += 1
+        cluster_members[id_mapping[cluster]] = key[1]
+
+    region_communities = create_communities_from_clusters(
+        [
+            (level, id_mapping[cluster], id_mapping[parent], titles)
+            for level, cluster, parent, titles in clusters
+        ],
+        entities,
+        relationships,
+    )
+
+    reused = set(previous.values())
+    changed = {
+        community
+        for community, titles in cluster_members.items()
+        if community not in reused or not titles.isdisjoint(changed_titles)
+    }
+
+    # unchanged communities keep their previous id and period
+    unchanged = ~region_communities["community"].isin(changed)
+    previous_rows = old_communities.set_index("community")
+    for column in ["id", "period"]:
+        region_communities.loc[unchanged, column] = region_communities.loc[
+            unchanged, "community"
+        ].map(previous_rows[column])
+
+    merged_communities = pd.concat(
+        [kept.loc[:, COMMUNITIES_FINAL_COLUMNS], region_communities],
+        ignore_index=True,
+        copy=False,
+    )
+    changed &= set(merged_communities["community"])
+    return merged_communities.loc[:, COMMUNITIES_FINAL_COLUMNS], changed
+
+
+def _merge_regenerated_community_reports(
+    old_community_reports: pd.DataFrame,
+    regenerated_reports: pd.DataFrame,
+    communities: pd.DataFrame,
+) -> pd.DataFrame:
+    """Replace the reports of re-clustered communities and refresh the hierarchy fields.
+
+    Parameters
+    ----------
+    old_community_reports : pd.DataFrame
+        The community reports of the previous index.
+    regenerated_reports : pd.DataFrame
+        The reports generated for changed communities.
+    communities : pd.DataFrame
+        The updated communities.
+
+    Returns
+    -------
+    pd.DataFrame
+        The updated community reports.
+    """
+    old_community_reports = old_community_reports.copy()
+    old_community_reports["community"] = old_community_reports["community"].astype(int)
+    regenerated = set(regenerated_reports["community"].astype(int))
+    kept = old_community_reports.loc[
+        old_community_reports["community"].isin(set(communities["community"]))
+        & ~old_community_reports["community"].isin(regenerated)
+    ]
+    kept = kept.drop(
+        columns=["parent", "children", "size", "period"], errors="ignore"
+    ).merge(
+        communities.loc[:, ["community", "parent", "children", "size", "period"]],
+        on="community",
+        how="left",
+        copy=False,
+    )
+
+    merged_community_reports = pd.concat(
+        [kept.loc[:, COMMUNITY_REPORTS_FINAL_COLUMNS], regenerated_reports],
+        ignore_index=True,
+        copy=False,
+    )
+    merged_community_reports["community"] = merged_community_reports[
+        "community"
+    ].astype(int)
+    merged_community_reports["human_readable_id"] = merged_community_reports[
+        "community"
+    ]
+
+    return merged_community_reports.loc[:, COMMUNITY_REPORTS_FINAL_COLUMNS]
@@ -12,7 +12,11 @@ from graphrag.cache.pipeline_cache import PipelineCache
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.embeddings import get_embedded_fields, get_embedding_settings
 from graphrag.config.models.graph_rag_config import GraphRagConfig
+from graphrag.data_model.schemas import COMMUNITY_REPORTS_FINAL_COLUMNS
+from graphrag.index.operations.summarize_descriptions import summarize_descriptions
 from graphrag.index.update.communities import (
+    _merge_regenerated_community_reports,
+    _recluster_changed_region,
     _update_and_merge_communities,
     _update_and_merge_community_reports,
 )
@@ -20,8 +24,13 @@ from graphrag.index.update.entities import (
     _group_and_resolve_entities,
 )
 from graphrag.index.update.relationships import _update_and_merge_relationships
-from graphrag.index.workflows.extract_graph import get_summarized_entities_relationships
-from graphrag.index.workflows.generate_text_embeddings import generate_text_embeddings
+from graphrag.index.workflows.create_community_reports import (
+    create_community_reports,
+)
+from graphrag.index.workflows.generate_text_embeddings import (
+    generate_text_embeddings,
+    write_keyword_indexes,
+)
 from graphrag.logger.print_progress import ProgressLogger
 from graphrag.storage.pipeline_storage import PipelineStorage
 from graphrag.utils.storage import (
@@ -128,16 +137,30 @@ async def update_dataframe_outputs(
         await _update_covariates(previous_storage, delta_storage, output_storage)
 
     # 5. 合并新旧社区
-    progress_logger.info("Updating Communities")
-    community_id_mapping = await _update_communities(
-        previous_storage, delta_storage, output_storage
-    )
+    if config.cluster_graph.incremental_update:
+        # 只对受增量影响的区域重新聚类, 并只为发生变化的社区重新生成报告
+        progress_logger.info("Re-clustering Changed Communities")
+        merged_community_reports = await _update_communities_locally(
+            previous_storage,
+            delta_storage,
+            output_storage,
+            merged_entities_df,
+            merged_relationships_df,
+            config,
+            cache,
+            callbacks,
+        )
+    else:
+        progress_logger.info("Updating Communities")
+        community_id_mapping = await _update_communities(
+            previous_storage, delta_storage, output_storage
+        )
 
-    # 合并社区报告
-    progress_logger.info("Updating Community Reports")
-    merged_community_reports = await _update_community_reports(
-        previous_storage, delta_storage, output_storage, community_id_mapping
-    )
+        # 合并社区报告
+        progress_logger.info("Updating Community Reports")
+        merged_community_reports = await _update_community_reports(
+            previous_storage, delta_storage, output_storage, community_id_mapping
+        )
 
     # 合并新旧文本嵌入
     progress_logger.info("Updating Text Embeddings")
@@ -161,6 +184,86 @@ async def update_dataframe_outputs(
                 f"embeddings.{name}",
                 output_storage,
             )
+    if config.embed_text.keyword_index:
+        # BM25 statistics are corpus-wide, so the indexes are rebuilt over the merged tables
+        await write_keyword_indexes(
+            text_units=merged_text_units,
+            entities=merged_entities_df,
+            storage=output_storage,
+            tokenizer=config.embed_text.keyword_tokenizer,
+        )
+
+
+async def _update_communities_locally(
+    previous_storage: PipelineStorage,
+    delta_storage: PipelineStorage,
+    output_storage: PipelineStorage,
+    merged_entities: pd.DataFrame,
+    merged_relationships: pd.DataFrame,
+    config: GraphRagConfig,
+    cache: PipelineCache,
+    callbacks: WorkflowCallbacks,
+) -> pd.DataFrame:
+    """Re-cluster the region touched by the delta and regenerate its changed reports."""
+    delta_entities = await load_table_from_storage("entities", delta_storage)
+    delta_relationships = await load_table_from_storage("relationships", delta_storage)
+    changed_titles = (
+        set(delta_entities["title"])
+        | set(delta_relationships["source"])
+        | set(delta_relationships["target"])
+    )
+
+    old_communities = await load_table_from_storage("communities", previous_storage)
+    merged_communities, changed_communities = _recluster_changed_region(
+        old_communities,
+        merged_entities,
+        merged_relationships,
+        changed_titles,
+        max_cluster_size=config.cluster_graph.max_cluster_size,
+        use_lcc=config.cluster_graph.use_lcc,
+        seed=config.cluster_graph.seed,
+    )
+    await write_table_to_storage(merged_communities, "communities", output_storage)
+
+    claims = None
+    if config.extract_claims.enabled and await storage_has_table(
+        "covariates", output_storage
+    ):
+        claims = await load_table_from_storage("covariates", output_storage)
+
+    regenerated_reports = pd.DataFrame(columns=COMMUNITY_REPORTS_FINAL_COLUMNS)
+    if changed_communities:
+        community_reports_llm_settings = config.get_language_model_config(
+            config.community_reports.model_id
+        )
+        regenerated_reports = await create_community_reports(
+            edges_input=merged_relationships.copy(),
+            entities=merged_entities.copy(),
+            communities=merged_communities.loc[
+                merged_communities["community"].isin(changed_communities)
+            ],
+            claims_input=claims,
+            callbacks=callbacks,
+            cache=cache,
+            summarization_strategy=config.community_reports.resolved_strategy(
+                config.root_dir, community_reports_llm_settings
+            ),
+            async_mode=community_reports_llm_settings.async_mode,
+            num_threads=community_reports_llm_settings.concurrent_requests,
+            context_workers=config.community_reports.context_workers,
+        )
+
+    old_community_reports = await load_table_from_storage(
+        "community_reports", previous_storage
+    )
+    merged_community_reports = _merge_regenerated_community_reports(
+        old_community_reports, regenerated_reports, merged_communities
+    )
+    await write_table_to_storage(
+        merged_community_reports, "community_reports", output_storage
+    )
+
+    return merged_community_reports
 
 
 async def _update_community_reports(
@@ -261,25 +364,17 @@ async def _update_entities_and_relationships(
         delta_relationships,
     )
 
-    summarization_llm_settings = config.get_language_model_config(
-        config.summarize_descriptions.model_id
-    )
-
-    # 4. 合并新旧实体和关系，并根据合并后的实体和关系，重新生成摘要描述
-    summarization_strategy = config.summarize_descriptions.resolved_strategy(
-        config.root_dir, summarization_llm_settings
-    )
-
-    (
+    # 4. 只对描述集合发生变化 (出现在增量中) 的实体和关系重新生成摘要; 其余沿用旧摘要
+    merged_entities_df, merged_relationships_df = await _resummarize_changed(
         merged_entities_df,
         merged_relationships_df,
-    ) = await get_summarized_entities_relationships(
-        extracted_entities=merged_entities_df,
-        extracted_relationships=merged_relationships_df,
-        callbacks=callbacks,
+        changed_entities=merged_entities_df["title"].isin(delta_entities["title"]),
+        changed_relationships=_key_mask(
+            merged_relationships_df, delta_relationships, ["source", "target"]
+        ),
+        config=config,
         cache=cache,
-        summarization_strategy=summarization_strategy,
-        summarization_num_threads=summarization_llm_settings.concurrent_requests,
+        callbacks=callbacks,
     )
 
     # Save the updated entities back to storage
@@ -292,6 +387,82 @@ async def _update_entities_and_relationships(
     return merged_entities_df, merged_relationships_df, entity_id_mapping
 
 
+async def _resummarize_changed(
+    entities: pd.DataFrame,
+    relationships: pd.DataFrame,
+    changed_entities: pd.Series,
+    changed_relationships: pd.Series,
+    config: GraphRagConfig,
+    cache: PipelineCache,
+    callbacks: WorkflowCallbacks,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Summarize the descriptions of changed entities and relationships only.
+
+    Rows that are not touched by the delta carry a single description (the
+    previous summary), which is kept as is. The summaries of the changed rows
+    are spliced back into the merged tables in place.
+    """
+    entity_summaries = pd.DataFrame(columns=["title", "description"])
+    relationship_summaries = pd.DataFrame(columns=["source", "target", "description"])
+    if changed_entities.any() or changed_relationships.any():
+        summarization_llm_settings = config.get_language_model_config(
+            config.summarize_descriptions.model_id
+        )
+        summarization_strategy = config.summarize_descriptions.resolved_strategy(
+            config.root_dir, summarization_llm_settings
+        )
+        entity_summaries, relationship_summaries = await summarize_descriptions(
+            entities_df=entities.loc[changed_entities, ["title", "description"]],
+            relationships_df=relationships.loc[
+                changed_relationships, ["source", "target", "description"]
+            ],
+            callbacks=callbacks,
+            cache=cache,
+            strategy=summarization_strategy,
+            num_threads=summarization_llm_settings.concurrent_requests,
+        )
+
+    entities = entities.copy()
+    entities["description"] = entities["description"].apply(_first_description)
+    if len(entity_summaries) > 0:
+        summaries = entity_summaries.set_index("title")["description"]
+        entities.loc[changed_entities, "description"] = entities.loc[
+            changed_entities, "title"
+        ].map(summaries)
+
+    relationships = relationships.copy()
+    relationships["description"] = relationships["description"].apply(
+        _first_description
+    )
+    if len(relationship_summaries) > 0:
+        summaries = relationship_summaries.set_index(["source", "target"])[
+            "description"
+        ]
+        keys = pd.MultiIndex.from_frame(
+            relationships.loc[changed_relationships, ["source", "target"]]
+        )
+        relationships.loc[changed_relationships, "description"] = summaries.reindex(
+            keys
+        ).to_numpy()
+
+    return entities, relationships
+
+
+def _first_description(descriptions) -> str:
+    """Return the previous summary of a row that was not touched by the delta."""
+    if isinstance(descriptions, str):
+        return descriptions
+    return str(descriptions[0]) if len(descriptions) > 0 else ""
+
+
+def _key_mask(df: pd.DataFrame, other: pd.DataFrame, keys: list[str]) -> pd.Series:
+    """Return a mask of the rows of df whose key columns appear in other."""
+    mask = pd.MultiIndex.from_frame(df[keys]).isin(
+        pd.MultiIndex.from_frame(other[keys])
+    )
+    return pd.Series(mask, index=df.index)
+
+
 async def _concat_dataframes(
     name: str,
     previous_storage: PipelineStorage,
@@ -6,6 +6,7 @@
 import asyncio
 import inspect
 import logging
+import time
 import traceback
 from collections.abc import Awaitable, Callable, Coroutine, Hashable
 from typing import Any, TypeVar, cast
@@ -15,6 +16,7 @@ import pandas as pd
 from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.enums import AsyncType
+from graphrag.index.run.profiling import record_llm_wait
 from graphrag.logger.progress import progress_ticker
 
 logger = logging.getLogger(__name__)
@@ -74,7 +76,9 @@ async def derive_from_rows_asyncio_threads(
         tasks = [asyncio.to_thread(execute, row) for row in input.iterrows()]
 
         async def execute_task(task: Coroutine) -> ItemType | None:
+            wait_start = time.perf_counter()
             async with semaphore:
+                record_llm_wait(time.perf_counter() - wait_start)
                 # fire off the thread
                 thread = await task
                 return await thread
@@ -104,7 +108,9 @@ async def derive_from_rows_asyncio(
         async def execute_row_protected(
             row: tuple[Hashable, pd.Series],
         ) -> ItemType | None:
+            wait_start = time.perf_counter()
             async with semaphore:
+                record_llm_wait(time.perf_counter() - wait_start)
                 return await execute(row)
 
         tasks = [
@@ -3,7 +3,8 @@
 
 """Hashing utilities."""
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from hashlib import sha512
 from typing import Any
 
@@ -12,3 +13,26 @@ def gen_sha512_hash(item: dict[str, Any], hashcode: Iterable[str]):
     """Generate a SHA512 hash."""
     hashed = "".join([str(item[column]) for column in hashcode])
     return f"{sha512(hashed.encode('utf-8'), usedforsecurity=False).hexdigest()}"
+
+
+def gen_sha512_hashes(values: Sequence[str], num_threads: int = 1) -> list[str]:
+    """Generate the SHA512 hash of many strings.
+
+    hashlib releases the GIL on larger inputs, so chunk-sized strings hash in parallel threads.
+    """
+
+    def digest(batch: Sequence[str]) -> list[str]:
+        return [
+            sha512(value.encode("utf-8"), usedforsecurity=False).hexdigest()
+            for value in batch
+        ]
+
+    if num_threads <= 1 or len(values) < num_threads:
+        return digest(values)
+    size = -(-len(values) // num_threads)
+    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+        batches = executor.map(
+            digest,
+            [values[start : start + size] for start in range(0, len(values), size)],
+        )
+        return [hashed for batch in batches for hashed in batch]
@@ -3,42 +3,24 @@
 
 """Utilities for working with tokens."""
 
-import logging
-
-import tiktoken
-
 import graphrag.config.defaults as defs
+from graphrag.utils.tokenizer import get_encoding, get_tokenizer
 
 DEFAULT_ENCODING_NAME = defs.ENCODING_MODEL
 
-log = logging.getLogger(__name__)
-
 
 def num_tokens_from_string(
     string: str, model: str | None = None, encoding_name: str | None = None
 ) -> int:
     """Return the number of tokens in a text string."""
-    if model is not None:
-        try:
-            encoding = tiktoken.encoding_for_model(model)
-        except KeyError:
-            msg = f"Failed to get encoding for {model} when getting num_tokens_from_string. Fall back to default encoding {DEFAULT_ENCODING_NAME}"
-            log.warning(msg)
-            encoding = tiktoken.get_encoding(DEFAULT_ENCODING_NAME)
-    else:
-        encoding = tiktoken.get_encoding(encoding_name or DEFAULT_ENCODING_NAME)
-    return len(encoding.encode(string))
+    return get_tokenizer(encoding_name or DEFAULT_ENCODING_NAME, model).count(string)
 
 
 def string_from_tokens(
     tokens: list[int], model: str | None = None, encoding_name: str | None = None
 ) -> str:
     """Return a text string from a list of tokens."""
-    if model is not None:
-        encoding = tiktoken.encoding_for_model(model)
-    elif encoding_name is not None:
-        encoding = tiktoken.get_encoding(encoding_name)
-    else:
+    if model is None and encoding_name is None:
         msg = "Either model or encoding_name must be specified."
         raise ValueError(msg)
-    return encoding.decode(tokens)
+    return get_encoding(encoding_name, model).decode(tokens)
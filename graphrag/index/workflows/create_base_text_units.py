@@ -4,19 +4,24 @@
 """A module containing run_workflow method definition."""
 
 import json
+from itertools import chain
 from typing import Any, cast
 
 import pandas as pd
 
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
-from graphrag.config.models.chunking_config import ChunkStrategyType
+from graphrag.config.models.chunking_config import ChunkingConfig, ChunkStrategyType
 from graphrag.config.models.graph_rag_config import GraphRagConfig
-from graphrag.index.operations.chunk_text.chunk_text import chunk_text
+from graphrag.index.operations.chunk_text.chunk_text import chunk_text, load_strategy
 from graphrag.index.operations.chunk_text.strategies import get_encoding_fn
+from graphrag.index.text_splitting.text_splitting import (
+    DEFAULT_ENCODE_THREADS,
+    split_grouped_texts_on_tokens,
+)
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
-from graphrag.index.utils.hashing import gen_sha512_hash
-from graphrag.logger.progress import Progress
+from graphrag.index.utils.hashing import gen_sha512_hash, gen_sha512_hashes
+from graphrag.logger.progress import Progress, progress_ticker
 from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
 
 
@@ -39,6 +44,7 @@ async def run_workflow(
         strategy=chunks.strategy,
         prepend_metadata=chunks.prepend_metadata,
         chunk_size_includes_metadata=chunks.chunk_size_includes_metadata,
+        num_workers=chunks.num_workers,
     )
 
     await write_table_to_storage(output, "text_units", context.storage)
@@ -56,6 +62,7 @@ def create_base_text_units(
     strategy: ChunkStrategyType,
     prepend_metadata: bool = False,
     chunk_size_includes_metadata: bool = False,
+    num_workers: int = 0,
 ) -> pd.DataFrame:
     """All the steps to transform base text_units."""
 
@@ -85,11 +92,11 @@ def create_base_text_units(
     aggregated.rename(columns={"text_with_ids": "texts"}, inplace=True)
 
 
-    def chunker(row: dict[str, Any]) -> Any:
+    def metadata_prefix(row: dict[str, Any]) -> tuple[str, int]:
         line_delimiter = ".\n"
         metadata_str = ""
         metadata_tokens = 0
-   
+
         if prepend_metadata and "metadata" in row:
             metadata = row["metadata"]
             if isinstance(metadata, str):
@@ -106,6 +113,36 @@ def create_base_text_units(
                 if metadata_tokens >= size:
                     message = "Metadata tokens exceeds the maximum tokens per chunk. Please increase the tokens per chunk."
                     raise ValueError(message)
+        return metadata_str, metadata_tokens
+
+    if strategy == ChunkStrategyType.tokens:
+        return _chunk_on_tokens(
+            aggregated,
+            callbacks,
+            group_by_columns,
+            [metadata_prefix(row) for row in aggregated.to_dict("records")],
+            size,
+            overlap,
+            encoding_model,
+        )
+
+    if strategy in (ChunkStrategyType.markdown, ChunkStrategyType.csv):
+        return _chunk_per_document(
+            aggregated,
+            callbacks,
+            group_by_columns,
+            [metadata_prefix(row) for row in aggregated.to_dict("records")],
+            strategy,
+            ChunkingConfig(
+                size=size,
+                overlap=overlap,
+                encoding_model=encoding_model,
+                num_workers=num_workers,
+            ),
+        )
+
+    def chunker(row: dict[str, Any]) -> Any:
+        metadata_str, metadata_tokens = metadata_prefix(row)
 
         # 使用 chunk_text 函数对 text_with_ids 列进行分块处理
         chunked = chunk_text(
@@ -152,3 +189,107 @@ def create_base_text_units(
     return cast(
         "pd.DataFrame", aggregated[aggregated["text"].notna()].reset_index(drop=True)
     )
+
+
+def _chunk_on_tokens(
+    aggregated: pd.DataFrame,
+    callbacks: WorkflowCallbacks,
+    group_by_columns: list[str],
+    metadata: list[tuple[str, int]],
+    size: int,
+    overlap: int,
+    encoding_model: str,
+) -> pd.DataFrame:
+    """Chunk every group's documents in one batched pass, producing the same rows as the chunker above."""
+    groups = aggregated["texts"].tolist()
+    tick = progress_ticker(callbacks.progress, sum(len(texts) for texts in groups))
+    chunks = split_grouped_texts_on_tokens(
+        [[text for _, text in texts] for texts in groups],
+        [size - metadata_tokens for _, metadata_tokens in metadata],
+        overlap,
+        encoding_model,
+        tick=tick,
+    )
+
+    group_indices = chunks.group_indices.tolist()
+    document_ids = [
+        [groups[group][doc_index][0] for doc_index in doc_indices]
+        for group, doc_indices in zip(group_indices, chunks.doc_indices, strict=True)
+    ]
+    texts = [
+        metadata[group][0] + text
+        for group, text in zip(group_indices, chunks.texts, strict=True)
+    ]
+    n_tokens = chunks.n_tokens.tolist()
+
+    output = cast(
+        "pd.DataFrame",
+        aggregated[group_by_columns].iloc[group_indices].reset_index(drop=True),
+    )
+    output["text"] = texts
+    # ids hash the (document_ids, text, n_tokens) chunk tuple, as the row-wise hashing did
+    output["id"] = gen_sha512_hashes(
+        [
+            str(chunk)
+            for chunk in zip(document_ids, texts, n_tokens, strict=True)
+        ],
+        num_threads=DEFAULT_ENCODE_THREADS,
+    )
+    output["document_ids"] = document_ids
+    output["n_tokens"] = n_tokens
+    return output
+
+
+def _chunk_per_document(
+    aggregated: pd.DataFrame,
+    callbacks: WorkflowCallbacks,
+    group_by_columns: list[str],
+    metadata: list[tuple[str, int]],
+    strategy: ChunkStrategyType,
+    config: ChunkingConfig,
+) -> pd.DataFrame:
+    """Chunk the documents of every group in one streaming pass of a per-document strategy, producing the same rows as the chunker above."""
+    groups = aggregated["texts"].tolist()
+    doc_groups = [group for group, texts in enumerate(groups) for _ in texts]
+    documents = list(chain.from_iterable(groups))
+    tick = progress_ticker(callbacks.progress, len(documents))
+    strategy_exec = load_strategy(strategy)
+
+    rows: list[tuple[int, list[str], str, int | None]] = []
+    # chunk sizes only differ between groups when metadata counts towards them
+    group_sizes = [config.size - metadata_tokens for _, metadata_tokens in metadata]
+    for size in dict.fromkeys(group_sizes):
+        positions = [
+            position
+            for position, group in enumerate(doc_groups)
+            if group_sizes[group] == size
+        ]
+        for chunk in strategy_exec(
+            [documents[position][1] for position in positions],
+            config.model_copy(update={"size": size}),
+            tick,
+        ):
+            doc_positions = [positions[index] for index in chunk.source_doc_indices]
+            group = doc_groups[doc_positions[0]]
+            rows.append((
+                group,
+                [documents[position][0] for position in doc_positions],
+                metadata[group][0] + chunk.text_chunk,
+                chunk.n_tokens,
+            ))
+    rows.sort(key=lambda row: row[0])
+
+    output = cast(
+        "pd.DataFrame",
+        aggregated[group_by_columns]
+        .iloc[[group for group, *_ in rows]]
+        .reset_index(drop=True),
+    )
+    output["text"] = [text for _, _, text, _ in rows]
+    # ids hash the (document_ids, text, n_tokens) chunk tuple, as the row-wise hashing did
+    output["id"] = gen_sha512_hashes(
+        [str(tuple(row[1:])) for row in rows], num_threads=DEFAULT_ENCODE_THREADS
+    )
+    output["document_ids"] = [document_ids for _, document_ids, _, _ in rows]
+    output["n_tokens"] = [n_tokens for *_, n_tokens in rows]
+    return output
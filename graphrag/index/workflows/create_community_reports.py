@@ -66,6 +66,7 @@ async def run_workflow(
         summarization_strategy=summarization_strategy,
         async_mode=async_mode,
         num_threads=num_threads,
+        context_workers=config.community_reports.context_workers,
     )
 
     await write_table_to_storage(output, "community_reports", context.storage)
@@ -83,6 +84,7 @@ async def create_community_reports(
     summarization_strategy: dict,
     async_mode: AsyncType = AsyncType.AsyncIO,
     num_threads: int = 4,
+    context_workers: int = 0,
 ) -> pd.DataFrame:
     """All the steps to transform community reports."""
     nodes = explode_communities(communities, entities)
@@ -106,6 +108,7 @@ async def create_community_reports(
         claims,
         callbacks,
         max_input_length,
+        context_workers=context_workers,
     )
 
     community_reports = await summarize_communities(
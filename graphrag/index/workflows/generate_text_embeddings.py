@@ -3,6 +3,7 @@
 
 """A module containing run_workflow method definition."""
 
+import asyncio
 import logging
 
 import pandas as pd
@@ -25,6 +26,8 @@ from graphrag.config.models.graph_rag_config import GraphRagConfig
 from graphrag.index.operations.embed_text import embed_text
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
+from graphrag.keyword_index.bm25 import BM25Index, keyword_index_filename
+from graphrag.storage.pipeline_storage import PipelineStorage
 from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
 
 log = logging.getLogger(__name__)
@@ -66,6 +69,14 @@ async def run_workflow(
                 context.storage,
             )
 
+    if config.embed_text.keyword_index:
+        await write_keyword_indexes(
+            text_units=text_units,
+            entities=entities,
+            storage=context.storage,
+            tokenizer=config.embed_text.keyword_tokenizer,
+        )
+
     return WorkflowFunctionOutput(result=output)
 
 
@@ -162,3 +173,31 @@ async def _run_and_snapshot_embeddings(
     )
 
     return data.loc[:, ["id", "embedding"]]
+
+
+async def write_keyword_indexes(
+    text_units: pd.DataFrame | None,
+    entities: pd.DataFrame | None,
+    storage: PipelineStorage,
+    tokenizer: str,
+) -> None:
+    """Build the BM25 keyword indexes used by hybrid and keyword search and write them to storage."""
+    keyword_fields = {}
+    if text_units is not None:
+        keyword_fields[text_unit_text_embedding] = (
+            text_units["id"],
+            text_units["text"],
+        )
+    if entities is not None:
+        keyword_fields[entity_description_embedding] = (
+            entities["id"],
+            entities["title"].fillna("") + " " + entities["description"].fillna(""),
+        )
+
+    for name, (ids, texts) in keyword_fields.items():
+        # tokenizing is CPU bound; keep the event loop free for concurrent workflows
+        index = await asyncio.to_thread(
+            BM25Index.build, ids.tolist(), texts.tolist(), tokenizer
+        )
+        await storage.set(keyword_index_filename(name), index.to_bytes())
+        log.info("Wrote keyword index for %s (%d documents)", name, len(index))
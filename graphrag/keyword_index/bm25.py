@@ -0,0 +1,167 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A compact in-memory BM25 inverted index."""
+
+import io
+import json
+from collections import Counter
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+
+from graphrag.keyword_index.tokenizers import KeywordTokenizerType, TokenizerFactory
+
+DEFAULT_K1 = 1.2
+DEFAULT_B = 0.75
+
+
+def keyword_index_filename(embedding_name: str) -> str:
+    """Return the storage key of the keyword index built for an embedding."""
+    return f"keyword_index.{embedding_name}.npz"
+
+
+class BM25Index:
+    """A BM25 index over a fixed set of documents.
+
+    Postings are stored in CSR layout (one slice of document positions per term)
+    with the full BM25 term weight precomputed per posting, so a query is a
+    handful of vectorized scatter-adds followed by a partial sort.
+    """
+
+    def __init__(
+        self,
+        doc_ids: np.ndarray,
+        vocabulary: dict[str, int],
+        indptr: np.ndarray,
+        postings: np.ndarray,
+        weights: np.ndarray,
+        tokenizer: str = KeywordTokenizerType.CJK,
+        k1: float = DEFAULT_K1,
+        b: float = DEFAULT_B,
+    ):
+        self.doc_ids = doc_ids
+        self.vocabulary = vocabulary
+        self.indptr = indptr
+        self.postings = postings
+        self.weights = weights
+        self.tokenizer = getattr(tokenizer, "value", tokenizer)
+        self.k1 = k1
+        self.b = b
+        self._tokenize = TokenizerFactory.get_tokenizer(self.tokenizer)
+
+    def __len__(self) -> int:
+        """Return the number of indexed documents."""
+        return len(self.doc_ids)
+
+    @classmethod
+    def build(
+        cls,
+        doc_ids: Sequence[Any],
+        texts: Sequence[str | None],
+        tokenizer: str = KeywordTokenizerType.CJK,
+        k1: float = DEFAULT_K1,
+        b: float = DEFAULT_B,
+    ) -> "BM25Index":
+        """Tokenize and index the given documents."""
+        tokenize = TokenizerFactory.get_tokenizer(tokenizer)
+        vocabulary: dict[str, int] = {}
+        term_ids: list[int] = []
+        doc_positions: list[int] = []
+        freqs: list[int] = []
+        doc_lengths = np.zeros(len(texts), dtype=np.float32)
+        for position, text in enumerate(texts):
+            tokens = tokenize(text) if isinstance(text, str) else []
+            doc_lengths[position] = len(tokens)
+            for term, count in Counter(tokens).items():
+                term_ids.append(vocabulary.setdefault(term, len(vocabulary)))
+                doc_positions.append(position)
+                freqs.append(count)
+
+        term_array = np.asarray(term_ids, dtype=np.int64)
+        # stable sort keeps document positions ascending within each term
+        order = np.argsort(term_array, kind="stable")
+        postings = np.asarray(doc_positions, dtype=np.int32)[order]
+        tf = np.asarray(freqs, dtype=np.float32)[order]
+        doc_freq = np.bincount(term_array, minlength=len(vocabulary))
+        indptr = np.zeros(len(vocabulary) + 1, dtype=np.int64)
+        np.cumsum(doc_freq, out=indptr[1:])
+
+        n_docs = len(texts)
+        idf = np.log1p((n_docs - doc_freq + 0.5) / (doc_freq + 0.5)).astype(np.float32)
+        avg_length = float(doc_lengths.mean()) if n_docs and doc_lengths.any() else 1.0
+        norm = k1 * (1 - b + b * doc_lengths / avg_length)
+        weights = (
+            np.repeat(idf, doc_freq) * tf * (k1 + 1) / (tf + norm[postings])
+        ).astype(np.float32)
+
+        return cls(
+            doc_ids=np.asarray([str(doc_id) for doc_id in doc_ids], dtype=str),
+            vocabulary=vocabulary,
+            indptr=indptr,
+            postings=postings,
+            weights=weights,
+            tokenizer=tokenizer,
+            k1=k1,
+            b=b,
+        )
+
+    def search(self, query: str, k: int = 10) -> list[tuple[str, float]]:
+        """Return up to k (document id, score) pairs, best first.
+
+        Documents sharing no term with the query are never returned.
+        """
+        term_ids = {
+            self.vocabulary[token]
+            for token in self._tokenize(query)
+            if token in self.vocabulary
+        }
+        if not term_ids or k <= 0:
+            return []
+        scores = np.zeros(len(self.doc_ids), dtype=np.float32)
+        for term_id in term_ids:
+            start, end = self.indptr[term_id], self.indptr[term_id + 1]
+            # positions are unique within a posting list, so plain fancy-index add is safe
+            scores[self.postings[start:end]] += self.weights[start:end]
+
+        candidates = np.flatnonzero(scores)
+        if len(candidates) > k:
+            candidates = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+        candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [(str(self.doc_ids[i]), float(scores[i])) for i in candidates]
+
+    def to_bytes(self) -> bytes:
+        """Serialize the index to npz bytes."""
+        terms = np.empty(len(self.vocabulary), dtype=object)
+        for term, term_id in self.vocabulary.items():
+            terms[term_id] = term
+        meta = {"tokenizer": self.tokenizer, "k1": self.k1, "b": self.b}
+        buffer = io.BytesIO()
+        np.savez(
+            buffer,
+            doc_ids=self.doc_ids,
+            terms=terms.astype(str),
+            indptr=self.indptr,
+            postings=self.postings,
+            weights=self.weights,
+            meta=np.asarray(json.dumps(meta)),
+        )
+        return buffer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "BM25Index":
+        """Load an index serialized with to_bytes."""
+        with np.load(io.BytesIO(data), allow_pickle=False) as arrays:
+            meta = json.loads(str(arrays["meta"]))
+            terms = arrays["terms"].tolist()
+            return cls(
+                doc_ids=arrays["doc_ids"],
+                vocabulary={term: term_id for term_id, term in enumerate(terms)},
+                indptr=arrays["indptr"],
+                postings=arrays["postings"],
+                weights=arrays["weights"],
+                tokenizer=meta["tokenizer"],
+                k1=meta["k1"],
+                b=meta["b"],
+            )
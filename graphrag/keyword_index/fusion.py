@@ -0,0 +1,27 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Reciprocal rank fusion of ranked result lists."""
+
+from collections.abc import Hashable, Sequence
+
+DEFAULT_RRF_K = 60
+"""Rank offset from Cormack et al.; dampens the weight of the very top ranks."""
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[Sequence[Hashable]],
+    k: int = DEFAULT_RRF_K,
+    limit: int | None = None,
+) -> list[Hashable]:
+    """Merge ranked id lists by summing 1 / (k + rank) over every list an id appears in.
+
+    Ties keep the order in which ids were first seen, so the first ranking wins
+    ties against the later ones.
+    """
+    scores: dict[Hashable, float] = {}
+    for ranking in rankings:
+        for rank, key in enumerate(ranking, start=1):
+            scores[key] = scores.get(key, 0.0) + 1.0 / (k + rank)
+    fused = sorted(scores, key=lambda key: scores[key], reverse=True)
+    return fused[:limit] if limit is not None else fused
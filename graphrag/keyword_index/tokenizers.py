@@ -0,0 +1,78 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Tokenizers used to build and query keyword indexes."""
+
+import re
+import unicodedata
+from collections.abc import Callable
+from enum import Enum
+from typing import ClassVar
+
+Tokenizer = Callable[[str], list[str]]
+
+_WORD = re.compile(r"\w+")
+_CJK_CHARS = r"\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff\uac00-\ud7af"
+_CJK = f"[{_CJK_CHARS}]+"
+# letters and digits of any other script
+_WORD_CHAR = rf"(?:(?![{_CJK_CHARS}])[^\W_])"
+# words keep inner separators so product codes such as "x-200" or "v2.1" stay whole
+_NON_CJK = f"{_WORD_CHAR}+(?:[-_.]{_WORD_CHAR}+)*"
+_MIXED = re.compile(f"({_NON_CJK})|({_CJK})")
+
+
+def simple_tokenize(text: str) -> list[str]:
+    """Split text into lowercase word tokens."""
+    return _WORD.findall(text.lower())
+
+
+def cjk_tokenize(text: str) -> list[str]:
+    """Split text into words plus CJK unigrams and bigrams.
+
+    CJK text has no word delimiters, so every run of CJK characters is indexed
+    as its single characters and overlapping character pairs; this matches
+    proper nouns of any length without a segmentation dictionary.
+    """
+    tokens = []
+    for word, cjk in _MIXED.findall(unicodedata.normalize("NFC", text).lower()):
+        if word:
+            tokens.append(word)
+            continue
+        tokens.extend(cjk)
+        tokens.extend(cjk[i : i + 2] for i in range(len(cjk) - 1))
+    return tokens
+
+
+class KeywordTokenizerType(str, Enum):
+    """The built-in keyword tokenizers."""
+
+    Simple = "simple"
+    CJK = "cjk"
+
+
+class TokenizerFactory:
+    """A factory for keyword tokenizers.
+
+    Includes a method for users to register a custom tokenizer.
+    """
+
+    tokenizer_types: ClassVar[dict[str, Tokenizer]] = {}
+
+    @classmethod
+    def register(cls, tokenizer_type: str, tokenizer: Tokenizer):
+        """Register a custom tokenizer implementation."""
+        cls.tokenizer_types[tokenizer_type] = tokenizer
+
+    @classmethod
+    def get_tokenizer(cls, tokenizer_type: KeywordTokenizerType | str) -> Tokenizer:
+        """Get a tokenizer from the provided type."""
+        match tokenizer_type:
+            case KeywordTokenizerType.Simple:
+                return simple_tokenize
+            case KeywordTokenizerType.CJK:
+                return cjk_tokenize
+            case _:
+                if tokenizer_type in cls.tokenizer_types:
+                    return cls.tokenizer_types[tokenizer_type]
+                msg = f"Unknown keyword tokenizer type: {tokenizer_type}"
+                raise ValueError(msg)
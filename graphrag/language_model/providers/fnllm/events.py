@@ -7,13 +7,19 @@ from typing import Any
 
 from fnllm.events import LLMEvents
 
+from graphrag.index.run.profiling import current_profile
 from graphrag.index.typing.error_handler import ErrorHandlerFn
+from graphrag.language_model.scheduler import current_permit
 
 
 class FNLLMEvents(LLMEvents):
-    """FNLLM events handler that calls the error handler."""
+    """FNLLM events handler that calls the error handler and records LLM usage.
 
-    def __init__(self, on_error: ErrorHandlerFn):
+    Usage, cache hits and rate limits are recorded on the current workflow profile
+    and fed back to the scheduler permit of the request.
+    """
+
+    def __init__(self, on_error: ErrorHandlerFn | None = None):
         self._on_error = on_error
 
     async def on_error(
@@ -23,4 +29,52 @@ class FNLLMEvents(LLMEvents):
         arguments: dict[str, Any] | None = None,
     ) -> None:
         """Handle an fnllm error."""
-        self._on_error(error, traceback, arguments)
+        if self._on_error is not None:
+            self._on_error(error, traceback, arguments)
+        permit = current_permit()
+        if permit is not None and error is not None:
+            permit.record_error(error)
+
+    async def on_execute_llm(self) -> None:
+        """Count a request sent to the provider."""
+        profile = current_profile()
+        if profile is not None:
+            profile.llm_calls += 1
+
+    async def on_usage(self, usage: Any) -> None:
+        """Record token usage reported by the provider."""
+        prompt_tokens = getattr(usage, "input_tokens", 0) or 0
+        completion_tokens = getattr(usage, "output_tokens", 0) or 0
+        profile = current_profile()
+        if profile is not None:
+            profile.prompt_tokens += prompt_tokens
+            profile.completion_tokens += completion_tokens
+        permit = current_permit()
+        if permit is not None:
+            permit.record_usage(prompt_tokens, completion_tokens)
+
+    async def on_cache_hit(self, cache_key: str, name: str | None) -> None:
+        """Record a cached response."""
+        profile = current_profile()
+        if profile is not None:
+            profile.llm_cache_hits += 1
+        permit = current_permit()
+        if permit is not None:
+            permit.record_cache_hit()
+
+    async def on_cache_miss(self, cache_key: str, name: str | None) -> None:
+        """Record a cache miss."""
+        profile = current_profile()
+        if profile is not None:
+            profile.llm_cache_misses += 1
+
+    async def on_retryable_error(
+        self, error: BaseException, attempt_number: int, *args: Any
+    ) -> None:
+        """Record a retried request."""
+        profile = current_profile()
+        if profile is not None:
+            profile.llm_retries += 1
+        permit = current_permit()
+        if permit is not None:
+            permit.record_error(error)
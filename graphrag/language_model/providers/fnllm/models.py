@@ -18,6 +18,8 @@ from graphrag.language_model.providers.fnllm.utils import (
     _create_cache,
     _create_error_handler,
     _create_openai_config,
+    _create_quota,
+    _estimate_chat_tokens,
     run_coroutine_sync,
 )
 from graphrag.language_model.response.base import (
@@ -25,6 +27,7 @@ from graphrag.language_model.response.base import (
     BaseModelResponse,
     ModelResponse,
 )
+from graphrag.language_model.scheduler import estimate_tokens
 
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator, Generator
@@ -53,6 +56,8 @@ class OpenAIChatFNLLM:
         cache: PipelineCache | None = None,
     ) -> None:
         model_config = _create_openai_config(config, azure=False)
+        self.config = config
+        self.quota = _create_quota(config)
         error_handler = _create_error_handler(callbacks) if callbacks else None
         model_cache = _create_cache(cache, name)
         client = create_openai_client(model_config)
@@ -60,7 +65,7 @@ class OpenAIChatFNLLM:
             model_config,
             client=client,
             cache=model_cache,
-            events=FNLLMEvents(error_handler) if error_handler else None,
+            events=FNLLMEvents(error_handler),
         )
 
     async def achat(
@@ -77,10 +82,14 @@ class OpenAIChatFNLLM:
         -------
             The response from the Model.
         """
-        if history is None:
-            response = await self.model(prompt, **kwargs)
-        else:
-            response = await self.model(prompt, history=history, **kwargs)
+        tokens = _estimate_chat_tokens(self.quota, self.config, prompt, history)
+        async with self.quota.request(tokens) as permit:
+            if history is None:
+                response = await self.model(prompt, **kwargs)
+            else:
+                response = await self.model(prompt, history=history, **kwargs)
+            if response.cache_hit:
+                permit.record_cache_hit()
         return BaseModelResponse(
             output=BaseModelOutput(content=response.output.content),
             parsed_response=response.parsed_json,
@@ -104,10 +113,16 @@ class OpenAIChatFNLLM:
         -------
             A generator that yields strings representing the response.
         """
-        if history is None:
-            response = await self.model(prompt, stream=True, **kwargs)
-        else:
-            response = await self.model(prompt, history=history, stream=True, **kwargs)
+        tokens = _estimate_chat_tokens(self.quota, self.config, prompt, history)
+        async with self.quota.request(tokens):
+            if history is None:
+                response = await self.model(prompt, stream=True, **kwargs)
+            else:
+                response = await self.model(
+                    prompt, history=history, stream=True, **kwargs
+                )
+        # the slot is released once the request is issued, so a slow reader of the
+        # stream does not hold back other requests on the quota
         async for chunk in response.output.content:
             if chunk is not None:
                 yield chunk
@@ -158,6 +173,8 @@ class OpenAIEmbeddingFNLLM:
         cache: PipelineCache | None = None,
     ) -> None:
         model_config = _create_openai_config(config, azure=False)
+        self.config = config
+        self.quota = _create_quota(config)
         error_handler = _create_error_handler(callbacks) if callbacks else None
         model_cache = _create_cache(cache, name)
         client = create_openai_client(model_config)
@@ -165,7 +182,7 @@ class OpenAIEmbeddingFNLLM:
             model_config,
             client=client,
             cache=model_cache,
-            events=FNLLMEvents(error_handler) if error_handler else None,
+            events=FNLLMEvents(error_handler),
         )
 
     async def aembed_batch(self, text_list: list[str], **kwargs) -> list[list[float]]:
@@ -180,7 +197,9 @@ class OpenAIEmbeddingFNLLM:
         -------
             The embeddings of the text.
         """
-        response = await self.model(text_list, **kwargs)
+        tokens = estimate_tokens(text_list, self.config.encoding_model)
+        async with self.quota.request(tokens):
+            response = await self.model(text_list, **kwargs)
         if response.output.embeddings is None:
             msg = "No embeddings found in response"
             raise ValueError(msg)
@@ -199,7 +218,9 @@ class OpenAIEmbeddingFNLLM:
         -------
             The embeddings of the text.
         """
-        response = await self.model([text], **kwargs)
+        tokens = estimate_tokens([text], self.config.encoding_model)
+        async with self.quota.request(tokens):
+            response = await self.model([text], **kwargs)
         if response.output.embeddings is None:
             msg = "No embeddings found in response"
             raise ValueError(msg)
@@ -249,6 +270,8 @@ class AzureOpenAIChatFNLLM:
         cache: PipelineCache | None = None,
     ) -> None:
         model_config = _create_openai_config(config, azure=True)
+        self.config = config
+        self.quota = _create_quota(config)
         error_handler = _create_error_handler(callbacks) if callbacks else None
         model_cache = _create_cache(cache, name)
         client = create_openai_client(model_config)
@@ -256,7 +279,7 @@ class AzureOpenAIChatFNLLM:
             model_config,
             client=client,
             cache=model_cache,
-            events=FNLLMEvents(error_handler) if error_handler else None,
+            events=FNLLMEvents(error_handler),
         )
 
     async def achat(
@@ -274,10 +297,14 @@ class AzureOpenAIChatFNLLM:
         -------
             The response from the Model.
         """
-        if history is None:
-            response = await self.model(prompt, **kwargs)
-        else:
-            response = await self.model(prompt, history=history, **kwargs)
+        tokens = _estimate_chat_tokens(self.quota, self.config, prompt, history)
+        async with self.quota.request(tokens) as permit:
+            if history is None:
+                response = await self.model(prompt, **kwargs)
+            else:
+                response = await self.model(prompt, history=history, **kwargs)
+            if response.cache_hit:
+                permit.record_cache_hit()
         return BaseModelResponse(
             output=BaseModelOutput(content=response.output.content),
             parsed_response=response.parsed_json,
@@ -302,10 +329,16 @@ class AzureOpenAIChatFNLLM:
         -------
             A generator that yields strings representing the response.
         """
-        if history is None:
-            response = await self.model(prompt, stream=True, **kwargs)
-        else:
-            response = await self.model(prompt, history=history, stream=True, **kwargs)
+        tokens = _estimate_chat_tokens(self.quota, self.config, prompt, history)
+        async with self.quota.request(tokens):
+            if history is None:
+                response = await self.model(prompt, stream=True, **kwargs)
+            else:
+                response = await self.model(
+                    prompt, history=history, stream=True, **kwargs
+                )
+        # the slot is released once the request is issued, so a slow reader of the
+        # stream does not hold back other requests on the quota
         async for chunk in response.output.content:
             if chunk is not None:
                 yield chunk
@@ -356,6 +389,8 @@ class AzureOpenAIEmbeddingFNLLM:
         cache: PipelineCache | None = None,
     ) -> None:
         model_config = _create_openai_config(config, azure=True)
+        self.config = config
+        self.quota = _create_quota(config)
         error_handler = _create_error_handler(callbacks) if callbacks else None
         model_cache = _create_cache(cache, name)
         client = create_openai_client(model_config)
@@ -363,7 +398,7 @@ class AzureOpenAIEmbeddingFNLLM:
             model_config,
             client=client,
             cache=model_cache,
-            events=FNLLMEvents(error_handler) if error_handler else None,
+            events=FNLLMEvents(error_handler),
         )
 
     async def aembed_batch(self, text_list: list[str], **kwargs) -> list[list[float]]:
@@ -378,7 +413,9 @@ class AzureOpenAIEmbeddingFNLLM:
         -------
             The embeddings of the text.
         """
-        response = await self.model(text_list, **kwargs)
+        tokens = estimate_tokens(text_list, self.config.encoding_model)
+        async with self.quota.request(tokens):
+            response = await self.model(text_list, **kwargs)
         if response.output.embeddings is None:
             msg = "No embeddings found in response"
             raise ValueError(msg)
@@ -397,7 +434,9 @@ class AzureOpenAIEmbeddingFNLLM:
         -------
             The embeddings of the text.
         """
-        response = await self.model([text], **kwargs)
+        tokens = estimate_tokens([text], self.config.encoding_model)
+        async with self.quota.request(tokens):
+            response = await self.model([text], **kwargs)
         if response.output.embeddings is None:
             msg = "No embeddings found in response"
             raise ValueError(msg)
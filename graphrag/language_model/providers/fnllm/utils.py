@@ -15,6 +15,12 @@ from fnllm.openai.types.chat.parameters import OpenAIChatParameters
 
 import graphrag.config.defaults as defs
 from graphrag.language_model.providers.fnllm.cache import FNLLMCacheProvider
+from graphrag.language_model.scheduler import (
+    LLMQuota,
+    LLMScheduler,
+    estimate_tokens,
+    quota_key,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Coroutine
@@ -48,7 +54,7 @@ def _create_error_handler(callbacks: WorkflowCallbacks) -> ErrorHandlerFn:
 
 
 def _create_openai_config(config: LanguageModelConfig, azure: bool) -> OpenAIConfig:
-    """Create an OpenAIConfig from a LanguageModelConfig."""
+    """Create an OpenAIConfig from a LanguageModelConfig, leaving rate limits to the shared quota."""
     encoding_model = config.encoding_model
     json_strategy = (
         JsonStrategy.VALID if config.model_supports_json else JsonStrategy.LOOSE
@@ -76,8 +82,8 @@ def _create_openai_config(config: LanguageModelConfig, azure: bool) -> OpenAICon
             organization=config.organization,
             max_retries=config.max_retries,
             max_retry_wait=config.max_retry_wait,
-            requests_per_minute=config.requests_per_minute,
-            tokens_per_minute=config.tokens_per_minute,
+            requests_per_minute=None,
+            tokens_per_minute=None,
             audience=audience,
             retry_strategy=RetryStrategy(config.retry_strategy),
             timeout=config.request_timeout,
@@ -96,8 +102,8 @@ def _create_openai_config(config: LanguageModelConfig, azure: bool) -> OpenAICon
         retry_strategy=RetryStrategy(config.retry_strategy),
         max_retries=config.max_retries,
         max_retry_wait=config.max_retry_wait,
-        requests_per_minute=config.requests_per_minute,
-        tokens_per_minute=config.tokens_per_minute,
+        requests_per_minute=None,
+        tokens_per_minute=None,
         timeout=config.request_timeout,
         max_concurrency=config.concurrent_requests,
         model=config.model,
@@ -107,6 +113,38 @@ def _create_openai_config(config: LanguageModelConfig, azure: bool) -> OpenAICon
     )
 
 
+def _create_quota(config: LanguageModelConfig) -> LLMQuota:
+    """Get the process-wide quota shared by every model using the same endpoint, key and model.
+
+    The quota owns the requests and tokens per minute budgets, so the fnllm config is
+    built without them; a second fnllm limiter would charge every request twice.
+    """
+    return LLMScheduler.quota(
+        quota_key(
+            config.api_base, config.api_key, config.deployment_name or config.model
+        ),
+        max_concurrency=config.concurrent_requests,
+        requests_per_minute=config.requests_per_minute or None,
+        tokens_per_minute=config.tokens_per_minute or None,
+    )
+
+
+def _estimate_chat_tokens(
+    quota: LLMQuota,
+    config: LanguageModelConfig,
+    prompt: str,
+    history: list | None,
+) -> int:
+    """Estimate the tokens a chat request will use: its prompt plus the expected completion."""
+    texts = [prompt]
+    texts.extend(
+        message.get("content") for message in history or [] if isinstance(message, dict)
+    )
+    return estimate_tokens(texts, config.encoding_model) + quota.estimate_completion(
+        config.max_tokens
+    )
+
+
 # FNLLM does not support sync operations, so we workaround running in an available loop/thread.
 T = TypeVar("T")
 
@@ -0,0 +1,449 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A process-wide LLM request scheduler.
+
+Every request to a provider goes through the LLMQuota of its (endpoint, API key,
+model). A quota enforces request- and token-per-minute budgets with token buckets,
+caps concurrency with an AIMD limit that halves on rate-limit responses and
+recovers additively, honours retry-after hints, and serves waiting requests in
+priority order so interactive queries go ahead of background indexing.
+
+Quotas are shared by every model instance, thread and event loop in the process.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import heapq
+import itertools
+import logging
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager, suppress
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from graphrag.utils.tokenizer import get_tokenizer
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+
+log = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 25
+"""Concurrency limit of a quota first requested without one (e.g. by an ad-hoc client)."""
+
+DEFAULT_COMPLETION_TOKENS = 500
+"""Completion tokens reserved per chat request until real usage has been observed."""
+
+DEFAULT_RATE_LIMIT_BACKOFF = 1.0
+"""Seconds to pause dispatch after a rate-limit response without a retry-after hint."""
+
+MAX_RATE_LIMIT_BACKOFF = 60.0
+"""Upper bound on a single retry-after pause."""
+
+_DECREASE_FACTOR = 0.5
+_COMPLETION_SMOOTHING = 0.1
+
+
+class RequestPriority(IntEnum):
+    """The priority of an LLM request; lower values are served first."""
+
+    interactive = 0
+    """User-facing queries."""
+    background = 1
+    """Indexing and other batch work."""
+
+
+_priority: ContextVar[RequestPriority] = ContextVar(
+    "graphrag_llm_priority", default=RequestPriority.interactive
+)
+_current_permit: ContextVar[LLMPermit | None] = ContextVar(
+    "graphrag_llm_permit", default=None
+)
+
+
+@contextmanager
+def llm_priority(priority: RequestPriority) -> Iterator[None]:
+    """Run LLM requests made in this context (and tasks it spawns) at the given priority."""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority() -> RequestPriority:
+    """Return the priority of LLM requests made in the current context."""
+    return _priority.get()
+
+
+def current_permit() -> LLMPermit | None:
+    """Return the permit of the LLM request running in the current context, if any."""
+    return _current_permit.get()
+
+
+def estimate_tokens(texts: Iterable[Any], encoding_name: str = "cl100k_base") -> int:
+    """Estimate the prompt tokens of a request from its text parts (non-strings are skipped)."""
+    return get_tokenizer(encoding_name or "cl100k_base").count_total(texts)
+
+
+def rate_limit_retry_after(error: BaseException) -> float | None:
+    """Return the retry-after delay of a rate-limit error (0 when unknown), or None for other errors."""
+    status = getattr(error, "status_code", None) or getattr(error, "status", None)
+    if status != 429 and type(error).__name__ != "RateLimitError":
+        return None
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        if "retry-after-ms" in headers:
+            return float(headers["retry-after-ms"]) / 1000
+        if "retry-after" in headers:
+            return float(headers["retry-after"])
+    except (TypeError, ValueError):
+        pass
+    return 0.0
+
+
+def quota_key(api_base: str | None, api_key: str | None, model: str | None) -> str:
+    """Identify a provider quota without keeping the API key in clear text."""
+    key_hash = hashlib.sha256((api_key or "").encode()).hexdigest()[:12]
+    return f"{api_base or 'default'}|{key_hash}|{model or ''}"
+
+
+class _TokenBucket:
+    """A continuously refilled per-minute budget that may go negative on reconciliation."""
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float) -> float:
+        # a request larger than the whole budget waits for a full bucket instead of forever
+        missing = min(amount, self.capacity) - self.level
+        return missing / self.rate if missing > 0 else 0.0
+
+    def adjust(self, amount: float) -> None:
+        self.level = min(self.capacity, self.level + amount)
+
+
+class _Waiter:
+    __slots__ = ("priority", "seq", "tokens", "wake")
+
+    def __init__(
+        self, priority: int, seq: int, tokens: int, wake: Callable[[], Any]
+    ) -> None:
+        self.priority = priority
+        self.seq = seq
+        self.tokens = tokens
+        self.wake = wake
+
+    def __lt__(self, other: _Waiter) -> bool:
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+
+class LLMPermit:
+    """A granted request slot; report usage and rate limits on it while it is held."""
+
+    def __init__(self, quota: LLMQuota, tokens: int) -> None:
+        self.quota = quota
+        self.tokens = tokens
+        self.granted_at = time.monotonic()
+        self.usage: int | None = None
+        self.completion_tokens: int | None = None
+        self.cache_hit = False
+        self.rate_limited = False
+        self.succeeded = False
+
+    def record_usage(self, prompt_tokens: int, completion_tokens: int) -> None:
+        """Record the token usage reported by the provider."""
+        self.usage = (self.usage or 0) + prompt_tokens + completion_tokens
+        self.completion_tokens = (self.completion_tokens or 0) + completion_tokens
+
+    def record_cache_hit(self) -> None:
+        """Mark the request as answered from a cache, refunding its reservation."""
+        self.cache_hit = True
+
+    def record_error(self, error: BaseException) -> None:
+        """Feed a provider error back to the quota if it is a rate-limit response."""
+        retry_after = rate_limit_retry_after(error)
+        if retry_after is not None:
+            self.rate_limited = True
+            self.quota.on_rate_limited(self, retry_after)
+
+
+class LLMQuota:
+    """Admission control for all requests sharing one provider quota."""
+
+    def __init__(
+        self,
+        key: str,
+        max_concurrency: int,
+        requests_per_minute: int | None = None,
+        tokens_per_minute: int | None = None,
+    ) -> None:
+        self.key = key
+        self.max_concurrency = max(1, max_concurrency)
+        self.limit = float(self.max_concurrency)
+        self.in_flight = 0
+        self.completion_estimate = float(DEFAULT_COMPLETION_TOKENS)
+        self.granted = 0
+        self.rate_limited = 0
+        self._requests = (
+            _TokenBucket(requests_per_minute) if requests_per_minute else None
+        )
+        self._tokens = _TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self._lock = threading.Lock()
+        self._waiters: list[_Waiter] = []
+        self._seq = itertools.count()
+        self._paused_until = 0.0
+        self._last_decrease = 0.0
+
+    def tighten(
+        self,
+        max_concurrency: int | None,
+        requests_per_minute: int | None,
+        tokens_per_minute: int | None,
+    ) -> None:
+        """Apply the stricter of the current and the given limits."""
+        with self._lock:
+            if max_concurrency and max_concurrency < self.max_concurrency:
+                self.max_concurrency = max(1, max_concurrency)
+                self.limit = min(self.limit, self.max_concurrency)
+            if requests_per_minute and (
+                self._requests is None or requests_per_minute < self._requests.capacity
+            ):
+                self._requests = _TokenBucket(requests_per_minute)
+            if tokens_per_minute and (
+                self._tokens is None or tokens_per_minute < self._tokens.capacity
+            ):
+                self._tokens = _TokenBucket(tokens_per_minute)
+
+    def estimate_completion(self, max_tokens: int | None = None) -> int:
+        """Completion tokens to reserve for a chat request."""
+        estimate = int(self.completion_estimate)
+        return min(estimate, max_tokens) if max_tokens else estimate
+
+    @asynccontextmanager
+    async def request(
+        self, tokens: int = 0, priority: RequestPriority | None = None
+    ) -> AsyncIterator[LLMPermit]:
+        """Wait for a request slot on the event loop and hold it for the body."""
+        loop = asyncio.get_running_loop()
+        event = asyncio.Event()
+        waiter = self._enqueue(
+            tokens, priority, lambda: loop.call_soon_threadsafe(event.set)
+        )
+        try:
+            while True:
+                event.clear()
+                permit, delay = self._poll(waiter)
+                if permit is not None:
+                    break
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(event.wait(), timeout=delay)
+        except BaseException:
+            self._discard(waiter)
+            raise
+        with self._hold(permit):
+            yield permit
+
+    @contextmanager
+    def request_sync(
+        self, tokens: int = 0, priority: RequestPriority | None = None
+    ) -> Iterator[LLMPermit]:
+        """Block the calling thread until a request slot is free and hold it for the body."""
+        event = threading.Event()
+        waiter = self._enqueue(tokens, priority, event.set)
+        try:
+            while True:
+                event.clear()
+                permit, delay = self._poll(waiter)
+                if permit is not None:
+                    break
+                event.wait(timeout=delay)
+        except BaseException:
+            self._discard(waiter)
+            raise
+        with self._hold(permit):
+            yield permit
+
+    def on_rate_limited(self, permit: LLMPermit, retry_after: float) -> None:
+        """Pause dispatch and halve the concurrency limit (once per congestion event)."""
+        with self._lock:
+            now = time.monotonic()
+            pause = min(
+                retry_after or DEFAULT_RATE_LIMIT_BACKOFF, MAX_RATE_LIMIT_BACKOFF
+            )
+            self._paused_until = max(self._paused_until, now + pause)
+            self.rate_limited += 1
+            # requests sent before the last decrease saw the old limit; don't punish twice
+            if permit.granted_at >= self._last_decrease:
+                self.limit = max(1.0, self.limit * _DECREASE_FACTOR)
+                self._last_decrease = now
+                log.warning(
+                    "LLM rate limit hit for %s, concurrency limit lowered to %d",
+                    self.key,
+                    int(self.limit),
+                )
+
+    def stats(self) -> dict[str, Any]:
+        """Return the current state of the quota."""
+        with self._lock:
+            return {
+                "concurrency_limit": int(self.limit),
+                "max_concurrency": self.max_concurrency,
+                "in_flight": self.in_flight,
+                "waiting": len(self._waiters),
+                "waiting_interactive": sum(
+                    waiter.priority == RequestPriority.interactive
+                    for waiter in self._waiters
+                ),
+                "granted": self.granted,
+                "rate_limited": self.rate_limited,
+            }
+
+    def _enqueue(
+        self,
+        tokens: int,
+        priority: RequestPriority | None,
+        wake: Callable[[], Any],
+    ) -> _Waiter:
+        waiter = _Waiter(
+            int(current_priority() if priority is None else priority),
+            next(self._seq),
+            tokens,
+            wake,
+        )
+        with self._lock:
+            heapq.heappush(self._waiters, waiter)
+        return waiter
+
+    def _poll(self, waiter: _Waiter) -> tuple[LLMPermit | None, float | None]:
+        """Grant the waiter if it is first in line and the budgets allow it.
+
+        Otherwise return how long to sleep before polling again, or None to sleep
+        until woken by a released slot.
+        """
+        with self._lock:
+            if self._waiters[0] is not waiter or self.in_flight >= int(self.limit):
+                return None, None
+            now = time.monotonic()
+            delay = self._paused_until - now
+            for bucket, amount in ((self._requests, 1), (self._tokens, waiter.tokens)):
+                if bucket is not None:
+                    bucket.refill(now)
+                    delay = max(delay, bucket.wait_time(amount))
+            if delay > 0:
+                return None, delay
+
+            heapq.heappop(self._waiters)
+            if self._requests is not None:
+                self._requests.adjust(-1)
+            if self._tokens is not None:
+                self._tokens.adjust(-waiter.tokens)
+            self.in_flight += 1
+            self.granted += 1
+            self._wake_head()
+            return LLMPermit(self, waiter.tokens), None
+
+    def _discard(self, waiter: _Waiter) -> None:
+        with self._lock:
+            if waiter in self._waiters:
+                was_head = self._waiters[0] is waiter
+                self._waiters.remove(waiter)
+                heapq.heapify(self._waiters)
+                if was_head:
+                    self._wake_head()
+
+    @contextmanager
+    def _hold(self, permit: LLMPermit) -> Iterator[None]:
+        previous = _current_permit.get()
+        _current_permit.set(permit)
+        try:
+            yield
+            permit.succeeded = True
+        finally:
+            _current_permit.set(previous)
+            self._release(permit)
+
+    def _release(self, permit: LLMPermit) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            if permit.cache_hit:
+                # nothing reached the provider
+                if self._requests is not None:
+                    self._requests.adjust(1)
+                if self._tokens is not None:
+                    self._tokens.adjust(permit.tokens)
+            else:
+                if permit.usage is not None and self._tokens is not None:
+                    self._tokens.adjust(permit.tokens - permit.usage)
+                if permit.completion_tokens is not None:
+                    self.completion_estimate += _COMPLETION_SMOOTHING * (
+                        permit.completion_tokens - self.completion_estimate
+                    )
+                if permit.succeeded and not permit.rate_limited:
+                    # additive increase: about one more slot per limit's worth of successes
+                    self.limit = min(
+                        float(self.max_concurrency), self.limit + 1 / self.limit
+                    )
+            self._wake_head()
+
+    def _wake_head(self) -> None:
+        if self._waiters:
+            self._waiters[0].wake()
+
+
+class LLMScheduler:
+    """Registry of the LLM quotas shared across the process."""
+
+    _quotas: ClassVar[dict[str, LLMQuota]] = {}
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def quota(
+        cls,
+        key: str,
+        max_concurrency: int | None = None,
+        requests_per_minute: int | None = None,
+        tokens_per_minute: int | None = None,
+    ) -> LLMQuota:
+        """Return the quota for key, creating it or tightening it to the given limits.
+
+        Limits left as None keep the current value (or no limit, for a new quota).
+        """
+        with cls._lock:
+            quota = cls._quotas.get(key)
+            if quota is None:
+                quota = cls._quotas[key] = LLMQuota(
+                    key,
+                    max_concurrency or DEFAULT_MAX_CONCURRENCY,
+                    requests_per_minute,
+                    tokens_per_minute,
+                )
+                return quota
+        quota.tighten(max_concurrency, requests_per_minute, tokens_per_minute)
+        return quota
+
+    @classmethod
+    def stats(cls) -> dict[str, dict[str, Any]]:
+        """Return the state of every quota."""
+        with cls._lock:
+            quotas = dict(cls._quotas)
+        return {key: quota.stats() for key, quota in quotas.items()}
+
+    @classmethod
+    def reset(cls) -> None:
+        """Forget all quotas."""
+        with cls._lock:
+            cls._quotas.clear()
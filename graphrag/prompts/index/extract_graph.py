@@ -127,3 +127,9 @@ Output:"""
 
 CONTINUE_PROMPT = "MANY entities and relationships were missed in the last extraction. Remember to ONLY emit entities that match any of the previously extracted types. Add them below using the same format:\n"
 LOOP_PROMPT = "It appears some entities and relationships may have still been missed.  Answer Y or N if there are still entities or relationships that need to be added.\n"
+
+BATCH_INPUT_PROMPT = """The text below is made of {chunk_count} separate chunks. Each chunk starts with a line "{chunk_delimiter} <chunk number>".
+Extract the entities and relationships of every chunk on its own. Before the records of a chunk, output the line "{chunk_delimiter} <chunk number>" of that chunk, even when the chunk has no records.
+
+{chunks}"""
+BATCH_CONTINUE_PROMPT = 'MANY entities and relationships were missed in the last extraction. Remember to ONLY emit entities that match any of the previously extracted types. Add them below using the same format, starting the records of each chunk with its "{chunk_delimiter} <chunk number>" line:\n'
@@ -4,7 +4,7 @@
 """Base classes for global and local context builders."""
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 import pandas as pd
 
@@ -22,6 +22,8 @@ class ContextBuilderResult:
     llm_calls: int = 0
     prompt_tokens: int = 0
     output_tokens: int = 0
+    # seconds spent in named sub-stages of context building, e.g. vector_search
+    stage_times: dict[str, float] = field(default_factory=dict)
 
 
 class GlobalContextBuilder(ABC):
@@ -6,7 +6,6 @@
 import asyncio
 import logging
 from collections import Counter
-from copy import deepcopy
 from time import time
 from typing import Any
 
@@ -78,7 +77,7 @@ class DynamicCommunitySelection:
             query: the query to rate against
         """
         start = time()
-        queue = deepcopy(self.starting_communities)
+        queue = list(self.starting_communities)
         level = 0
 
         ratings = {}  # store the ratings for each community
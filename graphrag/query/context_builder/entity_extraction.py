@@ -5,8 +5,11 @@
 
 from enum import Enum
 
+from graphrag.config.enums import RetrievalMode
 from graphrag.data_model.entity import Entity
 from graphrag.data_model.relationship import Relationship
+from graphrag.keyword_index.bm25 import BM25Index
+from graphrag.keyword_index.fusion import reciprocal_rank_fusion
 from graphrag.language_model.protocol.base import EmbeddingModel
 from graphrag.query.input.retrieval.entities import (
     get_entity_by_id,
@@ -44,35 +47,61 @@ def map_query_to_entities(
     exclude_entity_names: list[str] | None = None,
     k: int = 10,
     oversample_scaler: int = 2,
+    keyword_index: BM25Index | None = None,
+    retrieval_mode: RetrievalMode | str = RetrievalMode.Vector,
 ) -> list[Entity]:
-    """Extract entities that match a given query using semantic similarity of text embeddings of query and entity descriptions."""
+    """Extract entities that match a given query using semantic similarity of text embeddings of query and entity descriptions.
+
+    With a keyword index and retrieval_mode 'hybrid', vector and BM25 matches are merged by
+    reciprocal rank fusion; with 'keyword', only the BM25 index is searched and no embedding is computed.
+    """
     if include_entity_names is None:
         include_entity_names = []
     if exclude_entity_names is None:
         exclude_entity_names = []
     all_entities = list(all_entities_dict.values())
     matched_entities = []
+    use_keywords = keyword_index is not None and retrieval_mode != RetrievalMode.Vector
     if query != "":
-        # get entities with highest semantic similarity to query
-        # oversample to account for excluded entities
-        search_results = text_embedding_vectorstore.similarity_search_by_text(
-            text=query,
-            text_embedder=lambda t: text_embedder.embed(t),
-            k=k * oversample_scaler,
-        )
-        for result in search_results:
-            if embedding_vectorstore_key == EntityVectorStoreKey.ID and isinstance(
-                result.document.id, str
-            ):
-                matched = get_entity_by_id(all_entities_dict, result.document.id)
-            else:
-                matched = get_entity_by_key(
-                    entities=all_entities,
-                    key=embedding_vectorstore_key,
-                    value=result.document.id,
-                )
-            if matched:
-                matched_entities.append(matched)
+        if not use_keywords or retrieval_mode == RetrievalMode.Hybrid:
+            # get entities with highest semantic similarity to query
+            # oversample to account for excluded entities
+            search_results = text_embedding_vectorstore.similarity_search_by_text(
+                text=query,
+                text_embedder=lambda t: text_embedder.embed(t),
+                k=k * oversample_scaler,
+            )
+            for result in search_results:
+                if embedding_vectorstore_key == EntityVectorStoreKey.ID and isinstance(
+                    result.document.id, str
+                ):
+                    matched = get_entity_by_id(all_entities_dict, result.document.id)
+                else:
+                    matched = get_entity_by_key(
+                        entities=all_entities,
+                        key=embedding_vectorstore_key,
+                        value=result.document.id,
+                    )
+                if matched:
+                    matched_entities.append(matched)
+        if use_keywords and keyword_index is not None:
+            # the keyword index is keyed by entity id
+            keyword_entities = [
+                all_entities_dict[doc_id]
+                for doc_id, _ in keyword_index.search(query, k=k * oversample_scaler)
+                if doc_id in all_entities_dict
+            ]
+            candidates = {
+                entity.id: entity for entity in matched_entities + keyword_entities
+            }
+            fused_ids = reciprocal_rank_fusion(
+                [
+                    [entity.id for entity in matched_entities],
+                    [entity.id for entity in keyword_entities],
+                ],
+                limit=k * oversample_scaler,
+            )
+            matched_entities = [candidates[entity_id] for entity_id in fused_ids]
     else:
         all_entities.sort(key=lambda x: x.rank if x.rank else 0, reverse=True)
         matched_entities = all_entities[:k]
@@ -0,0 +1,112 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A bounded executor that runs synchronous context builders off the event loop."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+R = TypeVar("R")
+
+DEFAULT_MAX_WORKERS = min(8, os.cpu_count() or 1)
+"""Default number of threads used to build query contexts."""
+
+
+class ContextBuildExecutor:
+    """A bounded thread pool for CPU-heavy, synchronous context building.
+
+    Context builders do entity mapping, DataFrame construction and token
+    counting; running them in this pool keeps the event loop responsive while
+    concurrent queries build their contexts in parallel. Requests beyond
+    max_workers wait in the pool's queue, and the time they spend there is
+    reported back to the caller.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS):
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="graphrag-context"
+        )
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        self._queue_time = 0.0
+
+    async def run(
+        self, fn: Callable[..., R], /, *args: Any, **kwargs: Any
+    ) -> tuple[R, float]:
+        """Run fn in the pool and return its result and the seconds it spent queued."""
+        loop = asyncio.get_running_loop()
+        submitted = time.perf_counter()
+        with self._lock:
+            self._queued += 1
+
+        def task() -> tuple[R, float]:
+            queue_time = time.perf_counter() - submitted
+            with self._lock:
+                self._queued -= 1
+                self._running += 1
+                self._queue_time += queue_time
+            try:
+                return fn(*args, **kwargs), queue_time
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self._completed += 1
+
+        # carry context variables (e.g. telemetry) into the worker thread
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(context.run, task)
+        )
+
+    def stats(self) -> dict[str, Any]:
+        """Return the current queue depth, active builds and cumulative queue time."""
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "queued": self._queued,
+                "running": self._running,
+                "completed": self._completed,
+                "queue_time": self._queue_time,
+            }
+
+    def shutdown(self) -> None:
+        """Shut down the pool, waiting for running builds to finish."""
+        self._executor.shutdown(wait=True)
+
+
+_executor: ContextBuildExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_context_executor() -> ContextBuildExecutor:
+    """Return the process-wide context build executor, creating it on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ContextBuildExecutor()
+        return _executor
+
+
+def configure_context_executor(max_workers: int) -> ContextBuildExecutor:
+    """Replace the process-wide context build executor with one of the given size."""
+    global _executor
+    with _executor_lock:
+        previous = _executor
+        _executor = ContextBuildExecutor(max_workers)
+    if previous is not None:
+        previous.shutdown()
+    return _executor
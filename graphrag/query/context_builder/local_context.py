@@ -279,31 +279,29 @@ def _filter_relationships(
         ]
         out_network_entity_links[entity_name] = len(set(targets + sources))
 
-    # sort out-network relationships by number of links and rank_attributes
-    for rel in out_network_relationships:
-        if rel.attributes is None:
-            rel.attributes = {}
-        rel.attributes["links"] = (
-            out_network_entity_links[rel.source]
-            if rel.source in out_network_entity_links
-            else out_network_entity_links[rel.target]
+    # sort out-network relationships by number of links and rank_attributes;
+    # relationships are shared across concurrent queries, so keep link counts local
+    def links(relationship: Relationship) -> int:
+        return (
+            out_network_entity_links[relationship.source]
+            if relationship.source in out_network_entity_links
+            else out_network_entity_links[relationship.target]
         )
 
-    # sort by attributes[links] first, then by ranking_attribute
     if relationship_ranking_attribute == "rank":
         out_network_relationships.sort(
-            key=lambda x: (x.attributes["links"], x.rank),  # type: ignore
+            key=lambda x: (links(x), x.rank),  # type: ignore
             reverse=True,  # type: ignore
         )
     elif relationship_ranking_attribute == "weight":
         out_network_relationships.sort(
-            key=lambda x: (x.attributes["links"], x.weight),  # type: ignore
+            key=lambda x: (links(x), x.weight),  # type: ignore
             reverse=True,  # type: ignore
         )
     else:
         out_network_relationships.sort(
             key=lambda x: (
-                x.attributes["links"],  # type: ignore
+                links(x),
                 x.attributes[relationship_ranking_attribute],  # type: ignore
             ),  # type: ignore
             reverse=True,
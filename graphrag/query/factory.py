@@ -3,9 +3,10 @@
 
 """Query Factory methods to support CLI."""
 
-import tiktoken
+import logging
 
 from graphrag.callbacks.query_callbacks import QueryCallbacks
+from graphrag.config.enums import RetrievalMode
 from graphrag.config.models.graph_rag_config import GraphRagConfig
 from graphrag.data_model.community import Community
 from graphrag.data_model.community_report import CommunityReport
@@ -13,6 +14,7 @@ from graphrag.data_model.covariate import Covariate
 from graphrag.data_model.entity import Entity
 from graphrag.data_model.relationship import Relationship
 from graphrag.data_model.text_unit import TextUnit
+from graphrag.keyword_index.bm25 import BM25Index
 from graphrag.language_model.manager import ModelManager
 from graphrag.query.context_builder.entity_extraction import EntityVectorStoreKey
 from graphrag.query.structured_search.basic_search.basic_context import (
@@ -31,8 +33,24 @@ from graphrag.query.structured_search.local_search.mixed_context import (
     LocalSearchMixedContext,
 )
 from graphrag.query.structured_search.local_search.search import LocalSearch
+from graphrag.utils.tokenizer import get_encoding
 from graphrag.vector_stores.base import BaseVectorStore
 
+log = logging.getLogger(__name__)
+
+
+def _resolve_retrieval_mode(
+    retrieval_mode: RetrievalMode, keyword_index: BM25Index | None
+) -> RetrievalMode:
+    """Fall back to vector retrieval when the configured mode needs a keyword index that was not built."""
+    if retrieval_mode != RetrievalMode.Vector and keyword_index is None:
+        log.warning(
+            "retrieval_mode %s requires a keyword index (embed_text.keyword_index); falling back to vector search",
+            retrieval_mode.value,
+        )
+        return RetrievalMode.Vector
+    return retrieval_mode
+
 
 def get_local_search_engine(
     config: GraphRagConfig,
@@ -45,6 +63,7 @@ def get_local_search_engine(
     description_embedding_store: BaseVectorStore,
     system_prompt: str | None = None,
     callbacks: list[QueryCallbacks] | None = None,
+    keyword_index: BM25Index | None = None,
 ) -> LocalSearch:
     """Create a local search engine based on data + configuration."""
     model_settings = config.get_language_model_config(config.local_search.chat_model_id)
@@ -73,7 +92,7 @@ def get_local_search_engine(
         config=embedding_settings,
     )
 
-    token_encoder = tiktoken.get_encoding(model_settings.encoding_model)
+    token_encoder = get_encoding(model_settings.encoding_model)
 
     ls_config = config.local_search
 
@@ -90,6 +109,10 @@ def get_local_search_engine(
             embedding_vectorstore_key=EntityVectorStoreKey.ID,  # if the vectorstore uses entity title as ids, set this to EntityVectorStoreKey.TITLE
             text_embedder=embedding_model,
             token_encoder=token_encoder,
+            keyword_index=keyword_index,
+            retrieval_mode=_resolve_retrieval_mode(
+                ls_config.retrieval_mode, keyword_index
+            ),
         ),
         token_encoder=token_encoder,
         model_params={
@@ -144,19 +167,17 @@ def get_global_search_engine(
     )
 
     # Here we get encoding based on specified encoding name
-    token_encoder = tiktoken.get_encoding(model_settings.encoding_model)
+    token_encoder = get_encoding(model_settings.encoding_model)
     gs_config = config.global_search
 
     dynamic_community_selection_kwargs = {}
     if dynamic_community_selection:
         # TODO: Allow for another llm definition only for Global Search to leverage -mini models
-        
-        # Try to get encoding for model, fallback to encoding_model if model not recognized
-        try:
-            dynamic_token_encoder = tiktoken.encoding_for_model(model_settings.model)
-        except KeyError:
-            # Model not recognized by tiktoken, use the configured encoding_model instead
-            dynamic_token_encoder = tiktoken.get_encoding(model_settings.encoding_model)
+
+        # Get encoding for model, falling back to encoding_model if model not recognized
+        dynamic_token_encoder = get_encoding(
+            model_settings.encoding_model, model=model_settings.model
+        )
 
         dynamic_community_selection_kwargs.update({
             "model": model,
@@ -260,7 +281,7 @@ def get_drift_search_engine(
         model_type=embedding_model_settings.type,
         config=embedding_model_settings,
     )
-    token_encoder = tiktoken.get_encoding(chat_model_settings.encoding_model)
+    token_encoder = get_encoding(chat_model_settings.encoding_model)
 
     return DRIFTSearch(
         model=chat_model,
@@ -288,6 +309,7 @@ def get_basic_search_engine(
     config: GraphRagConfig,
     system_prompt: str | None = None,
     callbacks: list[QueryCallbacks] | None = None,
+    keyword_index: BM25Index | None = None,
 ) -> BasicSearch:
     """Create a basic search engine based on data + configuration."""
     chat_model_settings = config.get_language_model_config(
@@ -315,7 +337,7 @@ def get_basic_search_engine(
         config=embedding_model_settings,
     )
 
-    token_encoder = tiktoken.get_encoding(chat_model_settings.encoding_model)
+    token_encoder = get_encoding(chat_model_settings.encoding_model)
 
     ls_config = config.basic_search
 
@@ -327,6 +349,10 @@ def get_basic_search_engine(
             text_unit_embeddings=text_unit_embeddings,
             text_units=text_units,
             token_encoder=token_encoder,
+            keyword_index=keyword_index,
+            retrieval_mode=_resolve_retrieval_mode(
+                ls_config.retrieval_mode, keyword_index
+            ),
         ),
         token_encoder=token_encoder,
         model_params={
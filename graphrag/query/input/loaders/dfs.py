@@ -1,7 +1,17 @@
 # Copyright (c) 2024 Microsoft Corporation.
 # Licensed under the MIT License
 
-"""Load data from dataframes into collections of data objects."""
+"""Load data from dataframes into collections of data objects.
+
+The loaders are columnar: each column is converted once for the whole table
+and the objects are assembled by zipping the converted columns, rather than
+materializing a dict per row and converting each field separately. Embedding
+columns are stacked into a single NumPy matrix and each object holds a row
+view of it. Entity titles and types and relationship endpoints are interned,
+so the same name is stored once however many objects refer to it.
+"""
+
+from typing import Any, TypeVar
 
 import pandas as pd
 
@@ -12,24 +22,34 @@ from graphrag.data_model.entity import Entity
 from graphrag.data_model.relationship import Relationship
 from graphrag.data_model.text_unit import TextUnit
 from graphrag.query.input.loaders.utils import (
-    to_list,
-    to_optional_dict,
-    to_optional_float,
-    to_optional_int,
-    to_optional_list,
-    to_optional_str,
-    to_str,
+    column_to_attributes,
+    column_to_embeddings,
+    column_to_list,
+    column_to_optional_dict,
+    column_to_optional_float,
+    column_to_optional_int,
+    column_to_optional_list,
+    column_to_optional_str,
+    column_to_str,
 )
 
+T = TypeVar("T")
+
+
+def _build(cls: type[T], columns: dict[str, list[Any]]) -> list[T]:
+    """Build one object per row from keyword-named, already converted columns."""
+    names = list(columns)
+    return [
+        cls(**dict(zip(names, values, strict=True)))
+        for values in zip(*columns.values(), strict=True)
+    ]
 
-def _prepare_records(df: pd.DataFrame) -> list[dict]:
-    """
-    Reset index and convert the DataFrame to a list of dictionaries.
 
-    We rename the reset index column to 'Index' for consistency.
-    """
-    df_reset = df.reset_index().rename(columns={"index": "Index"})
-    return df_reset.to_dict("records")
+def _short_ids(df: pd.DataFrame, short_id_col: str | None) -> list[str | None]:
+    """Return the short id column, falling back to the row index labels."""
+    if short_id_col:
+        return column_to_optional_str(df, short_id_col)
+    return [str(index) for index in df.index]
 
 
 def read_entities(
@@ -46,32 +66,25 @@ def read_entities(
     rank_col: str | None = "degree",
     attributes_cols: list[str] | None = None,
 ) -> list[Entity]:
-    """Read entities from a dataframe using pre-converted records."""
-    records = _prepare_records(df)
-    return [
-        Entity(
-            id=to_str(row, id_col),
-            short_id=to_optional_str(row, short_id_col)
-            if short_id_col
-            else str(row["Index"]),
-            title=to_str(row, title_col),
-            type=to_optional_str(row, type_col),
-            description=to_optional_str(row, description_col),
-            name_embedding=to_optional_list(row, name_embedding_col, item_type=float),
-            description_embedding=to_optional_list(
-                row, description_embedding_col, item_type=float
-            ),
-            community_ids=to_optional_list(row, community_col, item_type=str),
-            text_unit_ids=to_optional_list(row, text_unit_ids_col),
-            rank=to_optional_int(row, rank_col),
-            attributes=(
-                {col: row.get(col) for col in attributes_cols}
-                if attributes_cols
-                else None
+    """Read entities from a dataframe column by column."""
+    return _build(
+        Entity,
+        {
+            "id": column_to_str(df, id_col),
+            "short_id": _short_ids(df, short_id_col),
+            "title": column_to_str(df, title_col, intern=True),
+            "type": column_to_optional_str(df, type_col, intern=True),
+            "description": column_to_optional_str(df, description_col),
+            "name_embedding": column_to_embeddings(df, name_embedding_col),
+            "description_embedding": column_to_embeddings(
+                df, description_embedding_col
             ),
-        )
-        for row in records
-    ]
+            "community_ids": column_to_optional_list(df, community_col, item_type=str),
+            "text_unit_ids": column_to_optional_list(df, text_unit_ids_col),
+            "rank": column_to_optional_int(df, rank_col),
+            "attributes": column_to_attributes(df, attributes_cols),
+        },
+    )
 
 
 def read_relationships(
@@ -87,31 +100,26 @@ def read_relationships(
     text_unit_ids_col: str | None = "text_unit_ids",
     attributes_cols: list[str] | None = None,
 ) -> list[Relationship]:
-    """Read relationships from a dataframe using pre-converted records."""
-    records = _prepare_records(df)
-    return [
-        Relationship(
-            id=to_str(row, id_col),
-            short_id=to_optional_str(row, short_id_col)
-            if short_id_col
-            else str(row["Index"]),
-            source=to_str(row, source_col),
-            target=to_str(row, target_col),
-            description=to_optional_str(row, description_col),
-            description_embedding=to_optional_list(
-                row, description_embedding_col, item_type=float
+    """Read relationships from a dataframe column by column."""
+    return _build(
+        Relationship,
+        {
+            "id": column_to_str(df, id_col),
+            "short_id": _short_ids(df, short_id_col),
+            "source": column_to_str(df, source_col, intern=True),
+            "target": column_to_str(df, target_col, intern=True),
+            "description": column_to_optional_str(df, description_col),
+            "description_embedding": column_to_embeddings(
+                df, description_embedding_col
             ),
-            weight=to_optional_float(row, weight_col),
-            text_unit_ids=to_optional_list(row, text_unit_ids_col, item_type=str),
-            rank=to_optional_int(row, rank_col),
-            attributes=(
-                {col: row.get(col) for col in attributes_cols}
-                if attributes_cols
-                else None
+            "weight": column_to_optional_float(df, weight_col),
+            "text_unit_ids": column_to_optional_list(
+                df, text_unit_ids_col, item_type=str
             ),
-        )
-        for row in records
-    ]
+            "rank": column_to_optional_int(df, rank_col),
+            "attributes": column_to_attributes(df, attributes_cols),
+        },
+    )
 
 
 def read_covariates(
@@ -123,27 +131,25 @@ def read_covariates(
     text_unit_ids_col: str | None = "text_unit_ids",
     attributes_cols: list[str] | None = None,
 ) -> list[Covariate]:
-    """Read covariates from a dataframe using pre-converted records."""
-    records = _prepare_records(df)
-    return [
-        Covariate(
-            id=to_str(row, id_col),
-            short_id=to_optional_str(row, short_id_col)
-            if short_id_col
-            else str(row["Index"]),
-            subject_id=to_str(row, subject_col),
-            covariate_type=(
-                to_str(row, covariate_type_col) if covariate_type_col else "claim"
+    """Read covariates from a dataframe column by column."""
+    covariate_types = (
+        column_to_str(df, covariate_type_col)
+        if covariate_type_col
+        else ["claim"] * len(df)
+    )
+    return _build(
+        Covariate,
+        {
+            "id": column_to_str(df, id_col),
+            "short_id": _short_ids(df, short_id_col),
+            "subject_id": column_to_str(df, subject_col),
+            "covariate_type": covariate_types,
+            "text_unit_ids": column_to_optional_list(
+                df, text_unit_ids_col, item_type=str
             ),
-            text_unit_ids=to_optional_list(row, text_unit_ids_col, item_type=str),
-            attributes=(
-                {col: row.get(col) for col in attributes_cols}
-                if attributes_cols
-                else None
-            ),
-        )
-        for row in records
-    ]
+            "attributes": column_to_attributes(df, attributes_cols),
+        },
+    )
 
 
 def read_communities(
@@ -159,31 +165,26 @@ def read_communities(
     children_col: str | None = "children",
     attributes_cols: list[str] | None = None,
 ) -> list[Community]:
-    """Read communities from a dataframe using pre-converted records."""
-    records = _prepare_records(df)
-    return [
-        Community(
-            id=to_str(row, id_col),
-            short_id=to_optional_str(row, short_id_col)
-            if short_id_col
-            else str(row["Index"]),
-            title=to_str(row, title_col),
-            level=to_str(row, level_col),
-            entity_ids=to_optional_list(row, entities_col, item_type=str),
-            relationship_ids=to_optional_list(row, relationships_col, item_type=str),
-            covariate_ids=to_optional_dict(
-                row, covariates_col, key_type=str, value_type=str
+    """Read communities from a dataframe column by column."""
+    return _build(
+        Community,
+        {
+            "id": column_to_str(df, id_col),
+            "short_id": _short_ids(df, short_id_col),
+            "title": column_to_str(df, title_col),
+            "level": column_to_str(df, level_col),
+            "entity_ids": column_to_optional_list(df, entities_col, item_type=str),
+            "relationship_ids": column_to_optional_list(
+                df, relationships_col, item_type=str
             ),
-            parent=to_str(row, parent_col),
-            children=to_list(row, children_col),
-            attributes=(
-                {col: row.get(col) for col in attributes_cols}
-                if attributes_cols
-                else None
+            "covariate_ids": column_to_optional_dict(
+                df, covariates_col, key_type=str, value_type=str
             ),
-        )
-        for row in records
-    ]
+            "parent": column_to_str(df, parent_col),
+            "children": column_to_list(df, children_col),
+            "attributes": column_to_attributes(df, attributes_cols),
+        },
+    )
 
 
 def read_community_reports(
@@ -198,30 +199,21 @@ def read_community_reports(
     content_embedding_col: str | None = "full_content_embedding",
     attributes_cols: list[str] | None = None,
 ) -> list[CommunityReport]:
-    """Read community reports from a dataframe using pre-converted records."""
-    records = _prepare_records(df)
-    return [
-        CommunityReport(
-            id=to_str(row, id_col),
-            short_id=to_optional_str(row, short_id_col)
-            if short_id_col
-            else str(row["Index"]),
-            title=to_str(row, title_col),
-            community_id=to_str(row, community_col),
-            summary=to_str(row, summary_col),
-            full_content=to_str(row, content_col),
-            rank=to_optional_float(row, rank_col),
-            full_content_embedding=to_optional_list(
-                row, content_embedding_col, item_type=float
-            ),
-            attributes=(
-                {col: row.get(col) for col in attributes_cols}
-                if attributes_cols
-                else None
-            ),
-        )
-        for row in records
-    ]
+    """Read community reports from a dataframe column by column."""
+    return _build(
+        CommunityReport,
+        {
+            "id": column_to_str(df, id_col),
+            "short_id": _short_ids(df, short_id_col),
+            "title": column_to_str(df, title_col),
+            "community_id": column_to_str(df, community_col),
+            "summary": column_to_str(df, summary_col),
+            "full_content": column_to_str(df, content_col),
+            "rank": column_to_optional_float(df, rank_col),
+            "full_content_embedding": column_to_embeddings(df, content_embedding_col),
+            "attributes": column_to_attributes(df, attributes_cols),
+        },
+    )
 
 
 def read_text_units(
@@ -235,25 +227,24 @@ def read_text_units(
     document_ids_col: str | None = "document_ids",
     attributes_cols: list[str] | None = None,
 ) -> list[TextUnit]:
-    """Read text units from a dataframe using pre-converted records."""
-    records = _prepare_records(df)
-    return [
-        TextUnit(
-            id=to_str(row, id_col),
-            short_id=str(row["Index"]),
-            text=to_str(row, text_col),
-            entity_ids=to_optional_list(row, entities_col, item_type=str),
-            relationship_ids=to_optional_list(row, relationships_col, item_type=str),
-            covariate_ids=to_optional_dict(
-                row, covariates_col, key_type=str, value_type=str
+    """Read text units from a dataframe column by column."""
+    return _build(
+        TextUnit,
+        {
+            "id": column_to_str(df, id_col),
+            "short_id": _short_ids(df, None),
+            "text": column_to_str(df, text_col),
+            "entity_ids": column_to_optional_list(df, entities_col, item_type=str),
+            "relationship_ids": column_to_optional_list(
+                df, relationships_col, item_type=str
             ),
-            n_tokens=to_optional_int(row, tokens_col),
-            document_ids=to_optional_list(row, document_ids_col, item_type=str),
-            attributes=(
-                {col: row.get(col) for col in attributes_cols}
-                if attributes_cols
-                else None
+            "covariate_ids": column_to_optional_dict(
+                df, covariates_col, key_type=str, value_type=str
             ),
-        )
-        for row in records
-    ]
+            "n_tokens": column_to_optional_int(df, tokens_col),
+            "document_ids": column_to_optional_list(
+                df, document_ids_col, item_type=str
+            ),
+            "attributes": column_to_attributes(df, attributes_cols),
+        },
+    )
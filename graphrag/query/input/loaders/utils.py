@@ -3,10 +3,12 @@
 
 """Data load utils."""
 
+import sys
 from collections.abc import Mapping
 from typing import Any
 
 import numpy as np
+import pandas as pd
 
 
 def _get_value(
@@ -185,3 +187,177 @@ def to_optional_dict(
                 msg = f"dict value is not [{value_type}]: {v} ({type(v)})"
                 raise TypeError(msg)
     return value
+
+
+# Columnar converters: convert a whole DataFrame column at once instead of
+# looking values up row by row in per-record dicts.
+
+
+def _require_column(df: pd.DataFrame, column_name: str | None) -> pd.Series:
+    if column_name is None:
+        msg = "Column name is None"
+        raise ValueError(msg)
+    if column_name not in df.columns:
+        msg = f"Column [{column_name}] not found in data"
+        raise ValueError(msg)
+    return df[column_name]
+
+
+def _has_column(df: pd.DataFrame, column_name: str | None) -> bool:
+    return column_name is not None and column_name in df.columns
+
+
+def column_to_str(
+    df: pd.DataFrame, column_name: str | None, intern: bool = False
+) -> list[str]:
+    """Convert a required column to a list of strings.
+
+    With intern=True, equal values share a single string object, which saves
+    memory for low-cardinality or cross-referenced columns such as entity
+    titles, types and relationship endpoints.
+    """
+    values = _require_column(df, column_name).astype(str).tolist()
+    return [sys.intern(value) for value in values] if intern else values
+
+
+def column_to_optional_str(
+    df: pd.DataFrame, column_name: str | None, intern: bool = False
+) -> list[str | None]:
+    """Convert a required column to a list of optional strings."""
+    values = _require_column(df, column_name).tolist()
+    if intern:
+        return [None if value is None else sys.intern(str(value)) for value in values]
+    return [None if value is None else str(value) for value in values]
+
+
+def column_to_optional_int(
+    df: pd.DataFrame, column_name: str | None
+) -> list[int | None]:
+    """Convert an optional column to a list of optional ints."""
+    if not _has_column(df, column_name):
+        return [None] * len(df)
+    column = df[column_name]
+    if pd.api.types.is_integer_dtype(column):
+        return column.tolist()
+    result: list[int | None] = []
+    for value in column.tolist():
+        if value is None or (isinstance(value, float) and np.isnan(value)):
+            result.append(None)
+        elif isinstance(value, float | int):
+            result.append(int(value))
+        else:
+            msg = f"value is not an int: {value} ({type(value)})"
+            raise TypeError(msg)
+    return result
+
+
+def column_to_optional_float(
+    df: pd.DataFrame, column_name: str | None
+) -> list[float | None]:
+    """Convert an optional column to a list of optional floats."""
+    if not _has_column(df, column_name):
+        return [None] * len(df)
+    column = df[column_name]
+    if pd.api.types.is_float_dtype(column):
+        # keep NaN as in the per-record loader, which only maps None to None
+        return column.tolist()
+    return [None if value is None else float(value) for value in column.tolist()]
+
+
+def column_to_list(
+    df: pd.DataFrame, column_name: str | None, item_type: type | None = None
+) -> list[list]:
+    """Convert a required column of arrays to a list of lists."""
+    _require_column(df, column_name)
+    values = column_to_optional_list(df, column_name, item_type=item_type)
+    for value in values:
+        if value is None:
+            msg = f"value is not a list: {value} ({type(value)})"
+            raise TypeError(msg)
+    return values  # type: ignore[return-value]
+
+
+def column_to_optional_list(
+    df: pd.DataFrame, column_name: str | None, item_type: type | None = None
+) -> list[list | None]:
+    """Convert an optional column of arrays to a list of optional lists.
+
+    Only the first non-empty value is checked against item_type, since parquet
+    columns are homogeneously typed.
+    """
+    if not _has_column(df, column_name):
+        return [None] * len(df)
+    result: list[list | None] = []
+    checked = item_type is None
+    for value in df[column_name].tolist():
+        if value is None:
+            result.append(None)
+            continue
+        if isinstance(value, np.ndarray):
+            value = value.tolist()
+        elif isinstance(value, str):
+            value = [value]
+        elif not isinstance(value, list):
+            msg = f"value is not a list: {value} ({type(value)})"
+            raise TypeError(msg)
+        if not checked and value:
+            if not isinstance(value[0], item_type):  # type: ignore[arg-type]
+                msg = f"list item is not [{item_type}]: {value[0]} ({type(value[0])})"
+                raise TypeError(msg)
+            checked = True
+        result.append(value)
+    return result
+
+
+def column_to_optional_dict(
+    df: pd.DataFrame,
+    column_name: str | None,
+    key_type: type | None = None,
+    value_type: type | None = None,
+) -> list[dict | None]:
+    """Convert an optional column of dicts to a list of optional dicts."""
+    if not _has_column(df, column_name):
+        return [None] * len(df)
+    return [
+        to_optional_dict({"value": value}, "value", key_type, value_type)
+        for value in df[column_name].tolist()
+    ]
+
+
+def column_to_embeddings(
+    df: pd.DataFrame, column_name: str | None
+) -> list[np.ndarray | None]:
+    """Convert an optional column of embedding vectors to NumPy row views.
+
+    All non-null vectors are stacked once into a single contiguous matrix and
+    each row gets a view into it, instead of a Python list of floats per row.
+    """
+    if not _has_column(df, column_name):
+        return [None] * len(df)
+    values = df[column_name].tolist()
+    present = [i for i, value in enumerate(values) if value is not None]
+    result: list[np.ndarray | None] = [None] * len(values)
+    if not present:
+        return result
+    try:
+        matrix = np.vstack([np.asarray(values[i], dtype=float) for i in present])
+    except ValueError:
+        # vectors of different lengths cannot share a matrix
+        for i in present:
+            result[i] = np.asarray(values[i], dtype=float)
+        return result
+    for row, i in enumerate(present):
+        result[i] = matrix[row]
+    return result
+
+
+def column_to_attributes(
+    df: pd.DataFrame, columns: list[str] | None
+) -> list[dict[str, Any] | None]:
+    """Collect the given attribute columns into one dict per row."""
+    if not columns:
+        return [None] * len(df)
+    values = [
+        df[col].tolist() if col in df.columns else [None] * len(df) for col in columns
+    ]
+    return [dict(zip(columns, row, strict=True)) for row in zip(*values, strict=True)]
@@ -13,6 +13,7 @@ import tiktoken
 from json_repair import repair_json
 
 import graphrag.config.defaults as defs
+from graphrag.utils.tokenizer import get_encoding, get_tokenizer, tokenizer_for
 
 log = logging.getLogger(__name__)
 
@@ -20,8 +21,8 @@ log = logging.getLogger(__name__)
 def num_tokens(text: str, token_encoder: tiktoken.Encoding | None = None) -> int:
     """Return the number of tokens in the given text."""
     if token_encoder is None:
-        token_encoder = tiktoken.get_encoding(defs.ENCODING_MODEL)
-    return len(token_encoder.encode(text))  # type: ignore
+        return get_tokenizer(defs.ENCODING_MODEL).count(text)
+    return tokenizer_for(token_encoder).count(text)
 
 
 def batched(iterable: Iterator, n: int):
@@ -44,7 +45,7 @@ def chunk_text(
 ):
     """Chunk text by token length."""
     if token_encoder is None:
-        token_encoder = tiktoken.get_encoding(defs.ENCODING_MODEL)
+        token_encoder = get_encoding(defs.ENCODING_MODEL)
     tokens = token_encoder.encode(text)  # type: ignore
     chunk_iterator = batched(iter(tokens), max_tokens)
     yield from (token_encoder.decode(list(chunk)) for chunk in chunk_iterator)
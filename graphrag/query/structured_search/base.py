@@ -6,7 +6,7 @@
 from abc import ABC, abstractmethod
 from collections.abc import AsyncGenerator
 from dataclasses import dataclass
-from typing import Any, Generic, TypeVar
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 import pandas as pd
 import tiktoken
@@ -14,6 +14,7 @@ import tiktoken
 from graphrag.language_model.protocol.base import ChatModel
 from graphrag.query.context_builder.builders import (
     BasicContextBuilder,
+    ContextBuilderResult,
     DRIFTContextBuilder,
     GlobalContextBuilder,
     LocalContextBuilder,
@@ -21,6 +22,10 @@ from graphrag.query.context_builder.builders import (
 from graphrag.query.context_builder.conversation_history import (
     ConversationHistory,
 )
+from graphrag.query.context_builder.executor import get_context_executor
+
+if TYPE_CHECKING:
+    from graphrag.callbacks.query_callbacks import QueryCallbacks
 
 
 @dataclass
@@ -67,6 +72,45 @@ class BaseSearch(ABC, Generic[T]):
         self.token_encoder = token_encoder
         self.model_params = model_params or {}
         self.context_builder_params = context_builder_params or {}
+        self.callbacks: list[QueryCallbacks] = []
+
+    def _emit_stage(
+        self,
+        stage: str,
+        elapsed: float,
+        llm_calls: int = 0,
+        prompt_tokens: int = 0,
+        output_tokens: int = 0,
+    ) -> None:
+        """Report a timed stage to the query callbacks."""
+        for callback in self.callbacks:
+            callback.on_stage(stage, elapsed, llm_calls, prompt_tokens, output_tokens)
+
+    def _emit_context_stages(
+        self, context_result: ContextBuilderResult, elapsed: float
+    ) -> None:
+        """Report context building, and any sub-stages it timed, to the query callbacks."""
+        for stage, stage_elapsed in context_result.stage_times.items():
+            self._emit_stage(stage, stage_elapsed)
+        self._emit_stage(
+            "build_context",
+            elapsed,
+            context_result.llm_calls,
+            context_result.prompt_tokens,
+            context_result.output_tokens,
+        )
+
+    async def _build_context_offloaded(self, **kwargs) -> ContextBuilderResult:
+        """Run a synchronous context builder on the bounded context executor.
+
+        Reports the time spent waiting for a free worker as the context_queue
+        stage, so queueing under load is visible next to build_context.
+        """
+        context_result, queue_time = await get_context_executor().run(
+            self.context_builder.build_context, **kwargs
+        )
+        self._emit_stage("context_queue", queue_time)
+        return context_result
 
     @abstractmethod
     async def search(
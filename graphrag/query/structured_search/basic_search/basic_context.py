@@ -3,10 +3,15 @@
 
 """Basic Context Builder implementation."""
 
+import time
+
 import pandas as pd
 import tiktoken
 
+from graphrag.config.enums import RetrievalMode
 from graphrag.data_model.text_unit import TextUnit
+from graphrag.keyword_index.bm25 import BM25Index
+from graphrag.keyword_index.fusion import reciprocal_rank_fusion
 from graphrag.language_model.protocol.base import EmbeddingModel
 from graphrag.query.context_builder.builders import (
     BasicContextBuilder,
@@ -26,12 +31,17 @@ class BasicSearchContext(BasicContextBuilder):
         text_units: list[TextUnit] | None = None,
         token_encoder: tiktoken.Encoding | None = None,
         embedding_vectorstore_key: str = "id",
+        keyword_index: BM25Index | None = None,
+        retrieval_mode: RetrievalMode | str = RetrievalMode.Vector,
     ):
         self.text_embedder = text_embedder
         self.token_encoder = token_encoder
         self.text_units = text_units
         self.text_unit_embeddings = text_unit_embeddings
         self.embedding_vectorstore_key = embedding_vectorstore_key
+        self.keyword_index = keyword_index
+        self.retrieval_mode = retrieval_mode
+        self._text_units_by_id = {unit.id: unit for unit in text_units or []}
 
     def build_context(
         self,
@@ -40,15 +50,41 @@ class BasicSearchContext(BasicContextBuilder):
         **kwargs,
     ) -> ContextBuilderResult:
         """Build the context for the local search mode."""
-        search_results = self.text_unit_embeddings.similarity_search_by_text(
-            text=query,
-            text_embedder=lambda t: self.text_embedder.embed(t),
-            k=kwargs.get("k", 10),
+        k = kwargs.get("k", 10)
+        use_keywords = (
+            self.keyword_index is not None
+            and self.retrieval_mode != RetrievalMode.Vector
         )
+        stage_times = {}
+        texts: dict[str, str] = {}
+        vector_ranking = []
+        if not use_keywords or self.retrieval_mode == RetrievalMode.Hybrid:
+            vector_search_start = time.perf_counter()
+            search_results = self.text_unit_embeddings.similarity_search_by_text(
+                text=query,
+                text_embedder=lambda t: self.text_embedder.embed(t),
+                k=k,
+            )
+            stage_times["vector_search"] = time.perf_counter() - vector_search_start
+            for result in search_results:
+                texts.setdefault(str(result.document.id), result.document.text or "")
+                vector_ranking.append(str(result.document.id))
+        ranking = vector_ranking
+        if use_keywords and self.keyword_index is not None:
+            keyword_search_start = time.perf_counter()
+            keyword_ranking = [
+                doc_id
+                for doc_id, _ in self.keyword_index.search(query, k=k)
+                if doc_id in self._text_units_by_id
+            ]
+            for doc_id in keyword_ranking:
+                texts.setdefault(doc_id, self._text_units_by_id[doc_id].text)
+            ranking = reciprocal_rank_fusion([vector_ranking, keyword_ranking], limit=k)
+            stage_times["keyword_search"] = time.perf_counter() - keyword_search_start
         # we don't have a friendly id on text_units, so just copy the index
         sources = [
-            {"id": str(search_results.index(r)), "text": r.document.text}
-            for r in search_results
+            {"id": str(index), "text": texts[doc_id]}
+            for index, doc_id in enumerate(ranking)
         ]
         # make a delimited table for the context; this imitates graphrag context building
         table = ["id|text"] + [f"{s['id']}|{s['text']}" for s in sources]
@@ -58,4 +94,5 @@ class BasicSearchContext(BasicContextBuilder):
         return ContextBuilderResult(
             context_chunks="\n\n".join(table),
             context_records={"sources": pd.DataFrame(sources, columns=columns)},
+            stage_times=stage_times,
         )
@@ -67,12 +67,14 @@ class BasicSearch(BaseSearch[BasicContextBuilder]):
         search_prompt = ""
         llm_calls, prompt_tokens, output_tokens = {}, {}, {}
 
-        context_result = self.context_builder.build_context(
+        stage_start = time.perf_counter()
+        context_result = await self._build_context_offloaded(
             query=query,
             conversation_history=conversation_history,
             **kwargs,
             **self.context_builder_params,
         )
+        self._emit_context_stages(context_result, time.perf_counter() - stage_start)
 
         llm_calls["build_context"] = context_result.llm_calls
         prompt_tokens["build_context"] = context_result.prompt_tokens
@@ -89,6 +91,7 @@ class BasicSearch(BaseSearch[BasicContextBuilder]):
             ]
 
             response = ""
+            stage_start = time.perf_counter()
             async for chunk in self.model.achat_stream(
                 prompt=query,
                 history=search_messages,
@@ -101,6 +104,13 @@ class BasicSearch(BaseSearch[BasicContextBuilder]):
             llm_calls["response"] = 1
             prompt_tokens["response"] = num_tokens(search_prompt, self.token_encoder)
             output_tokens["response"] = num_tokens(response, self.token_encoder)
+            self._emit_stage(
+                "response",
+                time.perf_counter() - stage_start,
+                llm_calls["response"],
+                prompt_tokens["response"],
+                output_tokens["response"],
+            )
 
             for callback in self.callbacks:
                 callback.on_context(context_result.context_records)
@@ -135,11 +145,13 @@ class BasicSearch(BaseSearch[BasicContextBuilder]):
         """Build basic search context that fits a single context window and generate answer for the user query."""
         start_time = time.time()
 
-        context_result = self.context_builder.build_context(
+        stage_start = time.perf_counter()
+        context_result = await self._build_context_offloaded(
             query=query,
             conversation_history=conversation_history,
             **self.context_builder_params,
         )
+        self._emit_context_stages(context_result, time.perf_counter() - stage_start)
         log.info("GENERATE ANSWER: %s. QUERY: %s", start_time, query)
         search_prompt = self.system_prompt.format(
             context_data=context_result.context_chunks, response_type=self.response_type
@@ -151,11 +163,21 @@ class BasicSearch(BaseSearch[BasicContextBuilder]):
         for callback in self.callbacks:
             callback.on_context(context_result.context_records)
 
+        stage_start = time.perf_counter()
+        full_response = ""
         async for chunk_response in self.model.achat_stream(
             prompt=query,
             history=search_messages,
             model_parameters=self.model_params,
         ):
+            full_response += chunk_response
             for callback in self.callbacks:
                 callback.on_llm_new_token(chunk_response)
             yield chunk_response
+        self._emit_stage(
+            "response",
+            time.perf_counter() - stage_start,
+            1,
+            num_tokens(search_prompt, self.token_encoder),
+            num_tokens(full_response, self.token_encoder),
+        )
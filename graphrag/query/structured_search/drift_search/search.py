@@ -203,17 +203,33 @@ class DRIFTSearch(BaseSearch[DRIFTSearchContextBuilder]):
         # Check if query state is empty
         if not self.query_state.graph:
             # Prime the search with the primer
+            stage_start = time.perf_counter()
             primer_context, token_ct = await self.context_builder.build_context(query)
             llm_calls["build_context"] = token_ct["llm_calls"]
             prompt_tokens["build_context"] = token_ct["prompt_tokens"]
             output_tokens["build_context"] = token_ct["prompt_tokens"]
+            self._emit_stage(
+                "primer_context",
+                time.perf_counter() - stage_start,
+                llm_calls["build_context"],
+                prompt_tokens["build_context"],
+                output_tokens["build_context"],
+            )
 
+            stage_start = time.perf_counter()
             primer_response = await self.primer.search(
                 query=query, top_k_reports=primer_context
             )
             llm_calls["primer"] = primer_response.llm_calls
             prompt_tokens["primer"] = primer_response.prompt_tokens
             output_tokens["primer"] = primer_response.output_tokens
+            self._emit_stage(
+                "primer",
+                time.perf_counter() - stage_start,
+                llm_calls["primer"],
+                prompt_tokens["primer"],
+                output_tokens["primer"],
+            )
 
             # Package response into DriftAction
             init_action = self._process_primer_results(query, primer_response)
@@ -221,6 +237,7 @@ class DRIFTSearch(BaseSearch[DRIFTSearchContextBuilder]):
             self.query_state.add_all_follow_ups(init_action, init_action.follow_ups)
 
         # Main loop
+        stage_start = time.perf_counter()
         epochs = 0
         llm_call_offset = 0
         while epochs < self.context_builder.config.n_depth:
@@ -250,6 +267,13 @@ class DRIFTSearch(BaseSearch[DRIFTSearchContextBuilder]):
         llm_calls["action"] = token_ct["llm_calls"]
         prompt_tokens["action"] = token_ct["prompt_tokens"]
         output_tokens["action"] = token_ct["output_tokens"]
+        self._emit_stage(
+            "action",
+            time.perf_counter() - stage_start,
+            llm_calls["action"],
+            prompt_tokens["action"],
+            output_tokens["action"],
+        )
 
         # Package up context data
         response_state, context_data, context_text = self.query_state.serialize(
@@ -262,6 +286,7 @@ class DRIFTSearch(BaseSearch[DRIFTSearchContextBuilder]):
             for callback in self.callbacks:
                 callback.on_reduce_response_start(response_state)
 
+            stage_start = time.perf_counter()
             reduced_response = await self._reduce_response(
                 responses=response_state,
                 query=query,
@@ -272,6 +297,14 @@ class DRIFTSearch(BaseSearch[DRIFTSearchContextBuilder]):
                 temperature=self.context_builder.config.reduce_temperature,
             )
 
+            self._emit_stage(
+                "reduce",
+                time.perf_counter() - stage_start,
+                llm_calls["reduce"],
+                prompt_tokens["reduce"],
+                output_tokens["reduce"],
+            )
+
             for callback in self.callbacks:
                 callback.on_reduce_response_end(reduced_response)
         return SearchResult(
@@ -307,6 +340,7 @@ class DRIFTSearch(BaseSearch[DRIFTSearchContextBuilder]):
         for callback in self.callbacks:
             callback.on_reduce_response_start(result.response)
 
+        stage_start = time.perf_counter()
         full_response = ""
         async for resp in self._reduce_response_streaming(
             responses=result.response,
@@ -316,6 +350,13 @@ class DRIFTSearch(BaseSearch[DRIFTSearchContextBuilder]):
         ):
             full_response += resp
             yield resp
+        self._emit_stage(
+            "reduce",
+            time.perf_counter() - stage_start,
+            1,
+            0,
+            num_tokens(full_response, self.token_encoder),
+        )
 
         for callback in self.callbacks:
             callback.on_reduce_response_end(full_response)
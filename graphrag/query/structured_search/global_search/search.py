@@ -108,31 +108,45 @@ class GlobalSearch(BaseSearch[GlobalContextBuilder]):
         conversation_history: ConversationHistory | None = None,
     ) -> AsyncGenerator[str, None]:
         """Stream the global search response."""
+        stage_start = time.perf_counter()
         context_result = await self.context_builder.build_context(
             query=query,
             conversation_history=conversation_history,
             **self.context_builder_params,
         )
+        self._emit_context_stages(context_result, time.perf_counter() - stage_start)
         for callback in self.callbacks:
             callback.on_map_response_start(context_result.context_chunks)  # type: ignore
 
+        stage_start = time.perf_counter()
         map_responses = await asyncio.gather(*[
             self._map_response_single_batch(
                 context_data=data, query=query, **self.map_llm_params
             )
             for data in context_result.context_chunks
         ])
+        self._emit_map_stage(map_responses, time.perf_counter() - stage_start)
 
         for callback in self.callbacks:
             callback.on_map_response_end(map_responses)  # type: ignore
             callback.on_context(context_result.context_records)
 
+        stage_start = time.perf_counter()
+        reduce_response = ""
         async for response in self._stream_reduce_response(
             map_responses=map_responses,  # type: ignore
             query=query,
             model_parameters=self.reduce_llm_params,
         ):
+            reduce_response += response
             yield response
+        self._emit_stage(
+            "reduce",
+            time.perf_counter() - stage_start,
+            1,
+            0,
+            num_tokens(reduce_response, self.token_encoder),
+        )
 
     async def search(
         self,
@@ -152,11 +166,13 @@ class GlobalSearch(BaseSearch[GlobalContextBuilder]):
         llm_calls, prompt_tokens, output_tokens = {}, {}, {}
 
         start_time = time.time()
+        stage_start = time.perf_counter()
         context_result = await self.context_builder.build_context(
             query=query,
             conversation_history=conversation_history,
             **self.context_builder_params,
         )
+        self._emit_context_stages(context_result, time.perf_counter() - stage_start)
         llm_calls["build_context"] = context_result.llm_calls
         prompt_tokens["build_context"] = context_result.prompt_tokens
         output_tokens["build_context"] = context_result.output_tokens
@@ -164,12 +180,14 @@ class GlobalSearch(BaseSearch[GlobalContextBuilder]):
         for callback in self.callbacks:
             callback.on_map_response_start(context_result.context_chunks)  # type: ignore
 
+        stage_start = time.perf_counter()
         map_responses = await asyncio.gather(*[
             self._map_response_single_batch(
                 context_data=data, query=query, **self.map_llm_params
             )
             for data in context_result.context_chunks
         ])
+        self._emit_map_stage(map_responses, time.perf_counter() - stage_start)
 
         for callback in self.callbacks:
             callback.on_map_response_end(map_responses)
@@ -180,6 +198,7 @@ class GlobalSearch(BaseSearch[GlobalContextBuilder]):
         output_tokens["map"] = sum(response.output_tokens for response in map_responses)
 
         # Step 2: Combine the intermediate answers from step 2 to generate the final answer
+        stage_start = time.perf_counter()
         reduce_response = await self._reduce_response(
             map_responses=map_responses,
             query=query,
@@ -188,6 +207,13 @@ class GlobalSearch(BaseSearch[GlobalContextBuilder]):
         llm_calls["reduce"] = reduce_response.llm_calls
         prompt_tokens["reduce"] = reduce_response.prompt_tokens
         output_tokens["reduce"] = reduce_response.output_tokens
+        self._emit_stage(
+            "reduce",
+            time.perf_counter() - stage_start,
+            llm_calls["reduce"],
+            prompt_tokens["reduce"],
+            output_tokens["reduce"],
+        )
 
         return GlobalSearchResult(
             response=reduce_response.response,
@@ -205,6 +231,18 @@ class GlobalSearch(BaseSearch[GlobalContextBuilder]):
             output_tokens_categories=output_tokens,
         )
 
+    def _emit_map_stage(
+        self, map_responses: list[SearchResult], elapsed: float
+    ) -> None:
+        """Report the map stage with the usage summed across all batches."""
+        self._emit_stage(
+            "map",
+            elapsed,
+            sum(response.llm_calls for response in map_responses),
+            sum(response.prompt_tokens for response in map_responses),
+            sum(response.output_tokens for response in map_responses),
+        )
+
     async def _map_response_single_batch(
         self,
         context_data: str,
@@ -3,17 +3,19 @@
 """Algorithms to build context data for local search prompt."""
 
 import logging
-from copy import deepcopy
+import time
 from typing import Any
 
 import pandas as pd
 import tiktoken
 
+from graphrag.config.enums import RetrievalMode
 from graphrag.data_model.community_report import CommunityReport
 from graphrag.data_model.covariate import Covariate
 from graphrag.data_model.entity import Entity
 from graphrag.data_model.relationship import Relationship
 from graphrag.data_model.text_unit import TextUnit
+from graphrag.keyword_index.bm25 import BM25Index
 from graphrag.language_model.protocol.base import EmbeddingModel
 from graphrag.query.context_builder.builders import ContextBuilderResult
 from graphrag.query.context_builder.community_context import (
@@ -61,6 +63,8 @@ class LocalSearchMixedContext(LocalContextBuilder):
         covariates: dict[str, list[Covariate]] | None = None,
         token_encoder: tiktoken.Encoding | None = None,
         embedding_vectorstore_key: str = EntityVectorStoreKey.ID,
+        keyword_index: BM25Index | None = None,
+        retrieval_mode: RetrievalMode | str = RetrievalMode.Vector,
     ):
         if community_reports is None:
             community_reports = []
@@ -83,6 +87,8 @@ class LocalSearchMixedContext(LocalContextBuilder):
         self.text_embedder = text_embedder
         self.token_encoder = token_encoder
         self.embedding_vectorstore_key = embedding_vectorstore_key
+        self.keyword_index = keyword_index
+        self.retrieval_mode = retrieval_mode
 
     def filter_by_entity_keys(self, entity_keys: list[int] | list[str]):
         """Filter entity text embeddings by entity keys."""
@@ -136,6 +142,7 @@ class LocalSearchMixedContext(LocalContextBuilder):
             )
             query = f"{query}\n{pre_user_questions}"
 
+        vector_search_start = time.perf_counter()
         selected_entities = map_query_to_entities(
             query=query,
             text_embedding_vectorstore=self.entity_text_embeddings,
@@ -146,6 +153,15 @@ class LocalSearchMixedContext(LocalContextBuilder):
             exclude_entity_names=exclude_entity_names,
             k=top_k_mapped_entities,
             oversample_scaler=2,
+            keyword_index=self.keyword_index,
+            retrieval_mode=self.retrieval_mode,
+        )
+        vector_search_time = time.perf_counter() - vector_search_start
+        search_stage = (
+            "keyword_search"
+            if self.keyword_index is not None
+            and self.retrieval_mode == RetrievalMode.Keyword
+            else "vector_search"
         )
 
         # build context
@@ -219,6 +235,7 @@ class LocalSearchMixedContext(LocalContextBuilder):
         return ContextBuilderResult(
             context_chunks="\n\n".join(final_context),
             context_records=final_context_data,
+            stage_times={search_stage: vector_search_time},
         )
 
     def _build_community_context(
@@ -251,16 +268,11 @@ class LocalSearchMixedContext(LocalContextBuilder):
             for community_id in community_matches
             if community_id in self.community_reports
         ]
-        for community in selected_communities:
-            if community.attributes is None:
-                community.attributes = {}
-            community.attributes["matches"] = community_matches[community.community_id]
+        # reports are shared across concurrent queries, so keep match counts local
         selected_communities.sort(
-            key=lambda x: (x.attributes["matches"], x.rank),  # type: ignore
+            key=lambda x: (community_matches[x.community_id], x.rank),  # type: ignore
             reverse=True,  # type: ignore
         )
-        for community in selected_communities:
-            del community.attributes["matches"]  # type: ignore
 
         context_text, context_data = build_community_context(
             community_reports=selected_communities,
@@ -330,7 +342,7 @@ class LocalSearchMixedContext(LocalContextBuilder):
 
             for text_id in entity.text_unit_ids or []:
                 if text_id not in text_unit_ids_set and text_id in self.text_units:
-                    selected_unit = deepcopy(self.text_units[text_id])
+                    selected_unit = self.text_units[text_id]
                     num_relationships = count_relationships(
                         entity_relationships, selected_unit
                     )
@@ -65,12 +65,14 @@ class LocalSearch(BaseSearch[LocalContextBuilder]):
         start_time = time.time()
         search_prompt = ""
         llm_calls, prompt_tokens, output_tokens = {}, {}, {}
-        context_result = self.context_builder.build_context(
+        stage_start = time.perf_counter()
+        context_result = await self._build_context_offloaded(
             query=query,
             conversation_history=conversation_history,
             **kwargs,
             **self.context_builder_params,
         )
+        self._emit_context_stages(context_result, time.perf_counter() - stage_start)
         llm_calls["build_context"] = context_result.llm_calls
         prompt_tokens["build_context"] = context_result.prompt_tokens
         output_tokens["build_context"] = context_result.output_tokens
@@ -95,6 +97,7 @@ class LocalSearch(BaseSearch[LocalContextBuilder]):
 
             full_response = ""
 
+            stage_start = time.perf_counter()
             async for response in self.model.achat_stream(
                 prompt=query,
                 history=history_messages,
@@ -107,6 +110,13 @@ class LocalSearch(BaseSearch[LocalContextBuilder]):
             llm_calls["response"] = 1
             prompt_tokens["response"] = num_tokens(search_prompt, self.token_encoder)
             output_tokens["response"] = num_tokens(full_response, self.token_encoder)
+            self._emit_stage(
+                "response",
+                time.perf_counter() - stage_start,
+                llm_calls["response"],
+                prompt_tokens["response"],
+                output_tokens["response"],
+            )
 
             for callback in self.callbacks:
                 callback.on_context(context_result.context_records)
@@ -144,11 +154,13 @@ class LocalSearch(BaseSearch[LocalContextBuilder]):
         """Build local search context that fits a single context window and generate answer for the user query."""
         start_time = time.time()
 
-        context_result = self.context_builder.build_context(
+        stage_start = time.perf_counter()
+        context_result = await self._build_context_offloaded(
             query=query,
             conversation_history=conversation_history,
             **self.context_builder_params,
         )
+        self._emit_context_stages(context_result, time.perf_counter() - stage_start)
         log.info("GENERATE ANSWER: %s. QUERY: %s", start_time, query)
         search_prompt = self.system_prompt.format(
             context_data=context_result.context_chunks, response_type=self.response_type
@@ -160,11 +172,21 @@ class LocalSearch(BaseSearch[LocalContextBuilder]):
         for callback in self.callbacks:
             callback.on_context(context_result.context_records)
 
+        stage_start = time.perf_counter()
+        full_response = ""
         async for response in self.model.achat_stream(
             prompt=query,
             history=history_messages,
             model_parameters=self.model_params,
         ):
+            full_response += response
             for callback in self.callbacks:
                 callback.on_llm_new_token(response)
             yield response
+        self._emit_stage(
+            "response",
+            time.perf_counter() - stage_start,
+            1,
+            num_tokens(search_prompt, self.token_encoder),
+            num_tokens(full_response, self.token_encoder),
+        )
@@ -9,9 +9,11 @@ from typing import Any
 from graphrag.cache.factory import CacheFactory
 from graphrag.cache.pipeline_cache import PipelineCache
 from graphrag.config.embeddings import create_collection_name
+from graphrag.config.enums import OutputType, RetrievalMode
 from graphrag.config.models.cache_config import CacheConfig
 from graphrag.config.models.output_config import OutputConfig
 from graphrag.data_model.types import TextEmbedder
+from graphrag.keyword_index.bm25 import BM25Index, keyword_index_filename
 from graphrag.storage.factory import StorageFactory
 from graphrag.storage.pipeline_storage import PipelineStorage
 from graphrag.vector_stores.base import (
@@ -119,6 +121,35 @@ def get_embedding_store(
     return MultiVectorStore(embedding_stores, index_names)
 
 
+_keyword_indexes: dict[Path, tuple[int, BM25Index]] = {}
+
+
+def get_keyword_index(
+    output_config: OutputConfig,
+    embedding_name: str,
+    retrieval_mode: RetrievalMode | str = RetrievalMode.Hybrid,
+) -> BM25Index | None:
+    """Load the BM25 keyword index written next to the output tables.
+
+    Returns None for the vector retrieval mode, for non-file outputs and when no
+    index was built. Loaded indexes are cached per file until the file changes,
+    so queries after the first one do not touch the disk.
+    """
+    if retrieval_mode == RetrievalMode.Vector or output_config.type != OutputType.file:
+        return None
+    path = Path(output_config.base_dir) / keyword_index_filename(embedding_name)
+    try:
+        mtime = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    cached = _keyword_indexes.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    index = BM25Index.from_bytes(path.read_bytes())
+    _keyword_indexes[path] = (mtime, index)
+    return index
+
+
 def reformat_context_data(context_data: dict) -> dict:
     """
     Reformats context_data for all query responses.
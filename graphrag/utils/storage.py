@@ -8,6 +8,7 @@ from io import BytesIO
 
 import pandas as pd
 
+from graphrag.index.run.profiling import record_table
 from graphrag.storage.pipeline_storage import PipelineStorage
 
 log = logging.getLogger(__name__)
@@ -21,16 +22,19 @@ async def load_table_from_storage(name: str, storage: PipelineStorage) -> pd.Dat
         raise ValueError(msg)
     try:
         log.info("reading table from storage: %s", filename)
-        return pd.read_parquet(BytesIO(await storage.get(filename, as_bytes=True)))
+        table = pd.read_parquet(BytesIO(await storage.get(filename, as_bytes=True)))
     except Exception:
         log.exception("error loading table from storage: %s", filename)
         raise
+    record_table(name, table, output=False)
+    return table
 
 
 async def write_table_to_storage(
     table: pd.DataFrame, name: str, storage: PipelineStorage
 ) -> None:
     """Write a table to storage."""
+    record_table(name, table, output=True)
     await storage.set(f"{name}.parquet", table.to_parquet())
 
 
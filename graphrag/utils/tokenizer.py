@@ -0,0 +1,165 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Shared tiktoken encoders with memoized token counts.
+
+Every token count in indexing and query goes through one CachedTokenizer per
+encoding, so the same prompt, description or report is encoded once per process
+however many components measure it.
+"""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+import tiktoken
+
+import graphrag.config.defaults as defs
+
+log = logging.getLogger(__name__)
+
+DEFAULT_ENCODE_THREADS = 8
+"""Threads used by tiktoken's encode_batch and decode_batch."""
+DEFAULT_COUNT_CACHE_SIZE = 65_536
+"""Token counts memoized per encoding."""
+
+_tokenizers: dict[str, "CachedTokenizer"] = {}
+_tokenizers_lock = threading.Lock()
+
+
+def _content_key(text: str) -> bytes:
+    return hashlib.blake2b(
+        text.encode("utf-8", "surrogatepass"), digest_size=16
+    ).digest()
+
+
+class CachedTokenizer:
+    """A tiktoken encoding with a content-hash keyed LRU of token counts.
+
+    Counts treat special tokens as plain text, so counting never raises.
+    """
+
+    def __init__(
+        self,
+        encoding: tiktoken.Encoding,
+        cache_size: int = DEFAULT_COUNT_CACHE_SIZE,
+    ):
+        self.encoding = encoding
+        self._cache_size = cache_size
+        self._counts: OrderedDict[bytes, int] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def encode(self, text: str) -> list[int]:
+        """Encode a text, treating special tokens as plain text."""
+        return self.encoding.encode(text, disallowed_special=())
+
+    def decode(self, tokens: list[int]) -> str:
+        """Decode a list of token ids."""
+        return self.encoding.decode(tokens)
+
+    def count(self, text: str) -> int:
+        """Return the number of tokens in a text."""
+        key = _content_key(text)
+        with self._lock:
+            count = self._counts.get(key)
+            if count is not None:
+                self._counts.move_to_end(key)
+                self._hits += 1
+                return count
+        count = len(self.encode(text))
+        self._store({key: count})
+        return count
+
+    def count_batch(
+        self, texts: Sequence[str], num_threads: int = DEFAULT_ENCODE_THREADS
+    ) -> list[int]:
+        """Return the number of tokens of every text.
+
+        Texts missing from the cache are encoded together with tiktoken's threaded
+        encode_batch, which runs outside the GIL.
+        """
+        keys = [_content_key(text) for text in texts]
+        counts: dict[bytes, int] = {}
+        with self._lock:
+            for key in keys:
+                count = self._counts.get(key)
+                if count is not None:
+                    self._counts.move_to_end(key)
+                    counts[key] = count
+            self._hits += len(counts)
+        missing = {
+            key: text
+            for key, text in zip(keys, texts, strict=True)
+            if key not in counts
+        }
+        if missing:
+            encoded = self.encoding.encode_batch(
+                list(missing.values()), num_threads=num_threads, disallowed_special=()
+            )
+            new_counts = {
+                key: len(tokens) for key, tokens in zip(missing, encoded, strict=True)
+            }
+            self._store(new_counts)
+            counts.update(new_counts)
+        return [counts[key] for key in keys]
+
+    def count_total(self, texts: Iterable[Any]) -> int:
+        """Return the total tokens of the strings among the given parts (others are skipped)."""
+        return sum(self.count(text) for text in texts if isinstance(text, str))
+
+    def cache_info(self) -> dict[str, int]:
+        """Return the hits, misses and current size of the count cache."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "size": len(self._counts),
+            }
+
+    def _store(self, counts: dict[bytes, int]) -> None:
+        with self._lock:
+            self._misses += len(counts)
+            self._counts.update(counts)
+            for key in counts:
+                self._counts.move_to_end(key)
+            while len(self._counts) > self._cache_size:
+                self._counts.popitem(last=False)
+
+
+def get_encoding(
+    encoding_name: str | None = None, model: str | None = None
+) -> tiktoken.Encoding:
+    """Return the shared encoding of a model, or of the named encoding.
+
+    Unknown models fall back to the named (or default) encoding.
+    """
+    encoding_name = encoding_name or defs.ENCODING_MODEL
+    if model is not None:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            log.warning("Model %s not found, using %s", model, encoding_name)
+    return tiktoken.get_encoding(encoding_name)
+
+
+def get_tokenizer(
+    encoding_name: str | None = None, model: str | None = None
+) -> CachedTokenizer:
+    """Return the shared tokenizer of a model, or of the named encoding."""
+    return tokenizer_for(get_encoding(encoding_name, model))
+
+
+def tokenizer_for(encoding: tiktoken.Encoding) -> CachedTokenizer:
+    """Return the shared tokenizer wrapping an encoding."""
+    with _tokenizers_lock:
+        tokenizer = _tokenizers.get(encoding.name)
+        # tiktoken keeps one encoding per name, so a different object is a custom one
+        if tokenizer is None or tokenizer.encoding is not encoding:
+            tokenizer = CachedTokenizer(encoding)
+            _tokenizers[encoding.name] = tokenizer
+        return tokenizer
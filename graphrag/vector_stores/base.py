@@ -7,6 +7,8 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any
 
+import numpy as np
+
 from graphrag.data_model.types import TextEmbedder
 
 DEFAULT_VECTOR_SIZE: int = 1536
@@ -64,6 +66,31 @@ class BaseVectorStore(ABC):
     ) -> None:
         """Load documents into the vector-store."""
 
+    def load_vectors(
+        self,
+        ids: list[str] | list[int],
+        texts: list[str | None],
+        vectors: np.ndarray,
+        attributes: list[dict[str, Any]],
+        overwrite: bool = True,
+    ) -> None:
+        """Load documents given as parallel columns and an (n, d) vector matrix.
+
+        Stores that can bulk-insert columnar data override this; the default loads
+        the rows as documents.
+        """
+        self.load_documents(
+            [
+                VectorStoreDocument(
+                    id=doc_id, text=text, vector=vector, attributes=doc_attributes
+                )
+                for doc_id, text, vector, doc_attributes in zip(
+                    ids, texts, np.asarray(vectors).tolist(), attributes, strict=True
+                )
+            ],
+            overwrite,
+        )
+
     @abstractmethod
     def similarity_search_by_vector(
         self, query_embedding: list[float], k: int = 10, **kwargs: Any
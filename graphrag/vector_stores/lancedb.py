@@ -6,6 +6,7 @@
 import json  # noqa: I001
 from typing import Any
 
+import numpy as np
 import pyarrow as pa
 
 from graphrag.data_model.types import TextEmbedder
@@ -15,6 +16,13 @@ from graphrag.vector_stores.base import (
     VectorStoreDocument,
     VectorStoreSearchResult,
 )
+from graphrag.vector_stores.quantization import (
+    DEFAULT_RESCORE_MULTIPLIER,
+    QuantizedVectors,
+    VectorQuantization,
+    quantize,
+    rescore,
+)
 import lancedb
 
 
@@ -23,6 +31,15 @@ class LanceDBVectorStore(BaseVectorStore):
 
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
+        self.quantization = VectorQuantization(
+            kwargs.get("quantization") or VectorQuantization.none
+        )
+        self.rescore_multiplier = int(
+            kwargs.get("rescore_multiplier") or DEFAULT_RESCORE_MULTIPLIER
+        )
+        self.include_ids: set | None = None
+        self._quantized: QuantizedVectors | None = None
+        self._quantized_version: int | None = None
 
     def connect(self, **kwargs: Any) -> Any:
         """Connect to the vector storage."""
@@ -50,15 +67,31 @@ class LanceDBVectorStore(BaseVectorStore):
             if document.vector is not None
         ]
 
-        if len(data) == 0:
-            data = None
-
-        schema = pa.schema([
+        fields = [
             pa.field("id", pa.string()),
             pa.field("text", pa.string()),
             pa.field("vector", pa.list_(pa.float64())),
             pa.field("attributes", pa.string()),
-        ])
+        ]
+        if self.quantization != VectorQuantization.none:
+            # quantized codes are stored beside the full-precision vectors used for rescoring
+            fields += [
+                pa.field("vector_code", pa.binary()),
+                pa.field("vector_scale", pa.float32()),
+            ]
+            if data:
+                codes, scales = quantize(
+                    np.asarray([row["vector"] for row in data]), self.quantization
+                )
+                for row, code, scale in zip(data, codes, scales, strict=True):
+                    row["vector_code"] = code.tobytes()
+                    row["vector_scale"] = float(scale)
+        self._quantized = None
+
+        if len(data) == 0:
+            data = None
+
+        schema = pa.schema(fields)
         # NOTE: If modifying the next section of code, ensure that the schema remains the same.
         #       The pyarrow format of the 'vector' field may change if the order of operations is changed
         #       and will break vector search.
@@ -79,8 +112,67 @@ class LanceDBVectorStore(BaseVectorStore):
             if data:
                 self.document_collection.add(data)
 
+    def load_vectors(
+        self,
+        ids: list[str] | list[int],
+        texts: list[str | None],
+        vectors: np.ndarray,
+        attributes: list[dict[str, Any]],
+        overwrite: bool = True,
+    ) -> None:
+        """Load a batch of documents as one Arrow table.
+
+        Vectors are written as a fixed-size float32 list column straight from the
+        matrix buffer, the same layout LanceDB infers for the rows of load_documents.
+        """
+        if len(ids) == 0:
+            self.load_documents([], overwrite)
+            return
+
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        rows, dimensions = vectors.shape
+        columns = {
+            "id": pa.array(ids),
+            "text": pa.array(texts, pa.string(), from_pandas=True),
+            "vector": pa.FixedSizeListArray.from_arrays(
+                pa.array(vectors.reshape(-1)), dimensions
+            ),
+            "attributes": pa.array(
+                [json.dumps(item) for item in attributes], pa.string()
+            ),
+        }
+        if self.quantization != VectorQuantization.none:
+            codes, scales = quantize(vectors, self.quantization)
+            width = codes.shape[1]
+            # variable-size binary over the packed codes, offsets every `width` bytes
+            columns["vector_code"] = pa.Array.from_buffers(
+                pa.binary(),
+                rows,
+                [
+                    None,
+                    pa.py_buffer(
+                        np.arange(0, (rows + 1) * width, width, dtype=np.int32)
+                    ),
+                    pa.py_buffer(np.ascontiguousarray(codes)),
+                ],
+            )
+            columns["vector_scale"] = pa.array(scales, pa.float64())
+        self._quantized = None
+
+        table = pa.table(columns)
+        if overwrite:
+            self.document_collection = self.db_connection.create_table(
+                self.collection_name, data=table, mode="overwrite"
+            )
+        else:
+            self.document_collection = self.db_connection.open_table(
+                self.collection_name
+            )
+            self.document_collection.add(table)
+
     def filter_by_id(self, include_ids: list[str] | list[int]) -> Any:
         """Build a query filter to filter documents by id."""
+        self.include_ids = set(include_ids) if include_ids else None
         if len(include_ids) == 0:
             self.query_filter = None
         else:
@@ -97,6 +189,8 @@ class LanceDBVectorStore(BaseVectorStore):
         self, query_embedding: list[float], k: int = 10, **kwargs: Any
     ) -> list[VectorStoreSearchResult]:
         """Perform a vector-based similarity search."""
+        if self.quantization != VectorQuantization.none:
+            return self._rescored_search(query_embedding, k)
         if self.query_filter:
             docs = (
                 self.document_collection.search(
@@ -127,6 +221,83 @@ class LanceDBVectorStore(BaseVectorStore):
             for doc in docs
         ]
 
+    def _rescored_search(
+        self, query_embedding: list[float], k: int
+    ) -> list[VectorStoreSearchResult]:
+        """Rank candidates on the quantized codes, then rescore them on full-precision vectors."""
+        candidate_ids = self._load_quantized(len(query_embedding)).candidates(
+            query_embedding, k * self.rescore_multiplier, include_ids=self.include_ids
+        )
+        if not candidate_ids:
+            return []
+        id_filter = ", ".join([f"'{doc_id}'" for doc_id in candidate_ids])
+        docs = (
+            self.document_collection.search()
+            .where(f"id in ({id_filter})", prefilter=True)
+            .select(["id", "text", "vector", "attributes"])
+            .limit(len(candidate_ids))
+            .to_list()
+        )
+        if not docs:
+            return []
+        # same score as the unquantized path: 1 - squared L2 distance
+        distances = rescore(query_embedding, [doc["vector"] for doc in docs])
+        return [
+            VectorStoreSearchResult(
+                document=VectorStoreDocument(
+                    id=docs[i]["id"],
+                    text=docs[i]["text"],
+                    vector=docs[i]["vector"],
+                    attributes=json.loads(docs[i]["attributes"]),
+                ),
+                score=1 - abs(float(distances[i])),
+            )
+            for i in np.argsort(distances, kind="stable")[:k]
+        ]
+
+    def _load_quantized(self, dimensions: int) -> QuantizedVectors:
+        """Load the quantized codes into memory, reloading when the table version changes.
+
+        Tables indexed without quantization (or with another method) are quantized
+        on load from the full-precision vectors, so only the codes stay resident.
+        """
+        version = self.document_collection.version
+        if self._quantized is not None and self._quantized_version == version:
+            return self._quantized
+        dataset = self.document_collection.to_lance()
+        code_width = (
+            dimensions
+            if self.quantization == VectorQuantization.int8
+            else -(-dimensions // 8)
+        )
+        self._quantized = None
+        if "vector_code" in dataset.schema.names:
+            table = dataset.to_table(columns=["id", "vector_code", "vector_scale"])
+            buffer = b"".join(table.column("vector_code").to_pylist())
+            if len(buffer) == table.num_rows * code_width:
+                self._quantized = QuantizedVectors(
+                    ids=table.column("id").to_pylist(),
+                    codes=np.frombuffer(
+                        buffer,
+                        dtype=np.int8
+                        if self.quantization == VectorQuantization.int8
+                        else np.uint8,
+                    ).reshape(table.num_rows, code_width),
+                    scales=table.column("vector_scale").to_numpy(),
+                    method=self.quantization,
+                )
+        if self._quantized is None:
+            table = dataset.to_table(columns=["id", "vector"])
+            self._quantized = QuantizedVectors.from_vectors(
+                ids=table.column("id").to_pylist(),
+                vectors=np.asarray(table.column("vector").to_pylist()).reshape(
+                    table.num_rows, dimensions
+                ),
+                method=self.quantization,
+            )
+        self._quantized_version = version
+        return self._quantized
+
     def similarity_search_by_text(
         self, text: str, text_embedder: TextEmbedder, k: int = 10, **kwargs: Any
     ) -> list[VectorStoreSearchResult]:
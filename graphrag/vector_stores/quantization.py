@@ -0,0 +1,148 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Quantized vector codes for two-stage (candidate + rescore) similarity search."""
+
+from enum import Enum
+
+import numpy as np
+
+DEFAULT_RESCORE_MULTIPLIER = 4
+"""Candidates fetched from the quantized codes per requested result."""
+
+_BLOCK_ROWS = 65_536
+"""Rows decoded at a time, bounding the temporary memory of a search."""
+
+# number of set bits for every byte value, used for hamming distances on packed codes
+_POPCOUNT = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(
+    axis=1, dtype=np.uint16
+)
+
+
+class VectorQuantization(str, Enum):
+    """The supported vector quantization methods."""
+
+    none = "none"
+    """Store and search full-precision vectors only."""
+    int8 = "int8"
+    """One signed byte per dimension with a per-vector scale (4x smaller than float32)."""
+    binary = "binary"
+    """One sign bit per dimension (32x smaller than float32)."""
+
+
+def quantize(
+    vectors: np.ndarray, method: VectorQuantization | str
+) -> tuple[np.ndarray, np.ndarray]:
+    """Quantize a (n, d) matrix, returning the codes and a per-vector float32 scale.
+
+    int8 codes are symmetric (x ~= code * scale); binary codes pack the sign of each
+    dimension and use the vector norm as scale.
+    """
+    vectors = np.asarray(vectors, dtype=np.float32)
+    if vectors.ndim == 1:
+        vectors = vectors[None, :]
+    match VectorQuantization(method):
+        case VectorQuantization.int8:
+            scales = np.abs(vectors).max(axis=1) / 127
+            safe = np.where(scales > 0, scales, 1)
+            codes = np.rint(vectors / safe[:, None]).astype(np.int8)
+            return codes, scales.astype(np.float32)
+        case VectorQuantization.binary:
+            codes = np.packbits(vectors > 0, axis=1)
+            return codes, np.linalg.norm(vectors, axis=1).astype(np.float32)
+        case _:
+            msg = f"Cannot quantize with method: {method}"
+            raise ValueError(msg)
+
+
+class QuantizedVectors:
+    """An in-memory matrix of quantized codes that ranks candidates for rescoring."""
+
+    def __init__(
+        self,
+        ids: list,
+        codes: np.ndarray,
+        scales: np.ndarray,
+        method: VectorQuantization | str,
+    ):
+        self.ids = ids
+        self.codes = codes
+        self.scales = scales
+        self.method = VectorQuantization(method)
+        self._positions = {doc_id: position for position, doc_id in enumerate(ids)}
+        if self.method == VectorQuantization.int8:
+            # squared norms of the dequantized vectors, for approximate L2 distances
+            self._sq_norms = np.empty(len(ids), dtype=np.float32)
+            for start in range(0, len(ids), _BLOCK_ROWS):
+                block = codes[start : start + _BLOCK_ROWS].astype(np.float32)
+                self._sq_norms[start : start + _BLOCK_ROWS] = np.einsum(
+                    "ij,ij->i", block, block
+                )
+            self._sq_norms *= scales**2
+
+    @classmethod
+    def from_vectors(
+        cls, ids: list, vectors: np.ndarray, method: VectorQuantization | str
+    ) -> "QuantizedVectors":
+        """Quantize full-precision vectors."""
+        codes, scales = quantize(vectors, method)
+        return cls(ids, codes, scales, method)
+
+    def __len__(self) -> int:
+        """Return the number of stored vectors."""
+        return len(self.ids)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the codes and scales."""
+        return self.codes.nbytes + self.scales.nbytes
+
+    def candidates(
+        self,
+        query: np.ndarray | list[float],
+        k: int,
+        include_ids: set | None = None,
+    ) -> list:
+        """Return the ids of the k nearest vectors by approximate distance, nearest first."""
+        distances = self._distances(np.asarray(query, dtype=np.float32))
+        if include_ids is not None:
+            allowed = np.zeros(len(self.ids), dtype=bool)
+            positions = [
+                self._positions[doc_id]
+                for doc_id in include_ids
+                if doc_id in self._positions
+            ]
+            allowed[positions] = True
+            distances = np.where(allowed, distances, np.inf)
+        k = min(k, int(np.isfinite(distances).sum()))
+        if k <= 0:
+            return []
+        top = np.argpartition(distances, k - 1)[:k]
+        top = top[np.argsort(distances[top], kind="stable")]
+        return [self.ids[position] for position in top]
+
+    def _distances(self, query: np.ndarray) -> np.ndarray:
+        distances = np.empty(len(self.ids), dtype=np.float32)
+        query_code = np.packbits(query > 0)
+        for start in range(0, len(self.ids), _BLOCK_ROWS):
+            block = slice(start, start + _BLOCK_ROWS)
+            if self.method == VectorQuantization.int8:
+                # approximate squared L2 distance without the constant |q|^2 term
+                distances[block] = self._sq_norms[block] - 2 * self.scales[block] * (
+                    self.codes[block].astype(np.float32) @ query
+                )
+            else:
+                # hamming distance between sign bits approximates the angle
+                distances[block] = _POPCOUNT[
+                    np.bitwise_xor(self.codes[block], query_code)
+                ].sum(axis=1)
+        return distances
+
+
+def rescore(
+    query: np.ndarray | list[float], vectors: np.ndarray | list[list[float]]
+) -> np.ndarray:
+    """Exact squared L2 distances between the query and full-precision candidate vectors."""
+    vectors = np.asarray(vectors, dtype=np.float64)
+    diff = vectors - np.asarray(query, dtype=np.float64)
+    return np.einsum("ij,ij->i", diff, diff)
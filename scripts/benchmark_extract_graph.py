@@ -0,0 +1,166 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Benchmark batched graph extraction and adaptive gleaning against the mock LLM.
+
+Reports LLM calls and prompt tokens (including the resent conversation history of
+gleaning calls) per 1k chunks, and checks every extracted entity is attributed to
+the chunk it came from.
+
+Usage: python scripts/benchmark_extract_graph.py --chunks 1000 --chunk-tokens 300
+"""
+
+import argparse
+import asyncio
+import random
+import re
+from typing import Any
+
+from graphrag.index.operations.extract_graph.graph_extractor import (
+    DEFAULT_CHUNK_DELIMITER,
+    GraphExtractor,
+)
+from graphrag.language_model.response.base import BaseModelOutput, BaseModelResponse
+from graphrag.language_model.scheduler import estimate_tokens
+from graphrag.prompts.index.extract_graph import LOOP_PROMPT
+
+_ENTITY = re.compile(r"\bENTITY_\d+\b")
+_FILLER = [
+    "the",
+    "quarterly",
+    "report",
+    "describes",
+    "operations",
+    "suppliers",
+    "markets",
+    "and",
+    "staff",
+]
+
+
+class CountingMockChat:
+    """Mock chat model answering from the entity names in the prompt and counting the prompt tokens it is sent."""
+
+    def __init__(self):
+        self.calls = 0
+        self.prompt_tokens = 0
+
+    async def achat(self, prompt: str, history: list | None = None, **kwargs: Any):
+        """Answer like `chat`."""
+        return self.chat(prompt, history, **kwargs)
+
+    def chat(self, prompt: str, history: list | None = None, **kwargs: Any):
+        """Answer extraction prompts with one record per entity name, gleaning with nothing new."""
+        history = history or []
+        self.calls += 1
+        self.prompt_tokens += estimate_tokens([
+            prompt,
+            *(message["content"] for message in history),
+        ])
+        if prompt == LOOP_PROMPT:
+            content = "N"
+        elif history:
+            content = ""
+        else:
+            content = _answer(prompt.rsplit("Text:", 1)[-1])
+        return BaseModelResponse(
+            output=BaseModelOutput(content=content),
+            history=[
+                *history,
+                {"role": "user", "content": prompt},
+                {"role": "assistant", "content": content},
+            ],
+        )
+
+
+def _answer(text: str) -> str:
+    parts = re.split(rf"({re.escape(DEFAULT_CHUNK_DELIMITER)}\s*\d+)", text)
+    if len(parts) == 1:
+        parts = ["", "", text]
+    answer = []
+    for marker, chunk in zip(parts[1::2], parts[2::2], strict=True):
+        records = [
+            f'("entity"<|>{name}<|>ORGANIZATION<|>{name} is mentioned in the text)'
+            for name in dict.fromkeys(_ENTITY.findall(chunk))
+        ]
+        answer.append(marker + "\n" + "\n##\n".join(records))
+    return "\n".join(answer) + "\n<|COMPLETE|>"
+
+
+def _chunks(count: int, tokens: int, seed: int) -> list[str]:
+    """Chunks of roughly the given size; a third of them mention at most one entity."""
+    rng = random.Random(seed)
+    chunks = []
+    for index in range(count):
+        mentions = rng.randint(0, 1) if index % 3 == 0 else rng.randint(3, 8)
+        words = [rng.choice(_FILLER) for _ in range(int(tokens * 0.75))]
+        for _ in range(mentions):
+            words.insert(rng.randrange(len(words)), f"ENTITY_{rng.randrange(5000)}")
+        chunks.append(" ".join(words))
+    return chunks
+
+
+async def _run(chunks: list[str], **extractor_args: Any) -> tuple[int, int, bool]:
+    model = CountingMockChat()
+    extractor = GraphExtractor(model_invoker=model, **extractor_args)  # type: ignore
+    result = await extractor(chunks, {"entity_types": ["organization"]})
+    extracted = set(
+        zip(result.entities["source_id"], result.entities["title"], strict=True)
+    )
+    expected = {
+        (doc_index, name)
+        for doc_index, chunk in enumerate(chunks)
+        for name in _ENTITY.findall(chunk)
+    }
+    attributed = extracted == expected
+    return model.calls, model.prompt_tokens, attributed
+
+
+async def main() -> None:
+    """Run the benchmark and print one row per extraction setting."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chunks", type=int, default=1000)
+    parser.add_argument("--chunk-tokens", type=int, default=300)
+    parser.add_argument("--max-gleanings", type=int, default=1)
+    parser.add_argument("--gleaning-min-records", type=int, default=3)
+    parser.add_argument("--budgets", type=int, nargs="+", default=[1200, 2400, 4800])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    chunks = _chunks(args.chunks, args.chunk_tokens, args.seed)
+    settings = [
+        ("per chunk", {"batch_max_tokens": 0, "gleaning_min_records": 0}),
+        (
+            "adaptive",
+            {"batch_max_tokens": 0, "gleaning_min_records": args.gleaning_min_records},
+        ),
+        *(
+            (
+                f"batch {budget}",
+                {
+                    "batch_max_tokens": budget,
+                    "gleaning_min_records": args.gleaning_min_records,
+                },
+            )
+            for budget in args.budgets
+        ),
+    ]
+
+    print(
+        f"{args.chunks} chunks of ~{args.chunk_tokens} tokens, "
+        f"max gleanings={args.max_gleanings}"
+    )
+    print(f"{'setting':<12}{'calls/1k':>10}{'prompt tokens/1k':>18}{'attributed':>12}")
+    for name, extractor_args in settings:
+        calls, prompt_tokens, attributed = await _run(
+            chunks, max_gleanings=args.max_gleanings, **extractor_args
+        )
+        scale = 1000 / args.chunks
+        print(
+            f"{name:<12}{calls * scale:>10.0f}{prompt_tokens * scale:>18,.0f}"
+            f"{'yes' if attributed else 'NO':>12}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,95 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Benchmark quantized candidate search + full-precision rescoring.
+
+Reports recall@k against exact search, resident embedding memory and per-query
+latency for float32, int8 and binary storage on synthetic clustered embeddings.
+
+Usage: python scripts/benchmark_quantization.py --rows 100000 --dimensions 1536
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from graphrag.vector_stores.quantization import (
+    QuantizedVectors,
+    VectorQuantization,
+    rescore,
+)
+
+
+def _embeddings(rows: int, dimensions: int, seed: int) -> np.ndarray:
+    """Clustered unit vectors, a rough stand-in for text embeddings."""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(max(rows // 50, 1), dimensions)).astype(np.float32)
+    vectors = centers[rng.integers(0, len(centers), rows)] + rng.normal(
+        scale=0.5, size=(rows, dimensions)
+    ).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def _exact_top_k(vectors: np.ndarray, query: np.ndarray, k: int) -> np.ndarray:
+    # vectors are unit length, so |v - q|^2 ranks like -2 v.q
+    distances = -(vectors @ query)
+    top = np.argpartition(distances, k - 1)[:k]
+    return top[np.argsort(distances[top])]
+
+
+def main() -> None:
+    """Run the benchmark and print one row per storage method."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--dimensions", type=int, default=1536)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--rescore-multiplier", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    vectors = _embeddings(args.rows, args.dimensions, args.seed)
+    rng = np.random.default_rng(args.seed + 1)
+    queries = vectors[rng.integers(0, args.rows, args.queries)] + rng.normal(
+        scale=0.1, size=(args.queries, args.dimensions)
+    ).astype(np.float32)
+
+    start = time.perf_counter()
+    truth = [_exact_top_k(vectors, query, args.k) for query in queries]
+    exact_ms = (time.perf_counter() - start) * 1000 / args.queries
+
+    print(
+        f"{args.rows} x {args.dimensions} embeddings, {args.queries} queries, "
+        f"k={args.k}, rescore multiplier={args.rescore_multiplier}"
+    )
+    print(
+        f"{'storage':<10}{'memory MB':>12}{'ratio':>8}{'recall@k':>10}{'ms/query':>10}"
+    )
+    print(
+        f"{'float32':<10}{vectors.nbytes / 2**20:>12.1f}{1:>8.1f}{1.0:>10.3f}{exact_ms:>10.2f}"
+    )
+
+    ids = list(range(args.rows))
+    for method in (VectorQuantization.int8, VectorQuantization.binary):
+        quantized = QuantizedVectors.from_vectors(ids, vectors, method)
+        hits = 0
+        start = time.perf_counter()
+        for query, expected in zip(queries, truth, strict=True):
+            candidates = np.asarray(
+                quantized.candidates(query, args.k * args.rescore_multiplier)
+            )
+            # rescoring fetches only the candidate rows at full precision
+            distances = rescore(query, vectors[candidates])
+            found = candidates[np.argsort(distances, kind="stable")[: args.k]]
+            hits += len(set(found.tolist()) & set(expected.tolist()))
+        elapsed_ms = (time.perf_counter() - start) * 1000 / args.queries
+        print(
+            f"{method.value:<10}{quantized.nbytes / 2**20:>12.1f}"
+            f"{vectors.nbytes / quantized.nbytes:>8.1f}"
+            f"{hits / (args.k * args.queries):>10.3f}{elapsed_ms:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
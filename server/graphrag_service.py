@@ -9,13 +9,14 @@ FastAPI service wrapping GraphRAG query functionality
 import asyncio
 import logging
 import os
+import time
 from pathlib import Path
 from typing import Optional, Any, List
 import threading
 
-from fastapi import FastAPI, HTTPException, Query, UploadFile, File, BackgroundTasks, Form
+from fastapi import FastAPI, HTTPException, Query, UploadFile, File, Form
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, HTMLResponse
+from fastapi.responses import JSONResponse, HTMLResponse, PlainTextResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field
 from dotenv import load_dotenv
@@ -37,11 +38,31 @@ import requests
 # Import GraphRAG modules
 import graphrag.api as api
 from graphrag.config.load_config import load_config
-from graphrag.callbacks.noop_query_callbacks import NoopQueryCallbacks
 from graphrag.utils.storage import load_table_from_storage
 from graphrag.storage.file_pipeline_storage import FilePipelineStorage
 from graphrag.config.enums import IndexingMethod
 from graphrag.logger.base import ProgressLogger
+from graphrag.query.context_builder.executor import configure_context_executor
+from graphrag.language_model.scheduler import LLMScheduler, estimate_tokens, quota_key
+
+# 服务以包方式启动（在项目根目录执行 `python -m server.graphrag_service`）
+from server.index_jobs import IndexJobQueue, TaskStore
+from server.index_snapshot import SnapshotManager
+from server.process_lock import try_lock
+from server.shared_snapshot import SharedSnapshotStore
+from server.query_metrics import (
+    MetricsQueryCallbacks,
+    context_builds_queued,
+    context_builds_running,
+    index_queue_depth,
+    index_snapshot_version,
+    queries_in_flight,
+    query_duration,
+    record_llm_scheduler,
+    query_stage_duration,
+    record_data_cache_lookup,
+    render_metrics,
+)
 
 # ========================================
 # Configuration
@@ -50,6 +71,25 @@ from graphrag.logger.base import ProgressLogger
 PROJECT_DIR = os.getenv("GRAPHRAG_PROJECT_DIR", "/Users/fengguihuan/Desktop/HHC/graphrag")
 DATA_DIR_NAME = os.getenv("GRAPHRAG_DATA_DIR", "data")
 
+# 索引更新批处理窗口（秒）：窗口内的多次上传合并为一次增量索引
+INDEX_BATCH_WINDOW = float(os.getenv("GRAPHRAG_INDEX_BATCH_WINDOW", "10"))
+
+# 查询上下文构建线程池大小：上下文构建在该线程池中执行，不阻塞事件循环
+CONTEXT_WORKERS = int(os.getenv("GRAPHRAG_CONTEXT_WORKERS", str(min(8, os.cpu_count() or 1))))
+context_executor = configure_context_executor(CONTEXT_WORKERS)
+
+# 索引更新完成后是否自动把差异同步到 Neo4j（连接信息见 NEO4J_URI 等环境变量）
+NEO4J_SYNC_ENABLED = os.getenv("GRAPHRAG_NEO4J_SYNC", "true").lower() in ("1", "true", "yes")
+
+# 服务工作进程数；多于 1 个时默认启用共享内存映射快照，各进程共享同一份索引数据
+SERVICE_WORKERS = int(os.getenv("GRAPHRAG_WORKERS", "1"))
+SHARED_SNAPSHOT_ENABLED = os.getenv(
+    "GRAPHRAG_SHARED_SNAPSHOT", "true" if SERVICE_WORKERS > 1 else "false"
+).lower() in ("1", "true", "yes")
+SHARED_SNAPSHOT_DIR = os.getenv(
+    "GRAPHRAG_SNAPSHOT_DIR", os.path.join(PROJECT_DIR, DATA_DIR_NAME, "snapshots")
+)
+
 # Access Key 配置
 QUERY_ACCESS_KEY = "hanhaochen"  # 查询权限
 UPDATE_ACCESS_KEY = "duping"     # 更新权限
@@ -78,8 +118,10 @@ logger.info(f"  API Base: {LLM_API_BASE}")
 logger.info(f"  API Key: {'*' * 20 if LLM_API_KEY else 'NOT SET'}")
 logger.info(f"  Model: {LLM_MODEL_NAME}")
 
-# Data cache
-data_cache = {}
+# 版本化索引快照：查询固定开始时的快照，索引更新后在后台加载新版本并原子切换
+snapshot_manager = SnapshotManager()
+snapshot_load_lock = asyncio.Lock()
+shared_snapshot_store = SharedSnapshotStore(SHARED_SNAPSHOT_DIR) if SHARED_SNAPSHOT_ENABLED else None
 
 # ========================================
 # Access Key 鉴权函数
@@ -159,8 +201,8 @@ class NLToCypherResponse(BaseModel):
     results: Any
     explanation: str = ""
 
-# 索引任务状态跟踪
-index_tasks = {}
+# 索引任务状态跟踪（持久化到 logs/index_tasks.json，服务重启后可恢复）
+index_tasks = TaskStore(os.path.join(PROJECT_DIR, DATA_DIR_NAME, "logs", "index_tasks.json"))
 
 # ========================================
 # NL to Cypher Functions
@@ -453,15 +495,25 @@ def fix_numeric_values(cypher: str) -> str:
 async def generate_cypher_with_llm(prompt: str) -> str:
     """调用 LLM 生成 Cypher 查询"""
     try:
-        response = await openai_client.chat.completions.create(
-            model=LLM_MODEL_NAME,
-            messages=[
-                {"role": "system", "content": "你是一个 Neo4j Cypher 查询专家。只返回一个 Cypher 查询语句，不要有任何解释。注意：数字类型的属性值不要加引号（如 id: 123），字符串类型的属性值必须加引号（如 name: '张三'）。"},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.1,  # 低温度保证稳定性
-            max_tokens=500
-        )
+        system_prompt = "你是一个 Neo4j Cypher 查询专家。只返回一个 Cypher 查询语句，不要有任何解释。注意：数字类型的属性值不要加引号（如 id: 123），字符串类型的属性值必须加引号（如 name: '张三'）。"
+        # 与索引共享同一配额，交互式请求优先派发
+        quota = LLMScheduler.quota(quota_key(LLM_API_BASE, LLM_API_KEY, LLM_MODEL_NAME))
+        async with quota.request(estimate_tokens([system_prompt, prompt]) + 500) as permit:
+            try:
+                response = await openai_client.chat.completions.create(
+                    model=LLM_MODEL_NAME,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": prompt}
+                    ],
+                    temperature=0.1,  # 低温度保证稳定性
+                    max_tokens=500
+                )
+            except Exception as e:
+                permit.record_error(e)
+                raise
+            if response.usage is not None:
+                permit.record_usage(response.usage.prompt_tokens, response.usage.completion_tokens)
         
         cypher = response.choices[0].message.content.strip()
         
@@ -571,13 +623,8 @@ def execute_neo4j_cypher(cypher: str, neo4j_url: str, username: str, password: s
 # Data Loading
 # ========================================
 
-async def load_data():
-    """Load GraphRAG data into cache"""
-    global data_cache
-    
-    if data_cache:
-        return data_cache
-    
+async def load_index_tables() -> dict:
+    """Load the current GraphRAG output tables and config into a new dict"""
     try:
         project_path = os.path.join(PROJECT_DIR, DATA_DIR_NAME)
         logger.info(f"Loading configuration from: {project_path}")
@@ -592,52 +639,131 @@ async def load_data():
         
         logger.info(f"Using output directory: {output_dir}")
         
-        # Create storage
-        storage = FilePipelineStorage(root_dir=str(output_dir))
-        
-        # Load data tables
-        logger.info("Loading data tables...")
-        entities = await load_table_from_storage("entities", storage)
-        logger.info(f"Loaded {len(entities)} entities")
-        
-        text_units = await load_table_from_storage("text_units", storage)
-        logger.info(f"Loaded {len(text_units)} text units")
-        
-        communities = await load_table_from_storage("communities", storage)
-        logger.info(f"Loaded {len(communities)} communities")
-        
-        community_reports = await load_table_from_storage("community_reports", storage)
-        logger.info(f"Loaded {len(community_reports)} community reports")
+        if shared_snapshot_store is not None:
+            # 多进程部署：映射共享快照（过期时由其中一个进程重建）
+            shared_version, tables = await asyncio.to_thread(attach_shared_tables, str(output_dir))
+        else:
+            shared_version = None
+            tables = await read_output_tables(str(output_dir))
         
-        relationships = await load_table_from_storage("relationships", storage)
-        logger.info(f"Loaded {len(relationships)} relationships")
+        # 预先连接向量库，确认新版本可用后再对外发布
+        warm_vector_store(graphrag_config)
         
-        # Load covariates (optional)
-        try:
-            covariates = await load_table_from_storage("covariates", storage)
-            logger.info(f"Loaded {len(covariates)} covariates")
-        except Exception:
-            covariates = None
-            logger.info("No covariates found")
-        
-        # Cache data
-        data_cache = {
+        data = {
             "config": graphrag_config,
-            "entities": entities,
-            "text_units": text_units,
-            "communities": communities,
-            "community_reports": community_reports,
-            "relationships": relationships,
-            "covariates": covariates
+            **tables,
+            "shared_version": shared_version,
         }
         
         logger.info("Data loading complete")
-        return data_cache
+        return data
         
     except Exception as e:
         logger.error(f"Error loading data: {str(e)}", exc_info=True)
         raise
 
+async def read_output_tables(output_dir: str) -> dict:
+    """从输出目录读取各 parquet 表"""
+    storage = FilePipelineStorage(root_dir=output_dir)
+    
+    logger.info("Loading data tables...")
+    entities = await load_table_from_storage("entities", storage)
+    logger.info(f"Loaded {len(entities)} entities")
+    
+    text_units = await load_table_from_storage("text_units", storage)
+    logger.info(f"Loaded {len(text_units)} text units")
+    
+    communities = await load_table_from_storage("communities", storage)
+    logger.info(f"Loaded {len(communities)} communities")
+    
+    community_reports = await load_table_from_storage("community_reports", storage)
+    logger.info(f"Loaded {len(community_reports)} community reports")
+    
+    relationships = await load_table_from_storage("relationships", storage)
+    logger.info(f"Loaded {len(relationships)} relationships")
+    
+    # Load covariates (optional)
+    try:
+        covariates = await load_table_from_storage("covariates", storage)
+        logger.info(f"Loaded {len(covariates)} covariates")
+    except Exception:
+        covariates = None
+        logger.info("No covariates found")
+    
+    return {
+        "entities": entities,
+        "text_units": text_units,
+        "communities": communities,
+        "community_reports": community_reports,
+        "relationships": relationships,
+        "covariates": covariates,
+    }
+
+def attach_shared_tables(output_dir: str) -> tuple:
+    """
+    映射共享快照的当前版本，返回 (版本号, 表)
+    
+    快照缺失或比 parquet 旧时，持有跨进程锁的进程重新读取 parquet 并写入新版本，
+    其他进程等待后直接映射，不再各自解析 parquet。
+    """
+    if shared_snapshot_store.is_stale(output_dir):
+        with shared_snapshot_store.build_lock():
+            if shared_snapshot_store.is_stale(output_dir):
+                logger.info("Shared index snapshot is missing or stale, rebuilding from parquet")
+                tables = asyncio.run(read_output_tables(output_dir))
+                shared_snapshot_store.publish(tables, output_dir)
+    return shared_snapshot_store.attach()
+
+def shared_snapshot_changed(snapshot) -> bool:
+    """其他工作进程是否已发布了新的共享快照版本"""
+    if shared_snapshot_store is None or snapshot.data is None:
+        return False
+    return snapshot.data.get("shared_version") != shared_snapshot_store.current_version()
+
+def warm_vector_store(graphrag_config) -> None:
+    """打开实体描述向量库连接，提前暴露新索引中缺失或损坏的向量表"""
+    from graphrag.config.embeddings import entity_description_embedding
+    from graphrag.utils.api import get_embedding_store
+    
+    # 失败时直接抛出，由调用方放弃发布新版本
+    vector_store_args = {
+        index: store.model_dump() for index, store in graphrag_config.vector_store.items()
+    }
+    get_embedding_store(
+        config_args=vector_store_args,
+        embedding_name=entity_description_embedding,
+    )
+
+def publish_snapshot(data: dict, load_seconds: float):
+    """发布新的索引快照并更新版本指标"""
+    snapshot = snapshot_manager.publish(data, load_seconds)
+    index_snapshot_version.set(snapshot.version)
+    return snapshot
+
+def reload_index_snapshot():
+    """
+    加载新版本索引并发布为当前快照
+    
+    读取或向量库预热失败时抛出异常且不发布，旧快照继续对外服务。
+    """
+    reload_start = time.perf_counter()
+    new_data = asyncio.run(load_index_tables())
+    return publish_snapshot(new_data, time.perf_counter() - reload_start)
+
+async def load_data():
+    """Return the data of the current index snapshot, loading the first one if needed"""
+    snapshot = snapshot_manager.current
+    if snapshot is None or shared_snapshot_changed(snapshot):
+        # 只允许一个请求执行加载，其余请求等待同一结果；
+        # 多进程部署时，其他进程发布新版本后在这里重新映射
+        async with snapshot_load_lock:
+            snapshot = snapshot_manager.current
+            if snapshot is None or shared_snapshot_changed(snapshot):
+                load_start = time.perf_counter()
+                data = await load_index_tables()
+                snapshot = publish_snapshot(data, time.perf_counter() - load_start)
+    return snapshot.data
+
 # ========================================
 # Query Execution
 # ========================================
@@ -650,18 +776,25 @@ async def execute_query(
     dynamic_community_selection: bool = False
 ) -> dict:
     """Execute GraphRAG query"""
+    query_type_label = query_type.lower()
+    status = "error"
+    request_start = time.perf_counter()
+    queries_in_flight.inc(query_type=query_type_label)
+    snapshot = None
     try:
-        data = await load_data()
-        
-        # Setup callbacks
-        context_data = {}
-        
-        def on_context(context):
-            nonlocal context_data
-            context_data = context
+        # 记录数据加载阶段耗时与缓存命中情况
+        record_data_cache_lookup(snapshot_manager.current is not None)
+        stage_start = time.perf_counter()
+        await load_data()
+        # 固定当前快照：索引更新切换版本时，本次查询仍使用旧快照直至结束
+        snapshot = snapshot_manager.pin()
+        data = snapshot.data
+        query_stage_duration.observe(
+            time.perf_counter() - stage_start, query_type=query_type_label, stage="load_data"
+        )
         
-        callbacks = NoopQueryCallbacks()
-        callbacks.on_context = on_context
+        # Setup callbacks: 收集上下文并把各阶段耗时汇总到 /metrics
+        callbacks = MetricsQueryCallbacks(query_type_label)
         
         logger.info(f"Executing {query_type} query: {query}")
         
@@ -719,14 +852,17 @@ async def execute_query(
         else:
             raise ValueError(f"Unsupported query type: {query_type}")
         
-        logger.info("Query completed successfully")
+        context_data = callbacks.context_data or {}
+        status = "ok"
+        stage_summary = ", ".join(f"{stage}={elapsed:.3f}s" for stage, elapsed in callbacks.stages.items())
+        logger.info(
+            f"Query completed in {time.perf_counter() - request_start:.3f}s ({stage_summary})"
+        )
         
-        # 🔍 DEBUG: 打印上下文数据用于调试
-        logger.info(f"Context data type: {type(context_data)}")
-        logger.info(f"Context data keys: {context_data.keys() if isinstance(context_data, dict) else 'Not a dict'}")
-        if isinstance(context_data, dict):
+        # 上下文数据量较大，仅在 DEBUG 级别输出
+        if logger.isEnabledFor(logging.DEBUG) and isinstance(context_data, dict):
             for key, value in context_data.items():
-                logger.info(f"Context[{key}]: {type(value)} - {str(value)[:200]}")
+                logger.debug(f"Context[{key}]: {type(value)} - {str(value)[:200]}")
         
         return {
             "query": query,
@@ -738,6 +874,14 @@ async def execute_query(
     except Exception as e:
         logger.error(f"Query execution error: {str(e)}", exc_info=True)
         raise
+    
+    finally:
+        if snapshot is not None:
+            snapshot_manager.unpin(snapshot)
+        queries_in_flight.dec(query_type=query_type_label)
+        query_duration.observe(
+            time.perf_counter() - request_start, query_type=query_type_label, status=status
+        )
 
 # ========================================
 # API Endpoints
@@ -762,7 +906,25 @@ async def root():
 @app.get("/api/health")
 async def health_check():
     """Health check endpoint"""
-    return {"status": "ok", "version": "1.0.0"}
+    health = {"status": "ok", "version": "1.0.0", "index_snapshot": snapshot_manager.status()}
+    if shared_snapshot_store is not None:
+        health["shared_snapshot"] = {
+            "dir": SHARED_SNAPSHOT_DIR,
+            "current": shared_snapshot_store.current_version(),
+            "worker_pid": os.getpid(),
+            "index_leader": is_index_leader(),
+        }
+    return health
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus metrics endpoint: per-stage latency histograms, LLM usage, in-flight queries, cache hit ratio, context executor load and index queue depth"""
+    index_queue_depth.set(index_queue.depth())
+    context_stats = context_executor.stats()
+    context_builds_queued.set(context_stats["queued"])
+    context_builds_running.set(context_stats["running"])
+    record_llm_scheduler(LLMScheduler.stats())
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4; charset=utf-8")
 
 @app.post("/api/nl-to-cypher", response_model=NLToCypherResponse)
 async def nl_to_cypher(request: NLToCypherRequest):
@@ -918,6 +1080,22 @@ async def query_post(request: QueryRequest):
 async def startup_event():
     """Preload data on startup"""
     logger.info("Starting GraphRAG Query Service...")
+    
+    global index_leader_lock
+    project_path = os.path.join(PROJECT_DIR, DATA_DIR_NAME)
+    if SERVICE_WORKERS > 1:
+        # 多进程部署：只有一个进程运行索引队列，其余进程的上传经任务表交给它
+        index_leader_lock = try_lock(os.path.join(project_path, "logs", "index_leader.lock"))
+        if index_leader_lock is not None:
+            logger.info(f"Worker {os.getpid()} runs the index update queue")
+            index_queue.poll_store(project_path)
+    
+    if is_index_leader():
+        # 重新排队上次服务退出时尚未完成的索引任务（上传的文件已保存在输入目录中）
+        for task_id in index_tasks.unfinished():
+            logger.info(f"Re-queueing unfinished index task {task_id}")
+            index_queue.submit(project_path, task_id)
+    
     try:
         await load_data()
         logger.info("Service ready")
@@ -928,21 +1106,58 @@ async def startup_event():
 # Index Update Functions
 # ========================================
 
-def run_index_update(file_path: str, file_type: str, task_id: str):
-    """Run GraphRAG index update in background using Python API"""
+def sync_neo4j_delta(output_dir: str, log_to_file, set_batch_status) -> None:
+    """
+    把本次索引更新产生的差异同步到 Neo4j
+    
+    只推送相对上次同步新增、变化和删除的行；同步失败不影响索引任务的状态，
+    下次更新时会重新推送未同步的差异。
+    """
+    log_to_file("正在把增量同步到 Neo4j...")
+    try:
+        from server.import_to_neo4j import sync_output_to_neo4j
+        result = sync_output_to_neo4j(Path(output_dir))
+    except Exception as e:
+        log_to_file(f"Neo4j 增量同步失败（索引已更新，下次更新时重试）: {str(e)}", 'warning')
+        set_batch_status(neo4j_sync={"status": "failed", "error": str(e)})
+        return
+    if result is None:
+        log_to_file("未找到输出表，跳过 Neo4j 同步", 'warning')
+        return
+    log_to_file(
+        f"Neo4j 增量同步完成：{result['changed_rows']} 行变化，耗时 {result['duration_seconds']:.2f} 秒"
+    )
+    set_batch_status(neo4j_sync={"status": "completed", **result})
+
+
+def run_index_update(data_dir: str, task_ids: List[str], file_type: str, batch_id: str):
+    """
+    Run one GraphRAG index update for a batch of uploaded files using Python API
+    
+    由索引队列的工作线程调用：同一项目同一时刻只会有一个批次在运行，
+    增量索引会一次性处理批次内（以及输入目录中所有尚未索引）的新文档。
+    """
     task_log_file = None
     task_logger = None
     
+    def set_batch_status(**fields):
+        for task_id in task_ids:
+            index_tasks.update_task(task_id, **fields)
+    
+    def read_batch_output():
+        if task_log_file and os.path.exists(task_log_file):
+            with open(task_log_file, 'r', encoding='utf-8') as f:
+                set_batch_status(output=f.read())
+    
     try:
-        # 创建任务专属日志文件
-        data_dir = os.path.join(PROJECT_DIR, DATA_DIR_NAME)
+        # 创建批次专属日志文件，批次内所有任务共享
         logs_dir = os.path.join(data_dir, "logs")
         os.makedirs(logs_dir, exist_ok=True)
         
-        task_log_file = os.path.join(logs_dir, f"task_{task_id}.log")
+        task_log_file = os.path.join(logs_dir, f"batch_{batch_id}.log")
         
-        # 创建任务专属的 logger
-        task_logger = logging.getLogger(f"task_{task_id}")
+        # 创建批次专属的 logger
+        task_logger = logging.getLogger(f"index_batch_{batch_id}")
         task_logger.setLevel(logging.INFO)
         task_logger.handlers = []  # 清除已有的 handlers
         
@@ -962,16 +1177,15 @@ def run_index_update(file_path: str, file_type: str, task_id: str):
                 task_logger.warning(message)
             else:
                 task_logger.info(message)
-            logger.info(f"Task {task_id}: {message}")
+            logger.info(f"Batch {batch_id}: {message}")
         
-        index_tasks[task_id]["status"] = "running"
-        index_tasks[task_id]["message"] = "正在更新索引..."
-        index_tasks[task_id]["log_file"] = task_log_file
+        set_batch_status(status="running", message="正在更新索引...", log_file=task_log_file)
         
         log_to_file("=" * 80)
         log_to_file(f"开始索引更新任务")
-        log_to_file(f"任务ID: {task_id}")
-        log_to_file(f"文件路径: {file_path}")
+        log_to_file(f"批次ID: {batch_id}（合并 {len(task_ids)} 个上传任务）")
+        for task_id in task_ids:
+            log_to_file(f"任务ID: {task_id}  文件路径: {index_tasks[task_id].get('file_path')}")
         log_to_file(f"文件类型: {file_type}")
         log_to_file("=" * 80)
         
@@ -1122,57 +1336,54 @@ def run_index_update(file_path: str, file_type: str, task_id: str):
         
         if return_code == 0:
             log_to_file("✅ 索引更新成功！")
-            index_tasks[task_id]["status"] = "completed"
-            index_tasks[task_id]["message"] = "索引更新成功！"
+            set_batch_status(status="completed", message="索引更新成功！")
             
             # 读取完整日志作为输出
-            with open(task_log_file, 'r', encoding='utf-8') as f:
-                index_tasks[task_id]["output"] = f.read()
+            read_batch_output()
             
-            logger.info(f"Index update completed for task {task_id}")
+            logger.info(f"Index update completed for batch {batch_id}")
             
-            # 清除数据缓存，强制重新加载
-            global data_cache
-            data_cache = {}
-            log_to_file("数据缓存已清除，下次查询将重新加载")
+            # 在后台加载新版本索引并原子切换，进行中的查询继续使用旧快照
+            log_to_file("正在加载新版本索引数据...")
+            try:
+                snapshot = reload_index_snapshot()
+                log_to_file(f"查询数据已切换到索引版本 v{snapshot.version}")
+            except Exception as e:
+                log_to_file(f"新版本索引加载失败，继续使用旧版本: {str(e)}", 'warning')
+            
+            if NEO4J_SYNC_ENABLED:
+                sync_neo4j_delta(output_dir, log_to_file, set_batch_status)
+                read_batch_output()
         else:
             log_to_file(f"❌ 索引更新失败，返回码: {return_code}")
-            index_tasks[task_id]["status"] = "failed"
-            index_tasks[task_id]["message"] = f"索引更新失败，返回码: {return_code}"
+            set_batch_status(status="failed", message=f"索引更新失败，返回码: {return_code}")
             
             # 读取完整日志作为输出
-            with open(task_log_file, 'r', encoding='utf-8') as f:
-                index_tasks[task_id]["output"] = f.read()
+            read_batch_output()
             
-            logger.error(f"Index update failed for task {task_id}, return code: {return_code}")
+            logger.error(f"Index update failed for batch {batch_id}, return code: {return_code}")
             
     except subprocess.TimeoutExpired:
         if task_log_file:
             log_to_file("❌ 索引更新超时（超过1小时）")
-        index_tasks[task_id]["status"] = "failed"
-        index_tasks[task_id]["message"] = "索引更新超时（超过1小时）"
-        logger.error(f"Index update timeout for task {task_id}")
+        set_batch_status(status="failed", message="索引更新超时（超过1小时）")
+        logger.error(f"Index update timeout for batch {batch_id}")
         
-        if task_log_file and os.path.exists(task_log_file):
-            with open(task_log_file, 'r', encoding='utf-8') as f:
-                index_tasks[task_id]["output"] = f.read()
+        read_batch_output()
                 
     except Exception as e:
         if task_log_file:
             log_to_file(f"❌ 索引更新出错: {str(e)}")
             log_to_file(f"错误详情: {repr(e)}")
-        index_tasks[task_id]["status"] = "failed"
-        index_tasks[task_id]["message"] = f"索引更新出错: {str(e)}"
-        logger.error(f"Index update error for task {task_id}: {str(e)}", exc_info=True)
+        set_batch_status(status="failed", message=f"索引更新出错: {str(e)}")
+        logger.error(f"Index update error for batch {batch_id}: {str(e)}", exc_info=True)
         
-        if task_log_file and os.path.exists(task_log_file):
-            with open(task_log_file, 'r', encoding='utf-8') as f:
-                index_tasks[task_id]["output"] = f.read()
+        read_batch_output()
                 
     finally:
         if task_log_file and task_logger:
             log_to_file("=" * 80)
-            log_to_file(f"任务结束，最终状态: {index_tasks[task_id]['status']}")
+            log_to_file(f"任务结束，最终状态: {index_tasks[task_ids[0]]['status']}")
             log_to_file("=" * 80)
             
             # 关闭 logger handlers
@@ -1184,9 +1395,18 @@ def run_index_update(file_path: str, file_type: str, task_id: str):
 # Index Update Endpoints
 # ========================================
 
+# 单写者索引队列：每个项目一个工作线程，串行执行合并后的增量索引
+index_queue = IndexJobQueue(run_index_update, index_tasks, batch_window=INDEX_BATCH_WINDOW)
+
+# 多进程部署时持有的索引队列锁（进程退出时由系统释放）
+index_leader_lock = None
+
+def is_index_leader() -> bool:
+    """当前进程是否负责运行索引队列"""
+    return SERVICE_WORKERS <= 1 or index_leader_lock is not None
+
 @app.post("/api/upload", response_model=IndexUpdateResponse)
 async def upload_file(
-    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     access_key: Optional[str] = Form(None)
 ):
@@ -1235,26 +1455,25 @@ async def upload_file(
         
         # 创建任务ID
         task_id = str(uuid.uuid4())
-        index_tasks[task_id] = {
+        index_tasks.create(task_id, {
             "status": "pending",
             "message": "文件已上传，等待处理...",
             "file_name": file.filename,
             "file_type": file_type,
             "file_path": file_path,
             "created_at": datetime.now().isoformat()
-        }
+        })
         
-        # 在后台运行索引更新
-        background_tasks.add_task(
-            run_index_update, 
-            file_path, 
-            file_type, 
-            task_id
-        )
+        # 加入索引队列，与批处理窗口内的其他上传合并为一次增量索引；
+        # 非队列进程只写入任务表，由运行队列的进程领取
+        if is_index_leader():
+            queue_depth = index_queue.submit(os.path.join(PROJECT_DIR, DATA_DIR_NAME), task_id)
+        else:
+            queue_depth = len(index_tasks.unfinished(statuses=("pending", "queued")))
         
         return IndexUpdateResponse(
             status="accepted",
-            message="文件已上传，索引更新已开始",
+            message=f"文件已上传，已加入索引队列（队列中 {queue_depth} 个任务）",
             task_id=task_id,
             file_name=file.filename,
             file_type=file_type
@@ -1274,7 +1493,7 @@ async def get_index_status(task_id: str):
     if task_id not in index_tasks:
         raise HTTPException(status_code=404, detail="任务不存在")
     
-    return index_tasks[task_id]
+    return {**index_tasks[task_id], "queue_depth": index_queue.depth()}
 
 @app.get("/api/index/tasks")
 async def list_index_tasks():
@@ -1291,6 +1510,13 @@ async def list_index_tasks():
         ]
     }
 
+@app.get("/api/index/queue")
+async def get_index_queue():
+    """
+    查看索引队列：排队中的任务、正在运行的批次及队列深度
+    """
+    return index_queue.snapshot()
+
 @app.get("/api/index/logs/{task_id}")
 async def get_index_logs(task_id: str, lines: int = 50):
     """
@@ -1402,4 +1628,9 @@ if __name__ == "__main__":
     
     logger.info(f"Starting server at http://{host}:{port}")
     logger.info("Note: Access via Nginx at http://localhost (port 80)")
-    uvicorn.run("graphrag_service:app", host=host, port=port, reload=True)
+    if SERVICE_WORKERS > 1:
+        # 多工作进程与自动重载互斥
+        logger.info(f"Running {SERVICE_WORKERS} workers sharing snapshot dir {SHARED_SNAPSHOT_DIR}")
+        uvicorn.run("server.graphrag_service:app", host=host, port=port, workers=SERVICE_WORKERS)
+    else:
+        uvicorn.run("server.graphrag_service:app", host=host, port=port, reload=True)
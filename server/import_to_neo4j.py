@@ -6,6 +6,11 @@
 适用于 macOS 系统
 """
 
+import argparse
+import json
+import os
+import time
+import numpy as np
 import pandas as pd
 from neo4j import GraphDatabase
 from pathlib import Path
@@ -26,10 +31,11 @@ logger = logging.getLogger(__name__)
 # ========================================
 # Neo4j 连接配置 - 在这里修改你的 Neo4j 连接信息
 # ========================================
-NEO4J_URI = "bolt://localhost:7687"  # Neo4j 连接地址，默认端口 7687
-NEO4J_USERNAME = "neo4j"              # Neo4j 用户名，默认为 neo4j
-NEO4J_PASSWORD = "Han9510!"      # ⚠️ 修改为你设置的密码
-NEO4J_DATABASE = "neo4j"              # 数据库名称，社区版只能使用 neo4j
+# 也可以通过环境变量 NEO4J_URI / NEO4J_USERNAME / NEO4J_PASSWORD / NEO4J_DATABASE 覆盖
+NEO4J_URI = os.getenv("NEO4J_URI", "bolt://localhost:7687")  # Neo4j 连接地址，默认端口 7687
+NEO4J_USERNAME = os.getenv("NEO4J_USERNAME", "neo4j")         # Neo4j 用户名，默认为 neo4j
+NEO4J_PASSWORD = os.getenv("NEO4J_PASSWORD", "Han9510!")      # ⚠️ 修改为你设置的密码
+NEO4J_DATABASE = os.getenv("NEO4J_DATABASE", "neo4j")         # 数据库名称，社区版只能使用 neo4j
 
 # ========================================
 # Parquet 文件路径配置 - 修改为你的 output 目录路径
@@ -46,6 +52,9 @@ RELATIONSHIPS_PATH = OUTPUT_DIR / "relationships.parquet"
 COMMUNITIES_PATH = OUTPUT_DIR / "communities.parquet"
 COMMUNITY_REPORTS_PATH = OUTPUT_DIR / "community_reports.parquet"
 
+# 上次同步到 Neo4j 的各行内容哈希，保存在 output 目录中，用于增量同步
+SYNC_STATE_FILE = "neo4j_sync_state.parquet"
+
 
 class Neo4jImporter:
     """Neo4j 数据导入器 - 使用并行批量导入提高性能"""
@@ -460,34 +469,603 @@ class Neo4jImporter:
         logger.info(f"✅ 社区报告导入完成: {result['successful_rows']}/{result['total_rows']} 成功")
         return result
 
+    # ========================================
+    # 在线批量导入（CREATE + 锁感知分区 + 多线程）
+    # ========================================
+    
+    def bulk_create_import(self, tables: Dict[str, pd.DataFrame],
+                           batch_size: int = 10000, max_workers: int = 4) -> Dict[str, Any]:
+        """
+        面向已有数据库（已清空或不含这些数据）的高吞吐在线导入
+        
+        - 节点使用 CREATE 大批量写入，多线程并发
+        - 关系按端点哈希分桶，同一轮内并发执行的分区端点桶互不相交，避免锁冲突和死锁
+        - 每张 parquet 表只在 prepare_graph_tables 中处理一次
+        
+        参数:
+            tables: prepare_graph_tables 的输出
+            batch_size: 每批行数
+            max_workers: 并发线程数（同时也是分桶数）
+        """
+        start_time = time.time()
+        results = {}
+        
+        for name, label in NODE_TABLES:
+            if name in tables:
+                logger.info(f"📦 创建 {label} 节点: {len(tables[name])} 行")
+                results[name] = self._create_nodes(label, tables[name], batch_size, max_workers)
+        
+        for name, rel_type, start_label, end_label in RELATIONSHIP_TABLES:
+            if name in tables:
+                logger.info(f"🔗 创建 {rel_type} 边: {len(tables[name])} 行")
+                results[name] = self._create_relationships(
+                    rel_type, start_label, end_label, tables[name], batch_size, max_workers
+                )
+        
+        duration = time.time() - start_time
+        logger.info(f"⏱️  在线批量导入总耗时: {duration:.2f}秒")
+        results["duration_seconds"] = duration
+        return results
+    
+    def _run_statement(self, statement: str, rows: List[Dict[str, Any]]) -> int:
+        """在一个写事务中执行一批 UNWIND 语句，返回写入行数"""
+        with self.driver.session(database=self.database) as session:
+            session.execute_write(
+                lambda tx: tx.run("UNWIND $rows AS value " + statement, rows=rows).consume()
+            )
+        return len(rows)
+    
+    def _create_nodes(self, label: str, df: pd.DataFrame, batch_size: int, max_workers: int) -> Dict[str, Any]:
+        import concurrent.futures
+        
+        statement = f"CREATE (n:{label}) SET n = value"
+        records = _to_records(df)
+        batches = [records[i:i + batch_size] for i in range(0, len(records), batch_size)]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            written = sum(executor.map(lambda batch: self._run_statement(statement, batch), batches))
+        return {"total_rows": len(df), "successful_rows": written}
+    
+    def _create_relationships(self, rel_type: str, start_label: str, end_label: str,
+                              df: pd.DataFrame, batch_size: int, max_workers: int) -> Dict[str, Any]:
+        import concurrent.futures
+        
+        props = [col for col in df.columns if col not in ("start", "end")]
+        set_clause = f" SET {', '.join(f'r.{col} = value.{col}' for col in props)}" if props else ""
+        statement = (
+            f"MATCH (s:{start_label} {{id: value.start}}) "
+            f"MATCH (t:{end_label} {{id: value.end}}) "
+            f"CREATE (s)-[r:{rel_type}]->(t)" + set_clause
+        )
+        
+        buckets = max(max_workers, 1)
+        start_bucket = _hash_buckets(df["start"], buckets)
+        end_bucket = _hash_buckets(df["end"], buckets)
+        same_space = start_label == end_label
+        if same_space:
+            # 同一 ID 空间：按无序桶对分区，轮次取自循环赛排程，保证同轮分区的桶集合互不相交
+            low = np.minimum(start_bucket, end_bucket)
+            high = np.maximum(start_bucket, end_bucket)
+            partition_keys = list(zip(low.tolist(), high.tolist()))
+            rounds = _tournament_rounds(buckets)
+        else:
+            partition_keys = list(zip(start_bucket.tolist(), end_bucket.tolist()))
+            rounds = _bipartite_rounds(buckets)
+        
+        records = _to_records(df)
+        partitions: Dict[tuple, List[Dict[str, Any]]] = {}
+        for key, record in zip(partition_keys, records):
+            partitions.setdefault(key, []).append(record)
+        
+        def run_partition(key):
+            rows = partitions.get(key, [])
+            return sum(
+                self._run_statement(statement, rows[i:i + batch_size])
+                for i in range(0, len(rows), batch_size)
+            )
+        
+        written = 0
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for round_keys in rounds:
+                written += sum(executor.map(run_partition, round_keys))
+        return {"total_rows": len(df), "successful_rows": written}
+
+    
+    # ========================================
+    # 增量同步（只推送新增、变化和删除的行）
+    # ========================================
+    
+    def sync_delta(self, delta: Dict[str, Dict[str, pd.DataFrame]],
+                   batch_size: int = 1000) -> Dict[str, Dict[str, int]]:
+        """
+        把 diff_graph_tables 的结果写入 Neo4j
+        
+        顺序：删除边 → 删除节点 → MERGE 节点 → MERGE 边，保证边的端点已存在。
+        
+        参数:
+            delta: diff_graph_tables 的输出
+            batch_size: 每批行数
+        """
+        summary = {name: {"upserted": 0, "deleted": 0} for name in delta}
+        
+        def run(statement: str, df: pd.DataFrame) -> int:
+            records = _to_records(df)
+            return sum(
+                self._run_statement(statement, records[i:i + batch_size])
+                for i in range(0, len(records), batch_size)
+            )
+        
+        for name, rel_type, start_label, end_label in RELATIONSHIP_TABLES:
+            deleted = delta.get(name, {}).get("delete")
+            if deleted is not None and len(deleted):
+                filter_clause = " {relationship_id: value.key}" if name == "related_to" else ""
+                summary[name]["deleted"] = run(
+                    f"MATCH (s:{start_label} {{id: value.start}})-[r:{rel_type}{filter_clause}]->(t:{end_label} {{id: value.end}}) DELETE r",
+                    deleted,
+                )
+        
+        for name, label in NODE_TABLES:
+            deleted = delta.get(name, {}).get("delete")
+            if deleted is not None and len(deleted):
+                summary[name]["deleted"] = run(
+                    f"MATCH (n:{label} {{id: value.key}}) DETACH DELETE n", deleted
+                )
+        
+        for name, label in NODE_TABLES:
+            upserts = delta.get(name, {}).get("upsert")
+            if upserts is not None and len(upserts):
+                summary[name]["upserted"] = run(
+                    f"MERGE (n:{label} {{id: value.id}}) SET n = value", upserts
+                )
+        
+        for name, rel_type, start_label, end_label in RELATIONSHIP_TABLES:
+            upserts = delta.get(name, {}).get("upsert")
+            if upserts is not None and len(upserts):
+                merge_key = " {relationship_id: value.relationship_id}" if "relationship_id" in upserts.columns else ""
+                props = [col for col in upserts.columns if col not in ("start", "end", "relationship_id")]
+                set_clause = f" SET {', '.join(f'r.{col} = value.{col}' for col in props)}" if props else ""
+                summary[name]["upserted"] = run(
+                    f"MATCH (s:{start_label} {{id: value.start}}) "
+                    f"MATCH (t:{end_label} {{id: value.end}}) "
+                    f"MERGE (s)-[r:{rel_type}{merge_key}]->(t)" + set_clause,
+                    upserts,
+                )
+        
+        return summary
+
 
-def main():
+# ========================================
+# 图表准备（每张表一次向量化处理）
+# ========================================
+
+# (表名, 节点标签)
+NODE_TABLES = [
+    ("documents", "__Document__"),
+    ("entities", "__Entity__"),
+    ("relationship_nodes", "__Relationship__"),
+    ("chunks", "__Chunk__"),
+    ("communities", "__Community__"),
+]
+
+# (表名, 关系类型, 起点标签, 终点标签)
+RELATIONSHIP_TABLES = [
+    ("related_to", "RELATED_TO", "__Entity__", "__Entity__"),
+    ("part_of", "PART_OF", "__Chunk__", "__Document__"),
+    ("mentions", "MENTIONS", "__Chunk__", "__Entity__"),
+    ("has_relationship", "HAS_RELATIONSHIP", "__Chunk__", "__Relationship__"),
+    ("belongs_to", "BELONGS_TO", "__Entity__", "__Community__"),
+]
+
+# neo4j-admin 导入时每个标签使用的 ID 空间
+ID_SPACES = {
+    "__Document__": "Document",
+    "__Entity__": "Entity",
+    "__Relationship__": "Relationship",
+    "__Chunk__": "Chunk",
+    "__Community__": "Community",
+}
+
+
+def _as_list(series: pd.Series) -> pd.Series:
+    """把 parquet 中的数组列统一为 Python list（None 变为空列表）"""
+    return series.map(lambda v: list(v) if v is not None and not isinstance(v, float) else [])
+
+
+def _links(df: pd.DataFrame, start_col: str, list_col: str, mapping: pd.Series = None) -> pd.DataFrame:
+    """展开数组列得到 (start, end) 边表；mapping 用于把数组中的 ID 映射为目标节点 ID"""
+    if list_col not in df.columns:
+        return pd.DataFrame(columns=["start", "end"])
+    exploded = df[[start_col, list_col]].explode(list_col).dropna(subset=[list_col])
+    end = exploded[list_col]
+    if mapping is not None:
+        end = end.map(mapping)
+    links = pd.DataFrame({"start": exploded[start_col].to_numpy(), "end": end.to_numpy()})
+    return links.dropna().drop_duplicates(ignore_index=True)
+
+
+def _column(df: pd.DataFrame, name: str, default=None) -> pd.Series:
+    return df[name] if name in df.columns else pd.Series(default, index=df.index)
+
+
+def prepare_graph_tables(data_files: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
     """
-    主函数：执行完整的 GraphRAG 数据导入流程
+    对每张 parquet 表只处理一次，生成图的节点表和边表（向量化 pandas 操作）
     
-    流程：
-    1. 检查 parquet 文件是否存在
-    2. 读取所有数据
-    3. 连接 Neo4j 数据库
-    4. 创建约束和索引
-    5. 并行批量导入所有数据
-    6. 显示导入结果
+    实体节点以 title 作为 id（与逐行 MERGE 导入保持一致）；文本单元和社区中
+    引用的实体 UUID 会映射为实体 title，社区报告合并到社区节点上。
     """
-    logger.info("=" * 70)
-    logger.info("🚀 开始导入 GraphRAG 数据到 Neo4j")
-    logger.info("=" * 70)
+    tables: Dict[str, pd.DataFrame] = {}
+    
+    entities = data_files["entities"]
+    key_column = 'title' if 'title' in entities.columns else 'name' if 'name' in entities.columns else 'id'
+    entity_keys = entities[key_column].where(
+        entities[key_column].notna(),
+        "__NULL_ENTITY_" + _column(entities, "human_readable_id").astype(str),
+    )
+    entity_title_by_id = pd.Series(entity_keys.to_numpy(), index=entities["id"].to_numpy())
+    tables["entities"] = pd.DataFrame({
+        "id": entity_keys,
+        "name": entity_keys,
+        "type": _column(entities, "type"),
+        "description": _column(entities, "description"),
+        "human_readable_id": _column(entities, "human_readable_id"),
+        "text_unit_ids": _as_list(_column(entities, "text_unit_ids")),
+    })
+    
+    relationships = data_files["relationships"]
+    tables["relationship_nodes"] = pd.DataFrame({
+        "id": relationships["id"],
+        "human_readable_id": _column(relationships, "human_readable_id"),
+        "source": relationships["source"],
+        "target": relationships["target"],
+        "description": _column(relationships, "description"),
+        "weight": _column(relationships, "weight"),
+        "text_unit_ids": _as_list(_column(relationships, "text_unit_ids")),
+    })
+    tables["related_to"] = pd.DataFrame({
+        "start": relationships["source"],
+        "end": relationships["target"],
+        "description": _column(relationships, "description"),
+        "weight": _column(relationships, "weight"),
+        "relationship_id": relationships["id"],
+    })
+    
+    if "documents" in data_files:
+        documents = data_files["documents"]
+        raw_content = _column(documents, "raw_content") if "raw_content" in documents.columns else _column(documents, "text")
+        tables["documents"] = pd.DataFrame({
+            "id": documents["id"],
+            "title": _column(documents, "title"),
+            "raw_content": raw_content,
+            "text_unit_ids": _as_list(_column(documents, "text_unit_ids")),
+        })
+    
+    if "text_units" in data_files:
+        text_units = data_files["text_units"]
+        tables["chunks"] = pd.DataFrame({
+            "id": text_units["id"],
+            "text": _column(text_units, "text"),
+            "n_tokens": _column(text_units, "n_tokens"),
+            "document_ids": _as_list(_column(text_units, "document_ids")),
+            "entity_ids": _as_list(_column(text_units, "entity_ids")),
+            "relationship_ids": _as_list(_column(text_units, "relationship_ids")),
+        })
+        tables["part_of"] = _links(text_units, "id", "document_ids")
+        tables["mentions"] = _links(text_units, "id", "entity_ids", entity_title_by_id)
+        tables["has_relationship"] = _links(text_units, "id", "relationship_ids")
+    
+    if "communities" in data_files:
+        communities = data_files["communities"]
+        community_nodes = pd.DataFrame({
+            "id": communities["id"],
+            "community": _column(communities, "community"),
+            "title": _column(communities, "title"),
+            "level": _column(communities, "level"),
+            "entity_ids": _as_list(_column(communities, "entity_ids")),
+            "relationship_ids": _as_list(_column(communities, "relationship_ids")),
+            "text_unit_ids": _as_list(_column(communities, "text_unit_ids")),
+        })
+        if "community_reports" in data_files:
+            reports = data_files["community_reports"]
+            report_fields = pd.DataFrame({
+                "community": reports["community"],
+                "summary": _column(reports, "summary"),
+                "full_content": _column(reports, "full_content"),
+                "rank": _column(reports, "rank"),
+                "rank_explanation": _column(reports, "rating_explanation") if "rating_explanation" in reports.columns else _column(reports, "rank_explanation"),
+                # findings 是对象数组，Neo4j 属性不支持嵌套结构，序列化为 JSON 字符串
+                "findings": _column(reports, "findings").map(_findings_json),
+            }).drop_duplicates(subset=["community"])
+            community_nodes = community_nodes.merge(report_fields, on="community", how="left")
+        tables["communities"] = community_nodes
+        belongs_to = _links(communities, "id", "entity_ids", entity_title_by_id)
+        tables["belongs_to"] = pd.DataFrame({"start": belongs_to["end"], "end": belongs_to["start"]})
+    
+    return tables
+
+
+def _findings_json(findings) -> str:
+    if findings is None or isinstance(findings, float):
+        return None
+    return json.dumps([dict(f) if isinstance(f, dict) else f for f in list(findings)], ensure_ascii=False, default=str)
+
+
+def _to_records(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """一次性把整张表转换为 Neo4j 驱动可序列化的记录（数组列转为 list，NaN 转为 None）"""
+    try:
+        import pyarrow as pa
+        return pa.Table.from_pandas(df, preserve_index=False).to_pylist()
+    except Exception:
+        return df.astype(object).where(df.notna(), None).to_dict("records")
+
+
+def _hash_buckets(series: pd.Series, buckets: int) -> np.ndarray:
+    return (pd.util.hash_pandas_object(series, index=False).to_numpy() % np.uint64(buckets)).astype(np.int64)
+
+
+def _bipartite_rounds(buckets: int) -> List[List[tuple]]:
+    """起点、终点属于不同 ID 空间：第 r 轮包含 (i, (i + r) % k)，同轮起点桶与终点桶各不相同"""
+    return [[(i, (i + r) % buckets) for i in range(buckets)] for r in range(buckets)]
+
+
+def _tournament_rounds(buckets: int) -> List[List[tuple]]:
+    """
+    起点、终点属于同一 ID 空间：按无序桶对 (a, b) 分区，
+    用循环赛排程保证同一轮的分区两两不共享任何桶
+    """
+    rounds = [[(i, i) for i in range(buckets)]]
+    players = list(range(buckets)) + ([None] if buckets % 2 else [])
+    n = len(players)
+    for _ in range(n - 1):
+        pairs = []
+        for i in range(n // 2):
+            a, b = players[i], players[n - 1 - i]
+            if a is not None and b is not None:
+                pairs.append((min(a, b), max(a, b)))
+        if pairs:
+            rounds.append(pairs)
+        players = [players[0]] + [players[-1]] + players[1:-1]
+    return rounds
+
+
+# ========================================
+# 同步状态与差异计算
+# ========================================
+
+def _row_keys(name: str, df: pd.DataFrame) -> pd.Series:
+    """节点表以 id 为键；RELATED_TO 以关系 id 为键；其余边以 (start, end) 为键"""
+    if "id" in df.columns:
+        return df["id"].astype(str)
+    if "relationship_id" in df.columns:
+        return df["relationship_id"].astype(str)
+    return df["start"].astype(str) + "\x1f" + df["end"].astype(str)
+
+
+def _canonical(value):
+    """数组、字典等非标量值转为 JSON 字符串，其余值原样返回"""
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return json.dumps(
+            [v.item() if isinstance(v, np.generic) else v for v in value],
+            ensure_ascii=False, default=str,
+        )
+    if isinstance(value, dict):
+        return json.dumps(value, ensure_ascii=False, sort_keys=True, default=str)
+    return value
+
+
+def _hashable(df: pd.DataFrame) -> pd.DataFrame:
+    """把 object 列（text_unit_ids 等数组列）规范化为标量，hash_pandas_object 无法直接哈希数组"""
+    return pd.DataFrame({
+        column: df[column].map(_canonical) if df[column].dtype == object else df[column]
+        for column in df.columns
+    }, index=df.index)
+
+
+def table_row_hashes(tables: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """
+    计算每张图表每一行的键和内容哈希（向量化）
+    
+    返回列: table, key, hash, start, end（节点表的 start/end 为空）
+    """
+    frames = []
+    for name, df in tables.items():
+        if df.empty:
+            continue
+        frames.append(pd.DataFrame({
+            "table": name,
+            "key": _row_keys(name, df).to_numpy(),
+            "hash": pd.util.hash_pandas_object(_hashable(df), index=False, categorize=False).to_numpy(),
+            "start": _column(df, "start").to_numpy(),
+            "end": _column(df, "end").to_numpy(),
+        }))
+    if not frames:
+        return pd.DataFrame(columns=["table", "key", "hash", "start", "end"])
+    return pd.concat(frames, ignore_index=True)
+
+
+def load_sync_state(output_dir: Path) -> pd.DataFrame:
+    """读取上次同步保存的行哈希；不存在时返回 None"""
+    path = Path(output_dir) / SYNC_STATE_FILE
+    if not path.exists():
+        return None
+    return pd.read_parquet(path)
+
+
+def save_sync_state(output_dir: Path, state: pd.DataFrame) -> None:
+    """原子地写入同步状态"""
+    path = Path(output_dir) / SYNC_STATE_FILE
+    tmp_path = path.with_suffix(".tmp")
+    state.astype({"start": "string", "end": "string"}).to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, path)
+
+
+def diff_graph_tables(tables: Dict[str, pd.DataFrame], state: pd.DataFrame,
+                      previous_state: pd.DataFrame) -> Dict[str, Dict[str, pd.DataFrame]]:
+    """
+    按 (键, 内容哈希) 比较新旧版本
+    
+    返回:
+        {表名: {"upsert": 新增或内容变化的行, "delete": 已删除行的 key/start/end}}
+    """
+    if previous_state is None:
+        previous_state = state.iloc[0:0]
+    
+    delta = {}
+    for name, df in tables.items():
+        current = state[state["table"] == name]
+        previous = previous_state[previous_state["table"] == name]
+        
+        # state 中的行与 df 顺序一致；在 (key, hash) 上精确匹配，未命中即为新增或变化
+        matched = current[["key", "hash"]].merge(
+            previous[["key", "hash"]].drop_duplicates(), on=["key", "hash"], how="left", indicator=True
+        )
+        unchanged = (matched["_merge"] == "both").to_numpy()
+        
+        removed = previous[~previous["key"].isin(current["key"])]
+        delta[name] = {
+            "upsert": df[~unchanged],
+            "delete": removed[["key", "start", "end"]].reset_index(drop=True),
+        }
+    return delta
+
+
+def sync_output_to_neo4j(output_dir: Path = OUTPUT_DIR, uri: str = NEO4J_URI, username: str = NEO4J_USERNAME,
+                         password: str = NEO4J_PASSWORD, database: str = NEO4J_DATABASE,
+                         batch_size: int = 1000) -> Dict[str, Any]:
+    """
+    增量同步：把 output 目录与上次同步的状态比较，只把差异写入 Neo4j
+    
+    首次同步（没有状态文件）时所有行都会以 MERGE 方式写入。同步成功后才更新状态文件，
+    失败时下次同步会重新推送同一批差异。
+    
+    返回:
+        各表写入/删除的行数和耗时；输出文件缺失时返回 None
+    """
+    start_time = time.time()
+    data_files = load_output_tables(Path(output_dir))
+    if data_files is None:
+        return None
+    
+    tables = prepare_graph_tables(data_files)
+    state = table_row_hashes(tables)
+    previous_state = load_sync_state(output_dir)
+    delta = diff_graph_tables(tables, state, previous_state)
+    
+    changed = sum(len(d["upsert"]) + len(d["delete"]) for d in delta.values())
+    logger.info(f"🔍 与上次同步相比共有 {changed} 行变化（首次同步: {previous_state is None}）")
+    
+    summary = {}
+    if changed:
+        importer = Neo4jImporter(uri, username, password, database)
+        try:
+            if previous_state is None:
+                importer.create_constraints()
+            summary = importer.sync_delta(delta, batch_size=batch_size)
+        finally:
+            importer.close()
+    
+    save_sync_state(output_dir, state)
+    duration = time.time() - start_time
+    logger.info(f"✅ Neo4j 增量同步完成，耗时 {duration:.2f} 秒")
+    return {"tables": summary, "changed_rows": changed, "duration_seconds": duration}
+
+
+# ========================================
+# neo4j-admin 离线批量导入文件
+# ========================================
+
+CSV_TYPES = {
+    "human_readable_id": "long",
+    "n_tokens": "long",
+    "level": "int",
+    "community": "long",
+    "weight": "double",
+    "rank": "double",
+}
+
+
+def _csv_frame(df: pd.DataFrame, id_header: Dict[str, str]) -> pd.DataFrame:
+    """把表转换为 neo4j-admin 的 CSV 格式：带类型的表头，数组列用 ';' 连接"""
+    out = pd.DataFrame(index=df.index)
+    for col in df.columns:
+        values = df[col]
+        if col in id_header:
+            out[id_header[col]] = values
+        elif values.map(lambda v: isinstance(v, list)).any():
+            out[f"{col}:string[]"] = values.map(lambda v: ";".join(map(str, v)) if isinstance(v, list) else "")
+        elif col in CSV_TYPES:
+            out[f"{col}:{CSV_TYPES[col]}"] = values
+        else:
+            out[col] = values
+    return out
+
+
+def write_admin_import_csv(tables: Dict[str, pd.DataFrame], out_dir: Path, database: str = NEO4J_DATABASE) -> str:
+    """
+    为全新数据库生成 `neo4j-admin database import full` 兼容的 CSV 文件
+    
+    返回可直接执行的导入命令（需先停止 Neo4j，导入会覆盖目标数据库）。
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    args = []
+    
+    for name, label in NODE_TABLES:
+        if name not in tables:
+            continue
+        path = out_dir / f"{name}.csv"
+        _csv_frame(tables[name], {"id": f"id:ID({ID_SPACES[label]})"}).to_csv(path, index=False)
+        args.append(f"--nodes={label}={path}")
+        logger.info(f"📝 已写入 {label} 节点文件: {path} ({len(tables[name])} 行)")
+    
+    for name, rel_type, start_label, end_label in RELATIONSHIP_TABLES:
+        if name not in tables:
+            continue
+        path = out_dir / f"{name}.csv"
+        header = {
+            "start": f":START_ID({ID_SPACES[start_label]})",
+            "end": f":END_ID({ID_SPACES[end_label]})",
+        }
+        _csv_frame(tables[name], header).to_csv(path, index=False)
+        args.append(f"--relationships={rel_type}={path}")
+        logger.info(f"📝 已写入 {rel_type} 关系文件: {path} ({len(tables[name])} 行)")
+    
+    command = " ".join([
+        "neo4j-admin database import full",
+        *args,
+        "--array-delimiter=';'",
+        "--multiline-fields=true",
+        "--skip-bad-relationships=true",
+        "--skip-duplicate-nodes=true",
+        "--overwrite-destination=true",
+        database,
+    ])
+    (out_dir / "import_command.sh").write_text(command + "\n", encoding="utf-8")
+    return command
+
+
+def load_output_tables(output_dir: Path = OUTPUT_DIR) -> Dict[str, pd.DataFrame]:
+    """
+    读取 GraphRAG 输出的 parquet 文件
+    
+    参数:
+        output_dir: parquet 文件所在目录
+    
+    返回:
+        表名到 DataFrame 的字典；必需文件缺失或读取失败时返回 None
+    """
+    output_dir = Path(output_dir)
     
     # 1. 检查必需文件是否存在
     required_files = {
-        "实体": ENTITIES_PATH,
-        "关系": RELATIONSHIPS_PATH,
+        "实体": output_dir / ENTITIES_PATH.name,
+        "关系": output_dir / RELATIONSHIPS_PATH.name,
     }
     
     for name, path in required_files.items():
         if not path.exists():
             logger.error(f"❌ {name}文件不存在: {path}")
             logger.error("请先运行 GraphRAG 索引构建生成 parquet 文件")
-            return
+            return None
     
     # 2. 读取 parquet 文件
     logger.info("📖 读取 parquet 文件...")
@@ -495,18 +1073,18 @@ def main():
     
     try:
         # 必需文件
-        data_files['entities'] = pd.read_parquet(ENTITIES_PATH)
-        data_files['relationships'] = pd.read_parquet(RELATIONSHIPS_PATH)
+        data_files['entities'] = pd.read_parquet(required_files["实体"])
+        data_files['relationships'] = pd.read_parquet(required_files["关系"])
         
         logger.info(f"📊 实体数量: {len(data_files['entities'])}")
         logger.info(f"📊 关系数量: {len(data_files['relationships'])}")
         
         # 可选文件
         optional_files = {
-            'documents': DOCUMENTS_PATH,
-            'text_units': TEXT_UNITS_PATH,
-            'communities': COMMUNITIES_PATH,
-            'community_reports': COMMUNITY_REPORTS_PATH,
+            'documents': output_dir / DOCUMENTS_PATH.name,
+            'text_units': output_dir / TEXT_UNITS_PATH.name,
+            'communities': output_dir / COMMUNITIES_PATH.name,
+            'community_reports': output_dir / COMMUNITY_REPORTS_PATH.name,
         }
         
         for key, path in optional_files.items():
@@ -525,6 +1103,71 @@ def main():
         logger.error(f"❌ 读取 parquet 文件失败: {e}")
         import traceback
         logger.error(traceback.format_exc())
+        return None
+    
+    return data_files
+
+
+def parse_args(argv: List[str] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="导入 GraphRAG 输出到 Neo4j")
+    parser.add_argument(
+        "--mode",
+        choices=["merge", "online", "bulk-csv", "sync"],
+        default="merge",
+        help=(
+            "merge: 逐表 MERGE 导入（默认，兼容旧流程）；"
+            "online: 清空后用 CREATE 大批量 + 锁感知分区并发导入；"
+            "bulk-csv: 生成 neo4j-admin database import 所需的 CSV 文件（用于全新数据库）；"
+            "sync: 与上次同步的状态比较，只推送新增、变化和删除的行（不清空数据库）"
+        ),
+    )
+    parser.add_argument("--output-dir", type=Path, default=OUTPUT_DIR, help="GraphRAG 输出的 parquet 目录")
+    parser.add_argument("--batch-size", type=int, default=None, help="每批行数（merge 默认 100，online 默认 10000）")
+    parser.add_argument("--workers", type=int, default=4, help="online 模式的并发线程数")
+    parser.add_argument("--csv-dir", type=Path, default=SCRIPT_DIR / "data" / "neo4j_import", help="bulk-csv 模式的输出目录")
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] = None):
+    """
+    主函数：执行完整的 GraphRAG 数据导入流程
+    
+    流程：
+    1. 检查 parquet 文件是否存在
+    2. 读取所有数据
+    3. 连接 Neo4j 数据库（bulk-csv 模式改为生成离线导入文件）
+    4. 创建约束和索引
+    5. 并行批量导入所有数据
+    6. 显示导入结果
+    """
+    args = parse_args(argv)
+    
+    logger.info("=" * 70)
+    logger.info(f"🚀 开始导入 GraphRAG 数据到 Neo4j（模式: {args.mode}）")
+    logger.info("=" * 70)
+    
+    if args.mode == "sync":
+        result = sync_output_to_neo4j(args.output_dir, batch_size=args.batch_size or 1000)
+        if result is not None:
+            for key, counts in result["tables"].items():
+                logger.info(f"📊 {key}: 写入 {counts['upserted']} 行，删除 {counts['deleted']} 行")
+        return
+    
+    data_files = load_output_tables(args.output_dir)
+    if data_files is None:
+        return
+    
+    if args.mode == "bulk-csv":
+        tables = prepare_graph_tables(data_files)
+        command = write_admin_import_csv(tables, args.csv_dir)
+        # neo4j-admin 导入由用户稍后执行（也可能不执行），此时不能记录同步状态；
+        # 导入完成后首次 sync 会按 MERGE 补齐差异
+        logger.info("\n" + "=" * 70)
+        logger.info("✅ 离线导入文件已生成")
+        logger.info("=" * 70)
+        logger.info("⚠️  先停止 Neo4j，再执行以下命令（会覆盖目标数据库）：")
+        logger.info(f"   {command}")
+        logger.info("   启动 Neo4j 后再运行本脚本的约束创建，或手动创建 id 唯一约束")
         return
     
     # 3. 连接 Neo4j 并导入
@@ -543,6 +1186,25 @@ def main():
         logger.info("🔧 创建约束和索引...")
         importer.create_constraints()
         
+        if args.mode == "online":
+            tables = prepare_graph_tables(data_files)
+            results = importer.bulk_create_import(
+                tables,
+                batch_size=args.batch_size or 10000,
+                max_workers=args.workers,
+            )
+            save_sync_state(args.output_dir, table_row_hashes(tables))
+            logger.info("\n" + "=" * 70)
+            logger.info("✅ 数据导入完成！")
+            logger.info("=" * 70)
+            for key, result in results.items():
+                if isinstance(result, dict):
+                    logger.info(f"📊 {key}: {result['successful_rows']}/{result['total_rows']} 成功")
+            logger.info(f"⏱️  总耗时: {results['duration_seconds']:.2f} 秒")
+            return
+        
+        batch_size = args.batch_size or 100
+        
         # 5. 导入数据（按依赖顺序）
         step = 1
         
@@ -551,7 +1213,7 @@ def main():
             logger.info("\n" + "=" * 70)
             logger.info(f"第 {step} 步：导入文档")
             logger.info("=" * 70)
-            results['documents'] = importer.import_documents(data_files['documents'], batch_size=100)
+            results['documents'] = importer.import_documents(data_files['documents'], batch_size=batch_size)
             total_duration += results['documents']['duration_seconds']
             step += 1
         
@@ -559,7 +1221,7 @@ def main():
         logger.info("\n" + "=" * 70)
         logger.info(f"第 {step} 步：导入实体节点")
         logger.info("=" * 70)
-        results['entities'] = importer.import_entities(data_files['entities'], batch_size=100)
+        results['entities'] = importer.import_entities(data_files['entities'], batch_size=batch_size)
         total_duration += results['entities']['duration_seconds']
         step += 1
         
@@ -567,7 +1229,7 @@ def main():
         logger.info("\n" + "=" * 70)
         logger.info(f"第 {step} 步：导入关系")
         logger.info("=" * 70)
-        results['relationships'] = importer.import_relationships(data_files['relationships'], batch_size=100)
+        results['relationships'] = importer.import_relationships(data_files['relationships'], batch_size=batch_size)
         # 关系导入返回的是包含 nodes 和 edges 的字典
         if 'nodes' in results['relationships']:
             total_duration += results['relationships']['nodes']['duration_seconds']
@@ -579,7 +1241,7 @@ def main():
             logger.info("\n" + "=" * 70)
             logger.info(f"第 {step} 步：导入文本单元")
             logger.info("=" * 70)
-            results['text_units'] = importer.import_text_units(data_files['text_units'], batch_size=100)
+            results['text_units'] = importer.import_text_units(data_files['text_units'], batch_size=batch_size)
             if 'duration_seconds' in results['text_units']:
                 total_duration += results['text_units']['duration_seconds']
             step += 1
@@ -589,7 +1251,7 @@ def main():
             logger.info("\n" + "=" * 70)
             logger.info(f"第 {step} 步：导入社区")
             logger.info("=" * 70)
-            results['communities'] = importer.import_communities(data_files['communities'], batch_size=100)
+            results['communities'] = importer.import_communities(data_files['communities'], batch_size=batch_size)
             total_duration += results['communities']['duration_seconds']
             step += 1
         
@@ -598,7 +1260,7 @@ def main():
             logger.info("\n" + "=" * 70)
             logger.info(f"第 {step} 步：导入社区报告")
             logger.info("=" * 70)
-            results['community_reports'] = importer.import_community_reports(data_files['community_reports'], batch_size=100)
+            results['community_reports'] = importer.import_community_reports(data_files['community_reports'], batch_size=batch_size)
             total_duration += results['community_reports']['duration_seconds']
             step += 1
         
@@ -0,0 +1,233 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Index update job queue for the GraphRAG service
+Persistent task state plus a single-writer queue per project that coalesces
+uploads arriving within a batching window into one incremental index run
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from server.process_lock import file_lock
+
+logger = logging.getLogger(__name__)
+
+# 重启后仍未完成的任务状态
+UNFINISHED_STATUSES = ("pending", "queued", "running")
+
+
+class TaskStore:
+    """
+    索引任务状态表，每次修改都原子地写回 JSON 文件，服务重启后可恢复
+
+    多个工作进程共享同一个文件：修改时持有跨进程文件锁并先合并磁盘上的最新内容，
+    读取时若文件已被其他进程更新则重新加载。
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.RLock()
+        self._tasks: "OrderedDict[str, dict]" = OrderedDict()
+        self._mtime: Optional[int] = None
+        self._load()
+
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        try:
+            self._mtime = os.stat(self.path).st_mtime_ns
+            with open(self.path, "r", encoding="utf-8") as f:
+                self._tasks = OrderedDict(json.load(f))
+        except Exception as e:
+            logger.error(f"Failed to load index task state from {self.path}: {str(e)}")
+
+    def _refresh(self) -> None:
+        """文件被其他进程改写过时重新加载"""
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except FileNotFoundError:
+            return
+        if mtime != self._mtime:
+            self._load()
+
+    def _save(self) -> None:
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._tasks, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+        self._mtime = os.stat(self.path).st_mtime_ns
+
+    def create(self, task_id: str, info: dict) -> None:
+        with self._lock, file_lock(f"{self.path}.lock"):
+            self._refresh()
+            self._tasks[task_id] = dict(info)
+            self._save()
+
+    def update_task(self, task_id: str, **fields) -> None:
+        with self._lock, file_lock(f"{self.path}.lock"):
+            self._refresh()
+            self._tasks.setdefault(task_id, {}).update(fields)
+            self._save()
+
+    def unfinished(self, statuses: tuple = UNFINISHED_STATUSES) -> List[str]:
+        """返回处于给定状态（默认：未完成）的任务（按创建顺序）"""
+        with self._lock:
+            self._refresh()
+            return [
+                task_id
+                for task_id, info in self._tasks.items()
+                if info.get("status") in statuses
+            ]
+
+    def __contains__(self, task_id: str) -> bool:
+        with self._lock:
+            self._refresh()
+            return task_id in self._tasks
+
+    def __getitem__(self, task_id: str) -> dict:
+        with self._lock:
+            self._refresh()
+            return dict(self._tasks[task_id])
+
+    def items(self) -> List[tuple]:
+        with self._lock:
+            self._refresh()
+            return [(task_id, dict(info)) for task_id, info in self._tasks.items()]
+
+
+class IndexJobQueue:
+    """
+    单写者索引任务队列
+
+    每个项目一个工作线程：收到第一个任务后等待 batch_window 秒，
+    把窗口内到达的所有上传合并为一次增量索引；同一项目的索引运行严格串行，
+    因此输出表不会被并发写入。
+    """
+
+    def __init__(
+        self,
+        runner: Callable[[str, List[str], str, str], None],
+        store: TaskStore,
+        batch_window: float = 10.0,
+    ):
+        # runner(project, task_ids, file_type, batch_id)
+        self.runner = runner
+        self.store = store
+        self.batch_window = batch_window
+        self._cond = threading.Condition()
+        self._pending: Dict[str, List[str]] = {}
+        self._running: Dict[str, dict] = {}
+        self._workers: Dict[str, threading.Thread] = {}
+        self._submitted: set = set()
+
+    def submit(self, project: str, task_id: str) -> int:
+        """加入队列，返回当前队列深度（排队或运行中的任务不会重复入队）"""
+        with self._cond:
+            if task_id in self._submitted:
+                return self._depth()
+            self._submitted.add(task_id)
+            self._pending.setdefault(project, []).append(task_id)
+            self.store.update_task(task_id, status="queued", message="已加入索引队列，等待合并处理...")
+            self._ensure_worker(project)
+            self._cond.notify_all()
+            return self._depth()
+
+    def depth(self, project: Optional[str] = None) -> int:
+        with self._cond:
+            return self._depth(project)
+
+    def _depth(self, project: Optional[str] = None) -> int:
+        if project is not None:
+            return len(self._pending.get(project, []))
+        return sum(len(tasks) for tasks in self._pending.values())
+
+    def snapshot(self) -> dict:
+        with self._cond:
+            return {
+                "queue_depth": self._depth(),
+                "batch_window": self.batch_window,
+                "pending": {project: list(tasks) for project, tasks in self._pending.items() if tasks},
+                "running": {project: dict(batch) for project, batch in self._running.items()},
+            }
+
+    def poll_store(self, project: str, interval: float = 1.0) -> None:
+        """
+        定期从任务表中领取 pending 任务
+
+        多工作进程部署时只有持有索引锁的进程运行队列，
+        其他进程接收的上传只写入任务表，由这里领取。
+        """
+        def poll():
+            while True:
+                try:
+                    for task_id in self.store.unfinished(statuses=("pending",)):
+                        self.submit(project, task_id)
+                except Exception as e:
+                    logger.error(f"Polling index tasks failed: {str(e)}")
+                time.sleep(interval)
+
+        threading.Thread(target=poll, name=f"index-poller-{project}", daemon=True).start()
+
+    def _ensure_worker(self, project: str) -> None:
+        worker = self._workers.get(project)
+        if worker is None or not worker.is_alive():
+            worker = threading.Thread(
+                target=self._work, args=(project,), name=f"index-worker-{project}", daemon=True
+            )
+            self._workers[project] = worker
+            worker.start()
+
+    def _take_batch(self, project: str) -> List[str]:
+        with self._cond:
+            while not self._pending.get(project):
+                self._cond.wait()
+            first_seen = time.monotonic()
+        # 等待批处理窗口结束，收集窗口内的所有上传
+        remaining = self.batch_window - (time.monotonic() - first_seen)
+        if remaining > 0:
+            time.sleep(remaining)
+        with self._cond:
+            batch = self._pending.pop(project, [])
+            return batch
+
+    def _work(self, project: str) -> None:
+        while True:
+            task_ids = self._take_batch(project)
+            # 不同文件类型使用不同的配置文件，按类型拆分为串行运行
+            by_type: "OrderedDict[str, List[str]]" = OrderedDict()
+            for task_id in task_ids:
+                file_type = self.store[task_id].get("file_type", "txt") if task_id in self.store else "txt"
+                by_type.setdefault(file_type, []).append(task_id)
+
+            for file_type, group in by_type.items():
+                batch_id = uuid.uuid4().hex[:12]
+                with self._cond:
+                    self._running[project] = {
+                        "batch_id": batch_id,
+                        "task_ids": group,
+                        "file_type": file_type,
+                        "started_at": datetime.now().isoformat(),
+                    }
+                for task_id in group:
+                    self.store.update_task(task_id, batch_id=batch_id, batch_size=len(group))
+                try:
+                    self.runner(project, group, file_type, batch_id)
+                except Exception as e:
+                    logger.error(f"Index batch {batch_id} crashed: {str(e)}", exc_info=True)
+                    for task_id in group:
+                        self.store.update_task(task_id, status="failed", message=f"索引更新出错: {str(e)}")
+                finally:
+                    # 批次结束后不再记住这些任务，已提交集合不会随运行时间增长
+                    with self._cond:
+                        self._running.pop(project, None)
+                        self._submitted.difference_update(group)
@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Cross-process file locks for multi-worker deployments
+Advisory flock-based locks shared by all worker processes on the same host
+"""
+
+import os
+from contextlib import contextmanager
+from typing import IO, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows：不支持 flock，退化为仅进程内有效
+    fcntl = None
+
+
+@contextmanager
+def file_lock(path: str) -> Iterator[None]:
+    """阻塞式获取跨进程排他锁，直到上下文结束"""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "a") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def try_lock(path: str) -> Optional[IO]:
+    """
+    非阻塞地获取跨进程排他锁
+
+    成功时返回打开的锁文件，调用方持有它即持有锁（进程退出时由系统释放）；
+    锁已被其他进程持有时返回 None。
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    lock_file = open(path, "a")
+    if fcntl is None:
+        return lock_file
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        return None
+    return lock_file
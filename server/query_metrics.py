@@ -0,0 +1,312 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Query metrics for the GraphRAG service
+Per-stage latency histograms, LLM usage counters and gauges rendered in the
+Prometheus text exposition format (no prometheus_client dependency)
+"""
+
+import math
+import threading
+from typing import Dict, Iterable, Optional, Tuple
+
+from graphrag.callbacks.noop_query_callbacks import NoopQueryCallbacks
+
+# 默认延迟分桶（秒），覆盖从向量检索的毫秒级到 global map/reduce 的分钟级
+DEFAULT_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0,
+)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    """Base class for a labelled metric family"""
+
+    metric_type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labels: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = labels
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.label_names)
+
+    def render(self) -> str:
+        header = f"# HELP {self.name} {self.documentation}\n# TYPE {self.name} {self.metric_type}\n"
+        return header + "".join(f"{line}\n" for line in self._samples())
+
+    def _samples(self) -> Iterable[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing counter"""
+
+    metric_type = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: Tuple[str, ...] = ()):
+        super().__init__(name, documentation, labels)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def _samples(self) -> Iterable[str]:
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            yield f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}"
+
+
+class Gauge(_Metric):
+    """Value that can go up and down"""
+
+    metric_type = "gauge"
+
+    def __init__(self, name: str, documentation: str, labels: Tuple[str, ...] = ()):
+        super().__init__(name, documentation, labels)
+        self._values: Dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def _samples(self) -> Iterable[str]:
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            yield f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}"
+
+
+class Histogram(_Metric):
+    """Cumulative histogram with fixed buckets"""
+
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._counts: Dict[LabelValues, list] = {}
+        self._sums: Dict[LabelValues, float] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            counts = self._counts.setdefault(key, [0] * len(self.buckets))
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[index] += 1
+                    break
+            self._sums[key] = self._sums.get(key, 0) + value
+
+    def count(self, **labels: str) -> int:
+        return sum(self._counts.get(self._key(labels), []))
+
+    def _samples(self) -> Iterable[str]:
+        with self._lock:
+            items = [(key, list(counts), self._sums[key]) for key, counts in self._counts.items()]
+        for key, counts, total in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                le = _format_labels(self.label_names, key, f'le="{_format_value(bound)}"')
+                yield f"{self.name}_bucket{le} {cumulative}"
+            labels = _format_labels(self.label_names, key)
+            yield f"{self.name}_sum{labels} {_format_value(total)}"
+            yield f"{self.name}_count{labels} {cumulative}"
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together on /metrics"""
+
+    def __init__(self):
+        self._metrics: list = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        return "".join(metric.render() for metric in self._metrics)
+
+
+# ========================================
+# Service metrics
+# ========================================
+
+registry = MetricsRegistry()
+
+query_duration = registry.register(Histogram(
+    "graphrag_query_duration_seconds",
+    "End-to-end latency of /api/query requests.",
+    ("query_type", "status"),
+))
+query_stage_duration = registry.register(Histogram(
+    "graphrag_query_stage_seconds",
+    "Latency of individual query stages (load_data, engine_construction, context_queue, vector_search, build_context, map, reduce, response, ...).",
+    ("query_type", "stage"),
+))
+query_llm_calls = registry.register(Counter(
+    "graphrag_query_llm_calls_total",
+    "LLM calls made by query stages.",
+    ("query_type", "stage"),
+))
+query_prompt_tokens = registry.register(Counter(
+    "graphrag_query_prompt_tokens_total",
+    "Prompt tokens sent by query stages.",
+    ("query_type", "stage"),
+))
+query_output_tokens = registry.register(Counter(
+    "graphrag_query_output_tokens_total",
+    "Output tokens generated by query stages.",
+    ("query_type", "stage"),
+))
+queries_in_flight = registry.register(Gauge(
+    "graphrag_queries_in_flight",
+    "Queries currently being executed.",
+    ("query_type",),
+))
+data_cache_requests = registry.register(Counter(
+    "graphrag_data_cache_requests_total",
+    "Index data cache lookups by result (hit or miss).",
+    ("result",),
+))
+data_cache_hit_ratio = registry.register(Gauge(
+    "graphrag_data_cache_hit_ratio",
+    "Fraction of index data cache lookups served without reloading parquet tables.",
+))
+context_builds_queued = registry.register(Gauge(
+    "graphrag_context_builds_queued",
+    "Query context builds waiting for a free context executor worker.",
+))
+context_builds_running = registry.register(Gauge(
+    "graphrag_context_builds_running",
+    "Query context builds currently running on the context executor.",
+))
+index_queue_depth = registry.register(Gauge(
+    "graphrag_index_queue_depth",
+    "Uploaded files waiting in the index update queue.",
+))
+index_snapshot_version = registry.register(Gauge(
+    "graphrag_index_snapshot_version",
+    "Version of the index snapshot currently served to queries.",
+))
+llm_concurrency_limit = registry.register(Gauge(
+    "graphrag_llm_concurrency_limit",
+    "Current adaptive (AIMD) concurrency limit of each shared LLM quota.",
+    ("quota",),
+))
+llm_requests_in_flight = registry.register(Gauge(
+    "graphrag_llm_requests_in_flight",
+    "LLM requests currently holding a slot of each shared quota.",
+    ("quota",),
+))
+llm_requests_waiting = registry.register(Gauge(
+    "graphrag_llm_requests_waiting",
+    "LLM requests waiting for a slot of each shared quota, by priority.",
+    ("quota", "priority"),
+))
+llm_rate_limited = registry.register(Gauge(
+    "graphrag_llm_rate_limited_total",
+    "Rate-limit (429) responses seen by each shared quota since start.",
+    ("quota",),
+))
+
+
+def record_data_cache_lookup(hit: bool) -> None:
+    """记录一次数据缓存查找，并刷新命中率"""
+    data_cache_requests.inc(result="hit" if hit else "miss")
+    hits = data_cache_requests.value(result="hit")
+    total = hits + data_cache_requests.value(result="miss")
+    data_cache_hit_ratio.set(hits / total if total else 0.0)
+
+
+def record_llm_scheduler(stats: Dict[str, dict]) -> None:
+    """刷新共享 LLM 配额的状态（标签只含端点和模型，不含密钥）"""
+    for key, quota in stats.items():
+        endpoint, _, model = key.split("|", 2)
+        label = f"{endpoint}|{model}"
+        llm_concurrency_limit.set(quota["concurrency_limit"], quota=label)
+        llm_requests_in_flight.set(quota["in_flight"], quota=label)
+        llm_requests_waiting.set(quota["waiting_interactive"], quota=label, priority="interactive")
+        llm_requests_waiting.set(quota["waiting"] - quota["waiting_interactive"], quota=label, priority="background")
+        llm_rate_limited.set(quota["rate_limited"], quota=label)
+
+
+def render_metrics() -> str:
+    """以 Prometheus 文本格式输出所有指标"""
+    return registry.render()
+
+
+class MetricsQueryCallbacks(NoopQueryCallbacks):
+    """QueryCallbacks that aggregate stage timings and LLM usage into histograms and counters"""
+
+    def __init__(self, query_type: str):
+        self.query_type = query_type
+        self.stages: Dict[str, float] = {}
+        self.context_data: Optional[object] = None
+
+    def on_context(self, context) -> None:
+        self.context_data = context
+
+    def on_stage(
+        self,
+        stage: str,
+        elapsed: float,
+        llm_calls: int = 0,
+        prompt_tokens: int = 0,
+        output_tokens: int = 0,
+    ) -> None:
+        # 同一阶段可能被多次触发（如 DRIFT 的多个本地搜索步骤），累加耗时
+        self.stages[stage] = self.stages.get(stage, 0) + elapsed
+        query_stage_duration.observe(elapsed, query_type=self.query_type, stage=stage)
+        if llm_calls:
+            query_llm_calls.inc(llm_calls, query_type=self.query_type, stage=stage)
+        if prompt_tokens:
+            query_prompt_tokens.inc(prompt_tokens, query_type=self.query_type, stage=stage)
+        if output_tokens:
+            query_output_tokens.inc(output_tokens, query_type=self.query_type, stage=stage)
@@ -0,0 +1,212 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Shared, memory-mapped index snapshots for multi-worker deployments
+The output tables are written once per index version as Arrow IPC files and
+embedding matrices as .npy files; every worker process maps them read-only,
+so attaching takes milliseconds and the OS page cache is shared across workers
+"""
+
+import json
+import logging
+import os
+import shutil
+import time
+import uuid
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from server.process_lock import file_lock
+
+logger = logging.getLogger(__name__)
+
+# 快照中包含的输出表
+SNAPSHOT_TABLES = (
+    "entities",
+    "text_units",
+    "communities",
+    "community_reports",
+    "relationships",
+    "covariates",
+)
+
+CURRENT_FILE = "CURRENT"
+MANIFEST_FILE = "manifest.json"
+LOCK_FILE = ".lock"
+
+
+def _embedding_matrix(column: pd.Series) -> Optional[np.ndarray]:
+    """把等长浮点向量列堆叠为矩阵；列中有空值、非数值或长度不一时返回 None"""
+    values = column.tolist()
+    if not values or any(v is None or isinstance(v, (str, bytes, dict)) for v in values):
+        return None
+    first = values[0]
+    if not isinstance(first, (list, np.ndarray)) or len(first) == 0:
+        return None
+    try:
+        matrix = np.vstack(values)
+    except ValueError:
+        return None
+    if matrix.ndim != 2 or not np.issubdtype(matrix.dtype, np.floating):
+        return None
+    return matrix
+
+
+def _source_mtime(output_dir: str) -> float:
+    """输出目录中各表 parquet 文件的最新修改时间"""
+    mtimes = [
+        os.path.getmtime(os.path.join(output_dir, f"{name}.parquet"))
+        for name in SNAPSHOT_TABLES
+        if os.path.exists(os.path.join(output_dir, f"{name}.parquet"))
+    ]
+    return max(mtimes) if mtimes else 0.0
+
+
+class SharedSnapshotStore:
+    """
+    磁盘上的共享索引快照目录
+
+    目录结构:
+        <root>/CURRENT                  当前版本号（原子替换）
+        <root>/<version>/manifest.json  表文件、嵌入矩阵和源文件时间
+        <root>/<version>/<table>.arrow  Arrow IPC 文件（不压缩，可内存映射）
+        <root>/<version>/<table>.<column>.npy  嵌入矩阵
+
+    任一工作进程构建新版本（跨进程文件锁保证同一时刻只有一个构建者），
+    其余进程发现 CURRENT 变化后重新映射，毫秒级完成。
+    """
+
+    def __init__(self, root: str, keep_versions: int = 2):
+        self.root = root
+        self.keep_versions = keep_versions
+        os.makedirs(root, exist_ok=True)
+
+    # ---------- 版本信息 ----------
+
+    def current_version(self) -> Optional[str]:
+        try:
+            with open(os.path.join(self.root, CURRENT_FILE), "r", encoding="utf-8") as f:
+                return f.read().strip() or None
+        except FileNotFoundError:
+            return None
+
+    def manifest(self, version: str) -> dict:
+        with open(os.path.join(self.root, version, MANIFEST_FILE), "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def is_stale(self, output_dir: str) -> bool:
+        """当前版本不存在，或输出目录中的 parquet 比快照更新"""
+        version = self.current_version()
+        if version is None:
+            return True
+        try:
+            manifest = self.manifest(version)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return True
+        return _source_mtime(output_dir) > manifest.get("source_mtime", 0.0)
+
+    def build_lock(self):
+        """跨进程互斥：同一时刻只有一个工作进程构建快照"""
+        return file_lock(os.path.join(self.root, LOCK_FILE))
+
+    # ---------- 写入 ----------
+
+    def publish(self, tables: Dict[str, Optional[pd.DataFrame]], output_dir: str) -> str:
+        """把各表写为新版本并原子切换 CURRENT，返回版本号"""
+        start = time.perf_counter()
+        version = f"{datetime.now().strftime('%Y%m%d%H%M%S')}-{uuid.uuid4().hex[:8]}"
+        tmp_dir = os.path.join(self.root, f".{version}.tmp")
+        os.makedirs(tmp_dir)
+
+        manifest = {
+            "version": version,
+            "created_at": datetime.now().isoformat(),
+            "source_mtime": _source_mtime(output_dir),
+            "tables": {},
+        }
+        for name, df in tables.items():
+            if df is None:
+                continue
+            embeddings = {}
+            for column in df.columns:
+                if df[column].dtype != object:
+                    continue
+                matrix = _embedding_matrix(df[column])
+                if matrix is not None:
+                    file_name = f"{name}.{column}.npy"
+                    np.save(os.path.join(tmp_dir, file_name), matrix)
+                    embeddings[column] = file_name
+            table = pa.Table.from_pandas(df.drop(columns=list(embeddings)), preserve_index=False)
+            file_name = f"{name}.arrow"
+            with pa.OSFile(os.path.join(tmp_dir, file_name), "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            manifest["tables"][name] = {
+                "file": file_name,
+                "rows": len(df),
+                "columns": list(df.columns),
+                "embeddings": embeddings,
+            }
+
+        with open(os.path.join(tmp_dir, MANIFEST_FILE), "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_dir, os.path.join(self.root, version))
+
+        current_tmp = os.path.join(self.root, f"{CURRENT_FILE}.tmp")
+        with open(current_tmp, "w", encoding="utf-8") as f:
+            f.write(version)
+        os.replace(current_tmp, os.path.join(self.root, CURRENT_FILE))
+
+        logger.info(f"Wrote shared index snapshot {version} in {time.perf_counter() - start:.2f}s")
+        self._prune(version)
+        return version
+
+    def _prune(self, current: str) -> None:
+        """只保留最近的若干版本；已映射的文件在 POSIX 上删除后仍可继续读取"""
+        for version in self.versions()[:-self.keep_versions]:
+            if version != current:
+                shutil.rmtree(os.path.join(self.root, version), ignore_errors=True)
+
+    # ---------- 映射 ----------
+
+    def attach(self, version: Optional[str] = None) -> Tuple[str, Dict[str, Optional[pd.DataFrame]]]:
+        """
+        只读映射指定版本（默认当前版本），返回 (版本号, 表)
+
+        数值列直接引用映射内存；嵌入列是共享矩阵的行视图。
+        """
+        version = version or self.current_version()
+        if version is None:
+            raise FileNotFoundError(f"No shared index snapshot in {self.root}")
+        start = time.perf_counter()
+        manifest = self.manifest(version)
+        version_dir = os.path.join(self.root, version)
+
+        tables: Dict[str, Optional[pd.DataFrame]] = {name: None for name in SNAPSHOT_TABLES}
+        for name, info in manifest["tables"].items():
+            source = pa.memory_map(os.path.join(version_dir, info["file"]), "r")
+            df = pa.ipc.open_file(source).read_all().to_pandas(split_blocks=True)
+            # 按原列位置插回嵌入列（insert 不会复制其余列的数据）
+            embeddings = sorted(info["embeddings"].items(), key=lambda item: info["columns"].index(item[0]))
+            for column, file_name in embeddings:
+                matrix = np.load(os.path.join(version_dir, file_name), mmap_mode="r")
+                df.insert(
+                    info["columns"].index(column),
+                    column,
+                    pd.Series(list(matrix), index=df.index, dtype=object),
+                )
+            tables[name] = df
+
+        logger.info(f"Attached shared index snapshot {version} in {time.perf_counter() - start:.3f}s")
+        return version, tables
+
+    def versions(self) -> List[str]:
+        return sorted(
+            entry for entry in os.listdir(self.root)
+            if not entry.startswith(".") and os.path.isdir(os.path.join(self.root, entry))
+        )
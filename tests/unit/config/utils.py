@@ -121,6 +121,8 @@ def assert_vector_store_configs(
         assert store_a.container_name == store_e.container_name
         assert store_a.overwrite == store_e.overwrite
         assert store_a.database_name == store_e.database_name
+        assert store_a.quantization == store_e.quantization
+        assert store_a.rescore_multiplier == store_e.rescore_multiplier
 
 
 def assert_reporting_configs(
@@ -131,6 +133,7 @@ def assert_reporting_configs(
     assert actual.connection_string == expected.connection_string
     assert actual.container_name == expected.container_name
     assert actual.storage_account_blob_url == expected.storage_account_blob_url
+    assert actual.otel_spans == expected.otel_spans
 
 
 def assert_output_configs(actual: OutputConfig, expected: OutputConfig) -> None:
@@ -198,6 +201,8 @@ def assert_text_embedding_configs(
     assert actual.strategy == expected.strategy
     assert actual.model_id == expected.model_id
     assert actual.vector_store_id == expected.vector_store_id
+    assert actual.keyword_index == expected.keyword_index
+    assert actual.keyword_tokenizer == expected.keyword_tokenizer
 
 
 def assert_chunking_configs(actual: ChunkingConfig, expected: ChunkingConfig) -> None:
@@ -208,6 +213,7 @@ def assert_chunking_configs(actual: ChunkingConfig, expected: ChunkingConfig) ->
     assert actual.encoding_model == expected.encoding_model
     assert actual.prepend_metadata == expected.prepend_metadata
     assert actual.chunk_size_includes_metadata == expected.chunk_size_includes_metadata
+    assert actual.num_workers == expected.num_workers
 
 
 def assert_snapshots_configs(
@@ -223,6 +229,8 @@ def assert_extract_graph_configs(
     assert actual.prompt == expected.prompt
     assert actual.entity_types == expected.entity_types
     assert actual.max_gleanings == expected.max_gleanings
+    assert actual.gleaning_min_records == expected.gleaning_min_records
+    assert actual.batch_max_tokens == expected.batch_max_tokens
     assert actual.strategy == expected.strategy
     assert actual.encoding_model == expected.encoding_model
     assert actual.model_id == expected.model_id
@@ -279,6 +287,7 @@ def assert_community_reports_configs(
     assert actual.text_prompt == expected.text_prompt
     assert actual.max_length == expected.max_length
     assert actual.max_input_length == expected.max_input_length
+    assert actual.context_workers == expected.context_workers
     assert actual.strategy == expected.strategy
     assert actual.model_id == expected.model_id
 
@@ -301,6 +310,7 @@ def assert_cluster_graph_configs(
     assert actual.max_cluster_size == expected.max_cluster_size
     assert actual.use_lcc == expected.use_lcc
     assert actual.seed == expected.seed
+    assert actual.incremental_update == expected.incremental_update
 
 
 def assert_umap_configs(actual: UmapConfig, expected: UmapConfig) -> None:
@@ -323,6 +333,7 @@ def assert_local_search_configs(
     assert actual.n == expected.n
     assert actual.max_tokens == expected.max_tokens
     assert actual.llm_max_tokens == expected.llm_max_tokens
+    assert actual.retrieval_mode == expected.retrieval_mode
 
 
 def assert_global_search_configs(
@@ -401,6 +412,7 @@ def assert_basic_search_configs(
     assert actual.n == expected.n
     assert actual.max_tokens == expected.max_tokens
     assert actual.llm_max_tokens == expected.llm_max_tokens
+    assert actual.retrieval_mode == expected.retrieval_mode
 
 
 def assert_graphrag_configs(actual: GraphRagConfig, expected: GraphRagConfig) -> None:
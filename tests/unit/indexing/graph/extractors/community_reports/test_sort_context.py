@@ -3,6 +3,9 @@
 import math
 import platform
 
+import pytest
+
+import graphrag.index.operations.summarize_communities.graph_context.sort_context as sort_context_module
 from graphrag.index.operations.summarize_communities.graph_context.sort_context import (
     sort_context,
 )
@@ -217,3 +220,60 @@ def test_sort_context_max_tokens():
     assert ctx is not None, "Context is none"
     num = num_tokens(ctx)
     assert num <= 800, f"num_tokens is not less than or equal to 800: {num}"
+
+
+def _rebuilt(monkeypatch, *args, **kwargs) -> str:
+    with monkeypatch.context() as patch:
+        patch.setattr(sort_context_module, "_csv_safe", lambda records: False)
+        return sort_context(*args, **kwargs)
+
+
+@pytest.mark.parametrize("max_tokens", [None, 50, 200, 400, 600, 800, 826, 2000])
+def test_sort_context_matches_rebuild(monkeypatch, max_tokens):
+    assert sort_context(context, max_tokens=max_tokens) == _rebuilt(
+        monkeypatch, context, max_tokens=max_tokens
+    )
+
+
+@pytest.mark.parametrize("max_tokens", [None, 300, 600, 900])
+def test_sort_context_matches_rebuild_with_claims_and_reports(monkeypatch, max_tokens):
+    with_claims = [
+        {
+            **record,
+            "claim_details": [
+                {
+                    "human_readable_id": 100 + index,
+                    "subject_id": record["title"],
+                    "type": "EVENT",
+                    "status": "TRUE",
+                    "description": f"A claim about {record['title'].lower()}, with a comma",
+                    "score": 0.5 + index / 10,
+                }
+            ],
+        }
+        for index, record in enumerate(context)
+    ]
+    reports = [
+        {"community": 1, "full_content": "A sub-community report\nover two lines"}
+    ]
+    assert sort_context(
+        with_claims, sub_community_reports=reports, max_tokens=max_tokens
+    ) == _rebuilt(
+        monkeypatch, with_claims, sub_community_reports=reports, max_tokens=max_tokens
+    )
+
+
+def test_sort_context_mixed_columns_falls_back():
+    mixed = [
+        {**record, "node_details": {**record["node_details"], "degree": nan}}
+        if index == 0
+        else record
+        for index, record in enumerate(context)
+    ]
+    assert not sort_context_module._csv_safe(  # noqa: SLF001
+        record["node_details"] for record in mixed
+    )
+    ctx = sort_context(mixed)
+    # pandas promotes the whole column to float once a NaN appears
+    assert "\n26,ALI BABA," in ctx
+    assert ",1.0" in ctx
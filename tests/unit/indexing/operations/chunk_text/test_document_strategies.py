@@ -0,0 +1,92 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import json
+from unittest.mock import Mock
+
+from graphrag.config.models.chunking_config import ChunkingConfig
+from graphrag.index.operations.chunk_text.csv_strategy import (
+    chunk_csv_document,
+    run_csv,
+)
+from graphrag.index.operations.chunk_text.markdown_strategy import (
+    chunk_markdown_document,
+)
+from graphrag.utils.tokenizer import get_tokenizer
+
+
+def _markdown_text(content: str, metadata: dict) -> str:
+    metadata_str = json.dumps(metadata, ensure_ascii=False, indent=2)
+    return f"METADATA:\n{metadata_str}\n\nCONTENT:\n{content}"
+
+
+def test_markdown_groups_by_top_level_heading():
+    text = '# A\n\npara one\n\n## B\n\npara two\n\n# C\n\n<!-- METADATA\n{"page": 3}\n-->\n\npara three'
+
+    chunks = chunk_markdown_document(4, text, ChunkingConfig(size=1200))
+
+    assert [chunk.text_chunk for chunk in chunks] == [
+        _markdown_text(
+            "# A\n\npara one\n\n## B\n\npara two", {"parent_headings": ["# A", "## B"]}
+        ),
+        _markdown_text("para three", {"page": 3, "parent_headings": ["# C"]}),
+    ]
+    assert [chunk.source_doc_indices for chunk in chunks] == [[4], [4]]
+    assert chunks[1].n_tokens == get_tokenizer().count("para three")
+
+
+def test_markdown_splits_oversized_groups():
+    paragraph = "one two three four five six seven eight"
+    text = "\n\n".join([paragraph] * 6)
+    tokenizer = get_tokenizer()
+
+    chunks = chunk_markdown_document(0, text, ChunkingConfig(size=5))
+
+    contents = [chunk.text_chunk.split("CONTENT:\n", 1)[1] for chunk in chunks]
+    assert "\n\n".join(contents) == text
+    assert [chunk.n_tokens for chunk in chunks] == [
+        tokenizer.count(content) for content in contents
+    ]
+    # a chunk is closed by the element that takes it over twice the chunk size
+    assert all(chunk.n_tokens > 10 for chunk in chunks[:-1])
+
+
+def test_markdown_skips_empty_documents():
+    assert chunk_markdown_document(0, "", ChunkingConfig()) == []
+
+
+def test_csv_packs_rows_up_to_chunk_size():
+    tokenizer = get_tokenizer()
+    rows = ["alpha beta gamma", "delta epsilon", "zeta eta theta iota", "kappa"]
+    size = tokenizer.count(rows[0]) + tokenizer.count(rows[1])
+
+    chunks = chunk_csv_document(2, "<ROW_SEP>".join(rows), ChunkingConfig(size=size))
+
+    assert chunks[0].text_chunk == f"{rows[0]}\n\n{rows[1]}"
+    assert chunks[0].n_tokens == size
+    assert all(chunk.source_doc_indices == [2] for chunk in chunks)
+    assert "\n\n".join(chunk.text_chunk for chunk in chunks) == "\n\n".join(rows)
+
+
+def test_csv_splits_overlong_rows():
+    row = " ".join(["word"] * 50)
+
+    chunks = chunk_csv_document(0, f"short\n{row}", ChunkingConfig(size=10, overlap=0))
+
+    assert chunks[0].text_chunk == "short"
+    assert len(chunks) > 2
+    assert all(chunk.n_tokens <= 10 for chunk in chunks)
+
+
+def test_run_csv_streams_documents_in_order():
+    tick = Mock()
+
+    chunks = list(
+        run_csv(["first\nrow", None, "second"], ChunkingConfig(size=100), tick)
+    )
+
+    assert [(chunk.text_chunk, chunk.source_doc_indices) for chunk in chunks] == [
+        ("first\n\nrow", [0]),
+        ("second", [2]),
+    ]
+    assert tick.call_count == 3
@@ -0,0 +1,142 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+from typing import Any
+from unittest.mock import AsyncMock, Mock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from graphrag.index.operations.embed_text.embed_text import (
+    _text_embed_with_vector_store,
+)
+from graphrag.index.operations.embed_text.strategies.typing import (
+    TextEmbeddingResult,
+)
+from graphrag.vector_stores.base import BaseVectorStore, VectorStoreDocument
+
+
+class RecordingVectorStore(BaseVectorStore):
+    def __init__(self, fail_on_write: int | None = None):
+        super().__init__(collection_name="test")
+        self.documents: list[list[VectorStoreDocument]] = []
+        self.overwrites: list[bool] = []
+        self.fail_on_write = fail_on_write
+
+    def connect(self, **kwargs: Any) -> None:
+        pass
+
+    def load_documents(
+        self, documents: list[VectorStoreDocument], overwrite: bool = True
+    ) -> None:
+        if self.fail_on_write == len(self.documents):
+            msg = "write failed"
+            raise RuntimeError(msg)
+        self.documents.append(documents)
+        self.overwrites.append(overwrite)
+
+    def similarity_search_by_vector(self, query_embedding, k=10, **kwargs):
+        return []
+
+    def similarity_search_by_text(self, text, text_embedder, k=10, **kwargs):
+        return []
+
+    def filter_by_id(self, include_ids):
+        return None
+
+    def search_by_id(self, id):
+        return VectorStoreDocument(id=id, text=None, vector=None)
+
+
+def _embed_lengths(texts, *_args):
+    return TextEmbeddingResult(
+        embeddings=[
+            None if text == "skip" else [float(len(text)), 1.0] for text in texts
+        ]
+    )
+
+
+async def _embed(input: pd.DataFrame, vector_store: BaseVectorStore, **config):
+    with patch(
+        "graphrag.index.operations.embed_text.embed_text.load_strategy",
+        return_value=AsyncMock(side_effect=_embed_lengths),
+    ):
+        return await _text_embed_with_vector_store(
+            input=input,
+            callbacks=Mock(),
+            cache=Mock(),
+            embed_column="text",
+            strategy={"type": "mock"},
+            vector_store=vector_store,
+            vector_store_config=config,
+            title_column="title",
+        )
+
+
+def _input(texts: list[str]) -> pd.DataFrame:
+    return pd.DataFrame({
+        "id": [f"id-{index}" for index in range(len(texts))],
+        "text": texts,
+        "title": [f"title-{index}" for index in range(len(texts))],
+    })
+
+
+async def test_batches_are_written_in_order():
+    store = RecordingVectorStore()
+
+    results = await _embed(
+        _input(["a", "bb", "skip", "dddd", "eeeee"]), store, batch_size=2
+    )
+
+    assert results == [[1.0, 1.0], [2.0, 1.0], [4.0, 1.0], [5.0, 1.0]]
+    assert [[document.id for document in batch] for batch in store.documents] == [
+        ["id-0", "id-1"],
+        ["id-3"],
+        ["id-4"],
+    ]
+    assert store.documents[0][1].text == "bb"
+    assert store.documents[0][1].vector == [2.0, 1.0]
+    assert store.documents[0][1].attributes == {"title": "title-1"}
+    assert store.overwrites == [True, False, False]
+
+
+async def test_overwrite_disabled_appends_every_batch():
+    store = RecordingVectorStore()
+
+    await _embed(_input(["a", "bb", "ccc"]), store, batch_size=1, overwrite=False)
+
+    assert store.overwrites == [False, False, False]
+
+
+async def test_writer_errors_are_raised():
+    store = RecordingVectorStore(fail_on_write=1)
+
+    with pytest.raises(RuntimeError, match="write failed"):
+        await _embed(_input(["a", "bb", "ccc", "dddd", "eeeee"]), store, batch_size=1)
+
+    assert len(store.documents) == 1
+
+
+def test_load_vectors_defaults_to_load_documents():
+    store = RecordingVectorStore()
+
+    store.load_vectors(
+        ["x", "y"],
+        ["text x", "text y"],
+        np.array([[0.5, 1.0], [1.5, 2.0]], dtype=np.float32),
+        [{"title": "X"}, {"title": "Y"}],
+        overwrite=False,
+    )
+
+    assert store.documents == [
+        [
+            VectorStoreDocument(
+                id="x", text="text x", vector=[0.5, 1.0], attributes={"title": "X"}
+            ),
+            VectorStoreDocument(
+                id="y", text="text y", vector=[1.5, 2.0], attributes={"title": "Y"}
+            ),
+        ]
+    ]
+    assert store.overwrites == [False]
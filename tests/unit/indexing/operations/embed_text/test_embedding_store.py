@@ -0,0 +1,91 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import numpy as np
+
+from graphrag.cache.json_pipeline_cache import JsonPipelineCache
+from graphrag.index.operations.embed_text.embedding_store import (
+    EMBEDDING_STORE_CACHE_NAME,
+    EmbeddingStore,
+)
+from graphrag.index.operations.embed_text.strategies import openai
+from graphrag.storage.file_pipeline_storage import FilePipelineStorage
+
+
+class RecordingEmbeddingModel:
+    def __init__(self):
+        self.batches: list[list[str]] = []
+
+    async def aembed_batch(self, text_list: list[str], **kwargs) -> list[list[float]]:
+        self.batches.append(text_list)
+        return [[len(text) / 3, 0.1, 1 / (len(text) + 7)] for text in text_list]
+
+
+def _cache(tmp_path) -> JsonPipelineCache:
+    return JsonPipelineCache(FilePipelineStorage(root_dir=str(tmp_path)))
+
+
+async def _run(texts: list[str], cache: JsonPipelineCache):
+    model = RecordingEmbeddingModel()
+    manager = Mock()
+    manager.return_value.get_or_create_embedding_model.return_value = model
+    config = SimpleNamespace(
+        model="embedding-model", encoding_model="cl100k_base", type="openai_embedding"
+    )
+    with (
+        patch.object(openai, "ModelManager", manager),
+        patch.object(openai, "LanguageModelConfig", return_value=config),
+    ):
+        result = await openai.run(texts, Mock(), cache, {"llm": {}, "batch_size": 2})
+    return result.embeddings, model.batches
+
+
+async def test_store_round_trips_exact_values(tmp_path):
+    vector = [0.1, 1 / 3, -2.5e-300, 7.0]
+    await EmbeddingStore(_cache(tmp_path), "model").set_many(["text"], [vector])
+
+    stored = await EmbeddingStore(_cache(tmp_path), "model").get_many(["text", "other"])
+
+    assert stored[0].tolist() == vector
+    assert stored[1] is None
+
+
+async def test_store_is_keyed_by_model(tmp_path):
+    await EmbeddingStore(_cache(tmp_path), "small").set_many(["text"], [[1.0, 2.0]])
+
+    assert await EmbeddingStore(_cache(tmp_path), "large").get_many(["text"]) == [None]
+
+
+async def test_unreadable_entries_are_misses(tmp_path):
+    store = EmbeddingStore(_cache(tmp_path), "model")
+    store_cache = _cache(tmp_path).child(EMBEDDING_STORE_CACHE_NAME)
+    await store_cache.set(store.key("text"), "not base64!")
+
+    assert await store.get_many(["text"]) == [None]
+
+
+async def test_only_new_texts_are_embedded(tmp_path):
+    first, first_batches = await _run(["alpha", "beta", "alpha"], _cache(tmp_path))
+    second, second_batches = await _run(["beta", "gamma", "alpha"], _cache(tmp_path))
+
+    # duplicates within a run are embedded once
+    assert first_batches == [["alpha", "beta"]]
+    assert second_batches == [["gamma"]]
+    assert np.array_equal(first[0], first[2])
+    assert np.array_equal(second[0], first[1])
+    assert np.array_equal(second[2], first[0])
+
+
+async def test_unchanged_texts_do_no_embedding_work(tmp_path):
+    texts = ["alpha", "beta", "gamma"]
+    first, _ = await _run(texts, _cache(tmp_path))
+
+    second, batches = await _run(texts, _cache(tmp_path))
+
+    assert batches == []
+    assert [embedding.tolist() for embedding in second] == [
+        embedding.tolist() for embedding in first
+    ]
@@ -0,0 +1,149 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+from graphrag.index.operations.extract_graph.graph_extractor import pack_by_tokens
+from graphrag.index.operations.extract_graph.graph_intelligence_strategy import (
+    run_extract_graph,
+)
+from graphrag.index.operations.extract_graph.typing import Document
+from tests.unit.indexing.verbs.helpers.mock_llm import create_mock_llm
+
+CHUNK_1_RECORDS = """
+("entity"<|>TEST_ENTITY_1<|>COMPANY<|>TEST_ENTITY_1 is a test company)
+##
+("entity"<|>TEST_ENTITY_2<|>PERSON<|>TEST_ENTITY_2 is director of TEST_ENTITY_1)
+##
+("relationship"<|>TEST_ENTITY_1<|>TEST_ENTITY_2<|>TEST_ENTITY_2 is director of TEST_ENTITY_1<|>1)
+"""
+
+CHUNK_2_RECORDS = """
+("entity"<|>TEST_ENTITY_1<|>COMPANY<|>TEST_ENTITY_1 owns TEST_ENTITY_3)
+##
+("entity"<|>TEST_ENTITY_3<|>COMPANY<|>TEST_ENTITY_3 is a subsidiary)
+##
+("relationship"<|>TEST_ENTITY_1<|>TEST_ENTITY_3<|>TEST_ENTITY_1 owns TEST_ENTITY_3<|>2)
+"""
+
+DOCS = [Document("text_1", "unit-1"), Document("text_2", "unit-2")]
+
+
+def _source_ids(result) -> list[tuple[str, str]]:
+    return list(
+        zip(result.entities["source_id"], result.entities["title"], strict=True)
+    )
+
+
+def test_pack_by_tokens():
+    assert pack_by_tokens([100, 200, 300, 50, 900, 10], 500) == [
+        [0, 1],
+        [2, 3],
+        [4],
+        [5],
+    ]
+    assert pack_by_tokens([10, 10], 0) == [[0], [1]]
+    assert pack_by_tokens([], 100) == []
+
+
+async def test_batched_extraction_maps_records_to_their_chunk():
+    model = create_mock_llm(
+        responses=[
+            f"<|CHUNK|> 1{CHUNK_1_RECORDS}##\n<|CHUNK|> 2{CHUNK_2_RECORDS}<|COMPLETE|>"
+        ],
+        name="test_batched_extraction_maps_records_to_their_chunk",
+    )
+    result = await run_extract_graph(
+        model=model,
+        docs=DOCS,
+        entity_types=["company", "person"],
+        callbacks=None,
+        args={"max_gleanings": 0, "batch_max_tokens": 1000},
+    )
+
+    assert model.response_index == 1
+    assert _source_ids(result) == [
+        ("unit-1", "TEST_ENTITY_1"),
+        ("unit-1", "TEST_ENTITY_2"),
+        ("unit-2", "TEST_ENTITY_1"),
+        ("unit-2", "TEST_ENTITY_3"),
+    ]
+    assert result.relationships["source_id"] == ["unit-1", "unit-2"]
+
+
+async def test_batched_extraction_retries_missing_chunks_alone():
+    model = create_mock_llm(
+        responses=[f"<|CHUNK|> 1{CHUNK_1_RECORDS}", CHUNK_2_RECORDS],
+        name="test_batched_extraction_retries_missing_chunks_alone",
+    )
+    result = await run_extract_graph(
+        model=model,
+        docs=DOCS,
+        entity_types=["company", "person"],
+        callbacks=None,
+        args={"max_gleanings": 0, "batch_max_tokens": 1000},
+    )
+
+    assert model.response_index == 2
+    assert _source_ids(result) == [
+        ("unit-1", "TEST_ENTITY_1"),
+        ("unit-1", "TEST_ENTITY_2"),
+        ("unit-2", "TEST_ENTITY_1"),
+        ("unit-2", "TEST_ENTITY_3"),
+    ]
+
+
+async def test_sparse_first_pass_skips_gleaning():
+    model = create_mock_llm(
+        responses=[CHUNK_1_RECORDS, CHUNK_2_RECORDS],
+        name="test_sparse_first_pass_skips_gleaning",
+    )
+    args = {"max_gleanings": 1, "gleaning_min_records": 4}
+    await run_extract_graph(model, DOCS[:1], ["company"], None, args)
+    # three records < 4: no continuation call
+    assert model.response_index == 1
+
+    args["gleaning_min_records"] = 3
+    await run_extract_graph(model, DOCS[:1], ["company"], None, args)
+    assert model.response_index == 3
+
+
+async def test_records_are_merged_per_document():
+    model = create_mock_llm(
+        responses=[
+            """
+("entity"<|>B<|>PERSON<|>B works at A)
+##
+("relationship"<|>A<|>B<|>B works at A<|>1)
+##
+("entity"<|>A<|>COMPANY<|>A is a company)
+##
+("entity"<|>a<|><|>A is based in Paris)
+##
+("relationship"<|>B<|>A<|>B founded A<|>2)
+##
+("relationship"<|>C<|>A<|>C competes with A<|>1)
+""".strip()
+        ],
+        name="test_records_are_merged_per_document",
+    )
+    result = await run_extract_graph(
+        model, DOCS[:1], ["company"], None, {"max_gleanings": 0}
+    )
+
+    assert result.entities == {
+        "title": ["B", "A", "C"],
+        "type": ["PERSON", "COMPANY", ""],
+        "description": [
+            "B works at A",
+            "A is a company\nA is based in Paris",
+            "",
+        ],
+        "source_id": ["unit-1", "unit-1", "unit-1"],
+    }
+    # pairs are undirected and oriented from the entity seen first
+    assert result.relationships == {
+        "source": ["B", "A"],
+        "target": ["A", "C"],
+        "weight": [3.0, 1.0],
+        "description": ["B works at A\nB founded A", "C competes with A"],
+        "source_id": ["unit-1", "unit-1"],
+    }
@@ -0,0 +1,88 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import asyncio
+
+import pandas as pd
+import pytest
+
+import graphrag.data_model.schemas as schemas
+import graphrag.index.operations.summarize_communities.summarize_communities as summarize_module
+from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
+from graphrag.index.utils.derive_from_rows import ParallelizationError
+
+# community 0 is summarized from its sub-communities 1 and 2; 3 fits on its own
+communities = pd.DataFrame({
+    "community": [0, 3, 1, 2],
+    "level": [0, 0, 1, 1],
+    "children": [[1, 2], [], [], []],
+})
+nodes = pd.DataFrame({schemas.COMMUNITY_LEVEL: [0, 0, 1, 1]})
+local_contexts = pd.DataFrame({
+    schemas.COMMUNITY_ID: [0, 3, 1, 2],
+    schemas.COMMUNITY_LEVEL: [0, 0, 1, 1],
+    schemas.CONTEXT_STRING: ["local 0", "local 3", "local 1", "local 2"],
+    schemas.CONTEXT_EXCEED_FLAG: [True, False, False, False],
+})
+
+
+def level_context_builder(
+    report_df, community_hierarchy_df, local_context_df, level, max_tokens
+):
+    context = local_context_df[local_context_df[schemas.COMMUNITY_LEVEL] == level]
+    if report_df is not None and not report_df.empty:
+        context = context.assign(**{
+            schemas.CONTEXT_STRING: "reports: "
+            + ",".join(sorted(report_df[schemas.FULL_CONTENT]))
+        })
+    return context
+
+
+async def _summarize(monkeypatch, events, contexts, delays, failing=()):
+    async def runner(community_id, context, level, callbacks, cache, strategy):
+        events.append(("start", community_id))
+        contexts[community_id] = context
+        await asyncio.sleep(delays.get(community_id, 0))
+        events.append(("end", community_id))
+        if community_id in failing:
+            msg = f"failed {community_id}"
+            raise ValueError(msg)
+        return {
+            "community": community_id,
+            "level": level,
+            "full_content": f"report {community_id}",
+        }
+
+    monkeypatch.setattr(summarize_module, "load_strategy", lambda _: runner)
+    return await summarize_module.summarize_communities(
+        nodes,
+        communities,
+        local_contexts,
+        level_context_builder,
+        NoopWorkflowCallbacks(),
+        None,
+        {"type": "graph_intelligence"},
+        max_input_length=100,
+        num_threads=4,
+    )
+
+
+async def test_parent_waits_only_for_its_sub_communities(monkeypatch):
+    events, contexts = [], {}
+    reports = await _summarize(monkeypatch, events, contexts, {2: 0.05})
+
+    # no level barrier: community 3 finishes while level 1 is still running
+    assert events.index(("end", 3)) < events.index(("end", 2))
+    # community 0 starts as soon as both of its sub-communities are done
+    assert events.index(("start", 0)) > events.index(("end", 2))
+    assert contexts[0] == "reports: report 1,report 2"
+    assert contexts[3] == "local 3"
+    assert reports["community"].tolist() == [1, 2, 0, 3]
+
+
+async def test_failed_sub_community_does_not_block_parent(monkeypatch):
+    events, contexts = [], {}
+    with pytest.raises(ParallelizationError):
+        await _summarize(monkeypatch, events, contexts, {}, failing={1})
+
+    assert ("end", 0) in events
+    assert contexts[0] == "reports: report 2"
@@ -0,0 +1,75 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+from graphrag.index.operations.summarize_descriptions.description_summary_extractor import (
+    SummarizeExtractor,
+)
+from graphrag.index.operations.summarize_descriptions.summarize_descriptions import (
+    _count_description_tokens,
+    _trivial_summary,
+)
+
+
+def test_trivial_summary_empty():
+    assert _trivial_summary([], {}, 500) == ""
+
+
+def test_trivial_summary_single_description():
+    counts = {"A long description": 10_000}
+    assert _trivial_summary(["A long description"], counts, 5) == "A long description"
+
+
+def test_trivial_summary_joins_short_descriptions():
+    counts = {"A is a company.": 5, "A is based in B.": 6}
+    assert (
+        _trivial_summary(["A is a company.", "A is based in B."], counts, 11)
+        == "A is a company. A is based in B."
+    )
+
+
+def test_trivial_summary_requires_llm_over_limit():
+    counts = {"A is a company.": 5, "A is based in B.": 6}
+    assert _trivial_summary(["A is a company.", "A is based in B."], counts, 10) is None
+
+
+def test_count_description_tokens_deduplicates():
+    counts = _count_description_tokens([
+        ("A", ["one", "two"]),
+        (("A", "B"), ["two", "three"]),
+    ])
+    assert set(counts) == {"one", "two", "three"}
+    assert all(count > 0 for count in counts.values())
+
+
+def test_count_description_tokens_uses_the_configured_encoding():
+    with patch(
+        "graphrag.index.operations.summarize_descriptions.summarize_descriptions.get_tokenizer"
+    ) as get_tokenizer:
+        get_tokenizer.return_value.count_batch.return_value = [1]
+        _count_description_tokens([("A", ["one"])], "o200k_base")
+
+    get_tokenizer.assert_called_once_with("o200k_base")
+
+
+async def test_extractor_budgets_with_precomputed_counts():
+    model = Mock()
+    model.achat = AsyncMock(
+        return_value=SimpleNamespace(output=SimpleNamespace(content="summary"))
+    )
+    descriptions = ["A is a company.", "A is based in B.", "A makes cars."]
+    # counts over the input budget force a partial summary before the last one
+    extractor = SummarizeExtractor(
+        model_invoker=model,
+        summarization_prompt="{entity_name} {description_list}",
+        max_input_tokens=4_000,
+        token_counts=dict.fromkeys(descriptions, 3_000),
+    )
+
+    result = await extractor("A", descriptions)
+
+    assert result.description == "summary"
+    assert model.achat.call_count == 2
+    assert "summary" in model.achat.call_args_list[1].args[0]
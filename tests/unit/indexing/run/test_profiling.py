@@ -0,0 +1,57 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import asyncio
+
+import pandas as pd
+
+from graphrag.index.run.profiling import (
+    current_profile,
+    profile_workflow,
+    record_llm_wait,
+    record_table,
+    stop_memory_profiling,
+)
+
+
+def test_profile_records_tables_and_wait_time():
+    stats = {}
+    with profile_workflow("test", stats):
+        record_table("entities", pd.DataFrame({"a": [1, 2, 3]}), output=False)
+        record_table("entities", pd.DataFrame({"a": [1]}), output=True)
+        record_llm_wait(0.5)
+
+    assert stats["overall"] >= 0
+    assert stats["tables_in"]["entities"]["rows"] == 3
+    assert stats["tables_out"]["entities"]["rows"] == 1
+    assert stats["llm_wait_time"] == 0.5
+    assert stats["llm_cache_hit_rate"] == 0.0
+    assert current_profile() is None
+
+
+def test_profile_is_inherited_by_tasks():
+    stats = {}
+
+    async def call_llm():
+        await asyncio.sleep(0)
+        profile = current_profile()
+        assert profile is not None
+        profile.llm_calls += 1
+        profile.llm_cache_hits += 1
+
+    async def run():
+        with profile_workflow("test", stats):
+            await asyncio.gather(*[asyncio.create_task(call_llm()) for _ in range(4)])
+
+    asyncio.run(run())
+    assert stats["llm_calls"] == 4
+    assert stats["llm_cache_hit_rate"] == 1.0
+
+
+def test_memory_profile_reports_allocators():
+    stats = {}
+    with profile_workflow("test", stats, memory_profile=True):
+        _ = [str(i) for i in range(10_000)]
+    stop_memory_profiling()
+
+    assert stats["tracemalloc_peak"] > 0
+    assert len(stats["top_allocators"]) > 0
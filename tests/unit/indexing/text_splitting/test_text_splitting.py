@@ -11,6 +11,8 @@ from graphrag.index.text_splitting.text_splitting import (
     NoopTextSplitter,
     Tokenizer,
     TokenTextSplitter,
+    chunk_windows,
+    split_grouped_texts_on_tokens,
     split_multiple_texts_on_tokens,
     split_single_text_on_tokens,
 )
@@ -202,3 +204,67 @@ def test_split_single_text_on_tokens_no_overlap():
 
     result = split_single_text_on_tokens(text=text, tokenizer=tokenizer)
     assert result == expected_splits
+
+
+def test_split_multiple_texts_on_tokens_spans_documents():
+    mocked_tokenizer = MockTokenizer()
+    tokenizer = Tokenizer(
+        chunk_overlap=2,
+        tokens_per_chunk=5,
+        decode=mocked_tokenizer.decode,
+        encode=mocked_tokenizer.encode,
+    )
+
+    result = split_multiple_texts_on_tokens(["abcd", "", "efg"], tokenizer, tick=None)
+
+    assert [(c.text_chunk, c.source_doc_indices, c.n_tokens) for c in result] == [
+        ("abcde", [0, 2], 5),
+        ("defg", [0, 2], 4),
+        ("g", [2], 1),
+    ]
+
+
+def test_chunk_windows():
+    groups, starts, ends = chunk_windows([7, 0, 3], [4, 4, 2], 1)
+
+    assert groups.tolist() == [0, 0, 0, 2, 2, 2]
+    assert starts.tolist() == [0, 3, 6, 7, 8, 9]
+    assert ends.tolist() == [4, 7, 7, 9, 10, 10]
+
+    with pytest.raises(ValueError, match="overlap"):
+        chunk_windows([3], 2, 2)
+
+
+def test_split_grouped_texts_on_tokens_matches_per_group_split():
+    enc = tiktoken.get_encoding("cl100k_base")
+    groups = [
+        ["This is a test text, meaning to be taken seriously.", "A second text."],
+        [],
+        ["", "Only this test only."],
+    ]
+
+    result = split_grouped_texts_on_tokens(
+        groups, [6, 6, 4], 2, "cl100k_base", num_threads=2
+    )
+
+    expected = []
+    for group_index, (texts, size) in enumerate(zip(groups, [6, 6, 4], strict=True)):
+        tokenizer = Tokenizer(
+            chunk_overlap=2, tokens_per_chunk=size, decode=enc.decode, encode=enc.encode
+        )
+        expected.extend(
+            (group_index, chunk.source_doc_indices, chunk.text_chunk, chunk.n_tokens)
+            for chunk in split_multiple_texts_on_tokens(texts, tokenizer, tick=None)
+        )
+    assert (
+        list(
+            zip(
+                result.group_indices.tolist(),
+                result.doc_indices,
+                result.texts,
+                result.n_tokens.tolist(),
+                strict=True,
+            )
+        )
+        == expected
+    )
@@ -0,0 +1,185 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pandas as pd
+
+from graphrag.data_model.schemas import COMMUNITY_REPORTS_FINAL_COLUMNS
+from graphrag.index.update.communities import (
+    _merge_regenerated_community_reports,
+    _recluster_changed_region,
+)
+from graphrag.index.update.incremental_index import _update_communities_locally
+from graphrag.storage.memory_pipeline_storage import MemoryPipelineStorage
+from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
+
+# A-B-C and X-Y were clustered before; the delta links a new entity D to C.
+ENTITIES = pd.DataFrame({
+    "id": ["a", "b", "c", "d", "x", "y"],
+    "title": ["A", "B", "C", "D", "X", "Y"],
+})
+RELATIONSHIPS = pd.DataFrame({
+    "id": ["ab", "bc", "cd", "xy"],
+    "source": ["A", "B", "C", "X"],
+    "target": ["B", "C", "D", "Y"],
+    "weight": 1.0,
+    "text_unit_ids": [["t1"], ["t1"], ["t2"], ["t3"]],
+})
+# the region A-B-C-D re-clusters into a new root with children {A, B} and {C, D}
+CLUSTERS = [
+    (0, 10, -1, ["A", "B", "C", "D"]),
+    (1, 11, 10, ["A", "B"]),
+    (1, 12, 10, ["C", "D"]),
+]
+
+
+def _old_communities() -> pd.DataFrame:
+    return pd.DataFrame({
+        "id": ["id-0", "id-1", "id-2", "id-3"],
+        "human_readable_id": [0, 1, 2, 3],
+        "community": [0, 1, 2, 3],
+        "level": [0, 0, 1, 1],
+        "parent": [-1, -1, 0, 0],
+        "children": [[2, 3], [], [], []],
+        "title": [f"Community {i}" for i in range(4)],
+        "entity_ids": [["a", "b", "c"], ["x", "y"], ["a", "b"], ["c"]],
+        "relationship_ids": [["ab", "bc"], ["xy"], ["ab"], []],
+        "text_unit_ids": [["t1"], ["t3"], ["t1"], []],
+        "period": "2024-01-01",
+        "size": [3, 2, 2, 1],
+    })
+
+
+def _reports(communities: list[int], summary: str) -> pd.DataFrame:
+    return pd.DataFrame({
+        "id": [f"report-{community}" for community in communities],
+        "human_readable_id": communities,
+        "community": communities,
+        "level": 0,
+        "parent": -1,
+        "children": [[] for _ in communities],
+        "title": [f"Community {community}" for community in communities],
+        "summary": [f"{summary} {community}" for community in communities],
+        "full_content": "",
+        "rank": 1.0,
+        "rating_explanation": "",
+        "findings": [[] for _ in communities],
+        "full_content_json": "",
+        "period": "2024-01-01",
+        "size": 1,
+    }).loc[:, COMMUNITY_REPORTS_FINAL_COLUMNS]
+
+
+def _recluster() -> tuple[pd.DataFrame, set[int]]:
+    with patch(
+        "graphrag.index.update.communities.cluster_graph", return_value=CLUSTERS
+    ) as cluster_graph:
+        result = _recluster_changed_region(
+            _old_communities(),
+            ENTITIES,
+            RELATIONSHIPS,
+            {"C", "D"},
+            max_cluster_size=10,
+            use_lcc=False,
+        )
+    assert sorted(cluster_graph.call_args.args[0].nodes) == ["A", "B", "C", "D"]
+    return result
+
+
+def _assert_consistent_hierarchy(communities: pd.DataFrame) -> None:
+    ids = set(communities["community"])
+    assert communities["community"].is_unique
+    assert communities["id"].is_unique
+    parent_of = dict(zip(communities["community"], communities["parent"], strict=True))
+    for community, children in zip(
+        communities["community"], communities["children"], strict=True
+    ):
+        assert parent_of[community] in ids | {-1}
+        assert all(parent_of[child] == community for child in children)
+    for community, parent in parent_of.items():
+        if parent != -1:
+            assert community in set(
+                communities.loc[communities["community"] == parent, "children"].iloc[0]
+            )
+
+
+def test_recluster_only_touches_the_changed_region():
+    communities, changed = _recluster()
+
+    _assert_consistent_hierarchy(communities)
+    by_id = communities.set_index("community")
+    # the untouched X-Y community is kept as is
+    assert by_id.loc[1, "id"] == "id-1"
+    assert by_id.loc[1, "period"] == "2024-01-01"
+    # {A, B} keeps its id, and only gets a new parent
+    assert by_id.loc[2, "id"] == "id-2"
+    assert by_id.loc[2, "parent"] == 4
+    # the new root and {C, D} get fresh ids above the previous maximum
+    assert sorted(by_id.index) == [1, 2, 4, 5]
+    assert sorted(by_id.loc[5, "entity_ids"]) == ["c", "d"]
+    assert changed == {4, 5}
+
+
+def test_regenerated_reports_replace_only_changed_communities():
+    communities, changed = _recluster()
+    regenerated = _reports(sorted(changed), "new")
+
+    reports = _merge_regenerated_community_reports(
+        _reports([0, 1, 2, 3], "old"), regenerated, communities
+    )
+
+    assert reports["community"].is_unique
+    assert set(reports["community"]) == set(communities["community"])
+    summaries = reports.set_index("community")["summary"].to_dict()
+    assert summaries == {1: "old 1", 2: "old 2", 4: "new 4", 5: "new 5"}
+    # kept reports follow the refreshed hierarchy
+    assert reports.set_index("community").loc[2, "parent"] == 4
+    assert reports["human_readable_id"].tolist() == reports["community"].tolist()
+
+
+async def test_update_communities_locally_regenerates_changed_reports():
+    previous, delta, output = (
+        MemoryPipelineStorage(),
+        MemoryPipelineStorage(),
+        MemoryPipelineStorage(),
+    )
+    await write_table_to_storage(_old_communities(), "communities", previous)
+    await write_table_to_storage(
+        _reports([0, 1, 2, 3], "old"), "community_reports", previous
+    )
+    await write_table_to_storage(ENTITIES.iloc[[3]], "entities", delta)
+    await write_table_to_storage(RELATIONSHIPS.iloc[[2]], "relationships", delta)
+    config = Mock()
+    config.cluster_graph.use_lcc = False
+    config.extract_claims.enabled = False
+    config.community_reports.context_workers = 3
+
+    def create_reports(communities, **kwargs):
+        return _reports(sorted(communities["community"]), "new")
+
+    create_community_reports = AsyncMock(side_effect=create_reports)
+    with (
+        patch("graphrag.index.update.communities.cluster_graph", return_value=CLUSTERS),
+        patch(
+            "graphrag.index.update.incremental_index.create_community_reports",
+            create_community_reports,
+        ),
+    ):
+        reports = await _update_communities_locally(
+            previous, delta, output, ENTITIES, RELATIONSHIPS, config, Mock(), Mock()
+        )
+
+    regenerated = create_community_reports.call_args.kwargs["communities"]
+    assert create_community_reports.call_args.kwargs["context_workers"] == 3
+    assert sorted(regenerated["community"]) == [4, 5]
+    communities = await load_table_from_storage("communities", output)
+    _assert_consistent_hierarchy(communities)
+    assert reports.set_index("community")["summary"].to_dict() == {
+        1: "old 1",
+        2: "old 2",
+        4: "new 4",
+        5: "new 5",
+    }
+    stored = await load_table_from_storage("community_reports", output)
+    assert stored["community"].tolist() == reports["community"].tolist()
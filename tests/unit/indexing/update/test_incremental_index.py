@@ -0,0 +1,153 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pandas as pd
+
+from graphrag.index.update.incremental_index import (
+    _key_mask,
+    _update_entities_and_relationships,
+)
+from graphrag.storage.memory_pipeline_storage import MemoryPipelineStorage
+from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
+
+
+def _entities(rows: list[tuple[str, str, str]]) -> pd.DataFrame:
+    return pd.DataFrame({
+        "id": [row[0] for row in rows],
+        "human_readable_id": range(len(rows)),
+        "title": [row[1] for row in rows],
+        "type": "PERSON",
+        "description": [row[2] for row in rows],
+        "text_unit_ids": [[f"t-{row[0]}"] for row in rows],
+        "frequency": 1,
+        "degree": 1,
+        "x": 0,
+        "y": 0,
+    })
+
+
+def _relationships(rows: list[tuple[str, str, str, str]]) -> pd.DataFrame:
+    return pd.DataFrame({
+        "id": [row[0] for row in rows],
+        "human_readable_id": range(len(rows)),
+        "source": [row[1] for row in rows],
+        "target": [row[2] for row in rows],
+        "description": [row[3] for row in rows],
+        "weight": 1.0,
+        "combined_degree": 2,
+        "text_unit_ids": [[f"t-{row[0]}"] for row in rows],
+    })
+
+
+def _summarize(entities_df, relationships_df, **kwargs):
+    return (
+        pd.DataFrame({
+            "title": entities_df["title"],
+            "description": [
+                "summary of " + " + ".join(d) for d in entities_df["description"]
+            ],
+        }),
+        pd.DataFrame({
+            "source": relationships_df["source"],
+            "target": relationships_df["target"],
+            "description": [
+                "summary of " + " + ".join(d) for d in relationships_df["description"]
+            ],
+        }),
+    )
+
+
+def test_key_mask_matches_composite_keys():
+    relationships = pd.DataFrame({"source": ["A", "A", "B"], "target": ["B", "C", "A"]})
+    other = pd.DataFrame({"source": ["B", "A"], "target": ["A", "C"]})
+
+    assert _key_mask(relationships, other, ["source", "target"]).tolist() == [
+        False,
+        True,
+        True,
+    ]
+
+
+async def test_only_changed_entities_and_relationships_are_resummarized():
+    previous, delta, output = (
+        MemoryPipelineStorage(),
+        MemoryPipelineStorage(),
+        MemoryPipelineStorage(),
+    )
+    await write_table_to_storage(
+        _entities([("e1", "A", "A old"), ("e2", "B", "B old")]),
+        "entities",
+        previous,
+    )
+    await write_table_to_storage(
+        _relationships([("r1", "A", "B", "A-B old"), ("r2", "B", "A", "B-A old")]),
+        "relationships",
+        previous,
+    )
+    # B changes, C is new, A is untouched; B->A changes, B->C is new, A->B is untouched
+    await write_table_to_storage(
+        _entities([("e3", "B", "B new"), ("e4", "C", "C new")]), "entities", delta
+    )
+    await write_table_to_storage(
+        _relationships([("r3", "B", "A", "B-A new"), ("r4", "B", "C", "B-C new")]),
+        "relationships",
+        delta,
+    )
+    summarize = AsyncMock(side_effect=_summarize)
+
+    with patch(
+        "graphrag.index.update.incremental_index.summarize_descriptions", summarize
+    ):
+        entities, relationships, id_mapping = await _update_entities_and_relationships(
+            previous, delta, output, Mock(), Mock(), Mock()
+        )
+
+    summarized = summarize.call_args.kwargs
+    assert summarized["entities_df"]["title"].tolist() == ["B", "C"]
+    assert summarized["relationships_df"][["source", "target"]].to_numpy().tolist() == [
+        ["B", "A"],
+        ["B", "C"],
+    ]
+    assert dict(zip(entities["title"], entities["description"], strict=True)) == {
+        "A": "A old",
+        "B": "summary of B old + B new",
+        "C": "summary of C new",
+    }
+    assert relationships.set_index(["source", "target"])["description"].to_dict() == {
+        ("A", "B"): "A-B old",
+        ("B", "A"): "summary of B-A old + B-A new",
+        ("B", "C"): "summary of B-C new",
+    }
+    assert id_mapping == {"e3": "e2"}
+    stored = await load_table_from_storage("entities", output)
+    assert stored["description"].tolist() == entities["description"].tolist()
+
+
+async def test_unchanged_delta_skips_summarization():
+    previous, delta, output = (
+        MemoryPipelineStorage(),
+        MemoryPipelineStorage(),
+        MemoryPipelineStorage(),
+    )
+    await write_table_to_storage(
+        _entities([("e1", "A", "A old")]), "entities", previous
+    )
+    await write_table_to_storage(
+        _relationships([("r1", "A", "B", "A-B old")]), "relationships", previous
+    )
+    await write_table_to_storage(_entities([]), "entities", delta)
+    await write_table_to_storage(_relationships([]), "relationships", delta)
+    summarize = AsyncMock(side_effect=_summarize)
+
+    with patch(
+        "graphrag.index.update.incremental_index.summarize_descriptions", summarize
+    ):
+        entities, relationships, _ = await _update_entities_and_relationships(
+            previous, delta, output, Mock(), Mock(), Mock()
+        )
+
+    summarize.assert_not_called()
+    assert entities["description"].tolist() == ["A old"]
+    assert relationships["description"].tolist() == ["A-B old"]
@@ -41,9 +41,9 @@ class TestRunChain(unittest.IsolatedAsyncioTestCase):
 
         # self.assertItemsEqual isn't available yet, or I am just silly
         # so we sort the lists and compare them
-        assert sorted(["TEST_ENTITY_1", "TEST_ENTITY_2", "TEST_ENTITY_3"]) == sorted([
-            entity["title"] for entity in results.entities
-        ])
+        assert sorted(["TEST_ENTITY_1", "TEST_ENTITY_2", "TEST_ENTITY_3"]) == sorted(
+            results.entities["title"]
+        )
 
     async def test_run_extract_graph_multiple_documents_correct_entities_returned(
         self,
@@ -80,9 +80,9 @@ class TestRunChain(unittest.IsolatedAsyncioTestCase):
 
         # self.assertItemsEqual isn't available yet, or I am just silly
         # so we sort the lists and compare them
-        assert sorted(["TEST_ENTITY_1", "TEST_ENTITY_2", "TEST_ENTITY_3"]) == sorted([
-            entity["title"] for entity in results.entities
-        ])
+        assert sorted(["TEST_ENTITY_1", "TEST_ENTITY_2", "TEST_ENTITY_3"]) == sorted(
+            set(results.entities["title"])
+        )
 
     async def test_run_extract_graph_multiple_documents_correct_edges_returned(self):
         results = await run_extract_graph(
@@ -117,11 +117,15 @@ class TestRunChain(unittest.IsolatedAsyncioTestCase):
 
         # self.assertItemsEqual isn't available yet, or I am just silly
         # so we sort the lists and compare them
-        graph = results.graph
-        assert graph is not None, "No graph returned!"
-
         # convert to strings for more visual comparison
-        edges_str = sorted([f"{edge[0]} -> {edge[1]}" for edge in graph.edges])
+        edges_str = sorted([
+            f"{source} -> {target}"
+            for source, target in zip(
+                results.relationships["source"],
+                results.relationships["target"],
+                strict=True,
+            )
+        ])
         assert edges_str == sorted([
             "TEST_ENTITY_1 -> TEST_ENTITY_2",
             "TEST_ENTITY_1 -> TEST_ENTITY_3",
@@ -160,19 +164,15 @@ class TestRunChain(unittest.IsolatedAsyncioTestCase):
             ),
         )
 
-        graph = results.graph
-        assert graph is not None, "No graph returned!"
+        source_ids: dict[str, list[str]] = {}
+        for title, source_id in zip(
+            results.entities["title"], results.entities["source_id"], strict=True
+        ):
+            source_ids.setdefault(title, []).append(source_id)
 
-        # TODO: The edges might come back in any order, but we're assuming they're coming
-        # back in the order that we passed in the docs, that might not be true
-        assert (
-            graph.nodes["TEST_ENTITY_3"].get("source_id") == "2"
-        )  # TEST_ENTITY_3 should be in just 2
-        assert (
-            graph.nodes["TEST_ENTITY_2"].get("source_id") == "1"
-        )  # TEST_ENTITY_2 should be in just 1
-        ids_str = graph.nodes["TEST_ENTITY_1"].get("source_id") or ""
-        assert sorted(ids_str.split(",")) == sorted([
+        assert source_ids["TEST_ENTITY_3"] == ["2"]  # TEST_ENTITY_3 should be in just 2
+        assert source_ids["TEST_ENTITY_2"] == ["1"]  # TEST_ENTITY_2 should be in just 1
+        assert sorted(source_ids["TEST_ENTITY_1"]) == sorted([
             "1",
             "2",
         ])  # TEST_ENTITY_1 should be 1 and 2
@@ -210,14 +210,10 @@ class TestRunChain(unittest.IsolatedAsyncioTestCase):
             ),
         )
 
-        graph = results.graph
-        assert graph is not None, "No graph returned!"
-        edges = list(graph.edges(data=True))
-
         # should only have 2 edges
-        assert len(edges) == 2
+        assert len(results.relationships["source"]) == 2
 
         # Sort by source_id for consistent ordering
-        edge_source_ids = sorted([edge[2].get("source_id", "") for edge in edges])
+        edge_source_ids = sorted(results.relationships["source_id"])
         assert edge_source_ids[0].split(",") == ["1"]
         assert edge_source_ids[1].split(",") == ["2"]
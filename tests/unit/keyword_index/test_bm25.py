@@ -0,0 +1,96 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import pytest
+
+from graphrag.keyword_index.bm25 import BM25Index
+from graphrag.keyword_index.fusion import reciprocal_rank_fusion
+from graphrag.keyword_index.tokenizers import (
+    TokenizerFactory,
+    cjk_tokenize,
+    simple_tokenize,
+)
+
+DOC_IDS = ["d1", "d2", "d3"]
+TEXTS = [
+    "北京大学位于北京海淀区",
+    "上海交通大学发布了 X-200 型号",
+    "The X-100 sensor ships in May",
+]
+
+
+def test_simple_tokenize():
+    assert simple_tokenize("Hello, World 42") == ["hello", "world", "42"]
+
+
+def test_cjk_tokenize():
+    assert cjk_tokenize("北京大学 X-200") == [
+        "北",
+        "京",
+        "大",
+        "学",
+        "北京",
+        "京大",
+        "大学",
+        "x-200",
+    ]
+
+
+def test_cjk_tokenize_keeps_other_scripts():
+    assert cjk_tokenize("Café Müller") == ["café", "müller"]
+    # decomposed accents are composed before matching
+    assert cjk_tokenize("Cafe\u0301") == ["café"]
+    assert cjk_tokenize("Пётр Чайковский") == ["пётр", "чайковский"]
+    assert cjk_tokenize("Αθήνα 東京") == ["αθήνα", "東", "京", "東京"]
+
+
+def test_search_matches_accented_and_cyrillic_queries():
+    index = BM25Index.build(
+        ["d1", "d2", "d3"],
+        ["Café Müller opened in Köln", "Пётр Чайковский родился в Воткинске", "北京"],
+    )
+    assert [doc_id for doc_id, _ in index.search("müller")] == ["d1"]
+    assert [doc_id for doc_id, _ in index.search("Чайковский")] == ["d2"]
+
+
+def test_tokenizer_factory():
+    TokenizerFactory.register("whitespace", str.split)
+    assert TokenizerFactory.get_tokenizer("whitespace")("a b") == ["a", "b"]
+    assert TokenizerFactory.get_tokenizer("cjk") is cjk_tokenize
+    with pytest.raises(ValueError, match="Unknown keyword tokenizer"):
+        TokenizerFactory.get_tokenizer("unknown")
+
+
+def test_search_ranks_exact_matches():
+    index = BM25Index.build(DOC_IDS, TEXTS)
+    assert [doc_id for doc_id, _ in index.search("北京")] == ["d1"]
+    assert [doc_id for doc_id, _ in index.search("x-200 型号")] == ["d2"]
+    assert index.search("大学", k=1)[0][0] in {"d1", "d2"}
+    assert index.search("no match") == []
+
+
+def test_search_scores_descending():
+    index = BM25Index.build(DOC_IDS, TEXTS)
+    scores = [score for _, score in index.search("大学 北京 x-100")]
+    assert scores == sorted(scores, reverse=True)
+    assert len(scores) == 3
+
+
+def test_round_trip():
+    index = BM25Index.build(DOC_IDS, TEXTS, tokenizer="simple")
+    loaded = BM25Index.from_bytes(index.to_bytes())
+    assert loaded.tokenizer == "simple"
+    assert len(loaded) == 3
+    assert loaded.search("sensor") == index.search("sensor")
+
+
+def test_empty_index():
+    index = BM25Index.build([], [])
+    assert index.search("anything") == []
+    assert len(BM25Index.from_bytes(index.to_bytes())) == 0
+
+
+def test_reciprocal_rank_fusion():
+    assert reciprocal_rank_fusion([["a", "b"], ["b", "c"]]) == ["b", "a", "c"]
+    assert reciprocal_rank_fusion([["a"], ["b"]]) == ["a", "b"]
+    assert reciprocal_rank_fusion([["a", "b", "c"], []], limit=2) == ["a", "b"]
@@ -0,0 +1,156 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+from graphrag.language_model.scheduler import (
+    LLMQuota,
+    LLMScheduler,
+    RequestPriority,
+    llm_priority,
+    quota_key,
+    rate_limit_retry_after,
+)
+
+
+class RateLimitError(Exception):
+    def __init__(self, headers: dict):
+        super().__init__("429 Too Many Requests")
+        self.status_code = 429
+        self.response = SimpleNamespace(headers=headers)
+
+
+async def test_concurrency_is_capped():
+    quota = LLMQuota("test", max_concurrency=2)
+    running = 0
+    peak = 0
+
+    async def call():
+        nonlocal running, peak
+        async with quota.request():
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    await asyncio.gather(*[call() for _ in range(8)])
+    assert peak == 2
+    assert quota.stats()["in_flight"] == 0
+
+
+async def test_interactive_requests_go_first():
+    quota = LLMQuota("test", max_concurrency=1)
+    order = []
+    release = asyncio.Event()
+
+    async def hold():
+        async with quota.request():
+            await release.wait()
+
+    async def call(name, priority):
+        async with quota.request(priority=priority):
+            order.append(name)
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    background = [
+        asyncio.create_task(call(f"background-{i}", RequestPriority.background))
+        for i in range(3)
+    ]
+    await asyncio.sleep(0)
+    with llm_priority(RequestPriority.interactive):
+        interactive = asyncio.create_task(call("interactive", None))
+    await asyncio.sleep(0)
+    assert quota.stats()["waiting_interactive"] == 1
+
+    release.set()
+    await asyncio.gather(holder, interactive, *background)
+    assert order == ["interactive", "background-0", "background-1", "background-2"]
+
+
+async def test_rate_limit_halves_limit_once_and_recovers():
+    quota = LLMQuota("test", max_concurrency=8)
+    async with quota.request() as first, quota.request() as second:
+        first.record_error(RateLimitError({"retry-after-ms": "10"}))
+        # sent before the decrease, so it does not halve the limit again
+        second.record_error(RateLimitError({}))
+    assert quota.stats()["concurrency_limit"] == 4
+    assert quota.stats()["rate_limited"] == 2
+
+    for _ in range(40):
+        async with quota.request():
+            pass
+    assert quota.stats()["concurrency_limit"] == 8
+
+
+async def test_rate_limit_pauses_dispatch():
+    quota = LLMQuota("test", max_concurrency=4)
+    async with quota.request() as permit:
+        permit.record_error(RateLimitError({"retry-after": "0.1"}))
+    start = time.perf_counter()
+    async with quota.request():
+        pass
+    assert time.perf_counter() - start >= 0.08
+
+
+async def test_token_budget_delays_requests():
+    quota = LLMQuota("test", max_concurrency=4, tokens_per_minute=6_000)
+    async with quota.request(tokens=6_000):
+        pass
+    start = time.perf_counter()
+    # the bucket refills at 100 tokens per second
+    async with quota.request(tokens=10):
+        pass
+    assert time.perf_counter() - start >= 0.08
+
+
+async def test_cache_hits_refund_the_reservation():
+    quota = LLMQuota("test", max_concurrency=4, tokens_per_minute=6_000)
+    async with quota.request(tokens=6_000) as permit:
+        permit.record_cache_hit()
+    start = time.perf_counter()
+    async with quota.request(tokens=6_000):
+        pass
+    assert time.perf_counter() - start < 0.05
+
+
+def test_sync_and_async_callers_share_the_quota():
+    quota = LLMQuota("test", max_concurrency=1)
+    events = []
+
+    def sync_call():
+        with quota.request_sync():
+            events.append("sync-start")
+            time.sleep(0.05)
+            events.append("sync-end")
+
+    async def async_call():
+        await asyncio.sleep(0.01)
+        async with quota.request():
+            events.append("async")
+
+    thread = threading.Thread(target=sync_call)
+    thread.start()
+    asyncio.run(async_call())
+    thread.join()
+    assert events == ["sync-start", "sync-end", "async"]
+
+
+def test_quota_is_shared_and_tightened():
+    LLMScheduler.reset()
+    key = quota_key("https://api.example.com", "secret", "model")
+    assert "secret" not in key
+    quota = LLMScheduler.quota(key, max_concurrency=10, tokens_per_minute=1_000)
+    assert LLMScheduler.quota(key, max_concurrency=4) is quota
+    assert quota.max_concurrency == 4
+    assert LLMScheduler.quota(key).max_concurrency == 4
+    LLMScheduler.reset()
+
+
+def test_rate_limit_retry_after():
+    assert rate_limit_retry_after(ValueError("boom")) is None
+    assert rate_limit_retry_after(RateLimitError({})) == 0.0
+    assert rate_limit_retry_after(RateLimitError({"retry-after": "2"})) == 2.0
+    assert rate_limit_retry_after(RateLimitError({"retry-after-ms": "250"})) == 0.25
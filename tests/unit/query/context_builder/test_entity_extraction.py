@@ -3,8 +3,10 @@
 
 from typing import Any
 
+from graphrag.config.enums import RetrievalMode
 from graphrag.data_model.entity import Entity
 from graphrag.data_model.types import TextEmbedder
+from graphrag.keyword_index.bm25 import BM25Index
 from graphrag.language_model.manager import ModelManager
 from graphrag.query.context_builder.entity_extraction import (
     EntityVectorStoreKey,
@@ -185,3 +187,51 @@ def test_map_query_to_entities():
             rank=3,
         ),
     ]
+
+
+class FailingEmbedder:
+    def embed(self, text: str) -> list[float]:
+        msg = "keyword retrieval must not embed the query"
+        raise AssertionError(msg)
+
+
+def test_map_query_to_entities_keyword_modes():
+    entities = [
+        Entity(id="e1", short_id="sid1", title="北京大学", rank=1),
+        Entity(id="e2", short_id="sid2", title="X-200", rank=2),
+        Entity(id="e3", short_id="sid3", title="t333", rank=3),
+    ]
+    keyword_index = BM25Index.build(
+        [entity.id for entity in entities], [entity.title for entity in entities]
+    )
+    vectorstore = MockBaseVectorStore([
+        VectorStoreDocument(id=entity.id, text=entity.title, vector=None)
+        for entity in entities
+    ])
+
+    assert map_query_to_entities(
+        query="x-200",
+        text_embedding_vectorstore=vectorstore,
+        text_embedder=FailingEmbedder(),  # type: ignore
+        all_entities_dict={entity.id: entity for entity in entities},
+        k=1,
+        oversample_scaler=1,
+        keyword_index=keyword_index,
+        retrieval_mode=RetrievalMode.Keyword,
+    ) == [entities[1]]
+
+    hybrid = map_query_to_entities(
+        query="北京",
+        text_embedding_vectorstore=vectorstore,
+        text_embedder=ModelManager().get_or_create_embedding_model(
+            model_type="mock_embedding", name="mock"
+        ),
+        all_entities_dict={entity.id: entity for entity in entities},
+        k=3,
+        oversample_scaler=1,
+        keyword_index=keyword_index,
+        retrieval_mode=RetrievalMode.Hybrid,
+    )
+    # the keyword match is fused into the top of the vector ranking
+    assert hybrid[0] == entities[0]
+    assert sorted(entity.id for entity in hybrid) == ["e1", "e2", "e3"]
@@ -0,0 +1,39 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import asyncio
+import threading
+
+from graphrag.query.context_builder.executor import ContextBuildExecutor
+
+
+async def test_run_returns_result_off_the_event_loop():
+    executor = ContextBuildExecutor(max_workers=2)
+    loop_thread = threading.get_ident()
+
+    result, queue_time = await executor.run(lambda x: (x, threading.get_ident()), 1)
+
+    assert result[0] == 1
+    assert result[1] != loop_thread
+    assert queue_time >= 0
+    assert executor.stats()["completed"] == 1
+    executor.shutdown()
+
+
+async def test_run_bounds_concurrency():
+    executor = ContextBuildExecutor(max_workers=1)
+    release = threading.Event()
+
+    first = asyncio.ensure_future(executor.run(release.wait, 5))
+    second = asyncio.ensure_future(executor.run(lambda: "done"))
+    await asyncio.sleep(0.05)
+
+    stats = executor.stats()
+    assert stats["running"] == 1
+    assert stats["queued"] == 1
+
+    release.set()
+    assert (await second)[0] == "done"
+    await first
+    assert executor.stats()["queued"] == 0
+    executor.shutdown()
@@ -0,0 +1,116 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import sys
+
+import numpy as np
+import pandas as pd
+
+from graphrag.query.input.loaders.dfs import (
+    read_community_reports,
+    read_entities,
+    read_relationships,
+    read_text_units,
+)
+
+
+def test_read_entities_columnar():
+    entities_df = pd.DataFrame({
+        "id": ["e1", "e2"],
+        "human_readable_id": [0, 1],
+        "title": ["A", "B"],
+        "type": ["person", None],
+        "description": ["first", "second"],
+        "description_embedding": [np.array([0.1, 0.2]), None],
+        "community_ids": [np.array(["1", "2"]), None],
+        "text_unit_ids": [np.array(["t1"]), np.array([], dtype=object)],
+        "degree": [3, 1],
+        "extra": ["x", "y"],
+    })
+
+    entities = read_entities(entities_df, attributes_cols=["extra", "missing"])
+
+    assert [e.id for e in entities] == ["e1", "e2"]
+    assert entities[0].short_id == "0"
+    assert entities[1].type is None
+    assert entities[0].community_ids == ["1", "2"]
+    assert entities[1].community_ids is None
+    assert entities[1].text_unit_ids == []
+    assert entities[0].rank == 3
+    assert entities[0].attributes == {"extra": "x", "missing": None}
+    assert entities[0].name_embedding is None
+    assert entities[1].description_embedding is None
+    np.testing.assert_allclose(entities[0].description_embedding, [0.1, 0.2])
+
+
+def test_embeddings_share_one_matrix():
+    reports_df = pd.DataFrame({
+        "id": ["r1", "r2"],
+        "community": [1, 2],
+        "title": ["t1", "t2"],
+        "summary": ["s1", "s2"],
+        "full_content": ["c1", "c2"],
+        "rank": [1.0, 2.5],
+        "full_content_embedding": [np.array([1.0, 2.0]), np.array([3.0, 4.0])],
+    })
+
+    reports = read_community_reports(reports_df)
+
+    first = reports[0].full_content_embedding
+    second = reports[1].full_content_embedding
+    assert isinstance(first, np.ndarray)
+    assert first.base is not None
+    assert first.base is second.base
+    assert reports[1].community_id == "2"
+    assert reports[1].rank == 2.5
+
+
+def test_read_text_units_uses_index_for_short_id():
+    text_units_df = pd.DataFrame(
+        {
+            "id": ["t1", "t2"],
+            "text": ["hello", "world"],
+            "entity_ids": [np.array(["e1"]), None],
+            "relationship_ids": [None, np.array(["r1"])],
+            "n_tokens": [2.0, None],
+            "document_ids": [np.array(["d1"]), np.array(["d1"])],
+        },
+        index=[5, 7],
+    )
+
+    text_units = read_text_units(text_units_df, covariates_col=None)
+
+    assert [t.short_id for t in text_units] == ["5", "7"]
+    assert text_units[0].n_tokens == 2
+    assert text_units[1].n_tokens is None
+    assert text_units[1].relationship_ids == ["r1"]
+    assert text_units[0].covariate_ids is None
+
+
+def _fresh(text: str) -> str:
+    # build the string at runtime so it is not interned like a literal
+    return "".join(list(text))
+
+
+def test_entities_are_slotted_and_titles_interned():
+    entities_df = pd.DataFrame({
+        "id": ["e1"],
+        "human_readable_id": [0],
+        "title": [_fresh("ALPHA_BETA")],
+        "type": [_fresh("organization")],
+        "description": ["d"],
+    })
+    relationships_df = pd.DataFrame({
+        "id": ["r1"],
+        "human_readable_id": [0],
+        "source": [_fresh("ALPHA_BETA")],
+        "target": ["GAMMA"],
+        "description": ["d"],
+    })
+
+    entity = read_entities(entities_df)[0]
+    relationship = read_relationships(relationships_df)[0]
+
+    assert not hasattr(entity, "__dict__")
+    assert entity.title is relationship.source
+    assert entity.type is sys.intern("organization")
@@ -0,0 +1,91 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+from graphrag.data_model.community_report import CommunityReport
+from graphrag.data_model.entity import Entity
+from graphrag.data_model.relationship import Relationship
+from graphrag.query.context_builder.local_context import build_relationship_context
+from graphrag.query.structured_search.local_search.mixed_context import (
+    LocalSearchMixedContext,
+)
+
+
+def _reports() -> list[CommunityReport]:
+    return [
+        CommunityReport(
+            id=f"report-{index}",
+            short_id=str(index),
+            title=f"Community {index}",
+            community_id=str(index),
+            summary=f"summary {index}",
+            full_content=f"content {index}",
+            rank=float(index % 3),
+        )
+        for index in range(12)
+    ]
+
+
+def _entities(query: int) -> list[Entity]:
+    # each query matches a different community most often
+    return [
+        Entity(
+            id=f"entity-{query}-{index}",
+            short_id=str(index),
+            title=f"E{query}-{index}",
+            community_ids=[str((query + index) % 12), str(query % 12)],
+        )
+        for index in range(query % 5 + 1)
+    ]
+
+
+def _report_order(context: LocalSearchMixedContext, query: int) -> list[str]:
+    _, data = context._build_community_context(  # noqa: SLF001
+        _entities(query), max_tokens=100_000
+    )
+    return data["reports"]["id"].tolist()
+
+
+def test_community_context_is_safe_to_build_concurrently():
+    reports = _reports()
+    context = LocalSearchMixedContext(
+        entities=[],
+        entity_text_embeddings=Mock(),
+        text_embedder=Mock(),
+        community_reports=reports,
+    )
+    queries = list(range(12)) * 20
+    expected = {query: _report_order(context, query) for query in range(12)}
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        orders = list(executor.map(lambda q: _report_order(context, q), queries))
+
+    assert orders == [expected[query] for query in queries]
+    assert all(report.attributes is None for report in reports)
+
+
+def test_relationship_context_leaves_relationships_untouched():
+    selected = [Entity(id="a", short_id="0", title="A")]
+    relationships = [
+        Relationship(
+            id=f"r{index}",
+            short_id=str(index),
+            source="A",
+            target=f"T{index}",
+            rank=index,
+        )
+        for index in range(4)
+    ]
+    relationships.append(
+        Relationship(id="r4", short_id="4", source="T0", target="T1", rank=9)
+    )
+
+    build_relationship_context(
+        selected_entities=selected,
+        relationships=relationships,
+        top_k_relationships=10,
+    )
+
+    assert all(relationship.attributes is None for relationship in relationships)
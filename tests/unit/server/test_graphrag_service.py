@@ -0,0 +1,66 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from server import graphrag_service
+from server.index_snapshot import SnapshotManager
+
+
+def _reload(tmp_path, get_embedding_store):
+    config = Mock()
+    config.output.base_dir = str(tmp_path)
+    config.vector_store = {"default_vector_store": Mock()}
+    with (
+        patch.object(graphrag_service, "load_config", return_value=config),
+        patch.object(
+            graphrag_service,
+            "read_output_tables",
+            AsyncMock(return_value={"entities": "new"}),
+        ),
+        patch.object(graphrag_service, "shared_snapshot_store", None),
+        patch("graphrag.utils.api.get_embedding_store", get_embedding_store),
+    ):
+        return graphrag_service.reload_index_snapshot()
+
+
+def test_reload_publishes_the_new_snapshot(tmp_path):
+    manager = SnapshotManager()
+    with patch.object(graphrag_service, "snapshot_manager", manager):
+        previous = manager.publish({"entities": "old"})
+        snapshot = _reload(tmp_path, Mock())
+
+    assert manager.current is snapshot
+    assert snapshot.version == previous.version + 1
+    assert snapshot.data["entities"] == "new"
+
+
+def test_failed_vector_store_warm_up_keeps_the_previous_snapshot(tmp_path):
+    manager = SnapshotManager()
+    get_embedding_store = Mock(side_effect=RuntimeError("missing vector table"))
+    with patch.object(graphrag_service, "snapshot_manager", manager):
+        previous = manager.publish({"entities": "old"})
+        with pytest.raises(RuntimeError, match="missing vector table"):
+            _reload(tmp_path, get_embedding_store)
+
+    get_embedding_store.assert_called_once()
+    assert manager.current is previous
+    assert previous.data == {"entities": "old"}
+
+
+async def test_metrics_endpoint_renders_prometheus_text():
+    graphrag_service.MetricsQueryCallbacks("test_endpoint").on_stage("reduce", 0.4)
+
+    response = await graphrag_service.metrics()
+
+    assert response.media_type.startswith("text/plain; version=0.0.4")
+    lines = response.body.decode().splitlines()
+    assert "# TYPE graphrag_index_queue_depth gauge" in lines
+    assert (
+        'graphrag_query_stage_seconds_count{query_type="test_endpoint",stage="reduce"} 1'
+        in lines
+    )
@@ -0,0 +1,255 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import csv
+import itertools
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("neo4j")
+
+from server.import_to_neo4j import (
+    Neo4jImporter,
+    _bipartite_rounds,
+    _hash_buckets,
+    _tournament_rounds,
+    diff_graph_tables,
+    load_sync_state,
+    prepare_graph_tables,
+    save_sync_state,
+    table_row_hashes,
+    write_admin_import_csv,
+)
+
+
+def _output_tables(alice_description: str = "A person") -> dict[str, pd.DataFrame]:
+    # parquet array columns load as numpy arrays
+    return {
+        "entities": pd.DataFrame({
+            "id": ["e1", "e2"],
+            "human_readable_id": [0, 1],
+            "title": ["ALICE", "BOB"],
+            "type": ["PERSON", "PERSON"],
+            "description": [alice_description, "Another person"],
+            "text_unit_ids": [np.array(["t1"]), np.array(["t1", "t2"])],
+        }),
+        "relationships": pd.DataFrame({
+            "id": ["r1"],
+            "human_readable_id": [0],
+            "source": ["ALICE"],
+            "target": ["BOB"],
+            "description": ["Alice knows Bob"],
+            "weight": [1.0],
+            "text_unit_ids": [np.array(["t1"])],
+        }),
+        "text_units": pd.DataFrame({
+            "id": ["t1", "t2"],
+            "text": ["Alice met Bob.", "Bob left."],
+            "n_tokens": [4, 3],
+            "document_ids": [np.array(["d1"]), np.array(["d1"])],
+            "entity_ids": [np.array(["e1", "e2"]), np.array(["e2"])],
+            "relationship_ids": [np.array(["r1"]), None],
+        }),
+        "communities": pd.DataFrame({
+            "id": ["c1"],
+            "community": [0],
+            "title": ["Community 0"],
+            "level": [0],
+            "entity_ids": [np.array(["e1", "e2"])],
+            "relationship_ids": [np.array(["r1"])],
+            "text_unit_ids": [np.array(["t1", "t2"])],
+        }),
+        "community_reports": pd.DataFrame({
+            "community": [0],
+            "summary": ["About Alice and Bob"],
+            "full_content": ["# Alice and Bob"],
+            "rank": [5.0],
+            "rating_explanation": ["Central"],
+            "findings": [np.array([{"summary": "s", "explanation": "e"}])],
+        }),
+    }
+
+
+def test_unchanged_output_has_no_delta():
+    tables = prepare_graph_tables(_output_tables())
+    state = table_row_hashes(tables)
+
+    delta = diff_graph_tables(
+        prepare_graph_tables(_output_tables()),
+        table_row_hashes(prepare_graph_tables(_output_tables())),
+        state,
+    )
+
+    assert len(state) == sum(len(df) for df in tables.values())
+    assert all(
+        changes["upsert"].empty and changes["delete"].empty
+        for changes in delta.values()
+    )
+
+
+def test_changed_and_removed_rows_are_detected():
+    previous = table_row_hashes(prepare_graph_tables(_output_tables()))
+    output = _output_tables("A curious person")
+    output["text_units"]["entity_ids"] = [np.array(["e1"]), np.array(["e2"])]
+    tables = prepare_graph_tables(output)
+
+    delta = diff_graph_tables(tables, table_row_hashes(tables), previous)
+
+    assert delta["entities"]["upsert"]["id"].tolist() == ["ALICE"]
+    assert delta["chunks"]["upsert"]["id"].tolist() == ["t1"]
+    assert delta["mentions"]["delete"][["start", "end"]].to_numpy().tolist() == [
+        ["t1", "BOB"]
+    ]
+    assert delta["relationship_nodes"]["upsert"].empty
+
+
+def test_first_sync_upserts_everything(tmp_path):
+    tables = prepare_graph_tables(_output_tables())
+    state = table_row_hashes(tables)
+
+    delta = diff_graph_tables(tables, state, None)
+    save_sync_state(tmp_path, state)
+
+    assert {name: len(changes["upsert"]) for name, changes in delta.items()} == {
+        name: len(df) for name, df in tables.items()
+    }
+    assert load_sync_state(tmp_path)["hash"].tolist() == state["hash"].tolist()
+
+
+def _read_csv(path) -> list[list[str]]:
+    with path.open(newline="", encoding="utf-8") as f:
+        return list(csv.reader(f))
+
+
+@pytest.mark.parametrize("buckets", [1, 2, 3, 4, 7, 8])
+def test_tournament_rounds_cover_every_unordered_bucket_pair_once(buckets):
+    rounds = _tournament_rounds(buckets)
+
+    for round_keys in rounds:
+        endpoints = [bucket for key in round_keys for bucket in set(key)]
+        assert len(endpoints) == len(set(endpoints))
+    scheduled = [key for round_keys in rounds for key in round_keys]
+    assert sorted(scheduled) == list(
+        itertools.combinations_with_replacement(range(buckets), 2)
+    )
+
+
+@pytest.mark.parametrize("buckets", [1, 2, 3, 4, 7, 8])
+def test_bipartite_rounds_cover_every_ordered_bucket_pair_once(buckets):
+    rounds = _bipartite_rounds(buckets)
+
+    for round_keys in rounds:
+        starts, ends = zip(*round_keys, strict=True)
+        assert len(set(starts)) == len(starts)
+        assert len(set(ends)) == len(ends)
+    scheduled = [key for round_keys in rounds for key in round_keys]
+    assert sorted(scheduled) == list(itertools.product(range(buckets), repeat=2))
+
+
+@pytest.mark.parametrize(
+    ("start_label", "end_label"),
+    [("__Entity__", "__Entity__"), ("__Chunk__", "__Entity__")],
+)
+def test_create_relationships_writes_every_row_once(start_label, end_label):
+    relationships = pd.DataFrame({
+        "start": [f"n{i % 23}" for i in range(200)],
+        "end": [f"n{(i * 7) % 31}" for i in range(200)],
+        "weight": [float(i) for i in range(200)],
+    })
+    importer = Neo4jImporter.__new__(Neo4jImporter)
+    lock = threading.Lock()
+    statements, written, in_flight = set(), [], set()
+
+    def endpoint_buckets(rows) -> set[tuple[str, int]]:
+        starts = _hash_buckets(pd.Series([row["start"] for row in rows]), 4)
+        ends = _hash_buckets(pd.Series([row["end"] for row in rows]), 4)
+        if start_label == end_label:
+            return {("node", int(bucket)) for bucket in [*starts, *ends]}
+        return {("start", int(b)) for b in starts} | {("end", int(b)) for b in ends}
+
+    def run_statement(statement, rows):
+        buckets = endpoint_buckets(rows)
+        with lock:
+            # concurrent batches must not lock the same endpoint nodes
+            assert not buckets & in_flight
+            in_flight.update(buckets)
+            statements.add(statement)
+            written.extend(rows)
+        time.sleep(0.001)
+        with lock:
+            in_flight.difference_update(buckets)
+        return len(rows)
+
+    importer._run_statement = run_statement  # noqa: SLF001
+
+    result = importer._create_relationships(  # noqa: SLF001
+        "RELATED_TO",
+        start_label,
+        end_label,
+        relationships,
+        batch_size=16,
+        max_workers=4,
+    )
+
+    assert result == {"total_rows": 200, "successful_rows": 200}
+    assert statements == {
+        f"MATCH (s:{start_label} {{id: value.start}}) "
+        f"MATCH (t:{end_label} {{id: value.end}}) "
+        "CREATE (s)-[r:RELATED_TO]->(t) SET r.weight = value.weight"
+    }
+    assert sorted(row["weight"] for row in written) == relationships["weight"].tolist()
+
+
+def test_admin_import_csv_uses_typed_headers_and_id_spaces(tmp_path):
+    tables = prepare_graph_tables(_output_tables())
+
+    command = write_admin_import_csv(tables, tmp_path, database="graph")
+
+    assert _read_csv(tmp_path / "entities.csv") == [
+        [
+            "id:ID(Entity)",
+            "name",
+            "type",
+            "description",
+            "human_readable_id:long",
+            "text_unit_ids:string[]",
+        ],
+        ["ALICE", "ALICE", "PERSON", "A person", "0", "t1"],
+        ["BOB", "BOB", "PERSON", "Another person", "1", "t1;t2"],
+    ]
+    assert _read_csv(tmp_path / "chunks.csv")[2] == [
+        "t2",
+        "Bob left.",
+        "3",
+        "d1",
+        "e2",
+        "",
+    ]
+    assert _read_csv(tmp_path / "related_to.csv") == [
+        [
+            ":START_ID(Entity)",
+            ":END_ID(Entity)",
+            "description",
+            "weight:double",
+            "relationship_id",
+        ],
+        ["ALICE", "BOB", "Alice knows Bob", "1.0", "r1"],
+    ]
+    assert _read_csv(tmp_path / "mentions.csv") == [
+        [":START_ID(Chunk)", ":END_ID(Entity)"],
+        ["t1", "ALICE"],
+        ["t1", "BOB"],
+        ["t2", "BOB"],
+    ]
+    assert command.startswith("neo4j-admin database import full ")
+    assert f"--nodes=__Entity__={tmp_path / 'entities.csv'}" in command
+    assert f"--relationships=MENTIONS={tmp_path / 'mentions.csv'}" in command
+    assert "--array-delimiter=';'" in command
+    assert command.endswith(" graph")
+    assert (tmp_path / "import_command.sh").read_text(
+        encoding="utf-8"
+    ) == command + "\n"
@@ -0,0 +1,53 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import threading
+import time
+
+from server.index_jobs import IndexJobQueue, TaskStore
+
+
+def _queue(tmp_path, runner) -> IndexJobQueue:
+    store = TaskStore(str(tmp_path / "index_tasks.json"))
+    for task_id in ("t1", "t2"):
+        store.create(task_id, {"status": "pending", "file_type": "txt"})
+    return IndexJobQueue(runner, store, batch_window=0.05)
+
+
+def test_duplicate_submissions_run_once(tmp_path):
+    batches, done = [], threading.Event()
+
+    def runner(project, task_ids, file_type, batch_id):
+        batches.append(task_ids)
+        done.set()
+
+    queue = _queue(tmp_path, runner)
+    queue.submit("default", "t1")
+    queue.submit("default", "t1")
+    queue.submit("default", "t2")
+
+    assert done.wait(5)
+    assert batches == [["t1", "t2"]]
+
+
+def test_finished_and_failed_tasks_are_forgotten(tmp_path):
+    finished = threading.Semaphore(0)
+
+    def runner(project, task_ids, file_type, batch_id):
+        finished.release()
+        if "t2" in task_ids:
+            msg = "index failed"
+            raise RuntimeError(msg)
+
+    queue = _queue(tmp_path, runner)
+    queue.submit("default", "t1")
+    assert finished.acquire(timeout=5)
+    queue.submit("default", "t2")
+    assert finished.acquire(timeout=5)
+
+    for _ in range(100):
+        if not queue.snapshot()["running"]:
+            break
+        time.sleep(0.01)
+    assert not queue._submitted  # noqa: SLF001
+    assert queue.store["t2"]["status"] == "failed"
@@ -0,0 +1,93 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import pytest
+
+from server.query_metrics import (
+    Histogram,
+    MetricsQueryCallbacks,
+    query_llm_calls,
+    query_output_tokens,
+    query_prompt_tokens,
+    query_stage_duration,
+    record_llm_scheduler,
+    render_metrics,
+)
+
+
+def test_stage_timings_accumulate_per_stage():
+    callbacks = MetricsQueryCallbacks("test_aggregate")
+
+    callbacks.on_stage("map", 0.2, llm_calls=2, prompt_tokens=300, output_tokens=40)
+    callbacks.on_stage("map", 0.3, llm_calls=1, prompt_tokens=100, output_tokens=10)
+    callbacks.on_stage("reduce", 1.5, llm_calls=1)
+
+    assert callbacks.stages == pytest.approx({"map": 0.5, "reduce": 1.5})
+    labels = {"query_type": "test_aggregate", "stage": "map"}
+    assert query_stage_duration.count(**labels) == 2
+    assert query_llm_calls.value(**labels) == 3
+    assert query_prompt_tokens.value(**labels) == 400
+    assert query_output_tokens.value(**labels) == 50
+    assert query_prompt_tokens.value(query_type="test_aggregate", stage="reduce") == 0
+
+
+def test_histogram_renders_cumulative_buckets():
+    histogram = Histogram(
+        "test_seconds", "Test latency.", ("stage",), buckets=(0.1, 1.0)
+    )
+
+    for value in (0.05, 0.5, 0.7, 5.0):
+        histogram.observe(value, stage="map")
+
+    assert histogram.render() == (
+        "# HELP test_seconds Test latency.\n"
+        "# TYPE test_seconds histogram\n"
+        'test_seconds_bucket{stage="map",le="0.1"} 1\n'
+        'test_seconds_bucket{stage="map",le="1"} 3\n'
+        'test_seconds_bucket{stage="map",le="+Inf"} 4\n'
+        'test_seconds_sum{stage="map"} 6.25\n'
+        'test_seconds_count{stage="map"} 4\n'
+    )
+
+
+def test_render_metrics_exposes_stage_series():
+    MetricsQueryCallbacks("test_render").on_stage(
+        "build_context", 0.02, llm_calls=1, prompt_tokens=7
+    )
+
+    lines = render_metrics().splitlines()
+
+    assert "# TYPE graphrag_query_stage_seconds histogram" in lines
+    assert (
+        'graphrag_query_stage_seconds_count{query_type="test_render",stage="build_context"} 1'
+        in lines
+    )
+    assert (
+        'graphrag_query_stage_seconds_bucket{query_type="test_render",stage="build_context",le="0.025"} 1'
+        in lines
+    )
+    assert (
+        'graphrag_query_prompt_tokens_total{query_type="test_render",stage="build_context"} 7'
+        in lines
+    )
+
+
+def test_llm_scheduler_labels_leave_out_the_key():
+    record_llm_scheduler({
+        "https://llm.test/v1|secret-key|test-model": {
+            "concurrency_limit": 8,
+            "in_flight": 3,
+            "waiting": 5,
+            "waiting_interactive": 2,
+            "rate_limited": 1,
+        }
+    })
+
+    output = render_metrics()
+
+    assert "secret-key" not in output
+    lines = output.splitlines()
+    quota = 'quota="https://llm.test/v1|test-model"'
+    assert f"graphrag_llm_concurrency_limit{{{quota}}} 8" in lines
+    assert f'graphrag_llm_requests_waiting{{{quota},priority="interactive"}} 2' in lines
+    assert f'graphrag_llm_requests_waiting{{{quota},priority="background"}} 3' in lines
@@ -0,0 +1,61 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import tiktoken
+
+from graphrag.utils.tokenizer import CachedTokenizer, get_tokenizer, tokenizer_for
+
+
+def test_tokenizers_are_shared_per_encoding():
+    tokenizer = get_tokenizer("cl100k_base")
+    assert get_tokenizer("cl100k_base") is tokenizer
+    assert tokenizer_for(tiktoken.get_encoding("cl100k_base")) is tokenizer
+    assert get_tokenizer("cl100k_base", model="unknown-model") is tokenizer
+
+
+def test_count_is_memoized():
+    encoding = tiktoken.get_encoding("cl100k_base")
+    tokenizer = CachedTokenizer(encoding)
+    text = "The quick brown fox jumps over the lazy dog."
+
+    assert tokenizer.count(text) == len(encoding.encode(text))
+    assert tokenizer.count(text) == len(encoding.encode(text))
+    assert tokenizer.cache_info() == {"hits": 1, "misses": 1, "size": 1}
+
+
+def test_count_allows_special_tokens():
+    tokenizer = CachedTokenizer(tiktoken.get_encoding("cl100k_base"))
+    assert tokenizer.count("<|endoftext|>") > 1
+
+
+def test_count_batch_matches_count():
+    encoding = tiktoken.get_encoding("cl100k_base")
+    tokenizer = CachedTokenizer(encoding)
+    texts = ["alpha beta", "", "gamma", "alpha beta", "delta epsilon zeta"]
+    tokenizer.count("gamma")
+
+    counts = tokenizer.count_batch(texts)
+
+    assert counts == [len(encoding.encode(text)) for text in texts]
+    # "gamma" was cached and the repeated text is encoded once
+    assert tokenizer.cache_info() == {"hits": 1, "misses": 4, "size": 4}
+
+
+def test_count_cache_evicts_least_recently_used():
+    tokenizer = CachedTokenizer(tiktoken.get_encoding("cl100k_base"), cache_size=2)
+    tokenizer.count("one")
+    tokenizer.count("two")
+    tokenizer.count("one")
+    tokenizer.count("three")
+
+    tokenizer.count("one")
+    assert tokenizer.cache_info()["hits"] == 2
+    tokenizer.count("two")
+    assert tokenizer.cache_info() == {"hits": 2, "misses": 4, "size": 2}
+
+
+def test_count_total_skips_non_strings():
+    tokenizer = get_tokenizer("cl100k_base")
+    assert tokenizer.count_total(["hello", None, {"a": 1}, "world"]) == (
+        tokenizer.count("hello") + tokenizer.count("world")
+    )
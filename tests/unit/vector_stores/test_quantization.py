@@ -0,0 +1,83 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import numpy as np
+import pytest
+
+from graphrag.vector_stores.quantization import (
+    QuantizedVectors,
+    VectorQuantization,
+    quantize,
+    rescore,
+)
+
+
+def _vectors(n: int = 500, dimensions: int = 64) -> np.ndarray:
+    # clusters of 10 nearby vectors, so nearest neighbors are well separated
+    rng = np.random.default_rng(0)
+    centers = rng.normal(size=(n // 10, dimensions))
+    vectors = np.repeat(centers, 10, axis=0) + rng.normal(
+        scale=0.05, size=(n, dimensions)
+    )
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def test_int8_codes():
+    vectors = _vectors()
+    codes, scales = quantize(vectors, VectorQuantization.int8)
+    assert codes.dtype == np.int8
+    assert codes.shape == vectors.shape
+    assert np.abs(codes * scales[:, None] - vectors).max() <= scales.max() / 2 + 1e-6
+
+
+def test_binary_codes():
+    vectors = _vectors()
+    codes, scales = quantize(vectors, "binary")
+    assert codes.dtype == np.uint8
+    assert codes.shape == (500, 8)
+    assert np.allclose(scales, 1.0, atol=1e-5)
+
+
+def test_quantize_rejects_none():
+    with pytest.raises(ValueError, match="Cannot quantize"):
+        quantize(_vectors(), VectorQuantization.none)
+
+
+@pytest.mark.parametrize(
+    ("method", "ratio"),
+    [(VectorQuantization.int8, 4), (VectorQuantization.binary, 32)],
+)
+def test_memory_ratio(method: VectorQuantization, ratio: int):
+    vectors = _vectors(n=1000, dimensions=1024).astype(np.float32)
+    quantized = QuantizedVectors.from_vectors(list(range(1000)), vectors, method)
+    assert quantized.codes.nbytes * ratio == vectors.nbytes
+
+
+@pytest.mark.parametrize("method", ["int8", "binary"])
+def test_candidates_contain_exact_neighbors(method: str):
+    vectors = _vectors()
+    ids = [f"doc-{i}" for i in range(len(vectors))]
+    quantized = QuantizedVectors.from_vectors(ids, vectors, method)
+    query = vectors[42]
+    exact = [ids[i] for i in np.argsort(rescore(query, vectors))[:5]]
+    candidates = quantized.candidates(query, k=20)
+    assert len(candidates) == 20
+    assert set(exact) <= set(candidates)
+
+
+def test_candidates_respect_include_ids():
+    vectors = _vectors()
+    ids = [f"doc-{i}" for i in range(len(vectors))]
+    quantized = QuantizedVectors.from_vectors(ids, vectors, "int8")
+    include = {"doc-1", "doc-2", "doc-3", "missing"}
+    assert set(quantized.candidates(vectors[0], k=10, include_ids=include)) == {
+        "doc-1",
+        "doc-2",
+        "doc-3",
+    }
+    assert quantized.candidates(vectors[0], k=10, include_ids=set()) == []
+
+
+def test_rescore_is_squared_l2():
+    query = np.array([1.0, 0.0])
+    assert rescore(query, [[1.0, 0.0], [0.0, 1.0]]).tolist() == [0.0, 2.0]